@@ -28,6 +28,7 @@ Production-ready features:
 """
 
 # Core components
+from .async_context import AsyncContextMesh
 from .context import ContextMesh
 
 # Error handling
@@ -64,6 +65,7 @@ from .logging import (
     get_security_logger,
 )
 from .persistence import DatabaseBackend, SQLiteBackend, create_database_backend
+from .pool import ContextMeshPool
 from .prompts import (
     build_custom_prompt,
     build_message_prompt,
@@ -71,6 +73,8 @@ from .prompts import (
     inject_context_into_prompt,
 )
 from .reports import OutcomeLogger
+from .server import ContextMeshServer, RemoteContextMesh
+from .sharding import HashRing, ShardedContextMesh
 from .tool_factory import SynthaToolFactory, create_tool_factory
 from .tools import (
     PREDEFINED_ROLES,
@@ -88,6 +92,12 @@ __author__ = "Syntha Team"
 __all__ = [
     # Core components
     "ContextMesh",
+    "AsyncContextMesh",
+    "ContextMeshServer",
+    "RemoteContextMesh",
+    "ShardedContextMesh",
+    "HashRing",
+    "ContextMeshPool",
     "build_custom_prompt",
     "build_system_prompt",
     "build_message_prompt",
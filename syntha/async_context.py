@@ -0,0 +1,366 @@
+"""
+Async Context Mesh - asyncio front end for Syntha's shared knowledge system.
+
+Copyright 2025 Syntha
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Wraps a ContextMesh so agents running inside an event loop can share context
+without blocking the loop on the mesh lock or on database commits.
+"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .context import ContextMesh
+
+
+class AsyncContextMesh:
+    """
+    Asyncio-native interface to a ContextMesh.
+
+    Every operation has the same routing, access control and user isolation
+    semantics as the matching ContextMesh method. When persistence is enabled,
+    calls run on a dedicated I/O executor so lock waits and database commits
+    happen off the event loop; purely in-memory meshes are called inline.
+    """
+
+    def __init__(
+        self,
+        mesh: Optional[ContextMesh] = None,
+        executor: Optional[Executor] = None,
+        max_workers: int = 4,
+        **mesh_config,
+    ):
+        """
+        Create an async mesh.
+
+        Args:
+            mesh: An existing ContextMesh to wrap. If omitted, one is created
+                from ``mesh_config`` (the ContextMesh constructor arguments).
+            executor: Executor for blocking calls. Defaults to a thread pool
+                owned by this mesh when persistence is enabled.
+            max_workers: Size of the default thread pool
+            **mesh_config: Arguments for the ContextMesh constructor
+        """
+        if mesh is not None and mesh_config:
+            raise ValueError("Pass either an existing mesh or mesh_config, not both")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.mesh = mesh if mesh is not None else ContextMesh(**mesh_config)
+        self.user_id = self.mesh.user_id
+
+        self._owns_executor = False
+        self._executor = executor
+        if executor is None and self.mesh.enable_persistence:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="syntha-io"
+            )
+            self._owns_executor = True
+
+    async def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking ContextMesh call without blocking the event loop."""
+        if self._executor is None:
+            return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        """Close the underlying mesh and shut down the owned executor."""
+        await self._call(self.mesh.close)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def push(
+        self,
+        key: str,
+        value: Any,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Add or update context. See ContextMesh.push()."""
+        await self._call(self.mesh.push, key, value, subscribers, topics, ttl)
+
+    async def push_many(self, items: List[Dict[str, Any]]) -> None:
+        """Add or update several context items. See ContextMesh.push_many()."""
+        await self._call(self.mesh.push_many, items)
+
+    async def patch(
+        self, key: str, merge_patch: Any, agent_name: Optional[str] = None
+    ) -> bool:
+        """Update part of a context value. See ContextMesh.patch()."""
+        return await self._call(self.mesh.patch, key, merge_patch, agent_name)
+
+    async def increment(
+        self,
+        key: str,
+        delta: Union[int, float] = 1,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> Union[int, float]:
+        """Atomically add to a numeric context value. See ContextMesh.increment()."""
+        return await self._call(
+            self.mesh.increment, key, delta, agent_name, subscribers, topics, ttl
+        )
+
+    async def append(
+        self,
+        key: str,
+        item: Any,
+        max_len: Optional[int] = None,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> int:
+        """Atomically append to a list context value. See ContextMesh.append()."""
+        return await self._call(
+            self.mesh.append, key, item, max_len, agent_name, subscribers, topics, ttl
+        )
+
+    async def get(self, key: str, agent_name: Optional[str] = None) -> Optional[Any]:
+        """Retrieve a context item. See ContextMesh.get()."""
+        return await self._call(self.mesh.get, key, agent_name)
+
+    async def get_many(
+        self, keys: List[str], agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve several context items. See ContextMesh.get_many()."""
+        return await self._call(self.mesh.get_many, keys, agent_name)
+
+    async def get_prefix(
+        self, prefix: str, agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve the context items under a key prefix. See ContextMesh.get_prefix()."""
+        return await self._call(self.mesh.get_prefix, prefix, agent_name)
+
+    async def list_keys(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None,
+        limit: Optional[int] = None,
+        agent_name: Optional[str] = None,
+    ) -> List[str]:
+        """List context keys in sorted order. See ContextMesh.list_keys()."""
+        return await self._call(
+            self.mesh.list_keys, prefix, start_after, limit, agent_name
+        )
+
+    async def export_items(
+        self, keys: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Export context items with their routing. See ContextMesh.export_items()."""
+        return await self._call(self.mesh.export_items, keys)
+
+    async def get_all_for_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Get all context accessible to an agent."""
+        return await self._call(self.mesh.get_all_for_agent, agent_name)
+
+    async def get_keys_for_agent(self, agent_name: str) -> List[str]:
+        """Get all context keys accessible to an agent."""
+        return await self._call(self.mesh.get_keys_for_agent, agent_name)
+
+    async def get_changes_since(
+        self,
+        cursor: int = 0,
+        agent_name: Optional[str] = None,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get the changes visible to an agent since a cursor."""
+        return await self._call(
+            self.mesh.get_changes_since, cursor, agent_name, keys, topics
+        )
+
+    async def current_cursor(self) -> int:
+        """Get a cursor for the current state. See ContextMesh.current_cursor()."""
+        return await self._call(self.mesh.current_cursor)
+
+    async def wait_for(
+        self,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        since: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait until matching context changes without blocking the event loop.
+
+        Takes the same arguments and returns the same result as
+        ContextMesh.wait_for(); None means the timeout expired first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        changed = asyncio.Event()
+        cursor = self.mesh._sequence if since is None else since
+        last_seen = [cursor]
+
+        def wakeup() -> None:
+            # Runs on whichever thread committed; only wake the loop when the
+            # sequence moved and no wakeup is already pending
+            if self.mesh._sequence != last_seen[0] and not changed.is_set():
+                loop.call_soon_threadsafe(changed.set)
+
+        wakeup_id = self.mesh._add_wakeup(wakeup)
+        try:
+            while True:
+                changed.clear()
+                changes = await self.get_changes_since(cursor, agent_name, keys, topics)
+                if changes["changed"] or changes["removed"]:
+                    return changes
+                cursor = last_seen[0] = changes["cursor"]
+
+                wait_time = None
+                if deadline is not None:
+                    wait_time = deadline - loop.time()
+                    if wait_time <= 0:
+                        return None
+
+                # Wake up for TTL expiry even without a background reaper
+                until_expiry = self.mesh._time_until_next_expiry()
+                if until_expiry is not None and (
+                    wait_time is None or until_expiry < wait_time
+                ):
+                    wait_time = until_expiry
+
+                try:
+                    await asyncio.wait_for(changed.wait(), wait_time)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.mesh._remove_wakeup(wakeup_id)
+
+    async def on_change(
+        self,
+        callback: Callable[[Dict[str, Any]], Any],
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+    ) -> int:
+        """
+        Register a callback for context changes, delivered on this event loop.
+
+        Works like ContextMesh.on_change(), except that callbacks run on the
+        calling event loop instead of the writing thread. Coroutine functions
+        are scheduled as tasks.
+
+        Returns:
+            An id to pass to remove_change_listener()
+        """
+        loop = asyncio.get_running_loop()
+
+        if inspect.iscoroutinefunction(callback):
+
+            def deliver(event: Dict[str, Any]) -> None:
+                asyncio.run_coroutine_threadsafe(callback(event), loop)
+
+        else:
+
+            def deliver(event: Dict[str, Any]) -> None:
+                loop.call_soon_threadsafe(callback, event)
+
+        return await self._call(self.mesh.on_change, deliver, keys, topics, agent_name)
+
+    async def remove_change_listener(self, listener_id: int) -> bool:
+        """Remove a callback registered with on_change()."""
+        return await self._call(self.mesh.remove_change_listener, listener_id)
+
+    async def remove(self, key: str) -> bool:
+        """Remove a context item from the mesh."""
+        return await self._call(self.mesh.remove, key)
+
+    async def clear(self) -> None:
+        """Clear all context items."""
+        await self._call(self.mesh.clear)
+
+    async def flush(self) -> None:
+        """Commit queued database writes. See ContextMesh.flush()."""
+        await self._call(self.mesh.flush)
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired items and return how many were removed."""
+        return await self._call(self.mesh.cleanup_expired)
+
+    async def size(self) -> int:
+        """Get the number of items in the mesh."""
+        return await self._call(self.mesh.size)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the context mesh."""
+        return await self._call(self.mesh.get_stats)
+
+    async def register_agent_topics(self, agent_name: str, topics: List[str]) -> None:
+        """Register the topics an agent is interested in."""
+        await self._call(self.mesh.register_agent_topics, agent_name, topics)
+
+    async def get_topics_for_agent(self, agent_name: str) -> List[str]:
+        """Get the topics an agent is subscribed to."""
+        return await self._call(self.mesh.get_topics_for_agent, agent_name)
+
+    async def get_subscribers_for_topic(self, topic: str) -> List[str]:
+        """Get all agents subscribed to a topic."""
+        return await self._call(self.mesh.get_subscribers_for_topic, topic)
+
+    async def get_all_topics(self) -> List[str]:
+        """Get all topics that have subscribers."""
+        return await self._call(self.mesh.get_all_topics)
+
+    async def unsubscribe_from_topics(self, agent_name: str, topics: List[str]) -> None:
+        """Unsubscribe an agent from specific topics."""
+        await self._call(self.mesh.unsubscribe_from_topics, agent_name, topics)
+
+    async def delete_topic(self, topic: str) -> int:
+        """Delete a topic and its context. Returns the number of items deleted."""
+        return await self._call(self.mesh.delete_topic, topic)
+
+    async def get_available_keys_by_topic(
+        self, agent_name: str
+    ) -> Dict[str, List[str]]:
+        """Get the keys accessible to an agent, grouped by topic."""
+        return await self._call(self.mesh.get_available_keys_by_topic, agent_name)
+
+    async def set_agent_post_permissions(
+        self, agent_name: str, allowed_topics: List[str]
+    ) -> None:
+        """Set which topics an agent is allowed to post to."""
+        await self._call(
+            self.mesh.set_agent_post_permissions, agent_name, allowed_topics
+        )
+
+    async def get_agent_post_permissions(self, agent_name: str) -> List[str]:
+        """Get the topics an agent is allowed to post to."""
+        return await self._call(self.mesh.get_agent_post_permissions, agent_name)
+
+    async def get_all_post_permissions(self) -> Dict[str, List[str]]:
+        """Get the posting permissions of every agent that has them."""
+        return await self._call(self.mesh.get_all_post_permissions)
+
+    async def can_agent_post_to_topic(self, agent_name: str, topic: str) -> bool:
+        """Check whether an agent can post to a topic."""
+        return await self._call(self.mesh.can_agent_post_to_topic, agent_name, topic)
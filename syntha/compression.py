@@ -0,0 +1,153 @@
+"""
+Value compression - zlib-compressed storage of large context values.
+
+Copyright 2025 Syntha
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Long documents and transcripts compress well. A ContextMesh created with a
+``compress_threshold`` keeps values whose JSON encoding reaches that many
+bytes as CompressedValue objects: the compressed JSON text, which is
+decompressed on every read and written to the database as it is.
+"""
+
+import json
+import struct
+import zlib
+from typing import Any
+
+# zlib level used for context values; 6 is zlib's default trade-off
+COMPRESSION_LEVEL = 6
+
+# Stored form of a compressed value: a header (magic, uncompressed size)
+# followed by the zlib data
+_STORED_HEADER = struct.Struct("<4sQ")
+_STORED_MAGIC = b"SYZ1"
+
+
+class CompressedValue:
+    """
+    A JSON context value held as zlib-compressed UTF-8 JSON text.
+
+    Instances are immutable, so copies share them. decompress() builds a new
+    value on every call.
+    """
+
+    __slots__ = ("data", "size")
+
+    def __init__(self, data: bytes, size: int):
+        """
+        Args:
+            data: zlib-compressed JSON text
+            size: Length of the uncompressed JSON text, in bytes
+        """
+        self.data = data
+        self.size = size
+
+    @classmethod
+    def from_bytes(cls, stored: bytes) -> "CompressedValue":
+        """Read a value back from the form written by to_bytes()."""
+        magic, size = _STORED_HEADER.unpack_from(stored)
+        if magic != _STORED_MAGIC:
+            raise ValueError("Not a compressed context value")
+        return cls(bytes(stored[_STORED_HEADER.size :]), size)
+
+    def to_bytes(self) -> bytes:
+        """Get the form stored in the database."""
+        return _STORED_HEADER.pack(_STORED_MAGIC, self.size) + self.data
+
+    def decompress(self) -> Any:
+        """Decode a new copy of the value."""
+        return json.loads(zlib.decompress(self.data))
+
+    def json(self) -> str:
+        """Get the value's JSON text."""
+        return zlib.decompress(self.data).decode("utf-8")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (CompressedValue, (self.data, self.size))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompressedValue):
+            return self.data == other.data
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"CompressedValue({self.size} bytes -> {len(self.data)} bytes)"
+
+
+def _is_plain_json(value: Any) -> bool:
+    """
+    Check that JSON represents a value: dicts with string keys, lists and
+    scalars only (tuples, sets and other objects would come back as
+    something else). Dict and list subclasses come back as plain dicts and
+    lists, as they do from the database.
+    """
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        kind = type(current)
+        if isinstance(current, dict):
+            for key in current:
+                if type(key) is not str:
+                    return False
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+        elif kind is float:
+            if current != current or current in (float("inf"), float("-inf")):
+                return False
+        elif kind not in (str, int, bool, type(None)):
+            return False
+    return True
+
+
+def compress_value(value: Any, threshold: int) -> Any:
+    """
+    Compress a value if its JSON encoding is at least ``threshold`` bytes.
+
+    Values that JSON cannot represent exactly, and values that do not get
+    smaller, are returned unchanged.
+
+    Args:
+        value: The value to compress
+        threshold: Minimum encoded size in bytes worth compressing
+
+    Returns:
+        A CompressedValue, or ``value`` itself
+    """
+    if type(value) is str:
+        # Every character takes at least one byte
+        if len(value) < threshold:
+            return value
+    elif not isinstance(value, (dict, list)):
+        return value
+
+    if not _is_plain_json(value):
+        return value
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(raw) < threshold:
+        return value
+    data = zlib.compress(raw, COMPRESSION_LEVEL)
+    if len(data) >= len(raw):
+        return value
+    return CompressedValue(data, len(raw))
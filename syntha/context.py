@@ -19,47 +19,664 @@ Stores context as key-value pairs with subscriber-based access control,
 optional time-to-live (TTL) functionality, and persistent database storage.
 """
 
+import bisect
 import copy
+import gc
+import heapq
+import itertools
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
 import time
-from threading import Lock
-from typing import Any, Dict, List, Optional
+from collections import deque
+from threading import Condition, Event, Lock, RLock, Thread, local
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from .persistence import create_database_backend
+from .compression import CompressedValue, compress_value
+from .persistence import DatabaseBackend, create_database_backend
+from .write_behind import WriteBehindQueue
+
+logger = logging.getLogger(__name__)
+
+# Supported values for the ContextMesh ``concurrency`` option
+CONCURRENCY_MODES = ("exclusive", "shared_reads")
+
+# Supported values for the ContextMesh ``copy_mode`` option
+COPY_MODES = ("deep", "frozen", "none")
+
+# Supported values for the ContextMesh ``eviction_policy`` option
+EVICTION_POLICIES = ("lru", "lfu")
+
+# Supported values for the ContextMesh ``durability`` option
+DURABILITY_MODES = ("sync", "batched", "async")
+
+# Value of an evicted item whose value must be paged back in from the database
+_UNLOADED = object()
+
+# Number of keys per block of the sorted key index; a block is split in two
+# once it holds twice as many
+_SORTED_BLOCK_SIZE = 512
+
+# Snapshot file layout (little endian): a fixed header, a table of
+# (offset, length) pairs for the out-of-band pickle buffers, then the pickled
+# state and the buffers, each starting on an aligned offset so they can be
+# used straight from a memory map
+_SNAPSHOT_MAGIC = b"SYNTHA-SNAPSHOT\x00"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<16sIIQQ")  # magic, version, buffers, offset, size
+_SNAPSHOT_BUFFER = struct.Struct("<QQ")  # offset, size
+_SNAPSHOT_ALIGNMENT = 64
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("Frozen context values are read-only")
+
+
+class FrozenDict(dict):
+    """Read-only dict handed out for values stored with ``copy_mode="frozen"``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list handed out for values stored with ``copy_mode="frozen"``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Build an immutable representation of a context value.
+
+    Dicts and lists become FrozenDict/FrozenList (so they still compare equal to
+    and serialize like the originals), tuples and sets are frozen element-wise.
+    Scalars are already immutable. Any other object is deep-copied once, since
+    its mutability cannot be controlled.
+    """
+    if value is None or isinstance(value, (str, int, float, bool, bytes)):
+        return value
+    if isinstance(value, (FrozenDict, FrozenList, frozenset)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze_value(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze_value(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(freeze_value(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return copy.deepcopy(value)
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Apply a JSON merge patch (RFC 7386) to a value and return the result.
+
+    Members of a dict patch replace the target's members, nested dicts are
+    merged recursively and None removes a member; any other patch replaces
+    the target. ``target`` is not modified: only the dicts along the patched
+    paths are copied and everything else is shared with it.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for name, value in patch.items():
+        if value is None:
+            result.pop(name, None)
+        else:
+            result[name] = apply_merge_patch(result.get(name), value)
+    return result
+
+
+def _approximate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a value, in bytes.
+
+    Sums ``sys.getsizeof`` over the value and everything reachable through
+    dicts, lists, tuples and sets, counting shared objects once. Attributes of
+    other objects are not followed, so the result is an approximation.
+    """
+    total = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, CompressedValue):
+            total += sys.getsizeof(obj.data)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+
+class _LRUTracker:
+    """Recency order of resident keys, least recently used first."""
+
+    def __init__(self) -> None:
+        self._order: Dict[str, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._order
+
+    def touch(self, key: str) -> None:
+        """Record an access (or insertion) of ``key``."""
+        self._order.pop(key, None)
+        self._order[key] = None
+
+    def discard(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self, protect: Optional[str] = None) -> Optional[str]:
+        """The key to evict next, never ``protect``."""
+        for key in self._order:
+            if key != protect:
+                return key
+        return None
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _LFUTracker:
+    """
+    Access counts of resident keys, kept in frequency buckets so accesses and
+    evictions are O(1). Ties are broken by least recent access.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, int] = {}
+        # {count: ordered set of keys accessed that many times}
+        self._buckets: Dict[int, Dict[str, None]] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counts
+
+    def touch(self, key: str) -> None:
+        """Record an access (or insertion) of ``key``."""
+        count = self._counts.get(key, 0)
+        if count:
+            self._remove_from_bucket(key, count)
+        elif not self._counts or self._min_count > 1:
+            self._min_count = 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, {})[key] = None
+        if count == self._min_count and count not in self._buckets:
+            self._min_count = count + 1
+
+    def discard(self, key: str) -> None:
+        count = self._counts.pop(key, None)
+        if count is None:
+            return
+        self._remove_from_bucket(key, count)
+        if count == self._min_count and count not in self._buckets:
+            self._min_count = min(self._buckets, default=0)
+
+    def _remove_from_bucket(self, key: str, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def victim(self, protect: Optional[str] = None) -> Optional[str]:
+        """The key to evict next, never ``protect``."""
+        bucket = self._buckets.get(self._min_count, {})
+        for key in bucket:
+            if key != protect:
+                return key
+        # Only ``protect`` has the lowest count; look at the next buckets
+        for count in sorted(self._buckets):
+            for key in self._buckets[count]:
+                if key != protect:
+                    return key
+        return None
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class _SortedKeys:
+    """
+    Keys in sorted order, for prefix and range lookups.
+
+    Keys are stored in a list of sorted blocks of bounded size, so adding or
+    removing a key moves at most one block's worth of entries instead of
+    shifting the whole index.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        ordered = sorted(keys)
+        size = _SORTED_BLOCK_SIZE
+        self._blocks: List[List[str]] = [
+            ordered[i : i + size] for i in range(0, len(ordered), size)
+        ]
+        # Last (largest) key of every block
+        self._maxes: List[str] = [block[-1] for block in self._blocks]
+        self._len = len(ordered)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: str) -> None:
+        """Add ``key`` if it is not indexed yet."""
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([key])
+            maxes.append(key)
+            self._len = 1
+            return
+
+        i = bisect.bisect_left(maxes, key)
+        if i == len(maxes):
+            # Larger than every key: append to the last block
+            i -= 1
+            block = self._blocks[i]
+            block.append(key)
+            maxes[i] = key
+        else:
+            block = self._blocks[i]
+            j = bisect.bisect_left(block, key)
+            if block[j] == key:
+                return
+            block.insert(j, key)
+        self._len += 1
+
+        if len(block) > 2 * _SORTED_BLOCK_SIZE:
+            half = len(block) // 2
+            self._blocks[i : i + 1] = [block[:half], block[half:]]
+            maxes[i : i + 1] = [block[half - 1], block[-1]]
+
+    def discard(self, key: str) -> None:
+        """Remove ``key`` if it is indexed."""
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        j = bisect.bisect_left(block, key)
+        if block[j] != key:
+            return
+        del block[j]
+        self._len -= 1
+        if not block:
+            del self._blocks[i]
+            del self._maxes[i]
+        elif j == len(block):
+            self._maxes[i] = block[-1]
+
+    def iter_from(self, start: str, inclusive: bool = True) -> Iterator[str]:
+        """Yield the keys from ``start`` onwards (after it if not ``inclusive``)."""
+        search = bisect.bisect_left if inclusive else bisect.bisect_right
+        i = search(self._maxes, start)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        yield from block[search(block, start) :]
+        for block in self._blocks[i + 1 :]:
+            yield from block
+
+
+class _LockSide:
+    """Context manager exposing one side (read or write) of a ReadWriteLock."""
+
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class ReadWriteLock:
+    """
+    Writer-preferring readers/writer lock.
+
+    Any number of readers may hold the lock at the same time, while writers get
+    exclusive access. Waiting writers block new readers so that a steady stream
+    of reads cannot starve writes. The lock is not reentrant.
+
+    Use the ``reader`` and ``writer`` attributes as context managers::
+
+        with rw_lock.reader:
+            ...
+    """
+
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        self.reader = _LockSide(self.acquire_read, self.release_read)
+        self.writer = _LockSide(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for shared (read) access."""
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release shared (read) access."""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquire the lock for exclusive (write) access."""
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Release exclusive (write) access."""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+
+class _CommitLock:
+    """
+    Context manager around the mesh write lock that runs a hook once the lock
+    has been released, so change notifications fire after commit and never
+    while the mesh is locked.
+    """
+
+    def __init__(self, lock: Any, after_release: Callable[[], None]):
+        self._lock = lock
+        self._after_release = after_release
+
+    def __enter__(self):
+        self._lock.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._lock.__exit__(exc_type, exc_val, exc_tb)
+        self._after_release()
+
+
+class _ChangeListener:
+    """A callback registered with ContextMesh.on_change and its filters."""
+
+    __slots__ = ("callback", "keys", "topics", "agent_name")
+
+    def __init__(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        keys: Optional[List[str]],
+        topics: Optional[List[str]],
+        agent_name: Optional[str],
+    ):
+        self.callback = callback
+        self.keys = frozenset(keys) if keys else None
+        self.topics = frozenset(topics) if topics else None
+        self.agent_name = agent_name
+
+
+# Subscriber sets and topic tuples are interned so the many items sharing a
+# routing combination share one object; the table is bounded so a stream of
+# unique combinations cannot grow it forever
+_INTERN_LIMIT = 10000
+_interned: Dict[Any, Any] = {}
+
+# Subscribers written by older versions for topic context with no subscribers
+_NO_SUBSCRIBERS = frozenset(["__NO_SUBSCRIBERS__"])
+
+
+def _intern(value: Any) -> Any:
+    """Return a shared instance equal to ``value`` (a frozenset or tuple)."""
+    shared = _interned.get(value)
+    if shared is None:
+        if len(_interned) >= _INTERN_LIMIT:
+            return value
+        shared = _interned.setdefault(value, value)
+    return shared
 
 
 class ContextItem:
-    """Represents a single context item with value, subscribers, and TTL."""
+    """Represents a single context item with value, subscribers, topics and TTL."""
+
+    # Items are the most numerous objects in a mesh, so they use slots and
+    # share their (interned) subscriber set and topics with other items
+    __slots__ = (
+        "value",
+        "subscriber_set",
+        "topics",
+        "_created_at",
+        "_ttl",
+        "expires_at",
+        "version",
+    )
 
     def __init__(
         self,
         value: Any,
         subscribers: Optional[List[str]] = None,
         ttl: Optional[float] = None,
+        copy_mode: str = "deep",
+        topics: Optional[List[str]] = None,
+        created_at: Optional[float] = None,
     ):
-        # Deep copy the value to prevent external modifications
-        self.value = copy.deepcopy(value)
-        # Copy the subscribers list to prevent external modifications
-        self.subscribers = (subscribers or []).copy()
-        self.created_at = time.time()
-        self.ttl = ttl
+        # Take ownership of the value according to the copy mode:
+        # "deep" copies it to prevent external modifications, "frozen" stores an
+        # immutable representation and "none" keeps the caller's object as-is
+        if copy_mode == "deep":
+            self.value = copy.deepcopy(value)
+        elif copy_mode == "frozen":
+            self.value = freeze_value(value)
+        else:
+            self.value = value
+        # An immutable set, so later changes to the caller's list have no effect
+        self.subscriber_set: frozenset = (
+            _intern(frozenset(subscribers)) if subscribers else frozenset()
+        )
+        # Topics the item was pushed to. Their subscribers are resolved when the
+        # item is read, so subscription changes never require rewriting items.
+        if isinstance(topics, str):
+            raise TypeError("topics must be a list of topic names, not a string")
+        self.topics: Tuple[str, ...] = _intern(tuple(topics)) if topics else ()
+        self._created_at = time.time() if created_at is None else created_at
+        self._ttl = ttl
+        # Absolute expiry timestamp, or None if the item never expires
+        self.expires_at: Optional[float] = (
+            None if ttl is None else self._created_at + ttl
+        )
+        # Sequence number of the mutation that stored this item
+        self.version = 0
+
+    def __reduce__(self):
+        # A flat tuple pickles (and copies) much faster than slot state
+        return (
+            _rebuild_item,
+            (
+                self.value,
+                self.subscriber_set,
+                self.topics,
+                self._created_at,
+                self._ttl,
+                self.version,
+            ),
+        )
+
+    @property
+    def subscribers(self) -> List[str]:
+        """The direct subscribers of the item, as a sorted list."""
+        return sorted(self.subscriber_set)
+
+    @property
+    def created_at(self) -> float:
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, created_at: float) -> None:
+        self._created_at = created_at
+        self.expires_at = None if self._ttl is None else created_at + self._ttl
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: Optional[float]) -> None:
+        self._ttl = ttl
+        self.expires_at = None if ttl is None else self._created_at + ttl
 
     def is_expired(self) -> bool:
         """Check if this context item has expired."""
-        if self.ttl is None:
-            return False
-        return time.time() > (self.created_at + self.ttl)
+        expires_at = self.expires_at
+        return expires_at is not None and time.time() > expires_at
+
+    @property
+    def is_global(self) -> bool:
+        """Whether the item is visible to every agent."""
+        return not self.subscriber_set and not self.topics
 
-    def is_accessible_by(self, agent_name: str) -> bool:
-        """Check if the given agent can access this context item."""
+    def is_accessible_by(
+        self, agent_name: str, agent_topics: Optional[Iterable[str]] = None
+    ) -> bool:
+        """
+        Check if the given agent can access this context item.
+
+        Args:
+            agent_name: Name of the agent
+            agent_topics: Topics the agent is currently subscribed to
+        """
         if self.is_expired():
             return False
 
-        # Special marker for topic-based context with no subscribers
-        if self.subscribers == ["__NO_SUBSCRIBERS__"]:
+        subscriber_set = self.subscriber_set
+        topics = self.topics
+        if not subscriber_set:
+            # No subscribers and no topics means global context
+            if not topics:
+                return True
+        elif agent_name in subscriber_set:
+            return True
+        elif subscriber_set == _NO_SUBSCRIBERS:
+            # Special marker for topic-based context with no subscribers,
+            # written by older versions that resolved topic subscribers at push
             return False
 
-        # Empty subscribers list means global context
-        return len(self.subscribers) == 0 or agent_name in self.subscribers
+        if topics and agent_topics:
+            return any(topic in agent_topics for topic in topics)
+        return False
+
+
+def _rebuild_item(
+    value: Any,
+    subscriber_set: frozenset,
+    topics: Tuple[str, ...],
+    created_at: float,
+    ttl: Optional[float],
+    version: int,
+) -> ContextItem:
+    """Recreate a pickled or copied ContextItem without copying its value."""
+    item = ContextItem.__new__(ContextItem)
+    item.value = value
+    item.subscriber_set = subscriber_set
+    item.topics = topics
+    item._created_at = created_at
+    item._ttl = ttl
+    item.expires_at = None if ttl is None else created_at + ttl
+    item.version = version
+    return item
+
+
+class _ChangeRecord:
+    """
+    Change log entry for a key: the sequence number of its latest mutation and
+    the audience of every version recorded since the key entered the log.
+
+    The audience lets removals (and lost access) be reported only to agents
+    that could have seen the key.
+    """
+
+    __slots__ = ("seq", "is_global", "subscribers", "topics")
+
+    _EMPTY: frozenset = frozenset()
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self.is_global = False
+        self.subscribers = self._EMPTY
+        self.topics = self._EMPTY
+
+    def add_audience(self, item: ContextItem) -> None:
+        """Extend the audience with the agents that can see ``item``."""
+        if item.is_global:
+            self.is_global = True
+        if item.subscriber_set and not self.subscribers.issuperset(item.subscriber_set):
+            self.subscribers = self.subscribers.union(item.subscriber_set)
+        if item.topics and not self.topics.issuperset(item.topics):
+            self.topics = self.topics.union(item.topics)
+
+    def could_see(self, agent_name: str, agent_topics: Iterable[str]) -> bool:
+        """Whether the agent could see any recorded version of the key."""
+        return (
+            self.is_global
+            or agent_name in self.subscribers
+            or not self.topics.isdisjoint(agent_topics)
+        )
 
 
 class ContextMesh:
@@ -77,49 +694,238 @@ class ContextMesh:
         enable_indexing: bool = True,
         auto_cleanup: bool = True,
         enable_persistence: bool = True,
-        db_backend: str = "sqlite",
+        db_backend: Union[str, DatabaseBackend] = "sqlite",
         user_id: Optional[str] = None,
+        concurrency: str = "exclusive",
+        copy_mode: str = "deep",
+        reaper_interval: Optional[float] = None,
+        cache_views: bool = True,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: str = "lru",
+        lazy_load: bool = False,
+        snapshot_path: Optional[str] = None,
+        durability: str = "sync",
+        flush_interval: float = 0.05,
+        flush_batch_size: int = 1000,
+        compress_threshold: Optional[int] = None,
         **db_config,
     ):
+        if concurrency not in CONCURRENCY_MODES:
+            raise ValueError(
+                f"Unsupported concurrency mode: {concurrency}. "
+                f"Available modes: {list(CONCURRENCY_MODES)}"
+            )
+        if copy_mode not in COPY_MODES:
+            raise ValueError(
+                f"Unsupported copy mode: {copy_mode}. "
+                f"Available modes: {list(COPY_MODES)}"
+            )
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unsupported eviction policy: {eviction_policy}. "
+                f"Available policies: {list(EVICTION_POLICIES)}"
+            )
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"Unsupported durability level: {durability}. "
+                f"Available levels: {list(DURABILITY_MODES)}"
+            )
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if flush_batch_size < 1:
+            raise ValueError("flush_batch_size must be at least 1")
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if compress_threshold is not None and compress_threshold < 1:
+            raise ValueError("compress_threshold must be at least 1")
+
         self._data: Dict[str, ContextItem] = {}
-        self._lock = Lock()  # Thread safety for concurrent access
+
+        # Thread safety for concurrent access. ``_lock`` guards mutations and
+        # ``_read_lock`` guards read-only operations. In "exclusive" mode both
+        # are the same mutex; in "shared_reads" mode readers run in parallel.
+        # Releasing ``_lock`` also wakes waiters and fires change listeners.
+        self.concurrency = concurrency
+        if concurrency == "shared_reads":
+            rw_lock = ReadWriteLock()
+            self._lock: Any = _CommitLock(rw_lock.writer, self._after_commit)
+            self._read_lock: Any = rw_lock.reader
+        else:
+            self._lock = _CommitLock(Lock(), self._after_commit)
+            self._read_lock = self._lock
 
         # User isolation support
         self.user_id = user_id
 
+        # Value copy semantics: "deep" copies on push and on every read,
+        # "frozen" stores an immutable value once and hands it out directly,
+        # "none" shares values with (trusted) callers without copying
+        self.copy_mode = copy_mode
+
+        # Values whose JSON encoding reaches compress_threshold bytes are held
+        # (and persisted) zlib-compressed and decompressed on every read
+        self.compress_threshold = compress_threshold
+        # {key: (compressed, uncompressed bytes)} of resident compressed values
+        self._compressed_sizes: Dict[str, Tuple[int, int]] = {}
+        self._compressed_bytes = 0
+        self._uncompressed_bytes = 0
+
         # Performance optimizations (controlled by simple flags)
         self.enable_indexing = enable_indexing
         self.auto_cleanup = auto_cleanup
         self.enable_persistence = enable_persistence
 
-        # Agent-based indexes for faster lookups (only if indexing enabled)
-        self._agent_index: Optional[Dict[str, List[str]]] = (
+        # Agent-based indexes for faster lookups (only if indexing enabled).
+        # Key collections are insertion-ordered sets (dicts with None values)
+        # so membership checks, inserts and removals are O(1).
+        self._agent_index: Optional[Dict[str, Dict[str, None]]] = (
+            {} if enable_indexing else None
+        )
+        self._global_keys: Optional[Dict[str, None]] = {} if enable_indexing else None
+        # Reverse index {key: subscriber set} so removals only touch the agents
+        # that actually hold the key
+        self._key_agents: Optional[Dict[str, frozenset]] = (
             {} if enable_indexing else None
         )
-        self._global_keys: Optional[List[str]] = [] if enable_indexing else None
 
         # Topic-based routing system
         self._agent_topics: Dict[str, List[str]] = {}  # {agent_name: [topics]}
-        self._topic_subscribers: Dict[str, List[str]] = {}  # {topic: [agent_names]}
-        self._key_topics: Dict[str, List[str]] = (
-            {}
-        )  # {key: [topics]} - track which topics each key was pushed to
+        # {topic: ordered set of subscribed agent names}
+        self._topic_subscribers: Dict[str, Dict[str, None]] = {}
+        # {topic: ordered set of keys pushed to the topic}; combined with
+        # _agent_topics this resolves topic visibility at read time
+        self._topic_keys: Dict[str, Dict[str, None]] = {}
+
+        # All keys in sorted order, for prefix and range queries over
+        # hierarchical keys such as "project/123/summary". Built by the first
+        # such query (see _key_index) and maintained from then on, so meshes
+        # that never run one do not pay for it on every push.
+        self._sorted_keys: Optional[_SortedKeys] = None
+
+        # Lists built by append() that no reader, change event or queued save
+        # references, keyed by context key. append() extends these in place;
+        # any other list value is copied once before it is extended.
+        self._owned_lists: Dict[str, List[Any]] = {}
 
         # Topic posting permissions
         self._agent_post_permissions: Dict[str, List[str]] = (
             {}
         )  # {agent_name: [topics_can_post_to]}
 
-        # Cleanup tracking
+        # Expiry index: min-heap of (expires_at, key). Entries are removed
+        # lazily, so an entry is only acted on if it still matches the item.
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+        # Cleanup tracking (database cleanup runs on an interval)
         self._last_cleanup = time.time()
         self._cleanup_interval = 300  # 5 minutes
 
-        # Database persistence (initialize after all attributes)
+        # Change tracking: every mutation takes the next sequence number.
+        # _change_log holds one record per key ordered by sequence number, so
+        # changes since a cursor are found by walking it backwards.
+        self._sequence = 0
+        self._change_log: Dict[str, _ChangeRecord] = {}
+        # Removed keys still in the change log, oldest first (bounded)
+        self._tombstones: Dict[str, None] = {}
+        self._max_tombstones = 10000
+        # Cursors below this can no longer be answered incrementally
+        self._history_floor = 0
+        # {agent_name: sequence number of its last subscription change}
+        self._subscription_changes: Dict[str, int] = {}
+
+        # Watch support: wait_for blocks on _change_cond, and on_change
+        # listeners receive events queued under the lock and dispatched after
+        # it is released (serialized by _dispatch_lock to preserve order)
+        self._change_cond = Condition(Lock())
+        self._waiting = 0
+        self._change_listeners: Dict[int, _ChangeListener] = {}
+        self._listener_ids = itertools.count(1)
+        self._pending_events: deque = deque()
+        self._dispatch_lock = RLock()
+        # Callbacks run after every commit for waiters that cannot block on
+        # _change_cond (AsyncContextMesh); guarded by _change_cond's lock
+        self._wakeups: Dict[int, Callable[[], None]] = {}
+
+        # Memory bounds: once more than max_items values (or max_bytes of
+        # approximate value size) are resident, the least recently (LRU) or
+        # least frequently (LFU) used ones are evicted. With persistence the
+        # item's metadata stays in memory and the value is paged back in from
+        # the database on access; without it the item is dropped. Usage is
+        # tracked under _usage_lock, since reads update it too.
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self._eviction: Any = None
+        if max_items is not None or max_bytes is not None:
+            self._eviction = (
+                _LFUTracker() if eviction_policy == "lfu" else _LRUTracker()
+            )
+        self._usage_lock = Lock()
+        self._item_sizes: Dict[str, int] = {}  # {key: approximate bytes}
+        self._resident_bytes = 0
+        self._evictions = 0
+
+        # Lazy loading: only item metadata is read at startup and values are
+        # fetched from the database on first access
+        self.lazy_load = lazy_load
+
+        # Materialized get_all_for_agent results:
+        # {agent_name: (valid_until, {key: stored value})}. A view is dropped
+        # whenever a key the agent can see changes, and expires with its first
+        # expiring item, so repeated reads without changes skip the rebuild.
+        self.cache_views = cache_views
+        if max_items is not None or max_bytes is not None:
+            # Views would keep evicted values alive
+            self.cache_views = False
+        self._agent_views: Dict[str, Tuple[Optional[float], Dict[str, Any]]] = {}
+
+        # Optional background reaper thread for expired items
+        self._reaper_stop = Event()
+        self._reaper_thread: Optional[Thread] = None
+
+        # Database persistence (initialize after all attributes). A backend
+        # instance is shared with its owner (e.g. a ContextMeshPool), which
+        # connects and closes it.
+        #
+        # Writes go through a queue that coalesces and batches them, so the
+        # lock only covers the in-memory change. With "sync" durability every
+        # mutation commits the queue once it has released the lock; with
+        # "batched" a background thread commits it in groups and the writing
+        # thread waits for its group; with "async" nobody waits and close()
+        # commits the rest.
+        self.durability = durability
         self.db_backend = None
+        self._owns_backend = False
+        self._writes: Optional[WriteBehindQueue] = None
+        # Per thread: sequence number of the last write the current mutation
+        # must commit or wait for after releasing the lock
+        self._write_waits = local()
         if enable_persistence:
-            self.db_backend = create_database_backend(db_backend, **db_config)
-            self.db_backend.connect()
-            self._load_from_database()
+            if isinstance(db_backend, DatabaseBackend):
+                self.db_backend = db_backend
+            else:
+                self.db_backend = create_database_backend(db_backend, **db_config)
+                self.db_backend.connect()
+                self._owns_backend = True
+            self._writes = WriteBehindQueue(
+                self.db_backend,
+                user_id=user_id,
+                flush_interval=None if durability == "sync" else flush_interval,
+                max_batch=flush_batch_size,
+            )
+            if snapshot_path is None:
+                self._load_from_database()
+
+        # Warm start: restore the state saved by snapshot() instead of
+        # replaying every row from the database
+        if snapshot_path is not None:
+            self.restore(snapshot_path)
+
+        if reaper_interval is not None:
+            self.start_reaper(reaper_interval)
 
     def _load_from_database(self) -> None:
         """Load existing data from database on startup with user isolation."""
@@ -127,20 +933,62 @@ class ContextMesh:
             return
 
         # Load context items (user-scoped if user_id is provided)
-        if hasattr(self.db_backend, "get_all_context_items_for_user") and self.user_id:
-            db_items = self.db_backend.get_all_context_items_for_user(self.user_id)
+        user_scoped = (
+            hasattr(self.db_backend, "get_all_context_items_for_user") and self.user_id
+        )
+        if self.lazy_load:
+            # Only metadata is read (with expired rows filtered by the query);
+            # values are read through from the database on first access
+            if user_scoped:
+                metadata = self.db_backend.get_all_context_metadata_for_user(
+                    self.user_id, time.time()
+                )
+            else:
+                metadata = self.db_backend.get_all_context_metadata(time.time())
+            rows: Iterable[Tuple[Any, ...]] = (
+                (key, _UNLOADED, subscribers, ttl, created_at, topics)
+                for key, (subscribers, ttl, created_at, topics) in metadata.items()
+            )
         else:
-            db_items = self.db_backend.get_all_context_items()
+            if user_scoped:
+                db_items = self.db_backend.get_all_context_items_for_user(self.user_id)
+                db_topics = self.db_backend.get_all_context_topics_for_user(
+                    self.user_id
+                )
+            else:
+                db_items = self.db_backend.get_all_context_items()
+                db_topics = self.db_backend.get_all_context_topics()
+            rows = (
+                (key, value, subscribers, ttl, created_at, db_topics.get(key))
+                for key, (value, subscribers, ttl, created_at) in db_items.items()
+            )
 
-        for key, (value, subscribers, ttl, created_at) in db_items.items():
-            item = ContextItem(value, subscribers, ttl)
-            item.created_at = created_at
+        # Freshly deserialized values are private, so "deep" needs no copy
+        load_mode = (
+            "none" if self.copy_mode == "deep" or self.lazy_load else self.copy_mode
+        )
+        for key, value, subscribers, ttl, created_at, topics in rows:
+            if value is not _UNLOADED:
+                value = self._compress(value)
+            item = ContextItem(
+                value,
+                subscribers,
+                ttl,
+                copy_mode=("none" if isinstance(value, CompressedValue) else load_mode),
+                topics=topics,
+                created_at=created_at,
+            )
 
             # Skip expired items
             if not item.is_expired():
                 self._data[key] = item
-                if self.enable_indexing:
-                    self._add_to_index(key, subscribers)
+                self._track_expiry(key, item)
+                self._add_to_index(key, item)
+                self._record_change(key)
+                self._track_compression(key, value)
+                if self._eviction is not None and value is not _UNLOADED:
+                    with self._usage_lock:
+                        self._admit(key, item.value)
 
         # Load agent topics (user-scoped if user_id is provided)
         if hasattr(self.db_backend, "get_all_agent_topics_for_user") and self.user_id:
@@ -152,10 +1000,7 @@ class ContextMesh:
             self._agent_topics[agent_name] = topics
             # Rebuild topic subscribers mapping
             for topic in topics:
-                if topic not in self._topic_subscribers:
-                    self._topic_subscribers[topic] = []
-                if agent_name not in self._topic_subscribers[topic]:
-                    self._topic_subscribers[topic].append(agent_name)
+                self._topic_subscribers.setdefault(topic, {})[agent_name] = None
 
         # Load agent permissions (user-scoped if user_id is provided)
         if (
@@ -171,9 +1016,26 @@ class ContextMesh:
         self._agent_post_permissions.update(agent_permissions)
 
     def close(self) -> None:
-        """Close database connection and cleanup resources."""
-        if self.db_backend:
-            self.db_backend.close()
+        """Commit queued writes, close database connection and cleanup resources."""
+        self.stop_reaper()
+        try:
+            if self._writes is not None:
+                self._writes.close()
+        finally:
+            if self.db_backend and self._owns_backend:
+                self.db_backend.close()
+
+    def flush(self) -> None:
+        """
+        Commit the writes queued by the "batched" and "async" durability
+        levels now, in one transaction.
+
+        Raises:
+            Exception: The database error if the writes could not be
+                committed; they stay queued and are retried later
+        """
+        if self._writes is not None:
+            self._writes.flush()
 
     def __enter__(self):
         """Context manager entry."""
@@ -225,33 +1087,323 @@ class ContextMesh:
         """
 
         with self._lock:
-            # Collect all target agents
-            target_agents = set()
-
-            # Add direct subscribers
-            if subscribers:
-                target_agents.update(subscribers)
-
-            # Add topic subscribers
-            if topics:
-                for topic in topics:
-                    if topic in self._topic_subscribers:
-                        target_agents.update(self._topic_subscribers[topic])
-
-            # Use the combined list
-            if target_agents:
-                final_subscribers: Optional[List[str]] = list(target_agents)
+            # Topic subscribers are resolved at read time, so only the direct
+            # subscribers and the topics themselves are stored with the item
+            self._push_internal(key, value, subscribers, ttl, topics)
+
+    def push_many(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Add or update many context items at once.
+
+        The whole batch is applied under a single lock acquisition and the
+        items are persisted in a single database transaction.
+
+        Args:
+            items: List of dicts, each with a ``key`` and ``value`` and optional
+                ``subscribers``, ``topics`` and ``ttl`` entries that behave like
+                the corresponding ``push`` arguments. If a key appears more
+                than once, the last entry wins.
+        """
+        for entry in items:
+            if "key" not in entry or "value" not in entry:
+                raise ValueError("Each item passed to push_many needs a key and value")
+
+        with self._lock:
+            # Auto-cleanup if enabled and anything is due
+            if self.auto_cleanup and self._is_cleanup_due(time.time()):
+                self._cleanup_expired()
+
+            rows: Dict[str, Tuple[Any, ...]] = {}
+
+            for entry in items:
+                key = entry["key"]
+                value = entry["value"]
+                item = self._store_item(
+                    key,
+                    value,
+                    entry.get("subscribers"),
+                    entry.get("ttl"),
+                    entry.get("topics"),
+                )
+                rows.pop(key, None)  # Keep batch order for overwritten keys
+                rows[key] = self._item_row(key, item.value, item)
+
+            # Persist the whole batch in one transaction (with user isolation)
+            if self._writes is not None and rows:
+                self._persisted(self._writes.save_items(list(rows.values())))
+
+    def patch(
+        self, key: str, merge_patch: Any, agent_name: Optional[str] = None
+    ) -> bool:
+        """
+        Update part of a context item's value with a JSON merge patch.
+
+        ``{"status": "done", "draft": None}`` sets one member and removes
+        another, leaving the rest of a large value alone: only the dicts
+        along the patched paths are copied, and the database receives the
+        patch rather than the whole value. The item keeps its subscribers,
+        topics and expiry time. See apply_merge_patch() for the semantics.
+
+        Args:
+            key: The context key to update
+            merge_patch: The patch; a value that is not a dict replaces the
+                whole value
+            agent_name: Name of the requesting agent (for access control)
+
+        Returns:
+            True if the item was patched, False if it doesn't exist, has
+            expired or is not accessible by the agent
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return False
+            if agent_name is None:
+                if item.is_expired():
+                    return False
+            elif not item.is_accessible_by(
+                agent_name, self._agent_topics.get(agent_name)
+            ):
+                return False
+
+            # Take ownership of the patch like push() does with values
+            if self.copy_mode == "deep":
+                merge_patch = copy.deepcopy(merge_patch)
+            value = apply_merge_patch(self._plain_value(key, item), merge_patch)
+            value = self._compress(value)
+            if self.copy_mode == "frozen":
+                value = freeze_value(value)
+
+            # Replace the item rather than modify it, since pending change
+            # events may still reference it
+            patched = copy.copy(item)
+            patched.value = value
+            self._data[key] = patched
+            self._owned_lists.pop(key, None)
+            self._track_compression(key, value)
+            self._record_change(key, item)
+            if self._eviction is not None:
+                with self._usage_lock:
+                    self._admit(key, value)
+
+            if self._writes is not None:
+                row = self._item_row(key, value, patched)
+                # A compressed value is stored as a whole, not as JSON that
+                # the database could patch
+                if isinstance(merge_patch, dict) and not isinstance(
+                    value, CompressedValue
+                ):
+                    sequence = self._writes.patch_item(row, merge_patch)
+                else:
+                    sequence = self._writes.save_items([row])
+                self._persisted(sequence)
+
+        return True
+
+    def increment(
+        self,
+        key: str,
+        delta: Union[int, float] = 1,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> Union[int, float]:
+        """
+        Atomically add to a numeric context value.
+
+        A missing or expired key is created with ``delta`` as its value,
+        routed with ``subscribers``, ``topics`` and ``ttl`` like push(); an
+        existing item keeps its routing and expiry time. Concurrent
+        increments never lose updates, unlike a get() followed by a push().
+
+        Args:
+            key: The context key of the counter
+            delta: Amount to add (may be negative)
+            agent_name: Name of the requesting agent (for access control)
+            subscribers: Subscribers of a newly created counter
+            topics: Topics of a newly created counter
+            ttl: Time-to-live in seconds of a newly created counter
+
+        Returns:
+            The new value
+
+        Raises:
+            TypeError: If ``delta`` or the stored value is not a number
+            PermissionError: If the item is not accessible by the agent
+        """
+        if isinstance(delta, bool) or not isinstance(delta, (int, float)):
+            raise TypeError("delta must be a number")
+
+        with self._lock:
+            item = self._item_for_update(key, agent_name)
+            if item is None:
+                self._push_internal(key, delta, subscribers, ttl, topics)
+                return delta
+
+            value = self._value_of(key, item)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"Cannot increment context '{key}': its value is not a number"
+                )
+            value += delta
+
+            # A number is as small as an increment, so the row is saved
+            # whole; that lets queued increments of a key coalesce
+            self._replace_value(key, item, value)
+            return value
+
+    def append(
+        self,
+        key: str,
+        item: Any,
+        max_len: Optional[int] = None,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> int:
+        """
+        Atomically append an entry to a list context value.
+
+        A missing or expired key is created as a one-entry list, routed with
+        ``subscribers``, ``topics`` and ``ttl`` like push(); an existing item
+        keeps its routing and expiry time. The list is extended in place, so
+        an append does not copy the entries already stored, and only the new
+        entry is sent to the database. The list is copied once after it has
+        been read with copy_mode "frozen" or "none", where readers share it,
+        and on every append while change listeners are registered, since
+        each event carries the whole list.
+
+        Args:
+            key: The context key of the list
+            item: Entry to append
+            max_len: Keep only the last ``max_len`` entries, for bounded logs
+            agent_name: Name of the requesting agent (for access control)
+            subscribers: Subscribers of a newly created list
+            topics: Topics of a newly created list
+            ttl: Time-to-live in seconds of a newly created list
+
+        Returns:
+            The length of the list after the append
+
+        Raises:
+            TypeError: If the stored value is not a list
+            PermissionError: If the item is not accessible by the agent
+            ValueError: If ``max_len`` is less than 1
+        """
+        if max_len is not None and max_len < 1:
+            raise ValueError("max_len must be at least 1")
+
+        with self._lock:
+            current = self._item_for_update(key, agent_name)
+            if current is None:
+                self._push_internal(key, [item], subscribers, ttl, topics)
+                return 1
+
+            values = self._plain_value(key, current)
+            if not isinstance(values, list):
+                raise TypeError(
+                    f"Cannot append to context '{key}': its value is not a list"
+                )
+
+            # Take ownership of the entry like push() does with values
+            if self.copy_mode == "deep":
+                item = copy.deepcopy(item)
+            elif self.copy_mode == "frozen":
+                item = freeze_value(item)
+
+            trim = 0 if max_len is None else max(len(values) + 1 - max_len, 0)
+            removed = values[:trim] if trim and self.max_bytes is not None else ()
+            if self._owned_lists.get(key) is values:
+                values.append(item)
+                if trim:
+                    del values[:trim]
             else:
-                # If we have topics but no subscribers, use the special marker
-                # This ensures topic-based context with no subscribers is not accessible
-                final_subscribers = ["__NO_SUBSCRIBERS__"] if topics else None
+                # Readers may hold this list: extend a copy, which is kept
+                # private and extended in place from now on (see _shared_value)
+                values = values[trim:]
+                values.append(item)
+                self._owned_lists[key] = values
+
+            # Compression re-encodes the whole list, which is then private
+            stored = self._compress(values)
+            if stored is not values or self._change_listeners:
+                # The queued event reads the list once the lock is released
+                self._owned_lists.pop(key, None)
+                if stored is values and self.copy_mode == "frozen":
+                    stored = FrozenList(values)
+
+            appended = copy.copy(current)
+            appended.value = stored
+            self._data[key] = appended
+            self._track_compression(key, stored)
+            self._record_change(key, current)
+            if self._eviction is not None:
+                with self._usage_lock:
+                    size = None
+                    if (
+                        self.max_bytes is not None
+                        and key in self._item_sizes
+                        and not isinstance(stored, CompressedValue)
+                        and not isinstance(current.value, CompressedValue)
+                    ):
+                        size = self._item_sizes[key] + _approximate_size(item)
+                        size -= sum(_approximate_size(entry) for entry in removed)
+                    self._admit(key, stored, size)
+
+            if self._writes is not None:
+                # The row is read by page-ins until the entry is committed;
+                # queued appends never write the list itself
+                row = self._item_row(key, stored, appended)
+                if stored is values:
+                    sequence = self._writes.append_item(row, [item], trim)
+                else:
+                    sequence = self._writes.save_items([row])
+                self._persisted(sequence)
+
+            return len(values)
 
-            # Push with combined subscribers
-            self._push_internal(key, value, final_subscribers, ttl)
+    def _item_for_update(
+        self, key: str, agent_name: Optional[str]
+    ) -> Optional[ContextItem]:
+        """
+        Get the live item an update applies to, or None if it doesn't exist
+        or has expired. Assumes lock is held.
 
-            # Track topics if specified (for topic-based queries)
-            if topics:
-                self._key_topics[key] = topics.copy()
+        Raises:
+            PermissionError: If the item is not accessible by the agent
+        """
+        item = self._data.get(key)
+        if item is None or item.is_expired():
+            return None
+        if agent_name is not None and not item.is_accessible_by(
+            agent_name, self._agent_topics.get(agent_name)
+        ):
+            raise PermissionError(
+                f"Context '{key}' is not accessible by agent '{agent_name}'"
+            )
+        return item
+
+    def _replace_value(self, key: str, item: ContextItem, value: Any) -> None:
+        """
+        Store a new value for an existing item, keeping its routing and
+        expiry time, and persist it. Assumes lock is held.
+        """
+        # Replace the item rather than modify it, since pending change
+        # events may still reference it
+        updated = copy.copy(item)
+        updated.value = value
+        self._data[key] = updated
+        self._owned_lists.pop(key, None)
+        self._track_compression(key, value)
+        self._record_change(key, item)
+        if self._eviction is not None:
+            with self._usage_lock:
+                self._admit(key, value)
+        if self._writes is not None:
+            row = self._item_row(key, value, updated)
+            self._persisted(self._writes.save_items([row]))
 
     def _push_internal(
         self,
@@ -259,69 +1411,87 @@ class ContextMesh:
         value: Any,
         subscribers: Optional[List[str]] = None,
         ttl: Optional[float] = None,
+        topics: Optional[List[str]] = None,
     ) -> None:
         """
         Internal push method that assumes lock is already held.
         """
-        # Auto-cleanup if enabled and interval passed
-        if (
-            self.auto_cleanup
-            and time.time() - self._last_cleanup > self._cleanup_interval
-        ):
+        # Auto-cleanup if enabled and anything is due
+        if self.auto_cleanup and self._is_cleanup_due(time.time()):
             self._cleanup_expired()
 
-        # Remove old index entries if updating
-        if key in self._data and self.enable_indexing:
-            self._remove_from_index(key, self._data[key])
-
-        # Store the context item
-        item = ContextItem(value, subscribers, ttl)
-        self._data[key] = item
+        item = self._store_item(key, value, subscribers, ttl, topics)
 
         # Persist to database if enabled (with user isolation)
-        if self.db_backend:
-            if hasattr(self.db_backend, "save_context_item_for_user") and self.user_id:
-                self.db_backend.save_context_item_for_user(
-                    self.user_id, key, value, subscribers or [], ttl, item.created_at
-                )
-            else:
-                self.db_backend.save_context_item(
-                    key, value, subscribers or [], ttl, item.created_at
-                )
+        if self._writes is not None:
+            row = self._item_row(key, item.value, item)
+            self._persisted(self._writes.save_items([row]))
+
+    def _persisted(self, sequence: int) -> None:
+        """
+        Record that the current mutation queued writes up to ``sequence``.
+        Assumes lock is held.
 
-        # Update indexes if enabled
-        if self.enable_indexing:
-            self._add_to_index(key, subscribers or [])
+        Nothing is written here: "sync" commits the writes and "batched"
+        waits for the flusher in _after_commit, once the lock is released,
+        so a slow database never blocks other readers and writers. The
+        queue keeps the writes in the order of the in-memory changes.
+        """
+        if self.durability != "async":
+            self._write_waits.sequence = sequence
 
-    def _push_to_topics_internal(
-        self, key: str, value: Any, topics: List[str], ttl: Optional[float] = None
-    ) -> None:
+    @staticmethod
+    def _item_row(key: str, value: Any, item: ContextItem) -> Tuple[Any, ...]:
         """
-        Internal method to push context to topics. Assumes lock is already held.
+        Build the database row for an item.
 
-        Args:
-            key: Context key
-            value: Context value
-            topics: List of topics to broadcast to
-            ttl: Time to live in seconds
-        """
-        # Find all agents interested in any of these topics
-        interested_agents = set()
-        for topic in topics:
-            if topic in self._topic_subscribers:
-                interested_agents.update(self._topic_subscribers[topic])
-
-        # Track which topics this key was pushed to
-        self._key_topics[key] = topics.copy()
-
-        # If no interested agents, use special marker to indicate this is topic-based
-        # context with no subscribers (stored but not accessible by any agent)
-        if not interested_agents:
-            self._push_internal(key, value, subscribers=["__NO_SUBSCRIBERS__"], ttl=ttl)
-        else:
-            self._push_internal(
-                key, value, subscribers=list(interested_agents), ttl=ttl
-            )
+        Topics are only appended when present, keeping the row compatible with
+        backends that predate topic storage.
+        """
+        row: Tuple[Any, ...] = (key, value, item.subscribers, item.ttl, item.created_at)
+        if item.topics:
+            row += (list(item.topics),)
+        return row
+
+    def _store_item(
+        self,
+        key: str,
+        value: Any,
+        subscribers: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+        topics: Optional[List[str]] = None,
+    ) -> ContextItem:
+        """
+        Store an item in memory and update the indexes, without persisting it.
+
+        Assumes lock is already held.
+        """
+        # Remove old index entries if updating
+        old_item = self._data.get(key)
+        if old_item is not None:
+            self._remove_from_index(key, old_item)
+
+        # Store the context item; a compressed value is a private immutable
+        # copy already
+        stored = self._compress(value)
+        item = ContextItem(
+            stored,
+            subscribers,
+            ttl,
+            copy_mode="none" if stored is not value else self.copy_mode,
+            topics=topics,
+        )
+        self._data[key] = item
+        self._track_expiry(key, item)
+        self._add_to_index(key, item)
+        self._track_compression(key, stored)
+        self._record_change(key, old_item)
+
+        if self._eviction is not None:
+            with self._usage_lock:
+                self._admit(key, item.value)
+
+        return item
 
     def get(self, key: str, agent_name: Optional[str] = None) -> Optional[Any]:
         """
@@ -334,20 +1504,391 @@ class ContextMesh:
         Returns:
             The context value if accessible, None otherwise
         """
-        with self._lock:
+        with self._read_lock:
             item = self._data.get(key)
             if item is None:
                 return None
 
             # If no agent specified, skip access control (for system use)
             if agent_name is None:
-                return copy.deepcopy(item.value) if not item.is_expired() else None
+                return self._read_value(key, item) if not item.is_expired() else None
 
             # Check if agent has access
-            if item.is_accessible_by(agent_name):
-                return copy.deepcopy(item.value)
+            if item.is_accessible_by(agent_name, self._agent_topics.get(agent_name)):
+                return self._read_value(key, item)
+
+            return None
+
+    def get_many(
+        self, keys: List[str], agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve several context items under a single lock acquisition.
+
+        Args:
+            keys: The context keys to retrieve
+            agent_name: Name of the requesting agent (for access control)
+
+        Returns:
+            Dictionary of {key: value} for the requested keys that exist and
+            are accessible; missing, expired or inaccessible keys are omitted
+        """
+        result = {}
+        with self._read_lock:
+            agent_topics = self._agent_topics.get(agent_name) if agent_name else None
+            for key in keys:
+                item = self._data.get(key)
+                if item is None or key in result:
+                    continue
+
+                # If no agent specified, skip access control (for system use)
+                if agent_name is None:
+                    accessible = not item.is_expired()
+                else:
+                    accessible = item.is_accessible_by(agent_name, agent_topics)
 
+                if accessible:
+                    result[key] = self._read_value(key, item)
+
+        return result
+
+    def get_prefix(
+        self, prefix: str, agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve every context item whose key starts with a prefix.
+
+        Hierarchical keys such as ``project/123/summary`` can be read a level
+        at a time (``get_prefix("project/123/")``). Keys are looked up in a
+        sorted index, so the cost depends on the number of matching keys, not
+        on the size of the mesh.
+
+        Args:
+            prefix: Key prefix to match ("" matches every key)
+            agent_name: Name of the requesting agent (for access control)
+
+        Returns:
+            Dictionary of {key: value} in key order for the matching keys that
+            are accessible; expired or inaccessible keys are omitted
+        """
+        self._cleanup_if_due()
+
+        with self._read_lock:
+            items = list(self._iter_prefix(prefix, None, agent_name))
+            self._page_in_prefix(prefix, items)
+            return {key: self._read_value(key, item) for key, item in items}
+
+    def list_keys(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None,
+        limit: Optional[int] = None,
+        agent_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        List context keys in sorted order, optionally under a prefix.
+
+        Large key spaces can be paged through by passing the last key of one
+        page as ``start_after`` for the next.
+
+        Args:
+            prefix: Only list keys starting with this prefix
+            start_after: Only list keys that sort after this key
+            limit: Maximum number of keys to return
+            agent_name: Name of the requesting agent (for access control)
+
+        Returns:
+            Sorted list of the matching keys that are accessible
+
+        Raises:
+            ValueError: If limit is negative
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        self._cleanup_if_due()
+
+        with self._read_lock:
+            return [
+                key
+                for key, _ in itertools.islice(
+                    self._iter_prefix(prefix, start_after, agent_name), limit
+                )
+            ]
+
+    def _iter_prefix(
+        self, prefix: str, start_after: Optional[str], agent_name: Optional[str]
+    ) -> Iterator[Tuple[str, ContextItem]]:
+        """
+        Yield the accessible (key, item) pairs under a prefix in key order,
+        starting after ``start_after`` if given. Assumes lock is held.
+        """
+        if start_after is not None and start_after >= prefix:
+            keys = self._key_index().iter_from(start_after, inclusive=False)
+        else:
+            keys = self._key_index().iter_from(prefix)
+
+        agent_topics = self._agent_topics.get(agent_name) if agent_name else None
+        for key in keys:
+            if not key.startswith(prefix):
+                break
+            item = self._data[key]
+            # If no agent specified, skip access control (for system use)
+            if agent_name is None:
+                accessible = not item.is_expired()
+            else:
+                accessible = item.is_accessible_by(agent_name, agent_topics)
+            if accessible:
+                yield key, item
+
+    def _key_index(self) -> _SortedKeys:
+        """Get the sorted key index, building it on first use. Assumes lock is held."""
+        index = self._sorted_keys
+        if index is None:
+            # Readers may run in parallel ("shared_reads"); build it once
+            with self._usage_lock:
+                index = self._sorted_keys
+                if index is None:
+                    index = self._sorted_keys = _SortedKeys(self._data)
+        return index
+
+    def _page_in_prefix(
+        self, prefix: str, items: List[Tuple[str, ContextItem]]
+    ) -> None:
+        """
+        Page in the evicted or lazily loaded values among ``items`` with one
+        prefix query instead of one query per key. Assumes lock is held.
+        """
+        unloaded = [(key, item) for key, item in items if item.value is _UNLOADED]
+        if len(unloaded) < 2:
+            return
+
+        if hasattr(self.db_backend, "get_context_items_by_prefix_for_user") and (
+            self.user_id
+        ):
+            rows = self.db_backend.get_context_items_by_prefix_for_user(
+                self.user_id, prefix
+            )
+        else:
+            rows = self.db_backend.get_context_items_by_prefix(prefix)
+
+        with self._usage_lock:
+            for key, item in unloaded:
+                if item.value is _UNLOADED:
+                    self._page_in(key, item, rows)
+
+    def export_items(self, keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Export context items with their routing, for copying them to another
+        mesh.
+
+        Args:
+            keys: Keys to export (None exports every item)
+
+        Returns:
+            List of entries in the ``push_many`` format (``key``, ``value``,
+            ``subscribers``, ``topics`` and ``ttl``), where ``ttl`` is the time
+            each item has left. Missing and expired keys are omitted.
+        """
+        entries = []
+        with self._read_lock:
+            now = time.time()
+            selected = self._data if keys is None else dict.fromkeys(keys)
+            for key in selected:
+                item = self._data.get(key)
+                if item is None or item.is_expired():
+                    continue
+                entries.append(
+                    {
+                        "key": key,
+                        "value": self._read_value(key, item),
+                        "subscribers": item.subscribers or None,
+                        "topics": list(item.topics) or None,
+                        "ttl": (
+                            None
+                            if item.expires_at is None
+                            else max(item.expires_at - now, 0.0)
+                        ),
+                    }
+                )
+        return entries
+
+    def _export_value(self, value: Any) -> Any:
+        """Prepare a stored value to be handed out according to the copy mode."""
+        if isinstance(value, CompressedValue):
+            value = value.decompress()
+            return freeze_value(value) if self.copy_mode == "frozen" else value
+        if self.copy_mode == "deep":
+            return copy.deepcopy(value)
+        return value
+
+    def _read_value(self, key: str, item: ContextItem) -> Any:
+        """Hand out an item's value for a read. Assumes lock is held."""
+        return self._export_value(self._shared_value(key, item))
+
+    def _shared_value(self, key: str, item: ContextItem) -> Any:
+        """
+        Get an item's stored value for readers that may keep it.
+
+        append() extends a private list in place; in the "frozen" and "none"
+        copy modes, where readers share stored values, the item is given a
+        copy of that list first, which later appends copy once again.
+        Assumes lock is held.
+        """
+        value = self._value_of(key, item)
+        if self.copy_mode == "deep" or self._owned_lists.get(key) is not value:
+            return value
+        # Concurrent readers may get here together under a shared lock
+        with self._usage_lock:
+            if self._owned_lists.get(key) is value:
+                del self._owned_lists[key]
+                item.value = (
+                    FrozenList(value) if self.copy_mode == "frozen" else value[:]
+                )
+            return item.value
+
+    def _plain_value(self, key: str, item: ContextItem) -> Any:
+        """
+        Get an item's value for an update, decompressing a compressed value
+        into a new, private copy. Assumes lock is held.
+        """
+        value = self._value_of(key, item)
+        if isinstance(value, CompressedValue):
+            return value.decompress()
+        return value
+
+    def _compress(self, value: Any) -> Any:
+        """Compress a value to store if compression is enabled and it is large."""
+        if self.compress_threshold is None:
+            return value
+        return compress_value(value, self.compress_threshold)
+
+    def _value_of(self, key: str, item: ContextItem) -> Any:
+        """
+        Get an item's stored value, recording the access for eviction and
+        paging the value in if it was evicted or not loaded yet (lazy_load).
+        Assumes lock is held.
+        """
+        value = item.value
+        if self._eviction is None and value is not _UNLOADED:
+            return value
+        with self._usage_lock:
+            value = item.value
+            if value is _UNLOADED:
+                return self._page_in(key, item)
+            if key in self._eviction:
+                self._eviction.touch(key)
+            return value
+
+    def _page_in(
+        self,
+        key: str,
+        item: ContextItem,
+        rows: Optional[Dict[str, Tuple[Any, ...]]] = None,
+    ) -> Any:
+        """
+        Load an evicted or lazily loaded value from the database into its item.
+
+        Assumes lock and _usage_lock are held.
+        """
+        value = self._fetch_value(key, rows)
+        item.value = value
+        self._track_compression(key, value)
+        if self._eviction is not None:
+            self._admit(key, value)
+        return value
+
+    def _fetch_value(
+        self, key: str, rows: Optional[Dict[str, Tuple[Any, ...]]] = None
+    ) -> Any:
+        """
+        Read a value from the database, ready to be stored in an item.
+
+        Args:
+            key: The context key to read
+            rows: Rows already read from the database, keyed by context key
+        """
+        # A queued write is newer than the database row
+        write = self._writes.pending_item(key) if self._writes is not None else None
+        if write is not None:
+            row = write[1][1:] if write[0] != "delete_item" else None
+        elif rows is not None:
+            row = rows.get(key)
+        elif hasattr(self.db_backend, "get_context_item_for_user") and self.user_id:
+            row = self.db_backend.get_context_item_for_user(self.user_id, key)
+        else:
+            row = self.db_backend.get_context_item(key)
+
+        if row is None:
+            logger.warning("Context item %r is missing from the database", key)
             return None
+        value = self._compress(row[0])
+        return freeze_value(value) if self.copy_mode == "frozen" else value
+
+    def _admit(self, key: str, value: Any, size: Optional[int] = None) -> None:
+        """
+        Account for a resident value, then evict other values while the mesh
+        is over its limits. Assumes lock and _usage_lock are held.
+
+        ``size`` is the value's accounted size if the caller already knows it.
+        """
+        self._eviction.touch(key)
+        if self.max_bytes is not None:
+            if size is None:
+                size = sys.getsizeof(key) + _approximate_size(value)
+            self._resident_bytes += size - self._item_sizes.get(key, 0)
+            self._item_sizes[key] = size
+
+        while (self.max_items is not None and len(self._eviction) > self.max_items) or (
+            self.max_bytes is not None and self._resident_bytes > self.max_bytes
+        ):
+            victim = self._eviction.victim(protect=key)
+            if victim is None:
+                break  # A single value larger than max_bytes stays resident
+            self._evict(victim)
+
+    def _evict(self, key: str) -> None:
+        """Evict a resident value. Assumes lock and _usage_lock are held."""
+        self._eviction.discard(key)
+        self._resident_bytes -= self._item_sizes.pop(key, 0)
+        self._evictions += 1
+        # An evicted list must not stay in memory through append()
+        self._owned_lists.pop(key, None)
+        self._track_compression(key, None)
+
+        item = self._data[key]
+        if self.db_backend:
+            # Keep the metadata so routing and indexes are unaffected; the
+            # item is replaced rather than modified because pending change
+            # events may still reference it
+            stub = copy.copy(item)
+            stub.value = _UNLOADED
+            self._data[key] = stub
+        else:
+            del self._data[key]
+            self._remove_from_index(key, item)
+            self._record_change(key, item)
+
+    def _track_compression(self, key: str, value: Any) -> None:
+        """
+        Account for the value now held for ``key`` (None if there is none)
+        in the compression statistics. Assumes lock is held, and
+        _usage_lock too while paging values in.
+        """
+        previous = self._compressed_sizes.pop(key, None)
+        if previous is not None:
+            self._compressed_bytes -= previous[0]
+            self._uncompressed_bytes -= previous[1]
+        if isinstance(value, CompressedValue):
+            self._compressed_sizes[key] = (len(value.data), value.size)
+            self._compressed_bytes += len(value.data)
+            self._uncompressed_bytes += value.size
+
+    def _untrack_usage(self, key: str) -> None:
+        """Forget the usage of a removed key. Assumes lock is held."""
+        if self._eviction is not None:
+            with self._usage_lock:
+                self._eviction.discard(key)
+                self._resident_bytes -= self._item_sizes.pop(key, 0)
 
     def get_all_for_agent(self, agent_name: str) -> Dict[str, Any]:
         """
@@ -359,43 +1900,67 @@ class ContextMesh:
         Returns:
             Dictionary of {key: value} for all accessible context
         """
-        with self._lock:
-            # Auto-cleanup if enabled
-            if (
-                self.auto_cleanup
-                and time.time() - self._last_cleanup > self._cleanup_interval
-            ):
-                self._cleanup_expired()
-
-            # Use index for faster lookup if enabled
-            if (
-                self.enable_indexing
-                and self._agent_index is not None
-                and self._global_keys is not None
-            ):
-                result = {}
+        # Auto-cleanup if enabled (takes the write lock only when due)
+        self._cleanup_if_due()
+
+        with self._read_lock:
+            if not self.cache_views:
+                return {
+                    key: self._read_value(key, item)
+                    for key, item in self._iter_items_for_agent(agent_name)
+                }
+
+            view = self._agent_views.get(agent_name)
+            if view is None or (view[0] is not None and time.time() > view[0]):
+                view = self._build_agent_view(agent_name)
+
+            if self.copy_mode == "deep":
+                values = copy.deepcopy(view[1])
+            else:
+                values = dict(view[1])
+            # Compressed values are shared by copies
+            for key, value in values.items():
+                if isinstance(value, CompressedValue):
+                    values[key] = self._export_value(value)
+            return values
+
+    def _build_agent_view(
+        self, agent_name: str
+    ) -> Tuple[Optional[float], Dict[str, Any]]:
+        """
+        Materialize and cache the stored values visible to an agent.
 
-                # Get keys from agent index
-                agent_keys = self._agent_index.get(agent_name, [])
-                for key in agent_keys:
-                    item = self._data.get(key)
-                    if item and item.is_accessible_by(agent_name):
-                        result[key] = copy.deepcopy(item.value)
+        The view stays valid until a change to a key the agent could see
+        drops it (see _invalidate_views) or until its first item expires.
+        Assumes lock is held.
+        """
+        values = {}
+        valid_until = None
+        for key, item in self._iter_items_for_agent(agent_name):
+            values[key] = self._shared_value(key, item)
+            expires_at = item.expires_at
+            if expires_at is not None and (
+                valid_until is None or expires_at < valid_until
+            ):
+                valid_until = expires_at
 
-                # Get global context keys
-                for key in self._global_keys:
-                    item = self._data.get(key)
-                    if item and item.is_accessible_by(agent_name):
-                        result[key] = copy.deepcopy(item.value)
+        view = (valid_until, values)
+        self._agent_views[agent_name] = view
+        return view
 
-                return result
-            else:
-                # Fallback to full scan
-                result = {}
-                for key, item in self._data.items():
-                    if item.is_accessible_by(agent_name):
-                        result[key] = copy.deepcopy(item.value)
-                return result
+    def _invalidate_views(self, item: ContextItem) -> None:
+        """Drop the cached views of every agent that can see ``item``."""
+        views = self._agent_views
+        if not views:
+            return
+        if item.is_global:
+            views.clear()
+            return
+        for agent_name in item.subscriber_set:
+            views.pop(agent_name, None)
+        for topic in item.topics:
+            for agent_name in self._topic_subscribers.get(topic, ()):
+                views.pop(agent_name, None)
 
     def get_keys_for_agent(self, agent_name: str) -> List[str]:
         """
@@ -407,42 +1972,292 @@ class ContextMesh:
         Returns:
             List of accessible context keys
         """
-        with self._lock:
+        self._cleanup_if_due()
+
+        with self._read_lock:
             return self._get_keys_for_agent_internal(agent_name)
 
     def _get_keys_for_agent_internal(self, agent_name: str) -> List[str]:
         """
         Internal method to get keys for agent, assumes lock is already held.
         """
+        return [key for key, _ in self._iter_items_for_agent(agent_name)]
+
+    def _iter_items_for_agent(
+        self, agent_name: str
+    ) -> Iterator[Tuple[str, ContextItem]]:
+        """
+        Yield the (key, item) pairs accessible by an agent. Assumes lock is held.
+
+        With indexing enabled, visibility is the union of the agent's direct
+        keys, the global keys and the keys of every topic the agent is
+        currently subscribed to.
+        """
+        agent_topics = self._agent_topics.get(agent_name, [])
+
         # Use index for faster lookup if enabled
         if (
             self.enable_indexing
             and self._agent_index is not None
             and self._global_keys is not None
         ):
-            keys = []
+            candidates: List[Iterable[str]] = [
+                self._agent_index.get(agent_name, {}),
+                self._global_keys,
+            ]
+            candidates.extend(self._topic_keys.get(topic, {}) for topic in agent_topics)
+
+            seen = set()
+            for keys in candidates:
+                for key in keys:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    item = self._data.get(key)
+                    if item and item.is_accessible_by(agent_name, agent_topics):
+                        yield key, item
+        else:
+            # Fallback to full scan
+            for key, item in self._data.items():
+                if item.is_accessible_by(agent_name, agent_topics):
+                    yield key, item
 
-            # Get keys from agent index
-            agent_keys = self._agent_index.get(agent_name, [])
-            for key in agent_keys:
-                item = self._data.get(key)
-                if item and item.is_accessible_by(agent_name):
-                    keys.append(key)
+    def get_changes_since(
+        self,
+        cursor: int = 0,
+        agent_name: Optional[str] = None,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the context changes visible to an agent since a cursor.
+
+        Every mutation of the mesh takes the next value of a global sequence
+        number. Agents keep the ``cursor`` returned by the previous call and
+        receive only what changed after it, so the cost is proportional to the
+        number of changes rather than to the visible context. Start with
+        ``cursor=0`` to receive the full visible context.
+
+        Args:
+            cursor: Sequence number returned by the previous call
+            agent_name: Name of the requesting agent (None skips access control)
+            keys: Only report these keys (combined with ``topics``)
+            topics: Only report keys pushed to any of these topics
+
+        Returns:
+            Dictionary with the new ``cursor``, the ``changed`` {key: value}
+            items, the ``removed`` keys (deleted, expired or no longer
+            accessible) and a ``reset`` flag. When ``reset`` is True the cursor
+            was too old to answer incrementally (or the agent's subscriptions
+            changed) and ``changed`` holds the agent's full context, which
+            replaces any state derived from earlier calls.
+        """
+        self._cleanup_if_due()
+
+        key_filter = frozenset(keys) if keys else None
+        topic_filter = frozenset(topics) if topics else None
+        filtered = key_filter is not None or topic_filter is not None
+
+        def selected(key: str, key_topics: Iterable[str]) -> bool:
+            if not filtered:
+                return True
+            return (key_filter is not None and key in key_filter) or (
+                topic_filter is not None and not topic_filter.isdisjoint(key_topics)
+            )
+
+        with self._read_lock:
+            agent_topics = self._agent_topics.get(agent_name, []) if agent_name else []
+
+            if (
+                cursor < self._history_floor
+                or cursor > self._sequence
+                or (
+                    agent_name is not None
+                    and self._subscription_changes.get(agent_name, 0) > cursor
+                )
+            ):
+                if agent_name is None:
+                    items = (
+                        (key, item)
+                        for key, item in self._data.items()
+                        if not item.is_expired()
+                    )
+                else:
+                    items = self._iter_items_for_agent(agent_name)
+                return {
+                    "cursor": self._sequence,
+                    "changed": {
+                        key: self._read_value(key, item)
+                        for key, item in items
+                        if selected(key, item.topics)
+                    },
+                    "removed": [],
+                    "reset": True,
+                }
+
+            changed_keys = []
+            removed = []
+            # Walk the log from the newest change back to the cursor
+            for key in reversed(self._change_log):
+                record = self._change_log[key]
+                if record.seq <= cursor:
+                    break
+                if not selected(key, record.topics):
+                    continue
 
-            # Get global context keys
-            for key in self._global_keys:
                 item = self._data.get(key)
-                if item and item.is_accessible_by(agent_name):
-                    keys.append(key)
+                if agent_name is None:
+                    visible = item is not None and not item.is_expired()
+                    was_visible = True
+                else:
+                    visible = item is not None and item.is_accessible_by(
+                        agent_name, agent_topics
+                    )
+                    was_visible = record.could_see(agent_name, agent_topics)
 
-            return keys
-        else:
-            # Fallback to full scan
-            return [
-                key
-                for key, item in self._data.items()
-                if item.is_accessible_by(agent_name)
-            ]
+                if visible:
+                    changed_keys.append(key)
+                elif was_visible:
+                    removed.append(key)
+
+            # Report changes oldest first
+            changed = {
+                key: self._read_value(key, self._data[key])
+                for key in reversed(changed_keys)
+            }
+            removed.reverse()
+
+            return {
+                "cursor": self._sequence,
+                "changed": changed,
+                "removed": removed,
+                "reset": False,
+            }
+
+    def current_cursor(self) -> int:
+        """
+        Get a cursor for the current state, so that get_changes_since() only
+        reports later changes.
+        """
+        with self._read_lock:
+            return self._sequence
+
+    def wait_for(
+        self,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        since: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Block until matching context changes, instead of polling.
+
+        Waiting threads sleep on a condition variable that is notified after
+        every committed mutation, including TTL expiry.
+
+        Args:
+            keys: Keys to watch (None with no topics watches everything)
+            topics: Topics to watch; matches keys pushed to any of them
+            agent_name: Only wake for changes this agent can see
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            since: Cursor to wait from. Defaults to the current sequence number,
+                so only future changes count; pass 0 to also accept context
+                that already exists.
+
+        Returns:
+            The matching changes in the ``get_changes_since`` format, or None
+            if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if since is None:
+            with self._read_lock:
+                since = self._sequence
+        cursor = since
+
+        while True:
+            changes = self.get_changes_since(cursor, agent_name, keys, topics)
+            if changes["changed"] or changes["removed"]:
+                return changes
+            cursor = changes["cursor"]
+
+            wait_time = None
+            if deadline is not None:
+                wait_time = deadline - time.monotonic()
+                if wait_time <= 0:
+                    return None
+
+            # Wake up when the next item expires so expiry is noticed even
+            # without a background reaper
+            until_expiry = self._time_until_next_expiry()
+            if until_expiry is not None and (
+                wait_time is None or until_expiry < wait_time
+            ):
+                wait_time = until_expiry
+
+            with self._change_cond:
+                self._waiting += 1
+                try:
+                    # Writers bump the sequence before notifying, so checking it
+                    # under the condition lock cannot miss a wakeup
+                    if self._sequence == cursor:
+                        self._change_cond.wait(wait_time)
+                finally:
+                    self._waiting -= 1
+
+    def on_change(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+    ) -> int:
+        """
+        Register a callback for context changes.
+
+        Callbacks run after the change is committed and the mesh lock has been
+        released, in commit order, one at a time. Each receives an event dict
+        with ``type`` ("set", "remove" or "expire"), ``key``, ``value`` (None
+        unless the type is "set") and ``sequence``. Expiry events fire when
+        expired items are cleaned up; use ``reaper_interval`` for timely
+        expiry events.
+
+        Args:
+            callback: Function called with each matching event
+            keys: Only report these keys (combined with ``topics``)
+            topics: Only report keys pushed to any of these topics
+            agent_name: Only report changes this agent can (or could) see
+
+        Returns:
+            Listener id for remove_change_listener()
+        """
+        listener = _ChangeListener(callback, keys, topics, agent_name)
+        with self._lock:
+            listener_id = next(self._listener_ids)
+            self._change_listeners[listener_id] = listener
+        return listener_id
+
+    def remove_change_listener(self, listener_id: int) -> bool:
+        """
+        Remove a callback registered with on_change().
+
+        Returns:
+            True if the listener was removed, False if it didn't exist
+        """
+        with self._lock:
+            return self._change_listeners.pop(listener_id, None) is not None
+
+    def _add_wakeup(self, callback: Callable[[], None]) -> int:
+        """Register a callback run after every commit; returns its id."""
+        with self._change_cond:
+            wakeup_id = next(self._listener_ids)
+            self._wakeups[wakeup_id] = callback
+        return wakeup_id
+
+    def _remove_wakeup(self, wakeup_id: int) -> None:
+        """Remove a callback registered with _add_wakeup()."""
+        with self._change_cond:
+            self._wakeups.pop(wakeup_id, None)
 
     def remove(self, key: str) -> bool:
         """
@@ -459,26 +2274,17 @@ class ContextMesh:
             if item is None:
                 return False
 
-        # Remove from database if enabled (with user isolation)
-        if self.db_backend:
-            if (
-                hasattr(self.db_backend, "delete_context_item_for_user")
-                and self.user_id
-            ):
-                self.db_backend.delete_context_item_for_user(self.user_id, key)
-            else:
-                self.db_backend.delete_context_item(key)
+            # Remove from indexes while still holding the lock so concurrent
+            # readers never observe an index entry without its item
+            self._remove_from_index(key, item)
+            self._record_change(key, item)
+            self._untrack_usage(key)
 
-            # Remove from indexes
-            if self.enable_indexing:
-                self._remove_from_index(key, item)
+            # Remove from database if enabled (with user isolation)
+            if self._writes is not None:
+                self._persisted(self._writes.delete_item(key))
 
-            return True
-        else:
-            # Remove from indexes if indexing is enabled
-            if self.enable_indexing:
-                self._remove_from_index(key, item)
-            return True
+        return True
 
     def cleanup_expired(self) -> int:
         """
@@ -489,23 +2295,20 @@ class ContextMesh:
         """
         with self._lock:
             current_time = time.time()
-            expired_keys = [
-                key for key, item in self._data.items() if item.is_expired()
-            ]
-
-            # Remove from memory
-            for key in expired_keys:
-                item = self._data.pop(key)
-                if self.enable_indexing:
-                    self._remove_from_index(key, item)
+            expired_keys = self._expire_due(current_time)
 
-            # Remove from database if enabled
-            if self.db_backend:
-                db_removed = self.db_backend.cleanup_expired(current_time)
-                # Database might have found more expired items than memory
-                return max(len(expired_keys), db_removed)
+            if self._writes is None:
+                return len(expired_keys)
+            self._last_cleanup = current_time
+            if self.durability != "sync":
+                self._writes.cleanup_expired(current_time)
+                return len(expired_keys)
 
-            return len(expired_keys)
+        # Sweep the database outside the lock, after the writes queued so far
+        self._writes.flush()
+        db_removed = self.db_backend.cleanup_expired(current_time)
+        # Database might have found more expired items than memory
+        return max(len(expired_keys), db_removed)
 
     def clear(self) -> None:
         """Remove all context items from the mesh."""
@@ -513,6 +2316,10 @@ class ContextMesh:
             self._data.clear()
 
             # Clear indexes
+            self._sorted_keys = None
+            self._owned_lists.clear()
+            self._compressed_sizes.clear()
+            self._compressed_bytes = self._uncompressed_bytes = 0
             if (
                 self.enable_indexing
                 and self._agent_index is not None
@@ -520,23 +2327,252 @@ class ContextMesh:
             ):
                 self._agent_index.clear()
                 self._global_keys.clear()
+                if self._key_agents is not None:
+                    self._key_agents.clear()
+
+            self._expiry_heap.clear()
+
+            if self._eviction is not None:
+                with self._usage_lock:
+                    self._eviction.clear()
+                    self._item_sizes.clear()
+                    self._resident_bytes = 0
+
+            # Nothing before this point can be replayed as a delta any more
+            self._sequence += 1
+            self._change_log.clear()
+            self._tombstones.clear()
+            self._subscription_changes.clear()
+            self._history_floor = self._sequence
+            self._agent_views.clear()
 
             # Clear topic mappings
             self._agent_topics.clear()
             self._topic_subscribers.clear()
-            self._key_topics.clear()
+            self._topic_keys.clear()
             self._agent_post_permissions.clear()
 
             # Clear database if enabled (with user isolation)
-        if self.db_backend:
-            if hasattr(self.db_backend, "clear_all_for_user") and self.user_id:
-                self.db_backend.clear_all_for_user(self.user_id)
-            else:
-                self.db_backend.clear_all()
+            if self._writes is not None:
+                self._persisted(self._writes.clear())
+
+    def snapshot(self, path: str) -> None:
+        """
+        Write the whole mesh state to a binary snapshot file.
+
+        Items, indexes, topic subscriptions and posting permissions are
+        pickled (protocol 5, with out-of-band buffers) into a single file that
+        restore() or the ``snapshot_path`` constructor argument load back much
+        faster than replaying the database. The file is replaced atomically.
+
+        Args:
+            path: File to write
+        """
+        fetched = self._fetch_unloaded_values()
+        with self._read_lock:
+            data = {}
+            for key, item in self._data.items():
+                if item.value is _UNLOADED:
+                    # Snapshot evicted or lazily loaded values without
+                    # making them resident; an item changed since they were
+                    # read is fetched again
+                    entry = fetched.get(key)
+                    item = copy.copy(item)
+                    if entry is not None and entry[0] == item.version:
+                        item.value = entry[1]
+                    else:
+                        item.value = self._fetch_value(key)
+                data[key] = item
+
+            state = {
+                "user_id": self.user_id,
+                "sequence": self._sequence,
+                "data": data,
+                "expiry_heap": self._expiry_heap,
+                "agent_index": self._agent_index,
+                "global_keys": self._global_keys,
+                "key_agents": self._key_agents,
+                "topic_keys": self._topic_keys,
+                "agent_topics": self._agent_topics,
+                "topic_subscribers": self._topic_subscribers,
+                "agent_post_permissions": self._agent_post_permissions,
+            }
+            buffers: List[pickle.PickleBuffer] = []
+            payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+
+        def aligned(offset: int) -> int:
+            return -(-offset // _SNAPSHOT_ALIGNMENT) * _SNAPSHOT_ALIGNMENT
+
+        # Place the pickle and then each buffer on an aligned offset
+        chunks: List[Any] = [payload] + [buffer.raw() for buffer in buffers]
+        offset = _SNAPSHOT_HEADER.size + _SNAPSHOT_BUFFER.size * len(buffers)
+        layout = []
+        for chunk in chunks:
+            offset = aligned(offset)
+            layout.append((offset, chunk))
+            offset += memoryview(chunk).nbytes
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as snapshot_file:
+            snapshot_file.write(
+                _SNAPSHOT_HEADER.pack(
+                    _SNAPSHOT_MAGIC,
+                    _SNAPSHOT_VERSION,
+                    len(buffers),
+                    layout[0][0],
+                    len(payload),
+                )
+            )
+            for start, chunk in layout[1:]:
+                snapshot_file.write(_SNAPSHOT_BUFFER.pack(start, chunk.nbytes))
+            for start, chunk in layout:
+                snapshot_file.seek(start)
+                snapshot_file.write(chunk)
+        os.replace(temp_path, path)
+
+    def restore(self, path: str) -> None:
+        """
+        Replace the in-memory state of the mesh with a snapshot.
+
+        The database is not modified. Like clear(), restoring starts a new
+        change history, so cursors from before the restore get a reset from
+        get_changes_since(). Only restore snapshots you created: they are
+        pickles and may run arbitrary code when loaded.
+
+        Args:
+            path: Snapshot file written by snapshot()
+
+        Raises:
+            ValueError: If the file is not a snapshot, has an unsupported
+                version or belongs to a different user_id
+        """
+        state = self._read_snapshot(path)
+        if state["user_id"] != self.user_id:
+            raise ValueError(
+                f"Snapshot belongs to user_id {state['user_id']!r}, "
+                f"not {self.user_id!r}"
+            )
+
+        with self._lock:
+            data: Dict[str, ContextItem] = state["data"]
+            for item in data.values():
+                # Share routing objects with items pushed from now on
+                item.subscriber_set = _intern(item.subscriber_set)
+                item.topics = _intern(item.topics)
+                if self.copy_mode == "frozen":
+                    item.value = freeze_value(item.value)
+            self._data = data
+            self._sorted_keys = None
+            self._owned_lists.clear()
+            self._expiry_heap = state["expiry_heap"]
+            self._agent_topics = state["agent_topics"]
+            self._topic_subscribers = state["topic_subscribers"]
+            self._topic_keys = state["topic_keys"]
+            self._agent_post_permissions = state["agent_post_permissions"]
+
+            if self.enable_indexing and state["agent_index"] is not None:
+                self._agent_index = state["agent_index"]
+                self._global_keys = state["global_keys"]
+                self._key_agents = state["key_agents"]
+            elif self.enable_indexing:
+                # The snapshot was taken without indexes; build them
+                self._agent_index, self._global_keys, self._key_agents = {}, {}, {}
+                for key, item in data.items():
+                    self._add_to_index(key, item)
+
+            # Nothing before this point can be replayed as a delta any more
+            self._sequence = max(self._sequence, state["sequence"]) + 1
+            self._change_log.clear()
+            self._tombstones.clear()
+            self._subscription_changes.clear()
+            self._history_floor = self._sequence
+            self._agent_views.clear()
+
+            self._compressed_sizes.clear()
+            self._compressed_bytes = self._uncompressed_bytes = 0
+            for key, item in data.items():
+                self._track_compression(key, item.value)
+
+            if self._eviction is not None:
+                with self._usage_lock:
+                    self._eviction.clear()
+                    self._item_sizes.clear()
+                    self._resident_bytes = 0
+                    for key, item in list(data.items()):
+                        # Skip items evicted while admitting earlier ones
+                        if self._data.get(key) is item:
+                            self._admit(key, item.value)
+
+    def _fetch_unloaded_values(self) -> Dict[str, Tuple[int, Any]]:
+        """
+        Read the values of evicted and lazily loaded items for snapshot().
+
+        Values with a queued write are read from the queue; the others are
+        read with one query, made without holding the lock.
+
+        Returns:
+            Dictionary of {key: (version, value)}, where a value is valid as
+            long as the item keeps that version
+        """
+        fetched: Dict[str, Tuple[int, Any]] = {}
+        versions: Dict[str, int] = {}
+        with self._read_lock:
+            for key, item in self._data.items():
+                if item.value is not _UNLOADED:
+                    continue
+                if self._writes is not None and self._writes.pending_item(key):
+                    fetched[key] = (item.version, self._fetch_value(key))
+                else:
+                    versions[key] = item.version
+        if not versions:
+            return fetched
+
+        # Without a queued write, the database row is the latest value
+        if hasattr(self.db_backend, "get_all_context_items_for_user") and (
+            self.user_id
+        ):
+            rows = self.db_backend.get_all_context_items_for_user(self.user_id)
+        else:
+            rows = self.db_backend.get_all_context_items()
+        for key, version in versions.items():
+            fetched[key] = (version, self._fetch_value(key, rows))
+        return fetched
+
+    @staticmethod
+    def _read_snapshot(path: str) -> Dict[str, Any]:
+        """Load the state pickled in a snapshot file."""
+        with open(path, "rb") as snapshot_file:
+            with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if len(mm) < _SNAPSHOT_HEADER.size:
+                    raise ValueError(f"{path} is not a ContextMesh snapshot")
+                magic, version, buffer_count, offset, size = (
+                    _SNAPSHOT_HEADER.unpack_from(mm)
+                )
+                if magic != _SNAPSHOT_MAGIC:
+                    raise ValueError(f"{path} is not a ContextMesh snapshot")
+                if version != _SNAPSHOT_VERSION:
+                    raise ValueError(f"Unsupported snapshot version: {version}")
+
+                buffers = []
+                for index in range(buffer_count):
+                    start, length = _SNAPSHOT_BUFFER.unpack_from(
+                        mm, _SNAPSHOT_HEADER.size + index * _SNAPSHOT_BUFFER.size
+                    )
+                    # Slicing copies, so nothing references the map once closed
+                    buffers.append(mm[start : start + length])
+                # Unpickling allocates one object after another and nothing
+                # can become garbage, so collector passes are pure overhead
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    return pickle.loads(mm[offset : offset + size], buffers=buffers)
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
 
     def size(self) -> int:
         """Get the total number of context items."""
-        with self._lock:
+        with self._read_lock:
             return len(self._data)
 
     def get_stats(self) -> Dict[str, Any]:
@@ -546,17 +2582,23 @@ class ContextMesh:
         Returns:
             Dictionary with mesh statistics
         """
-        with self._lock:
+        with self._read_lock:
             total_items = len(self._data)
-            expired_items = sum(1 for item in self._data.values() if item.is_expired())
-            global_items = sum(
-                1
-                for item in self._data.values()
-                if len(item.subscribers) == 0 and not item.is_expired()
-            )
+            expired_keys = self._collect_due_keys(time.time())
+            expired_items = len(expired_keys)
+            if self.enable_indexing and self._global_keys is not None:
+                global_items = len(self._global_keys) - sum(
+                    1 for key in expired_keys if key in self._global_keys
+                )
+            else:
+                global_items = sum(
+                    1
+                    for item in self._data.values()
+                    if item.is_global and not item.is_expired()
+                )
             active_items = total_items - expired_items
 
-            return {
+            stats = {
                 "total_items": total_items,
                 "active_items": active_items,
                 "expired_items": expired_items,
@@ -565,6 +2607,23 @@ class ContextMesh:
                 "total_topics": len(self._topic_subscribers),
                 "agents_with_topics": len(self._agent_topics),
             }
+            if self._eviction is not None:
+                with self._usage_lock:
+                    stats["resident_items"] = len(self._eviction)
+                    stats["resident_bytes"] = self._resident_bytes
+                    stats["evictions"] = self._evictions
+            if self.compress_threshold is not None:
+                stats["compressed_items"] = len(self._compressed_sizes)
+                stats["compressed_bytes"] = self._compressed_bytes
+                stats["uncompressed_bytes"] = self._uncompressed_bytes
+                stats["compression_ratio"] = (
+                    self._uncompressed_bytes / self._compressed_bytes
+                    if self._compressed_bytes
+                    else 1.0
+                )
+        if self._writes is not None and self.durability != "sync":
+            stats.update(self._writes.get_stats())
+        return stats
 
     def register_agent_topics(self, agent_name: str, topics: List[str]) -> None:
         """
@@ -575,37 +2634,37 @@ class ContextMesh:
             topics: List of topics the agent wants to receive context for
         """
         with self._lock:
+            previous_topics = self._agent_topics.get(agent_name, [])
             self._agent_topics[agent_name] = topics.copy()
 
-            # Update reverse mapping (always needed)
+            # Update reverse mapping (always needed): drop the agent from topics
+            # it no longer follows, then add it to the new ones
+            for topic in set(previous_topics).difference(topics):
+                self._discard_topic_subscriber(topic, agent_name)
             for topic in topics:
-                if topic not in self._topic_subscribers:
-                    self._topic_subscribers[topic] = []
-                if agent_name not in self._topic_subscribers[topic]:
-                    self._topic_subscribers[topic].append(agent_name)
+                self._topic_subscribers.setdefault(topic, {})[agent_name] = None
 
-        # Persist to database if enabled (with user isolation)
-        if self.db_backend:
-            if hasattr(self.db_backend, "save_agent_topics_for_user") and self.user_id:
-                self.db_backend.save_agent_topics_for_user(
-                    self.user_id, agent_name, topics
+            self._record_subscription_change(agent_name)
+
+            # Persist to database if enabled (with user isolation)
+            if self._writes is not None:
+                self._persisted(
+                    self._writes.save_agent_topics(agent_name, list(topics))
                 )
-            else:
-                self.db_backend.save_agent_topics(agent_name, topics)
 
     def get_topics_for_agent(self, agent_name: str) -> List[str]:
         """Get all topics an agent is subscribed to."""
-        with self._lock:
+        with self._read_lock:
             return self._agent_topics.get(agent_name, []).copy()
 
     def get_subscribers_for_topic(self, topic: str) -> List[str]:
         """Get all agents subscribed to a specific topic."""
-        with self._lock:
-            return self._topic_subscribers.get(topic, []).copy()
+        with self._read_lock:
+            return list(self._topic_subscribers.get(topic, {}))
 
     def get_all_topics(self) -> List[str]:
         """Get all available topics."""
-        with self._lock:
+        with self._read_lock:
             return list(self._topic_subscribers.keys())
 
     def unsubscribe_from_topics(self, agent_name: str, topics: List[str]) -> None:
@@ -621,7 +2680,8 @@ class ContextMesh:
             current_topics = self._agent_topics.get(agent_name, [])
 
             # Remove specified topics from agent's subscriptions
-            updated_topics = [t for t in current_topics if t not in topics]
+            removed_topics = set(topics)
+            updated_topics = [t for t in current_topics if t not in removed_topics]
 
             # Update agent topics
             if updated_topics:
@@ -631,37 +2691,21 @@ class ContextMesh:
                 self._agent_topics.pop(agent_name, None)
 
             # Update reverse mapping (topic -> agents)
-            for topic in topics:
-                if topic in self._topic_subscribers:
-                    if agent_name in self._topic_subscribers[topic]:
-                        self._topic_subscribers[topic].remove(agent_name)
-                    # If no agents left subscribed to this topic, remove it
-                    if not self._topic_subscribers[topic]:
-                        del self._topic_subscribers[topic]
+            for topic in removed_topics:
+                self._discard_topic_subscriber(topic, agent_name)
+
+            self._record_subscription_change(agent_name)
 
             # Persist changes to database if enabled (with user isolation)
-            if self.db_backend:
+            if self._writes is not None:
                 if updated_topics:
-                    if (
-                        hasattr(self.db_backend, "save_agent_topics_for_user")
-                        and self.user_id
-                    ):
-                        self.db_backend.save_agent_topics_for_user(
-                            self.user_id, agent_name, updated_topics
-                        )
-                    else:
-                        self.db_backend.save_agent_topics(agent_name, updated_topics)
+                    sequence = self._writes.save_agent_topics(
+                        agent_name, list(updated_topics)
+                    )
                 else:
                     # Remove agent from database if no topics left
-                    if (
-                        hasattr(self.db_backend, "remove_agent_topics_for_user")
-                        and self.user_id
-                    ):
-                        self.db_backend.remove_agent_topics_for_user(
-                            self.user_id, agent_name
-                        )
-                    else:
-                        self.db_backend.remove_agent_topics(agent_name)
+                    sequence = self._writes.remove_agent_topics(agent_name)
+                self._persisted(sequence)
 
     def delete_topic(self, topic: str) -> int:
         """
@@ -681,92 +2725,79 @@ class ContextMesh:
         with self._lock:
             context_items_deleted = 0
 
-            # Find all context items pushed to this topic
+            # Find all context items pushed to this topic (via the topic index)
             keys_to_delete = []
-            for key, key_topics in self._key_topics.items():
-                if topic in key_topics:
-                    # If this context was only pushed to this topic, delete it entirely
-                    if len(key_topics) == 1:
-                        keys_to_delete.append(key)
-                    else:
-                        # Otherwise, just remove this topic from the key's topics
-                        key_topics.remove(topic)
+            keys_to_update = []
+            for key in self._topic_keys.pop(topic, {}):
+                item = self._data[key]
+                # If this context was only pushed to this topic, delete it entirely
+                if len(item.topics) == 1:
+                    keys_to_delete.append(key)
+                else:
+                    # Otherwise, just remove this topic from the key's topics.
+                    # The value is needed to persist the updated item, and
+                    # the queued save references it from now on.
+                    value = self._shared_value(key, item)
+                    item = self._data[key]
+                    # Replace the item rather than modify it, since pending
+                    # change events may still reference it
+                    updated = copy.copy(item)
+                    updated.topics = _intern(
+                        tuple(t for t in item.topics if t != topic)
+                    )
+                    self._data[key] = updated
+                    self._owned_lists.pop(key, None)
+                    self._record_change(key, item)
+                    keys_to_update.append((key, value))
 
             # Delete context items that were only for this topic
             for key in keys_to_delete:
-                if key in self._data:
-                    item = self._data.pop(key)
-                    if self.enable_indexing:
-                        self._remove_from_index(key, item)
-                    context_items_deleted += 1
-
-                # Remove from key_topics mapping
-                self._key_topics.pop(key, None)
+                item = self._data.pop(key)
+                self._remove_from_index(key, item)
+                self._record_change(key, item)
+                self._untrack_usage(key)
+                context_items_deleted += 1
 
-            # Remove topic from all agent subscriptions
+            # Remove topic from the subscriptions of the agents following it
             agents_to_update = []
-            agents_to_remove = []
-            for agent_name, agent_topics in self._agent_topics.items():
-                if topic in agent_topics:
-                    agent_topics.remove(topic)
-                    agents_to_update.append(agent_name)
-                    # If agent has no topics left, mark for removal
-                    if not agent_topics:
-                        agents_to_remove.append(agent_name)
-
-            # Remove agents that have no topics left
-            for agent_name in agents_to_remove:
-                self._agent_topics.pop(agent_name, None)
-
-            # Remove topic from topic_subscribers mapping
-            self._topic_subscribers.pop(topic, None)
+            for agent_name in self._topic_subscribers.pop(topic, {}):
+                agent_topics = self._agent_topics.get(agent_name)
+                if agent_topics is None or topic not in agent_topics:
+                    continue
+                agent_topics.remove(topic)
+                agents_to_update.append(agent_name)
+                self._record_subscription_change(agent_name)
+                # Remove agents that have no topics left
+                if not agent_topics:
+                    del self._agent_topics[agent_name]
 
             # Persist changes to database if enabled (with user isolation)
-            if self.db_backend:
+            if self._writes is not None:
+                writes = self._writes
                 # Delete context items from database
                 for key in keys_to_delete:
-                    if (
-                        hasattr(self.db_backend, "delete_context_item_for_user")
-                        and self.user_id
-                    ):
-                        self.db_backend.delete_context_item_for_user(self.user_id, key)
-                    else:
-                        self.db_backend.delete_context_item(key)
+                    writes.delete_item(key)
+
+                # Store the remaining topics of items that were also pushed elsewhere
+                rows = [
+                    self._item_row(key, value, self._data[key])
+                    for key, value in keys_to_update
+                ]
+                if rows:
+                    writes.save_items(rows)
 
                 # Update agent topics in database
                 for agent_name in agents_to_update:
                     if agent_name in self._agent_topics:
-                        if (
-                            hasattr(self.db_backend, "save_agent_topics_for_user")
-                            and self.user_id
-                        ):
-                            self.db_backend.save_agent_topics_for_user(
-                                self.user_id, agent_name, self._agent_topics[agent_name]
-                            )
-                        else:
-                            self.db_backend.save_agent_topics(
-                                agent_name, self._agent_topics[agent_name]
-                            )
+                        writes.save_agent_topics(
+                            agent_name, list(self._agent_topics[agent_name])
+                        )
                     else:
                         # Agent has no topics left, remove from database
-                        if (
-                            hasattr(self.db_backend, "remove_agent_topics_for_user")
-                            and self.user_id
-                        ):
-                            self.db_backend.remove_agent_topics_for_user(
-                                self.user_id, agent_name
-                            )
-                        else:
-                            self.db_backend.remove_agent_topics(agent_name)
+                        writes.remove_agent_topics(agent_name)
 
                 # Clean up topic-specific data if backend supports it
-                if (
-                    hasattr(self.db_backend, "delete_topic_data_for_user")
-                    and self.user_id
-                ):
-                    self.db_backend.delete_topic_data_for_user(self.user_id, topic)
-                elif hasattr(self.db_backend, "delete_topic_data"):
-                    self.db_backend.delete_topic_data(topic)
+                self._persisted(writes.delete_topic_data(topic))
 
             return context_items_deleted
 
@@ -780,7 +2811,7 @@ class ContextMesh:
         Returns:
             Dictionary mapping topic names to lists of available keys
         """
-        with self._lock:
+        with self._read_lock:
             agent_topics = self._agent_topics.get(agent_name, [])
             result: Dict[str, List[str]] = {}
 
@@ -788,16 +2819,12 @@ class ContextMesh:
             for topic in agent_topics:
                 result[topic] = []
 
-            # Find keys that were pushed to each topic and are accessible to this agent
-            for key, key_topics in self._key_topics.items():
-                item = self._data.get(key)
-                if item and item.is_accessible_by(agent_name):
-                    # Add this key to all relevant topics the agent is subscribed to
-                    for topic in key_topics:
-                        if (
-                            topic in result
-                        ):  # Only include topics the agent is subscribed to
-                            result[topic].append(key)
+            # Look up the keys of each subscribed topic in the topic index
+            for topic, topic_keys in result.items():
+                for key in self._topic_keys.get(topic, {}):
+                    item = self._data.get(key)
+                    if item and item.is_accessible_by(agent_name, agent_topics):
+                        topic_keys.append(key)
 
             # Also include any other accessible keys in a special "other" category
             all_accessible_keys = self._get_keys_for_agent_internal(agent_name)
@@ -813,68 +2840,383 @@ class ContextMesh:
 
             return result
 
-    def _add_to_index(self, key: str, subscribers: List[str]) -> None:
+    def _add_to_index(self, key: str, item: ContextItem) -> None:
         """Add key to appropriate indexes."""
+        if self._sorted_keys is not None:
+            self._sorted_keys.add(key)
+
+        # The topic index is always maintained (topic visibility depends on it)
+        for topic in item.topics:
+            self._topic_keys.setdefault(topic, {})[key] = None
+
         if (
             not self.enable_indexing
             or self._agent_index is None
             or self._global_keys is None
+            or self._key_agents is None
         ):
             return
 
-        if len(subscribers) == 0:
+        if item.is_global:
             # Global context
-            if key not in self._global_keys:
-                self._global_keys.append(key)
-        else:
+            self._global_keys[key] = None
+        elif item.subscriber_set:
             # Agent-specific context
-            for agent in subscribers:
-                if agent not in self._agent_index:
-                    self._agent_index[agent] = []
-                if key not in self._agent_index[agent]:
-                    self._agent_index[agent].append(key)
+            for agent in item.subscriber_set:
+                self._agent_index.setdefault(agent, {})[key] = None
+            self._key_agents[key] = item.subscriber_set
 
     def _remove_from_index(self, key: str, item: ContextItem) -> None:
         """Remove key from all indexes."""
+        self._owned_lists.pop(key, None)
+        self._track_compression(key, None)
+
+        # An item being replaced keeps its key (it is still in _data)
+        if self._sorted_keys is not None and key not in self._data:
+            self._sorted_keys.discard(key)
+
+        for topic in item.topics:
+            topic_keys = self._topic_keys.get(topic)
+            if topic_keys is not None:
+                topic_keys.pop(key, None)
+                if not topic_keys:
+                    del self._topic_keys[topic]
+
         if (
             not self.enable_indexing
             or self._agent_index is None
             or self._global_keys is None
+            or self._key_agents is None
         ):
             return
 
         # Remove from global keys
-        if key in self._global_keys:
-            self._global_keys.remove(key)
+        self._global_keys.pop(key, None)
 
-        # Remove from agent indexes
-        for agent, keys in self._agent_index.items():
-            if key in keys:
-                keys.remove(key)
+        # Remove from the indexes of the agents holding this key only
+        for agent in self._key_agents.pop(key, ()):
+            agent_keys = self._agent_index.get(agent)
+            if agent_keys is not None:
+                agent_keys.pop(key, None)
+                if not agent_keys:
+                    del self._agent_index[agent]
 
-    def _cleanup_expired(self) -> None:
-        """Internal method to clean up expired items."""
-        current_time = time.time()
+    def _record_change(
+        self,
+        key: str,
+        previous: Optional[ContextItem] = None,
+        expired: bool = False,
+    ) -> None:
+        """
+        Assign the next sequence number to a mutation of ``key``.
+
+        ``previous`` is the version being replaced or removed, if any, and
+        ``expired`` marks removals caused by TTL expiry. Assumes lock is
+        already held.
+        """
+        self._sequence += 1
+
+        if self._agent_views:
+            if previous is not None:
+                self._invalidate_views(previous)
+            current = self._data.get(key)
+            if current is not None:
+                self._invalidate_views(current)
+
+        # Move the key to the end of the log so it stays ordered by sequence
+        record = self._change_log.pop(key, None) or _ChangeRecord()
+        record.seq = self._sequence
+        if previous is not None:
+            record.add_audience(previous)
+        self._change_log[key] = record
+
+        item = self._data.get(key)
+        if self._change_listeners:
+            if item is not None:
+                event_type = "set"
+            else:
+                event_type = "expire" if expired else "remove"
+            self._pending_events.append((event_type, key, self._sequence, item, record))
+
+        if item is not None:
+            item.version = self._sequence
+            record.add_audience(item)
+            self._tombstones.pop(key, None)
+            return
+
+        # Keep a bounded number of removals; older cursors need a reset
+        self._tombstones[key] = None
+        while len(self._tombstones) > self._max_tombstones:
+            oldest = next(iter(self._tombstones))
+            del self._tombstones[oldest]
+            dropped = self._change_log.pop(oldest)
+            self._history_floor = max(self._history_floor, dropped.seq)
+
+    def _record_subscription_change(self, agent_name: str) -> None:
+        """Record that an agent's topic subscriptions changed. Assumes lock is held."""
+        self._sequence += 1
+        self._subscription_changes[agent_name] = self._sequence
+        self._agent_views.pop(agent_name, None)
+
+    def _after_commit(self) -> None:
+        """
+        Wake waiters, fire listeners and make the mutation's database writes
+        durable once the write lock is released.
+        """
+        sequence = 0
+        if self._writes is not None:
+            sequence = getattr(self._write_waits, "sequence", 0)
+            if sequence:
+                self._write_waits.sequence = 0
+        if self._waiting:
+            with self._change_cond:
+                self._change_cond.notify_all()
+        if self._wakeups:
+            with self._change_cond:
+                wakeups = list(self._wakeups.values())
+            for wakeup in wakeups:
+                wakeup()
+        if self._pending_events:
+            self._dispatch_events()
+        if sequence:
+            if self.durability == "sync":
+                # Commits the writes of concurrent mutations along with ours
+                self._writes.flush(through=sequence)
+            else:
+                self._writes.wait(sequence)
+
+    def _dispatch_events(self) -> None:
+        """Deliver queued change events to matching listeners, in order."""
+        # Reentrant so listeners may modify the mesh; nested calls continue
+        # draining the same queue, which keeps events in commit order
+        with self._dispatch_lock:
+            while True:
+                try:
+                    event_type, key, sequence, item, record = (
+                        self._pending_events.popleft()
+                    )
+                except IndexError:
+                    return
+
+                for listener in list(self._change_listeners.values()):
+                    event = self._event_for_listener(
+                        listener, event_type, key, sequence, item, record
+                    )
+                    if event is not None:
+                        self._notify_listener(listener, event)
+
+    def _event_for_listener(
+        self,
+        listener: _ChangeListener,
+        event_type: str,
+        key: str,
+        sequence: int,
+        item: Optional[ContextItem],
+        record: _ChangeRecord,
+    ) -> Optional[Dict[str, Any]]:
+        """Build the event a listener should receive, or None if it doesn't match."""
+        if listener.keys is not None or listener.topics is not None:
+            key_match = listener.keys is not None and key in listener.keys
+            topic_match = (
+                listener.topics is not None
+                and not listener.topics.isdisjoint(record.topics)
+            )
+            if not (key_match or topic_match):
+                return None
+
+        if listener.agent_name is not None:
+            agent_topics = self._agent_topics.get(listener.agent_name, [])
+            accessible = item is not None and item.is_accessible_by(
+                listener.agent_name, agent_topics
+            )
+            if not accessible:
+                if not record.could_see(listener.agent_name, agent_topics):
+                    return None
+                # Losing access to a key looks like a removal to the agent
+                if event_type == "set":
+                    event_type = "remove"
+
+        return {
+            "type": event_type,
+            "key": key,
+            "value": self._export_value(item.value) if event_type == "set" else None,
+            "sequence": sequence,
+        }
+
+    @staticmethod
+    def _notify_listener(listener: _ChangeListener, event: Dict[str, Any]) -> None:
+        """Call a listener, logging instead of propagating its errors."""
+        try:
+            listener.callback(event)
+        except Exception:
+            logger.exception("ContextMesh change listener failed for %s", event["key"])
+
+    def _discard_topic_subscriber(self, topic: str, agent_name: str) -> None:
+        """Remove an agent from a topic's subscribers. Assumes lock is held."""
+        subscribers = self._topic_subscribers.get(topic)
+        if subscribers is None:
+            return
+        subscribers.pop(agent_name, None)
+        # If no agents left subscribed to this topic, remove it
+        if not subscribers:
+            del self._topic_subscribers[topic]
+
+    def _track_expiry(self, key: str, item: ContextItem) -> None:
+        """Add an item to the expiry heap. Assumes lock is already held."""
+        expires_at = item.expires_at
+        if expires_at is None:
+            return
+
+        heap = self._expiry_heap
+        heapq.heappush(heap, (expires_at, key))
+
+        # Overwrites and removals leave stale entries behind; rebuild the heap
+        # once they dominate so its size stays proportional to live items
+        if len(heap) > 2 * len(self._data) + 64:
+            self._expiry_heap = [
+                (live_item.expires_at, item_key)
+                for item_key, live_item in self._data.items()
+                if live_item.ttl is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _is_live_entry(self, expires_at: float, key: str) -> bool:
+        """Check whether a heap entry still describes the stored item."""
+        item = self._data.get(key)
+        return item is not None and item.expires_at == expires_at
+
+    def _expire_due(self, current_time: float) -> List[str]:
+        """
+        Remove items whose expiry time has passed, using the expiry heap.
+
+        Cost is proportional to the number of entries popped, not to the size
+        of the mesh. Assumes lock is already held.
+
+        Returns:
+            List of expired keys removed from memory
+        """
+        heap = self._expiry_heap
         expired_keys = []
 
-        for key, item in self._data.items():
-            if item.is_expired():
-                expired_keys.append(key)
+        while heap and heap[0][0] < current_time:
+            expires_at, key = heapq.heappop(heap)
+            if not self._is_live_entry(expires_at, key):
+                continue  # Stale entry for an overwritten or removed item
 
-        for key in expired_keys:
             item = self._data.pop(key)
-            if self.enable_indexing:
-                self._remove_from_index(key, item)
+            self._remove_from_index(key, item)
+            self._record_change(key, item, expired=True)
+            self._untrack_usage(key)
+            expired_keys.append(key)
+
+        return expired_keys
+
+    def _collect_due_keys(self, current_time: float) -> List[str]:
+        """
+        Find expired keys without modifying the heap (safe under the read lock).
+
+        Walks the heap as a tree and prunes every subtree whose root has not
+        expired yet, so only due entries (and their direct children) are visited.
+        """
+        heap = self._expiry_heap
+        due = []
+        seen = set()
+        stack = [0] if heap else []
+
+        while stack:
+            index = stack.pop()
+            expires_at, key = heap[index]
+            if expires_at >= current_time:
+                continue
+            if key not in seen and self._is_live_entry(expires_at, key):
+                seen.add(key)
+                due.append(key)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    stack.append(child)
+
+        return due
+
+    def _is_cleanup_due(self, current_time: float) -> bool:
+        """Check if items are due to expire or database cleanup is due."""
+        heap = self._expiry_heap
+        return bool(heap and heap[0][0] < current_time) or (
+            current_time - self._last_cleanup > self._cleanup_interval
+        )
+
+    def _time_until_next_expiry(self) -> Optional[float]:
+        """Seconds until the next item expires, if auto-cleanup will expire it."""
+        if not self.auto_cleanup:
+            return None
+        try:
+            return max(self._expiry_heap[0][0] - time.time() + 0.001, 0.0)
+        except IndexError:
+            return None
+
+    def _cleanup_if_due(self) -> None:
+        """Run auto-cleanup under the write lock if anything is due."""
+        if self.auto_cleanup and self._is_cleanup_due(time.time()):
+            with self._lock:
+                # Re-check: another thread may have cleaned up while we waited
+                if self._is_cleanup_due(time.time()):
+                    self._cleanup_expired()
+
+    def _cleanup_expired(self) -> None:
+        """
+        Internal method to clean up expired items. Assumes lock is already held.
+
+        In-memory expiry is driven by the expiry heap and runs whenever items
+        are due; the database sweep only runs once per cleanup interval.
+        """
+        current_time = time.time()
+        self._expire_due(current_time)
+
+        if current_time - self._last_cleanup <= self._cleanup_interval:
+            return
 
         # Clean up database if enabled (with user isolation)
-        if self.db_backend:
-            if hasattr(self.db_backend, "cleanup_expired_for_user") and self.user_id:
-                self.db_backend.cleanup_expired_for_user(self.user_id, current_time)
-            else:
-                self.db_backend.cleanup_expired(current_time)
+        if self._writes is not None:
+            self._persisted(self._writes.cleanup_expired(current_time))
 
         self._last_cleanup = current_time
 
+    def start_reaper(self, interval: float = 1.0) -> None:
+        """
+        Start a background thread that removes expired items periodically.
+
+        Args:
+            interval: Seconds between reaper runs
+        """
+        if interval <= 0:
+            raise ValueError("Reaper interval must be positive")
+        if self._reaper_thread is not None and self._reaper_thread.is_alive():
+            return
+
+        self._reaper_stop.clear()
+        self._reaper_thread = Thread(
+            target=self._reaper_loop,
+            args=(interval,),
+            name="syntha-context-reaper",
+            daemon=True,
+        )
+        self._reaper_thread.start()
+
+    def stop_reaper(self) -> None:
+        """Stop the background reaper thread if it is running."""
+        thread = self._reaper_thread
+        if thread is None:
+            return
+        self._reaper_stop.set()
+        thread.join()
+        self._reaper_thread = None
+
+    def _reaper_loop(self, interval: float) -> None:
+        """Body of the background reaper thread."""
+        while not self._reaper_stop.wait(interval):
+            if self._is_cleanup_due(time.time()):
+                with self._lock:
+                    self._cleanup_expired()
+
     def set_agent_post_permissions(
         self, agent_name: str, allowed_topics: List[str]
     ) -> None:
@@ -889,16 +3231,12 @@ class ContextMesh:
             self._agent_post_permissions[agent_name] = list(allowed_topics)
 
             # Persist to database if enabled (with user isolation)
-            if self.db_backend:
-                if (
-                    hasattr(self.db_backend, "save_agent_permissions_for_user")
-                    and self.user_id
-                ):
-                    self.db_backend.save_agent_permissions_for_user(
-                        self.user_id, agent_name, allowed_topics
+            if self._writes is not None:
+                self._persisted(
+                    self._writes.save_agent_permissions(
+                        agent_name, list(allowed_topics)
                     )
-                else:
-                    self.db_backend.save_agent_permissions(agent_name, allowed_topics)
+                )
 
     def get_agent_post_permissions(self, agent_name: str) -> List[str]:
         """
@@ -912,6 +3250,19 @@ class ContextMesh:
         """
         return self._agent_post_permissions.get(agent_name, [])
 
+    def get_all_post_permissions(self) -> Dict[str, List[str]]:
+        """
+        Get the posting permissions of every agent that has them.
+
+        Returns:
+            Dictionary of {agent_name: allowed_topics}
+        """
+        with self._read_lock:
+            return {
+                agent_name: list(topics)
+                for agent_name, topics in self._agent_post_permissions.items()
+            }
+
     def can_agent_post_to_topic(self, agent_name: str, topic: str) -> bool:
         """
         Check if an agent is allowed to post to a specific topic.
@@ -21,15 +21,121 @@ Supports easy switching to PostgreSQL, MySQL, or other databases.
 
 import json
 import sqlite3
+import sys
 import time
 from abc import ABC, abstractmethod
-from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from threading import RLock
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .compression import CompressedValue
+
+
+def _topics_json(topics: Optional[List[str]] = None) -> Optional[str]:
+    """Serialize an item's topics, storing NULL for items without topics."""
+    return json.dumps(topics) if topics else None
+
+
+def _json_text(value: Any) -> str:
+    """Serialize a value as JSON text, decompressing compressed values."""
+    if isinstance(value, CompressedValue):
+        return value.json()
+    return json.dumps(value)
+
+
+def _sqlite_value(value: Any) -> Union[str, bytes]:
+    """Serialize a value for SQLite; compressed values are stored as BLOBs."""
+    if isinstance(value, CompressedValue):
+        return value.to_bytes()
+    return json.dumps(value)
+
+
+def _from_sqlite_value(stored: Union[str, bytes]) -> Any:
+    """Deserialize a value stored by _sqlite_value()."""
+    if isinstance(stored, bytes):
+        return CompressedValue.from_bytes(stored)
+    return json.loads(stored)
+
+
+def _stored_json(stored: Union[str, bytes]) -> Any:
+    """Deserialize a value stored by _sqlite_value(), decompressing it."""
+    value = _from_sqlite_value(stored)
+    if isinstance(value, CompressedValue):
+        return value.decompress()
+    return value
+
+
+# Entries appended (or removed) per statement by the SQLite backend, keeping
+# json_insert() and json_remove() within SQLite's function argument limit
+_SQLITE_JSON_BATCH = 50
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Get the smallest string that sorts after every string starting with
+    ``prefix``, or None if there is none (every larger string matches).
+    """
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    following = ord(prefix[-1]) + 1
+    if 0xD800 <= following <= 0xDFFF:
+        following = 0xE000  # Surrogates cannot be encoded
+    return prefix[:-1] + chr(following)
+
+
+def _jsonb_merge_patch(
+    target: str, target_params: List[Any], patch: Dict[str, Any]
+) -> Tuple[str, List[Any]]:
+    """
+    Build a PostgreSQL expression applying a JSON merge patch to the JSONB
+    expression ``target``.
+
+    Replaced members are merged with ``||``, removed members dropped with
+    ``-`` and nested patches applied with ``jsonb_set``.
+
+    Returns:
+        The expression and its parameters, in placeholder order
+    """
+    sql = f"(CASE WHEN jsonb_typeof({target}) = 'object' THEN {target} ELSE '{{}}'::jsonb END)"
+    params = target_params + target_params
+
+    removed = [name for name, value in patch.items() if value is None]
+    if removed:
+        sql = f"({sql} - %s::text[])"
+        params.append(removed)
+    replaced = {
+        name: value
+        for name, value in patch.items()
+        if value is not None and not isinstance(value, dict)
+    }
+    if replaced:
+        sql = f"({sql} || %s::jsonb)"
+        params.append(json.dumps(replaced))
+
+    for name, value in patch.items():
+        if isinstance(value, dict):
+            member, member_params = _jsonb_merge_patch(
+                f"({target} -> %s)", target_params + [name], value
+            )
+            sql = f"jsonb_set({sql}, ARRAY[%s::text], {member})"
+            params = params + [name] + member_params
+    return sql, params
+
+
+def _like_prefix(prefix: str) -> str:
+    """Get a LIKE pattern matching strings that start with ``prefix``."""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
 
 
 class DatabaseBackend(ABC):
     """Abstract base class for database backends."""
 
+    # Whether the save methods accept CompressedValue objects (see
+    # syntha.compression); other backends are given the decompressed value
+    stores_compressed_values = False
+
     @abstractmethod
     def connect(self) -> None:
         """Establish database connection."""
@@ -53,8 +159,13 @@ class DatabaseBackend(ABC):
         subscribers: List[str],
         ttl: Optional[float],
         created_at: float,
+        topics: Optional[List[str]] = None,
     ) -> None:
-        """Save a context item to the database."""
+        """Save a context item to the database.
+
+        ``subscribers`` holds the direct subscribers only; agents subscribed to
+        any of ``topics`` are resolved when the item is read.
+        """
         pass
 
     @abstractmethod
@@ -77,6 +188,57 @@ class DatabaseBackend(ABC):
         """
         pass
 
+    def patch_context_item(self, key: str, patch: Dict[str, Any]) -> bool:
+        """Apply a JSON merge patch (RFC 7386) to a context item's value.
+
+        Returns:
+            True if the item was patched, False if it doesn't exist
+
+        Backends should override this to patch the value in the database
+        instead of rewriting the item.
+        """
+        # Default implementation: read, patch and save the whole item
+        from .context import apply_merge_patch
+
+        row = self.get_context_item(key)
+        if row is None:
+            return False
+        value, subscribers, ttl, created_at = row
+        topics = self.get_all_context_topics().get(key)
+        value = apply_merge_patch(value, patch)
+        if topics:
+            self.save_context_item(key, value, subscribers, ttl, created_at, topics)
+        else:
+            self.save_context_item(key, value, subscribers, ttl, created_at)
+        return True
+
+    def append_to_context_item(self, key: str, items: List[Any], trim: int = 0) -> bool:
+        """Append entries to a context item's list value.
+
+        Args:
+            key: The context key
+            items: Entries to append
+            trim: Number of entries to remove from the front afterwards
+
+        Returns:
+            True if the item was updated, False if it doesn't exist
+
+        Backends should override this to extend the value in the database
+        instead of rewriting the item.
+        """
+        # Default implementation: read, extend and save the whole item
+        row = self.get_context_item(key)
+        if row is None:
+            return False
+        value, subscribers, ttl, created_at = row
+        topics = self.get_all_context_topics().get(key)
+        value = (list(value) + list(items))[trim:]
+        if topics:
+            self.save_context_item(key, value, subscribers, ttl, created_at, topics)
+        else:
+            self.save_context_item(key, value, subscribers, ttl, created_at)
+        return True
+
     @abstractmethod
     def get_all_context_items(
         self,
@@ -139,6 +301,79 @@ class DatabaseBackend(ABC):
         """Get all agent permission mappings."""
         pass
 
+    def save_context_items(
+        self, items: List[Tuple[str, Any, List[str], Optional[float], float]]
+    ) -> None:
+        """Save several context items.
+
+        Args:
+            items: List of (key, value, subscribers, ttl, created_at) tuples,
+                optionally followed by the item's topics
+
+        Backends should override this to write the batch in one transaction.
+        """
+        # Default implementation for backward compatibility
+        for key, value, subscribers, ttl, created_at, *topics in items:
+            self.save_context_item(key, value, subscribers, ttl, created_at, *topics)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made inside the block into one transaction.
+
+        The writes are committed together when the block exits and rolled
+        back if it raises. Blocks may be nested; only the outermost one
+        commits.
+
+        Backends should override this; the default commits every write on
+        its own.
+        """
+        yield
+
+    def get_all_context_topics(self) -> Dict[str, List[str]]:
+        """Get the topics of all context items that were pushed to topics.
+
+        Returns:
+            Dict mapping keys to their topics (items without topics are omitted)
+        """
+        # Default implementation for backends that don't store topics
+        return {}
+
+    def get_all_context_metadata(
+        self, current_time: Optional[float] = None
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Get all context items without their values.
+
+        Args:
+            current_time: If given, items that expired before this time are skipped
+
+        Returns:
+            Dict mapping keys to (subscribers, ttl, created_at, topics) tuples
+        """
+        # Default implementation for backends without a metadata query
+        topics = self.get_all_context_topics()
+        return {
+            key: (subscribers, ttl, created_at, topics.get(key))
+            for key, (_, subscribers, ttl, created_at) in (
+                self.get_all_context_items().items()
+            )
+            if current_time is None or ttl is None or created_at + ttl >= current_time
+        }
+
+    def get_context_items_by_prefix(
+        self, prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """Get the context items whose keys start with ``prefix``.
+
+        Returns:
+            Dict mapping keys to (value, subscribers, ttl, created_at) tuples
+        """
+        # Default implementation for backends without a prefix query
+        return {
+            key: row
+            for key, row in self.get_all_context_items().items()
+            if key.startswith(prefix)
+        }
+
     # User isolation methods (optional - backward compatibility)
     def save_context_item_for_user(
         self,
@@ -148,10 +383,26 @@ class DatabaseBackend(ABC):
         subscribers: List[str],
         ttl: Optional[float],
         created_at: float,
+        topics: Optional[List[str]] = None,
     ) -> None:
         """Save a context item for a specific user."""
         # Default implementation for backward compatibility
-        self.save_context_item(key, value, subscribers, ttl, created_at)
+        if topics:
+            self.save_context_item(key, value, subscribers, ttl, created_at, topics)
+        else:
+            self.save_context_item(key, value, subscribers, ttl, created_at)
+
+    def save_context_items_for_user(
+        self,
+        user_id: str,
+        items: List[Tuple[str, Any, List[str], Optional[float], float]],
+    ) -> None:
+        """Save several context items for a specific user."""
+        # Default implementation for backward compatibility
+        for key, value, subscribers, ttl, created_at, *topics in items:
+            self.save_context_item_for_user(
+                user_id, key, value, subscribers, ttl, created_at, *topics
+            )
 
     def get_context_item_for_user(
         self, user_id: str, key: str
@@ -167,11 +418,44 @@ class DatabaseBackend(ABC):
         # Default implementation for backward compatibility
         return self.get_all_context_items()
 
+    def get_all_context_topics_for_user(self, user_id: str) -> Dict[str, List[str]]:
+        """Get the topics of all context items for a specific user."""
+        # Default implementation for backward compatibility
+        return self.get_all_context_topics()
+
+    def get_context_items_by_prefix_for_user(
+        self, user_id: str, prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """Get the context items of a specific user whose keys start with ``prefix``."""
+        # Default implementation for backward compatibility
+        return self.get_context_items_by_prefix(prefix)
+
+    def get_all_context_metadata_for_user(
+        self, user_id: str, current_time: Optional[float] = None
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Get all context items for a specific user without their values."""
+        # Default implementation for backward compatibility
+        return self.get_all_context_metadata(current_time)
+
     def delete_context_item_for_user(self, user_id: str, key: str) -> bool:
         """Delete a context item for a specific user."""
         # Default implementation for backward compatibility
         return self.delete_context_item(key)
 
+    def patch_context_item_for_user(
+        self, user_id: str, key: str, patch: Dict[str, Any]
+    ) -> bool:
+        """Apply a JSON merge patch to a context item for a specific user."""
+        # Default implementation for backward compatibility
+        return self.patch_context_item(key, patch)
+
+    def append_to_context_item_for_user(
+        self, user_id: str, key: str, items: List[Any], trim: int = 0
+    ) -> bool:
+        """Append entries to a context item's list value for a specific user."""
+        # Default implementation for backward compatibility
+        return self.append_to_context_item(key, items, trim)
+
     def save_agent_topics_for_user(
         self, user_id: str, agent_name: str, topics: List[str]
     ) -> None:
@@ -232,10 +516,14 @@ class DatabaseBackend(ABC):
 class SQLiteBackend(DatabaseBackend):
     """SQLite database backend implementation."""
 
+    # Compressed values are stored as BLOBs
+    stores_compressed_values = True
+
     def __init__(self, db_path: str = "syntha_context.db"):
         self.db_path = db_path
         self.connection = None
-        self._lock = Lock()
+        self._lock = RLock()
+        self._transaction_depth = 0
 
     def __enter__(self):
         """Context manager entry."""
@@ -377,6 +665,7 @@ class SQLiteBackend(DatabaseBackend):
                     subscribers TEXT NOT NULL,
                     ttl REAL,
                     created_at REAL NOT NULL,
+                    topics TEXT,
                     PRIMARY KEY (key, user_id)
                 )
             """
@@ -413,6 +702,13 @@ class SQLiteBackend(DatabaseBackend):
                 # Column already exists
                 pass
 
+            # Topics are resolved to subscribers at read time, so store them
+            try:
+                cursor.execute("ALTER TABLE context_items ADD COLUMN topics TEXT")
+            except sqlite3.OperationalError:
+                # Column already exists
+                pass
+
             try:
                 cursor.execute("ALTER TABLE agent_topics ADD COLUMN user_id TEXT")
             except sqlite3.OperationalError:
@@ -433,7 +729,7 @@ class SQLiteBackend(DatabaseBackend):
                 "CREATE INDEX IF NOT EXISTS idx_context_ttl ON context_items(ttl)"
             )
 
-            self.connection.commit()
+            self._commit()
 
     def save_context_item(
         self,
@@ -442,6 +738,7 @@ class SQLiteBackend(DatabaseBackend):
         subscribers: List[str],
         ttl: Optional[float],
         created_at: float,
+        topics: Optional[List[str]] = None,
     ) -> None:
         """Save a context item to SQLite."""
         import time
@@ -457,18 +754,19 @@ class SQLiteBackend(DatabaseBackend):
                     cursor.execute(
                         """
                         INSERT OR REPLACE INTO context_items 
-                        (key, value, subscribers, ttl, created_at) 
-                        VALUES (?, ?, ?, ?, ?)
+                        (key, value, subscribers, ttl, created_at, topics) 
+                        VALUES (?, ?, ?, ?, ?, ?)
                     """,
                         (
                             key,
-                            json.dumps(value),
+                            _sqlite_value(value),
                             json.dumps(subscribers),
                             ttl,
                             created_at,
+                            _topics_json(topics),
                         ),
                     )
-                    self.connection.commit()
+                    self._commit()
                     return  # Success
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e).lower() and attempt < max_retries - 1:
@@ -479,6 +777,37 @@ class SQLiteBackend(DatabaseBackend):
             except Exception:
                 raise
 
+    def save_context_items(
+        self, items: List[Tuple[str, Any, List[str], Optional[float], float]]
+    ) -> None:
+        """Save several context items to SQLite in one transaction."""
+        rows = [
+            (
+                key,
+                _sqlite_value(value),
+                json.dumps(subscribers),
+                ttl,
+                created_at,
+                _topics_json(*topics),
+            )
+            for key, value, subscribers, ttl, created_at, *topics in items
+        ]
+        with self._lock:
+            self._ensure_connection()
+            try:
+                self.connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO context_items 
+                    (key, value, subscribers, ttl, created_at, topics) 
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                self._commit()
+            except sqlite3.Error:
+                self.connection.rollback()
+                raise
+
     def get_context_item(
         self, key: str
     ) -> Optional[Tuple[Any, List[str], Optional[float], float]]:
@@ -503,7 +832,7 @@ class SQLiteBackend(DatabaseBackend):
                         return None
 
                     value_json, subscribers_json, ttl, created_at = row
-                    value = json.loads(value_json)
+                    value = _from_sqlite_value(value_json)
                     subscribers = json.loads(subscribers_json)
 
                     return (value, subscribers, ttl, created_at)
@@ -524,9 +853,101 @@ class SQLiteBackend(DatabaseBackend):
         with self._lock:
             cursor = self.connection.cursor()
             cursor.execute("DELETE FROM context_items WHERE key = ?", (key,))
-            self.connection.commit()
+            self._commit()
+            return cursor.rowcount > 0
+
+    def patch_context_item(self, key: str, patch: Dict[str, Any]) -> bool:
+        """Apply a JSON merge patch to a context item's value in SQLite."""
+        return self._patch_value("key = ?", (key,), patch)
+
+    def _patch_value(
+        self, condition: str, params: Tuple[Any, ...], patch: Dict[str, Any]
+    ) -> bool:
+        """Merge-patch the value of the item matching ``condition`` with json_patch()."""
+        patch_json = json.dumps(patch)
+        with self._lock:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(
+                    "UPDATE context_items SET value = json_patch(value, ?) "
+                    f"WHERE {condition}",
+                    (patch_json,) + params,
+                )
+            except sqlite3.OperationalError as e:
+                # SQLite without the JSON functions, or a value they cannot
+                # parse (such as NaN): patch the value here instead
+                if "json" not in str(e).lower():
+                    raise
+                from .context import apply_merge_patch
+
+                cursor.execute(
+                    f"SELECT value FROM context_items WHERE {condition}", params
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return False
+                value = apply_merge_patch(_stored_json(row[0]), patch)
+                cursor.execute(
+                    f"UPDATE context_items SET value = ? WHERE {condition}",
+                    (json.dumps(value),) + params,
+                )
+            self._commit()
             return cursor.rowcount > 0
 
+    def append_to_context_item(self, key: str, items: List[Any], trim: int = 0) -> bool:
+        """Append entries to a context item's list value in SQLite."""
+        return self._append_values("key = ?", (key,), items, trim)
+
+    def _append_values(
+        self,
+        condition: str,
+        params: Tuple[Any, ...],
+        items: List[Any],
+        trim: int,
+    ) -> bool:
+        """Extend the list value of the item matching ``condition`` with json_insert()."""
+        encoded = [json.dumps(item) for item in items]
+        with self._lock:
+            cursor = self.connection.cursor()
+            try:
+                updated = False
+                for start in range(0, len(encoded), _SQLITE_JSON_BATCH):
+                    batch = encoded[start : start + _SQLITE_JSON_BATCH]
+                    cursor.execute(
+                        "UPDATE context_items SET value = json_insert(value"
+                        + ", '$[#]', json(?)" * len(batch)
+                        + f") WHERE {condition}",
+                        tuple(batch) + params,
+                    )
+                    updated = cursor.rowcount > 0
+                for start in range(0, trim, _SQLITE_JSON_BATCH):
+                    count = min(trim - start, _SQLITE_JSON_BATCH)
+                    cursor.execute(
+                        "UPDATE context_items SET value = json_remove(value"
+                        + ", '$[0]'" * count
+                        + f") WHERE {condition}",
+                        params,
+                    )
+            except sqlite3.OperationalError as e:
+                # SQLite without the JSON functions, or a value they cannot
+                # parse (such as NaN): extend the value here instead
+                if "json" not in str(e).lower():
+                    raise
+                cursor.execute(
+                    f"SELECT value FROM context_items WHERE {condition}", params
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return False
+                value = (_stored_json(row[0]) + list(items))[trim:]
+                cursor.execute(
+                    f"UPDATE context_items SET value = ? WHERE {condition}",
+                    (json.dumps(value),) + params,
+                )
+                updated = cursor.rowcount > 0
+            self._commit()
+            return updated
+
     def get_all_context_items(
         self,
     ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
@@ -540,12 +961,92 @@ class SQLiteBackend(DatabaseBackend):
             result = {}
             for row in cursor.fetchall():
                 key, value_json, subscribers_json, ttl, created_at = row
-                value = json.loads(value_json)
+                value = _from_sqlite_value(value_json)
                 subscribers = json.loads(subscribers_json)
                 result[key] = (value, subscribers, ttl, created_at)
 
             return result
 
+    def get_all_context_topics(self) -> Dict[str, List[str]]:
+        """Get the topics of all context items from SQLite."""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT key, topics FROM context_items WHERE topics IS NOT NULL"
+            )
+            return {key: json.loads(topics_json) for key, topics_json in cursor}
+
+    def get_context_items_by_prefix(
+        self, prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """Get the context items whose keys start with ``prefix`` from SQLite."""
+        return self._fetch_context_items_by_prefix("", (), prefix)
+
+    def _fetch_context_items_by_prefix(
+        self, condition: str, params: Tuple[Any, ...], prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """
+        Read the items matching ``condition`` whose keys start with ``prefix``.
+
+        The prefix becomes a key range, which SQLite answers from the primary
+        key index (LIKE is case-insensitive and would scan the table).
+        """
+        conditions = [condition] if condition else []
+        conditions.append("key >= ?")
+        params += (prefix,)
+        upper = _prefix_upper_bound(prefix)
+        if upper is not None:
+            conditions.append("key < ?")
+            params += (upper,)
+        query = (
+            "SELECT key, value, subscribers, ttl, created_at FROM context_items "
+            "WHERE " + " AND ".join(conditions)
+        )
+
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            return {
+                key: (
+                    _from_sqlite_value(value_json),
+                    json.loads(subscribers_json),
+                    ttl,
+                    created_at,
+                )
+                for key, value_json, subscribers_json, ttl, created_at in cursor
+            }
+
+    def get_all_context_metadata(
+        self, current_time: Optional[float] = None
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Get all context items from SQLite without their values."""
+        return self._fetch_context_metadata("", (), current_time)
+
+    def _fetch_context_metadata(
+        self, condition: str, params: Tuple[Any, ...], current_time: Optional[float]
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Read item metadata matching ``condition``, filtering expiry in SQL."""
+        conditions = [condition] if condition else []
+        if current_time is not None:
+            conditions.append("(ttl IS NULL OR created_at + ttl >= ?)")
+            params += (current_time,)
+        query = "SELECT key, subscribers, ttl, created_at, topics FROM context_items"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            return {
+                key: (
+                    json.loads(subscribers_json),
+                    ttl,
+                    created_at,
+                    json.loads(topics_json) if topics_json else None,
+                )
+                for key, subscribers_json, ttl, created_at, topics_json in cursor
+            }
+
     def cleanup_expired(self, current_time: float) -> int:
         """Remove expired items from SQLite."""
         with self._lock:
@@ -557,7 +1058,7 @@ class SQLiteBackend(DatabaseBackend):
             """,
                 (current_time,),
             )
-            self.connection.commit()
+            self._commit()
             return cursor.rowcount
 
     def clear_all(self) -> None:
@@ -567,7 +1068,7 @@ class SQLiteBackend(DatabaseBackend):
             cursor.execute("DELETE FROM context_items")
             cursor.execute("DELETE FROM agent_topics")
             cursor.execute("DELETE FROM agent_permissions")
-            self.connection.commit()
+            self._commit()
 
     def save_agent_topics(self, agent_name: str, topics: List[str]) -> None:
         """Save agent topic subscriptions to SQLite."""
@@ -580,7 +1081,7 @@ class SQLiteBackend(DatabaseBackend):
             """,
                 (agent_name, json.dumps(topics)),
             )
-            self.connection.commit()
+            self._commit()
 
     def get_agent_topics(self, agent_name: str) -> List[str]:
         """Get agent topic subscriptions from SQLite."""
@@ -615,7 +1116,7 @@ class SQLiteBackend(DatabaseBackend):
             cursor.execute(
                 "DELETE FROM agent_topics WHERE agent_name = ?", (agent_name,)
             )
-            self.connection.commit()
+            self._commit()
 
     def save_agent_permissions(
         self, agent_name: str, allowed_topics: List[str]
@@ -630,7 +1131,7 @@ class SQLiteBackend(DatabaseBackend):
             """,
                 (agent_name, json.dumps(allowed_topics)),
             )
-            self.connection.commit()
+            self._commit()
 
     def get_agent_permissions(self, agent_name: str) -> List[str]:
         """Get agent posting permissions from SQLite."""
@@ -682,6 +1183,27 @@ class SQLiteBackend(DatabaseBackend):
         if not self.connection:
             raise RuntimeError("Database connection not established")
 
+    def _commit(self) -> None:
+        """Commit, unless the write is part of a transaction() block."""
+        if not self._transaction_depth:
+            self.connection.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made inside the block into one SQLite transaction."""
+        with self._lock:
+            self._ensure_connection()
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if not self._transaction_depth:
+                    self.connection.rollback()
+                raise
+            self._transaction_depth -= 1
+            self._commit()
+
     # User isolation implementations for SQLite
     def save_context_item_for_user(
         self,
@@ -691,6 +1213,7 @@ class SQLiteBackend(DatabaseBackend):
         subscribers: List[str],
         ttl: Optional[float],
         created_at: float,
+        topics: Optional[List[str]] = None,
     ) -> None:
         """Save a context item for a specific user in SQLite."""
         with self._lock:
@@ -699,19 +1222,54 @@ class SQLiteBackend(DatabaseBackend):
             cursor.execute(
                 """
                 INSERT OR REPLACE INTO context_items 
-                (key, user_id, value, subscribers, ttl, created_at) 
-                VALUES (?, ?, ?, ?, ?, ?)
+                (key, user_id, value, subscribers, ttl, created_at, topics) 
+                VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     key,
                     user_id,
-                    json.dumps(value),
+                    _sqlite_value(value),
                     json.dumps(subscribers),
                     ttl,
                     created_at,
+                    _topics_json(topics),
                 ),
             )
-            self.connection.commit()
+            self._commit()
+
+    def save_context_items_for_user(
+        self,
+        user_id: str,
+        items: List[Tuple[str, Any, List[str], Optional[float], float]],
+    ) -> None:
+        """Save several context items for a specific user in one transaction."""
+        rows = [
+            (
+                key,
+                user_id,
+                _sqlite_value(value),
+                json.dumps(subscribers),
+                ttl,
+                created_at,
+                _topics_json(*topics),
+            )
+            for key, value, subscribers, ttl, created_at, *topics in items
+        ]
+        with self._lock:
+            self._ensure_connection_for_operation()
+            try:
+                self.connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO context_items 
+                    (key, user_id, value, subscribers, ttl, created_at, topics) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                self._commit()
+            except sqlite3.Error:
+                self.connection.rollback()
+                raise
 
     def get_context_item_for_user(
         self, user_id: str, key: str
@@ -729,7 +1287,7 @@ class SQLiteBackend(DatabaseBackend):
                 return None
 
             value_json, subscribers_json, ttl, created_at = row
-            value = json.loads(value_json)
+            value = _from_sqlite_value(value_json)
             subscribers = json.loads(subscribers_json)
 
             return (value, subscribers, ttl, created_at)
@@ -748,12 +1306,35 @@ class SQLiteBackend(DatabaseBackend):
             result = {}
             for row in cursor.fetchall():
                 key, value_json, subscribers_json, ttl, created_at = row
-                value = json.loads(value_json)
+                value = _from_sqlite_value(value_json)
                 subscribers = json.loads(subscribers_json)
                 result[key] = (value, subscribers, ttl, created_at)
 
             return result
 
+    def get_all_context_topics_for_user(self, user_id: str) -> Dict[str, List[str]]:
+        """Get the topics of all context items for a specific user from SQLite."""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT key, topics FROM context_items "
+                "WHERE user_id = ? AND topics IS NOT NULL",
+                (user_id,),
+            )
+            return {key: json.loads(topics_json) for key, topics_json in cursor}
+
+    def get_context_items_by_prefix_for_user(
+        self, user_id: str, prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """Get a user's context items whose keys start with ``prefix`` from SQLite."""
+        return self._fetch_context_items_by_prefix("user_id = ?", (user_id,), prefix)
+
+    def get_all_context_metadata_for_user(
+        self, user_id: str, current_time: Optional[float] = None
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Get all context items for a specific user from SQLite without values."""
+        return self._fetch_context_metadata("user_id = ?", (user_id,), current_time)
+
     def delete_context_item_for_user(self, user_id: str, key: str) -> bool:
         """Delete a context item for a specific user from SQLite."""
         with self._lock:
@@ -762,9 +1343,23 @@ class SQLiteBackend(DatabaseBackend):
                 "DELETE FROM context_items WHERE key = ? AND user_id = ?",
                 (key, user_id),
             )
-            self.connection.commit()
+            self._commit()
             return cursor.rowcount > 0
 
+    def patch_context_item_for_user(
+        self, user_id: str, key: str, patch: Dict[str, Any]
+    ) -> bool:
+        """Apply a JSON merge patch to a context item for a specific user in SQLite."""
+        return self._patch_value("key = ? AND user_id = ?", (key, user_id), patch)
+
+    def append_to_context_item_for_user(
+        self, user_id: str, key: str, items: List[Any], trim: int = 0
+    ) -> bool:
+        """Append entries to a context item's list value for a specific user in SQLite."""
+        return self._append_values(
+            "key = ? AND user_id = ?", (key, user_id), items, trim
+        )
+
     def save_agent_topics_for_user(
         self, user_id: str, agent_name: str, topics: List[str]
     ) -> None:
@@ -778,7 +1373,7 @@ class SQLiteBackend(DatabaseBackend):
                 """,
                 (agent_name, user_id, json.dumps(topics)),
             )
-            self.connection.commit()
+            self._commit()
 
     def get_agent_topics_for_user(self, user_id: str, agent_name: str) -> List[str]:
         """Get agent topics for a specific user from SQLite."""
@@ -818,7 +1413,7 @@ class SQLiteBackend(DatabaseBackend):
                 "DELETE FROM agent_topics WHERE agent_name = ? AND user_id = ?",
                 (agent_name, user_id),
             )
-            self.connection.commit()
+            self._commit()
 
     def save_agent_permissions_for_user(
         self, user_id: str, agent_name: str, allowed_topics: List[str]
@@ -833,7 +1428,7 @@ class SQLiteBackend(DatabaseBackend):
                 """,
                 (agent_name, user_id, json.dumps(allowed_topics)),
             )
-            self.connection.commit()
+            self._commit()
 
     def get_agent_permissions_for_user(
         self, user_id: str, agent_name: str
@@ -879,7 +1474,7 @@ class SQLiteBackend(DatabaseBackend):
                 (user_id, current_time),
             )
             deleted = cursor.rowcount
-            self.connection.commit()
+            self._commit()
             return deleted
 
     def clear_all_for_user(self, user_id: str) -> None:
@@ -891,16 +1486,21 @@ class SQLiteBackend(DatabaseBackend):
             cursor.execute(
                 "DELETE FROM agent_permissions WHERE user_id = ?", (user_id,)
             )
-            self.connection.commit()
+            self._commit()
 
 
 class PostgreSQLBackend(DatabaseBackend):
     """PostgreSQL database backend implementation."""
 
+    # Compressed values are stored as plain JSONB, which PostgreSQL compresses
+    # itself (TOAST) and which jsonb_set()/|| updates need
+    stores_compressed_values = True
+
     def __init__(self, connection_string: str):
         self.connection_string = connection_string
         self.connection: Optional[Any] = None
-        self._lock = Lock()
+        self._lock = RLock()
+        self._transaction_depth = 0
 
     def connect(self) -> None:
         """Establish PostgreSQL connection."""
@@ -921,6 +1521,26 @@ class PostgreSQLBackend(DatabaseBackend):
             self.connection.close()
             self.connection = None
 
+    def _commit(self) -> None:
+        """Commit, unless the write is part of a transaction() block."""
+        if not self._transaction_depth:
+            self.connection.commit()  # type: ignore
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made inside the block into one PostgreSQL transaction."""
+        with self._lock:
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if not self._transaction_depth:
+                    self.connection.rollback()  # type: ignore
+                raise
+            self._transaction_depth -= 1
+            self._commit()
+
     def initialize_schema(self) -> None:
         """Create PostgreSQL tables and indexes."""
         with self._lock:
@@ -935,11 +1555,17 @@ class PostgreSQLBackend(DatabaseBackend):
                     value JSONB NOT NULL,
                     subscribers JSONB NOT NULL,
                     ttl REAL,
-                    created_at REAL NOT NULL
+                    created_at REAL NOT NULL,
+                    topics JSONB
                 )
             """
             )
 
+            # Topics are resolved to subscribers at read time, so store them
+            cursor.execute(
+                "ALTER TABLE context_items ADD COLUMN IF NOT EXISTS topics JSONB"
+            )
+
             # Create unique constraint to handle NULL user_id properly
             cursor.execute(
                 """
@@ -996,8 +1622,14 @@ class PostgreSQLBackend(DatabaseBackend):
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_context_user_id ON context_items(user_id)"
             )
+            # Lets prefix queries (key LIKE 'prefix%') use an index regardless
+            # of the database collation
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_context_key_pattern "
+                "ON context_items(key text_pattern_ops)"
+            )
 
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def save_context_item(
         self,
@@ -1006,6 +1638,7 @@ class PostgreSQLBackend(DatabaseBackend):
         subscribers: List[str],
         ttl: Optional[float],
         created_at: float,
+        topics: Optional[List[str]] = None,
     ) -> None:
         """Save a context item to PostgreSQL (legacy mode - user_id = NULL)."""
         with self._lock:
@@ -1014,22 +1647,90 @@ class PostgreSQLBackend(DatabaseBackend):
             cursor.execute(
                 """
                 UPDATE context_items 
-                SET value = %s, subscribers = %s, ttl = %s, created_at = %s
+                SET value = %s, subscribers = %s, ttl = %s, created_at = %s, topics = %s
                 WHERE key = %s AND user_id IS NULL
                 """,
-                (json.dumps(value), json.dumps(subscribers), ttl, created_at, key),
+                (
+                    _json_text(value),
+                    json.dumps(subscribers),
+                    ttl,
+                    created_at,
+                    _topics_json(topics),
+                    key,
+                ),
             )
 
             if cursor.rowcount == 0:
                 cursor.execute(
                     """
-                    INSERT INTO context_items (key, user_id, value, subscribers, ttl, created_at)
-                    VALUES (%s, NULL, %s, %s, %s, %s)
+                    INSERT INTO context_items (key, user_id, value, subscribers, ttl, created_at, topics)
+                    VALUES (%s, NULL, %s, %s, %s, %s, %s)
                     """,
-                    (key, json.dumps(value), json.dumps(subscribers), ttl, created_at),
+                    (
+                        key,
+                        _json_text(value),
+                        json.dumps(subscribers),
+                        ttl,
+                        created_at,
+                        _topics_json(topics),
+                    ),
                 )
 
-            self.connection.commit()  # type: ignore
+            self._commit()
+
+    def save_context_items(
+        self, items: List[Tuple[str, Any, List[str], Optional[float], float]]
+    ) -> None:
+        """Save several context items to PostgreSQL (legacy mode - user_id = NULL)."""
+        self._save_context_items_batch(None, items)
+
+    def _save_context_items_batch(
+        self,
+        user_id: Optional[str],
+        items: List[Tuple[str, Any, List[str], Optional[float], float]],
+    ) -> None:
+        """Upsert a batch of context items with execute_values in one transaction."""
+        import psycopg2.extras
+
+        # A single upsert statement cannot touch the same row twice, so keep
+        # only the last entry for each key
+        latest = {item[0]: item for item in items}
+        rows = [
+            (
+                key,
+                user_id,
+                _json_text(value),
+                json.dumps(subscribers),
+                ttl,
+                created_at,
+                _topics_json(*topics),
+            )
+            for key, value, subscribers, ttl, created_at, *topics in latest.values()
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            try:
+                psycopg2.extras.execute_values(
+                    cursor,
+                    """
+                    INSERT INTO context_items (key, user_id, value, subscribers, ttl, created_at, topics)
+                    VALUES %s
+                    ON CONFLICT (key, (COALESCE(user_id, ''))) DO UPDATE
+                    SET value = EXCLUDED.value,
+                        subscribers = EXCLUDED.subscribers,
+                        ttl = EXCLUDED.ttl,
+                        created_at = EXCLUDED.created_at,
+                        topics = EXCLUDED.topics
+                    """,
+                    rows,
+                )
+                self._commit()
+            except Exception:
+                self.connection.rollback()  # type: ignore
+                raise
 
     def get_context_item(
         self, key: str
@@ -1061,9 +1762,55 @@ class PostgreSQLBackend(DatabaseBackend):
                 "DELETE FROM context_items WHERE key = %s AND user_id IS NULL", (key,)
             )
             deleted = cursor.rowcount > 0
-            self.connection.commit()  # type: ignore
+            self._commit()
             return deleted
 
+    def patch_context_item(self, key: str, patch: Dict[str, Any]) -> bool:
+        """Apply a JSON merge patch to a context item's value in PostgreSQL (legacy mode - user_id = NULL)."""
+        return self._patch_value("key = %s AND user_id IS NULL", (key,), patch)
+
+    def _patch_value(
+        self, condition: str, params: Tuple[Any, ...], patch: Dict[str, Any]
+    ) -> bool:
+        """Merge-patch the JSONB value of the item matching ``condition`` in place."""
+        expression, patch_params = _jsonb_merge_patch("value", [], patch)
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            cursor.execute(
+                f"UPDATE context_items SET value = {expression} WHERE {condition}",
+                tuple(patch_params) + params,
+            )
+            patched = cursor.rowcount > 0
+            self._commit()
+            return patched
+
+    def append_to_context_item(self, key: str, items: List[Any], trim: int = 0) -> bool:
+        """Append entries to a context item's list value in PostgreSQL (legacy mode - user_id = NULL)."""
+        return self._append_values("key = %s AND user_id IS NULL", (key,), items, trim)
+
+    def _append_values(
+        self,
+        condition: str,
+        params: Tuple[Any, ...],
+        items: List[Any],
+        trim: int,
+    ) -> bool:
+        """Concatenate entries to the JSONB list value of the item matching ``condition``."""
+        expression = "value || %s::jsonb"
+        values: Tuple[Any, ...] = (json.dumps(items),)
+        if trim:
+            expression = f"jsonb_path_query_array({expression}, %s::jsonpath)"
+            values += (f"$[{trim} to last]",)
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            cursor.execute(
+                f"UPDATE context_items SET value = {expression} WHERE {condition}",
+                values + params,
+            )
+            updated = cursor.rowcount > 0
+            self._commit()
+            return updated
+
     def get_all_context_items(
         self,
     ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
@@ -1084,6 +1831,69 @@ class PostgreSQLBackend(DatabaseBackend):
 
             return result
 
+    def get_all_context_topics(self) -> Dict[str, List[str]]:
+        """Get context item topics from PostgreSQL (legacy mode - user_id = NULL)."""
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            cursor.execute(
+                "SELECT key, topics FROM context_items WHERE user_id IS NULL AND topics IS NOT NULL"
+            )
+            # psycopg2 automatically deserializes JSONB to Python objects
+            return {key: topics for key, topics in cursor.fetchall()}
+
+    def get_context_items_by_prefix(
+        self, prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """Get context items whose keys start with ``prefix`` from PostgreSQL (legacy mode - user_id = NULL)."""
+        return self._fetch_context_items_by_prefix("user_id IS NULL", (), prefix)
+
+    def _fetch_context_items_by_prefix(
+        self, condition: str, params: Tuple[Any, ...], prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """
+        Read the items matching ``condition`` whose keys start with ``prefix``,
+        using the text_pattern_ops index on the key.
+        """
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            cursor.execute(
+                "SELECT key, value, subscribers, ttl, created_at FROM context_items "
+                f"WHERE {condition} AND key LIKE %s",
+                params + (_like_prefix(prefix),),
+            )
+            # psycopg2 automatically deserializes JSONB to Python objects
+            return {
+                key: (value, subscribers or [], ttl, created_at)
+                for key, value, subscribers, ttl, created_at in cursor.fetchall()
+            }
+
+    def get_all_context_metadata(
+        self, current_time: Optional[float] = None
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Get context items from PostgreSQL without values (legacy mode - user_id = NULL)."""
+        return self._fetch_context_metadata("user_id IS NULL", (), current_time)
+
+    def _fetch_context_metadata(
+        self, condition: str, params: Tuple[Any, ...], current_time: Optional[float]
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Read item metadata matching ``condition``, filtering expiry in SQL."""
+        query = (
+            "SELECT key, subscribers, ttl, created_at, topics FROM context_items "
+            f"WHERE {condition}"
+        )
+        if current_time is not None:
+            query += " AND (ttl IS NULL OR created_at + ttl >= %s)"
+            params += (current_time,)
+
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            cursor.execute(query, params)
+            # psycopg2 automatically deserializes JSONB to Python objects
+            return {
+                key: (subscribers or [], ttl, created_at, topics)
+                for key, subscribers, ttl, created_at, topics in cursor.fetchall()
+            }
+
     def cleanup_expired(self, current_time: float) -> int:
         """Remove expired context items from PostgreSQL (legacy mode - user_id = NULL)."""
         with self._lock:
@@ -1093,7 +1903,7 @@ class PostgreSQLBackend(DatabaseBackend):
                 (current_time,),
             )
             deleted_count = cursor.rowcount
-            self.connection.commit()  # type: ignore
+            self._commit()
             return deleted_count
 
     def clear_all(self) -> None:
@@ -1103,7 +1913,7 @@ class PostgreSQLBackend(DatabaseBackend):
             cursor.execute("DELETE FROM context_items WHERE user_id IS NULL")
             cursor.execute("DELETE FROM agent_topics WHERE user_id IS NULL")
             cursor.execute("DELETE FROM agent_permissions WHERE user_id IS NULL")
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def save_agent_topics(self, agent_name: str, topics: List[str]) -> None:
         """Save agent topics to PostgreSQL (legacy mode - user_id = NULL)."""
@@ -1128,7 +1938,7 @@ class PostgreSQLBackend(DatabaseBackend):
                     (agent_name, json.dumps(topics)),
                 )
 
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def get_agent_topics(self, agent_name: str) -> List[str]:
         """Get agent topics from PostgreSQL (legacy mode - user_id = NULL)."""
@@ -1167,7 +1977,7 @@ class PostgreSQLBackend(DatabaseBackend):
                 "DELETE FROM agent_topics WHERE agent_name = %s AND user_id IS NULL",
                 (agent_name,),
             )
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def save_agent_permissions(
         self, agent_name: str, allowed_topics: List[str]
@@ -1194,7 +2004,7 @@ class PostgreSQLBackend(DatabaseBackend):
                     (agent_name, json.dumps(allowed_topics)),
                 )
 
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def get_agent_permissions(self, agent_name: str) -> List[str]:
         """Get agent permissions from PostgreSQL (legacy mode - user_id = NULL)."""
@@ -1236,6 +2046,7 @@ class PostgreSQLBackend(DatabaseBackend):
         subscribers: List[str],
         ttl: Optional[float],
         created_at: float,
+        topics: Optional[List[str]] = None,
     ) -> None:
         """Save a context item for a specific user to PostgreSQL."""
         with self._lock:
@@ -1244,14 +2055,15 @@ class PostgreSQLBackend(DatabaseBackend):
             cursor.execute(
                 """
                 UPDATE context_items 
-                SET value = %s, subscribers = %s, ttl = %s, created_at = %s
+                SET value = %s, subscribers = %s, ttl = %s, created_at = %s, topics = %s
                 WHERE key = %s AND (user_id = %s OR (user_id IS NULL AND %s IS NULL))
                 """,
                 (
-                    json.dumps(value),
+                    _json_text(value),
                     json.dumps(subscribers),
                     ttl,
                     created_at,
+                    _topics_json(topics),
                     key,
                     user_id,
                     user_id,
@@ -1261,19 +2073,28 @@ class PostgreSQLBackend(DatabaseBackend):
             if cursor.rowcount == 0:
                 cursor.execute(
                     """
-                    INSERT INTO context_items (key, user_id, value, subscribers, ttl, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    INSERT INTO context_items (key, user_id, value, subscribers, ttl, created_at, topics)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
                     """,
                     (
                         key,
                         user_id,
-                        json.dumps(value),
+                        _json_text(value),
                         json.dumps(subscribers),
                         ttl,
                         created_at,
+                        _topics_json(topics),
                     ),
                 )
-            self.connection.commit()  # type: ignore
+            self._commit()
+
+    def save_context_items_for_user(
+        self,
+        user_id: str,
+        items: List[Tuple[str, Any, List[str], Optional[float], float]],
+    ) -> None:
+        """Save several context items for a specific user to PostgreSQL."""
+        self._save_context_items_batch(user_id, items)
 
     def get_context_item_for_user(
         self, user_id: str, key: str
@@ -1313,6 +2134,29 @@ class PostgreSQLBackend(DatabaseBackend):
                 result[key] = (value, subscribers, ttl, created_at)
             return result
 
+    def get_all_context_topics_for_user(self, user_id: str) -> Dict[str, List[str]]:
+        """Get context item topics for a specific user from PostgreSQL."""
+        with self._lock:
+            cursor = self.connection.cursor()  # type: ignore
+            cursor.execute(
+                "SELECT key, topics FROM context_items WHERE user_id = %s AND topics IS NOT NULL",
+                (user_id,),
+            )
+            # psycopg2 automatically deserializes JSONB to Python objects
+            return {key: topics for key, topics in cursor.fetchall()}
+
+    def get_context_items_by_prefix_for_user(
+        self, user_id: str, prefix: str
+    ) -> Dict[str, Tuple[Any, List[str], Optional[float], float]]:
+        """Get a user's context items whose keys start with ``prefix`` from PostgreSQL."""
+        return self._fetch_context_items_by_prefix("user_id = %s", (user_id,), prefix)
+
+    def get_all_context_metadata_for_user(
+        self, user_id: str, current_time: Optional[float] = None
+    ) -> Dict[str, Tuple[List[str], Optional[float], float, Optional[List[str]]]]:
+        """Get context items for a specific user from PostgreSQL without values."""
+        return self._fetch_context_metadata("user_id = %s", (user_id,), current_time)
+
     def delete_context_item_for_user(self, user_id: str, key: str) -> bool:
         """Delete a context item for a specific user from PostgreSQL."""
         with self._lock:
@@ -1322,9 +2166,23 @@ class PostgreSQLBackend(DatabaseBackend):
                 (key, user_id),
             )
             deleted = cursor.rowcount > 0
-            self.connection.commit()  # type: ignore
+            self._commit()
             return deleted
 
+    def patch_context_item_for_user(
+        self, user_id: str, key: str, patch: Dict[str, Any]
+    ) -> bool:
+        """Apply a JSON merge patch to a context item for a specific user in PostgreSQL."""
+        return self._patch_value("key = %s AND user_id = %s", (key, user_id), patch)
+
+    def append_to_context_item_for_user(
+        self, user_id: str, key: str, items: List[Any], trim: int = 0
+    ) -> bool:
+        """Append entries to a context item's list value for a specific user in PostgreSQL."""
+        return self._append_values(
+            "key = %s AND user_id = %s", (key, user_id), items, trim
+        )
+
     def save_agent_topics_for_user(
         self, user_id: str, agent_name: str, topics: List[str]
     ) -> None:
@@ -1349,7 +2207,7 @@ class PostgreSQLBackend(DatabaseBackend):
                     """,
                     (agent_name, user_id, json.dumps(topics)),
                 )
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def get_agent_topics_for_user(self, user_id: str, agent_name: str) -> List[str]:
         """Get agent topics for a specific user from PostgreSQL."""
@@ -1389,7 +2247,7 @@ class PostgreSQLBackend(DatabaseBackend):
                 "DELETE FROM agent_topics WHERE agent_name = %s AND user_id = %s",
                 (agent_name, user_id),
             )
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def save_agent_permissions_for_user(
         self, user_id: str, agent_name: str, allowed_topics: List[str]
@@ -1415,7 +2273,7 @@ class PostgreSQLBackend(DatabaseBackend):
                     """,
                     (agent_name, user_id, json.dumps(allowed_topics)),
                 )
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def get_agent_permissions_for_user(
         self, user_id: str, agent_name: str
@@ -1463,7 +2321,7 @@ class PostgreSQLBackend(DatabaseBackend):
                 (user_id, current_time),
             )
             removed_count = cursor.rowcount
-            self.connection.commit()  # type: ignore
+            self._commit()
             return removed_count
 
     def clear_all_for_user(self, user_id: str) -> None:
@@ -1475,7 +2333,7 @@ class PostgreSQLBackend(DatabaseBackend):
             cursor.execute(
                 "DELETE FROM agent_permissions WHERE user_id = %s", (user_id,)
             )
-            self.connection.commit()  # type: ignore
+            self._commit()
 
     def delete_topic_data_for_user(self, user_id: str, topic: str) -> None:
         """Delete all data related to a topic for a specific user from PostgreSQL."""
@@ -1519,7 +2377,7 @@ class PostgreSQLBackend(DatabaseBackend):
                 (topic, user_id, topic),
             )
 
-            self.connection.commit()  # type: ignore
+            self._commit()
 
 
 def create_database_backend(backend_type: str = "sqlite", **kwargs) -> DatabaseBackend:
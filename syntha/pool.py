@@ -0,0 +1,322 @@
+"""
+Context Mesh Pool - per-tenant meshes over one shared database backend.
+
+Copyright 2025 Syntha
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Keeps the meshes of active tenants in memory and hibernates the rest. Every
+tenant mesh uses the same database backend (and so the same connection),
+with user isolation provided by the backend's per-user queries.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .context import ContextMesh
+from .persistence import DatabaseBackend, create_database_backend
+
+# ContextMesh constructor arguments; other pool keyword arguments configure
+# the database backend
+_MESH_ARGUMENTS = frozenset(inspect.signature(ContextMesh.__init__).parameters) - {
+    "self",
+    "db_config",
+    "user_id",
+    "enable_persistence",
+    "db_backend",
+}
+
+
+class _Tenant:
+    """A resident tenant mesh and its usage."""
+
+    __slots__ = ("mesh", "last_used", "leases")
+
+    def __init__(self, mesh: ContextMesh):
+        self.mesh = mesh
+        self.last_used = time.monotonic()
+        self.leases = 0
+
+
+class ContextMeshPool:
+    """
+    Hands out per-tenant ContextMesh instances that share one database
+    backend.
+
+    At most ``max_resident`` tenant meshes stay in memory; when another
+    tenant is loaded, the least recently used one is hibernated (its mesh is
+    closed and dropped, its context stays in the database). Tenants idle for
+    longer than ``idle_timeout`` are hibernated as well. A hibernated tenant
+    is loaded again from the database on its next get().
+    """
+
+    def __init__(
+        self,
+        max_resident: int = 1000,
+        idle_timeout: Optional[float] = None,
+        db_backend: Union[str, DatabaseBackend] = "sqlite",
+        **config,
+    ):
+        """
+        Create a pool.
+
+        Args:
+            max_resident: Maximum number of tenant meshes kept in memory
+            idle_timeout: Hibernate tenants not used for this many seconds
+                (None only hibernates to stay within max_resident)
+            db_backend: Backend type ("sqlite" or "postgresql"), or a
+                connected DatabaseBackend, which the pool does not close
+            **config: ContextMesh arguments for every tenant mesh (such as
+                ``lazy_load`` or ``max_items``); anything else configures the
+                database backend (such as ``db_path``)
+        """
+        if max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive")
+
+        self.max_resident = max_resident
+        self.idle_timeout = idle_timeout
+        self._mesh_config = {
+            name: value for name, value in config.items() if name in _MESH_ARGUMENTS
+        }
+        db_config = {
+            name: value for name, value in config.items() if name not in _MESH_ARGUMENTS
+        }
+
+        if isinstance(db_backend, DatabaseBackend):
+            self.db_backend = db_backend
+            self._owns_backend = False
+        else:
+            self.db_backend = create_database_backend(db_backend, **db_config)
+            self.db_backend.connect()
+            self._owns_backend = True
+
+        # Resident tenants, least recently used first
+        self._tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+        # Tenants being loaded or hibernated; get() calls wait on the future
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._last_idle_check = time.monotonic()
+        self._hibernations = 0
+        self._loads = 0
+        self._closed = False
+
+    def get(self, user_id: str) -> ContextMesh:
+        """
+        Get a tenant's mesh, loading it from the database if it is not
+        resident.
+
+        Don't keep the mesh beyond the current unit of work (such as a
+        request): once the tenant is hibernated, changes made through an old
+        mesh are persisted but not seen by the tenant's new mesh. Use lease()
+        to keep a tenant resident while it is in use.
+        """
+        return self._acquire(user_id, lease=False)
+
+    @contextmanager
+    def lease(self, user_id: str) -> Iterator[ContextMesh]:
+        """
+        Use a tenant's mesh without it being hibernated in the meantime.
+
+        Leased tenants are skipped when the pool hibernates tenants, so the
+        pool can temporarily hold more than ``max_resident`` tenants.
+        """
+        mesh = self._acquire(user_id, lease=True)
+        try:
+            yield mesh
+        finally:
+            with self._lock:
+                tenant = self._tenants.get(user_id)
+                if tenant is not None and tenant.mesh is mesh:
+                    tenant.leases -= 1
+                    tenant.last_used = time.monotonic()
+
+    def _acquire(self, user_id: str, lease: bool) -> ContextMesh:
+        if not user_id:
+            raise ValueError("ContextMeshPool tenants need a user_id")
+        self._hibernate_idle_if_due()
+
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise ValueError("ContextMeshPool is closed")
+                tenant = self._tenants.get(user_id)
+                if tenant is not None:
+                    self._tenants.move_to_end(user_id)
+                    tenant.last_used = time.monotonic()
+                    if lease:
+                        tenant.leases += 1
+                    return tenant.mesh
+                loading = self._loading.get(user_id)
+                if loading is None:
+                    loading = self._loading[user_id] = Future()
+                    break
+            # Another thread is loading or hibernating the tenant; wait for it
+            loading.result()
+
+        try:
+            mesh = ContextMesh(
+                user_id=user_id, db_backend=self.db_backend, **self._mesh_config
+            )
+        except BaseException as e:
+            with self._lock:
+                del self._loading[user_id]
+            loading.set_exception(e)
+            raise
+
+        tenant = _Tenant(mesh)
+        if lease:
+            tenant.leases = 1
+        with self._lock:
+            del self._loading[user_id]
+            self._tenants[user_id] = tenant
+            self._loads += 1
+            victims = self._take_over_limit(keep=user_id)
+        loading.set_result(mesh)
+        self._close_tenants(victims)
+        return mesh
+
+    def _take_over_limit(self, keep: str) -> List[Tuple[str, _Tenant]]:
+        """
+        Remove least recently used tenants over max_resident, except ``keep``.
+        Assumes lock is held.
+        """
+        victims = []
+        excess = len(self._tenants) - self.max_resident
+        if excess > 0:
+            for user_id, tenant in list(self._tenants.items()):
+                if tenant.leases == 0 and user_id != keep:
+                    victims.append(self._remove(user_id))
+                    excess -= 1
+                    if excess == 0:
+                        break
+        return victims
+
+    def _remove(self, user_id: str) -> Tuple[str, _Tenant]:
+        """
+        Remove a resident tenant to hibernate it with _close_tenants().
+
+        Until its mesh is closed, which commits the writes it still has
+        queued, get() waits rather than loading the tenant from the
+        database without them. Assumes lock is held.
+        """
+        tenant = self._tenants.pop(user_id)
+        self._loading[user_id] = Future()
+        return user_id, tenant
+
+    def _close_tenants(self, tenants: List[Tuple[str, _Tenant]]) -> None:
+        error: Optional[BaseException] = None
+        for user_id, tenant in tenants:
+            try:
+                tenant.mesh.close()
+            except BaseException as e:
+                error = error or e
+            with self._lock:
+                hibernating = self._loading.pop(user_id)
+                self._hibernations += 1
+            hibernating.set_result(None)
+        if error is not None:
+            raise error
+
+    def hibernate(self, user_id: str) -> bool:
+        """
+        Drop a tenant's mesh from memory; its context stays in the database.
+
+        Returns:
+            True if the tenant was hibernated, False if it was not resident
+            or is leased
+        """
+        with self._lock:
+            tenant = self._tenants.get(user_id)
+            if tenant is None or tenant.leases:
+                return False
+            victim = self._remove(user_id)
+        self._close_tenants([victim])
+        return True
+
+    def hibernate_idle(self) -> int:
+        """
+        Hibernate the tenants that have been idle for longer than
+        ``idle_timeout``. Runs automatically from get() about every
+        ``idle_timeout`` seconds.
+
+        Returns:
+            Number of tenants hibernated
+        """
+        if self.idle_timeout is None:
+            return 0
+        with self._lock:
+            self._last_idle_check = now = time.monotonic()
+            victims = []
+            # Least recently used first, so stop at the first recent tenant
+            for user_id, tenant in list(self._tenants.items()):
+                if now - tenant.last_used <= self.idle_timeout:
+                    break
+                if tenant.leases == 0:
+                    victims.append(self._remove(user_id))
+        self._close_tenants(victims)
+        return len(victims)
+
+    def _hibernate_idle_if_due(self) -> None:
+        if (
+            self.idle_timeout is not None
+            and time.monotonic() - self._last_idle_check >= self.idle_timeout
+        ):
+            self.hibernate_idle()
+
+    def resident_tenants(self) -> List[str]:
+        """The user ids of the resident tenants, least recently used first."""
+        with self._lock:
+            return list(self._tenants)
+
+    def __contains__(self, user_id: str) -> bool:
+        with self._lock:
+            return user_id in self._tenants
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tenants)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the pool."""
+        with self._lock:
+            return {
+                "resident_tenants": len(self._tenants),
+                "leased_tenants": sum(
+                    1 for tenant in self._tenants.values() if tenant.leases
+                ),
+                "max_resident": self.max_resident,
+                "loads": self._loads,
+                "hibernations": self._hibernations,
+            }
+
+    def close(self) -> None:
+        """Hibernate every tenant and close the backend if the pool owns it."""
+        with self._lock:
+            self._closed = True
+            tenants = [self._remove(user_id) for user_id in list(self._tenants)]
+        self._close_tenants(tenants)
+        if self._owns_backend:
+            self.db_backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
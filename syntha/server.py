@@ -0,0 +1,1001 @@
+"""
+Context Mesh Server - share one ContextMesh between processes.
+
+Copyright 2025 Syntha
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+ContextMeshServer serves a single ContextMesh over a Unix domain socket or TCP,
+and RemoteContextMesh is a client with the ContextMesh API, so worker processes
+(gunicorn, uvicorn, multiprocessing) all see the same context.
+
+Messages are length-prefixed frames carrying a compact binary encoding of
+JSON-like values. Every request has an id, so clients can send several
+requests without waiting for each reply (pipelining).
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .context import ContextMesh
+from .exceptions import SynthaConnectionError, SynthaError
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+
+# Frame header: payload length, request id, frame kind
+_FRAME = struct.Struct("!IQB")
+_REQUEST = 0
+_RESULT = 1
+_ERROR = 2
+_EVENT = 3
+
+# Largest payload either side will accept
+_MAX_MESSAGE = 64 * 1024 * 1024
+
+_INT64 = struct.Struct("!q")
+_FLOAT = struct.Struct("!d")
+_LENGTH = struct.Struct("!I")
+
+# ContextMesh methods clients may call. Snapshot/restore and the reaper are
+# left out because they act on the server's filesystem and threads.
+_REMOTE_METHODS = frozenset(
+    [
+        "push",
+        "push_many",
+        "patch",
+        "increment",
+        "append",
+        "get",
+        "get_many",
+        "get_prefix",
+        "list_keys",
+        "export_items",
+        "get_all_for_agent",
+        "get_keys_for_agent",
+        "get_changes_since",
+        "current_cursor",
+        "wait_for",
+        "remove",
+        "cleanup_expired",
+        "flush",
+        "clear",
+        "size",
+        "get_stats",
+        "register_agent_topics",
+        "get_topics_for_agent",
+        "get_subscribers_for_topic",
+        "get_all_topics",
+        "unsubscribe_from_topics",
+        "delete_topic",
+        "get_available_keys_by_topic",
+        "set_agent_post_permissions",
+        "get_agent_post_permissions",
+        "get_all_post_permissions",
+        "can_agent_post_to_topic",
+    ]
+)
+
+# Methods that may block for a long time run on their own thread so later
+# requests on the same connection are not stuck behind them
+_BLOCKING_METHODS = frozenset(["wait_for"])
+
+# Exception types re-raised as themselves on the client
+_REMOTE_ERRORS = {
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+    "PermissionError": PermissionError,
+}
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    """Append the binary encoding of a JSON-like value to ``out``."""
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        if -(2**63) <= value < 2**63:
+            out += b"i"
+            out += _INT64.pack(value)
+        else:
+            data = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+            out += b"n"
+            out += _LENGTH.pack(len(data))
+            out += data
+    elif isinstance(value, float):
+        out += b"d"
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out += b"s"
+        out += _LENGTH.pack(len(data))
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        out += b"b"
+        out += _LENGTH.pack(len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += b"l"
+        out += _LENGTH.pack(len(value))
+        for element in value:
+            _encode(element, out)
+    elif isinstance(value, dict):
+        out += b"m"
+        out += _LENGTH.pack(len(value))
+        for key, element in value.items():
+            _encode(key, out)
+            _encode(element, out)
+    else:
+        raise TypeError(
+            f"Cannot send a value of type {type(value).__name__} to a "
+            "context mesh server"
+        )
+
+
+def _decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+    """Decode one value starting at ``offset``; returns it and the next offset."""
+    tag = data[offset]
+    offset += 1
+    if tag == 0x4E:  # N
+        return None, offset
+    if tag == 0x54:  # T
+        return True, offset
+    if tag == 0x46:  # F
+        return False, offset
+    if tag == 0x69:  # i
+        return _INT64.unpack_from(data, offset)[0], offset + 8
+    if tag == 0x64:  # d
+        return _FLOAT.unpack_from(data, offset)[0], offset + 8
+
+    (length,) = _LENGTH.unpack_from(data, offset)
+    offset += 4
+    if tag == 0x73:  # s
+        end = offset + length
+        return str(data[offset:end], "utf-8"), end
+    if tag == 0x62:  # b
+        end = offset + length
+        return bytes(data[offset:end]), end
+    if tag == 0x6E:  # n
+        end = offset + length
+        return int.from_bytes(data[offset:end], "big", signed=True), end
+    if tag == 0x6C:  # l
+        items = []
+        for _ in range(length):
+            element, offset = _decode(data, offset)
+            items.append(element)
+        return items, offset
+    if tag == 0x6D:  # m
+        mapping = {}
+        for _ in range(length):
+            key, offset = _decode(data, offset)
+            mapping[key], offset = _decode(data, offset)
+        return mapping, offset
+    raise ValueError(f"Unknown value tag {tag!r} in context mesh message")
+
+
+def _frame(request_id: int, kind: int, payload: Any, out: bytearray) -> None:
+    """Append a complete frame for ``payload`` to ``out``."""
+    start = len(out)
+    out += bytes(_FRAME.size)
+    try:
+        _encode(payload, out)
+        size = len(out) - start - _FRAME.size
+        if size > _MAX_MESSAGE:
+            raise ValueError(f"Context mesh message too large ({size} bytes)")
+    except Exception:
+        del out[start:]
+        raise
+    _FRAME.pack_into(out, start, size, request_id, kind)
+
+
+def _split_frames(buffer: bytearray) -> List[Tuple[int, int, Any]]:
+    """Remove and decode every complete frame at the start of ``buffer``."""
+    frames = []
+    offset = 0
+    view = memoryview(buffer)
+    try:
+        while len(buffer) - offset >= _FRAME.size:
+            size, request_id, kind = _FRAME.unpack_from(buffer, offset)
+            if size > _MAX_MESSAGE:
+                raise ValueError(f"Context mesh message too large ({size} bytes)")
+            end = offset + _FRAME.size + size
+            if end > len(buffer):
+                break
+            payload, payload_end = _decode(view, offset + _FRAME.size)
+            if payload_end != end:
+                raise ValueError("Malformed context mesh message")
+            frames.append((request_id, kind, payload))
+            offset = end
+    finally:
+        view.release()
+    del buffer[:offset]
+    return frames
+
+
+def _parse_address(address: Union[str, Tuple[str, int]]) -> Tuple[int, Any]:
+    """Return the socket family and address for a path or (host, port)."""
+    if isinstance(address, str):
+        return socket.AF_UNIX, address
+    host, port = address
+    return socket.AF_INET6 if ":" in host else socket.AF_INET, (host, int(port))
+
+
+class _Connection:
+    """Server side of one client connection."""
+
+    def __init__(self, server: "ContextMeshServer", sock: socket.socket):
+        self.server = server
+        self.sock = sock
+        self.send_lock = threading.Lock()
+        self.listeners: List[int] = []
+
+    def send(self, data: bytearray) -> None:
+        if not data:
+            return
+        with self.send_lock:
+            self.sock.sendall(data)
+
+    def serve(self) -> None:
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = self.sock.recv(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+
+                # Answer everything that arrived together with a single send
+                out = bytearray()
+                for request_id, kind, payload in _split_frames(buffer):
+                    if kind != _REQUEST:
+                        raise ValueError(f"Unexpected frame kind {kind}")
+                    method, args, kwargs = payload
+                    if method in _BLOCKING_METHODS:
+                        threading.Thread(
+                            target=self._run_blocking,
+                            args=(request_id, method, args, kwargs),
+                            name="syntha-server-wait",
+                            daemon=True,
+                        ).start()
+                    else:
+                        self._run(request_id, method, args, kwargs, out)
+                self.send(out)
+        except (ConnectionError, OSError):
+            pass
+        except Exception:
+            logger.exception("Closing context mesh connection after a bad message")
+        finally:
+            for listener_id in self.listeners:
+                self.server.mesh.remove_change_listener(listener_id)
+
+    def _run_blocking(
+        self, request_id: int, method: str, args: list, kwargs: dict
+    ) -> None:
+        out = bytearray()
+        self._run(request_id, method, args, kwargs, out)
+        try:
+            self.send(out)
+        except OSError:
+            pass
+
+    def _run(
+        self, request_id: int, method: str, args: list, kwargs: dict, out: bytearray
+    ) -> None:
+        try:
+            result = self._dispatch(method, args, kwargs)
+            _frame(request_id, _RESULT, result, out)
+        except Exception as e:
+            _frame(request_id, _ERROR, [type(e).__name__, str(e)], out)
+
+    def _dispatch(self, method: str, args: list, kwargs: dict) -> Any:
+        mesh = self.server.mesh
+        if method in _REMOTE_METHODS:
+            return getattr(mesh, method)(*args, **kwargs)
+        if method == "on_change":
+            return self._add_listener(*args, **kwargs)
+        if method == "remove_change_listener":
+            (listener_id,) = args
+            if listener_id not in self.listeners:
+                return False
+            self.listeners.remove(listener_id)
+            return mesh.remove_change_listener(listener_id)
+        if method == "server_info":
+            return {
+                "protocol_version": PROTOCOL_VERSION,
+                "user_id": mesh.user_id,
+                "enable_persistence": mesh.enable_persistence,
+            }
+        raise ValueError(f"Unsupported context mesh method: {method}")
+
+    def _add_listener(self, *args, **kwargs) -> int:
+        listener: List[int] = []
+        # Events dispatched before on_change() returns the id, which a
+        # concurrent commit can do; they are sent once the id is known.
+        # No lock is held across the mesh call, since dispatching events
+        # may need it.
+        early: List[Dict[str, Any]] = []
+        order_lock = threading.Lock()
+
+        def send_event(event: Dict[str, Any]) -> None:
+            with order_lock:
+                if listener:
+                    self._send_event(listener[0], event)
+                else:
+                    early.append(event)
+
+        listener_id = self.server.mesh.on_change(send_event, *args, **kwargs)
+        with order_lock:
+            listener.append(listener_id)
+            for event in early:
+                self._send_event(listener_id, event)
+        self.listeners.append(listener_id)
+        return listener_id
+
+    def _send_event(self, listener_id: int, event: Dict[str, Any]) -> None:
+        out = bytearray()
+        _frame(0, _EVENT, [listener_id, event], out)
+        try:
+            self.send(out)
+        except OSError:
+            pass
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        self.server.mesh_server._serve_connection(self.request)
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _TCP6Server(_TCPServer):
+    address_family = socket.AF_INET6
+
+
+class ContextMeshServer:
+    """
+    Serve a ContextMesh to other processes.
+
+    Each client connection gets its own thread; requests on a connection run
+    in the order they were sent, except wait_for(), which runs on a separate
+    thread so it does not hold up later requests. The server has no
+    authentication: listen on a Unix socket with suitable file permissions,
+    or on a loopback/private interface.
+    """
+
+    def __init__(
+        self,
+        mesh: Optional[ContextMesh] = None,
+        address: Union[str, Tuple[str, int]] = ("127.0.0.1", 0),
+        **mesh_config,
+    ):
+        """
+        Create a server and bind its socket.
+
+        Args:
+            mesh: An existing ContextMesh to serve. If omitted, one is created
+                from ``mesh_config`` and closed with the server.
+            address: A Unix socket path, or a (host, port) tuple for TCP. Port
+                0 picks a free port; see the ``address`` attribute.
+            **mesh_config: Arguments for the ContextMesh constructor
+        """
+        if mesh is not None and mesh_config:
+            raise ValueError("Pass either an existing mesh or mesh_config, not both")
+
+        family, bind_address = _parse_address(address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(bind_address):
+                os.unlink(bind_address)  # Stale socket from a previous run
+            server_class: type = _UnixServer
+        elif family == socket.AF_INET6:
+            server_class = _TCP6Server
+        else:
+            server_class = _TCPServer
+
+        self._owns_mesh = mesh is None
+        self.mesh = mesh if mesh is not None else ContextMesh(**mesh_config)
+        self._server = server_class(bind_address, _Handler)
+        self._server.mesh_server = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+        self._connections: Dict[socket.socket, None] = {}
+        self._connections_lock = threading.Lock()
+
+        if family == socket.AF_UNIX:
+            self.address: Union[str, Tuple[str, int]] = bind_address
+        else:
+            self.address = self._server.server_address[:2]
+
+    def _serve_connection(self, sock: socket.socket) -> None:
+        if sock.family != socket.AF_UNIX:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._connections_lock:
+            self._connections[sock] = None
+        try:
+            _Connection(self, sock).serve()
+        finally:
+            with self._connections_lock:
+                self._connections.pop(sock, None)
+
+    def serve_forever(self) -> None:
+        """Handle connections until close() is called."""
+        self._server.serve_forever(poll_interval=0.05)
+
+    def start(self) -> "ContextMeshServer":
+        """Handle connections on a background thread and return the server."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever, name="syntha-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving, drop client connections and close an owned mesh."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for sock in connections:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+        if self._owns_mesh:
+            self.mesh.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _remote_error(name: str, message: str) -> Exception:
+    """Rebuild an exception raised by the server."""
+    error_type = _REMOTE_ERRORS.get(name)
+    if error_type is not None:
+        return error_type(message)
+    return SynthaError(message, error_code=name)
+
+
+class RemotePipeline:
+    """
+    Queue ContextMesh calls and send them to the server in one write.
+
+    Created by RemoteContextMesh.pipeline(). Calls are queued with the same
+    method names and arguments as ContextMesh and run in order by execute(),
+    which returns their results as a list.
+    """
+
+    def __init__(self, client: "RemoteContextMesh"):
+        self._client = client
+        self._calls: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, method: str) -> Callable[..., "RemotePipeline"]:
+        if method not in _REMOTE_METHODS or method in _BLOCKING_METHODS:
+            raise AttributeError(f"Cannot pipeline ContextMesh.{method}")
+
+        def queue_call(*args, **kwargs) -> "RemotePipeline":
+            self._calls.append((method, args, kwargs))
+            return self
+
+        return queue_call
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def execute(self) -> List[Any]:
+        """
+        Send the queued calls and wait for all of their results.
+
+        Raises:
+            The first error raised by a call, after every call has finished
+        """
+        calls, self._calls = self._calls, []
+        futures = self._client._submit(calls)
+        results = []
+        error = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(None)
+                error = error or e
+        if error is not None:
+            raise error
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+
+
+class RemoteContextMesh:
+    """
+    ContextMesh API backed by a ContextMeshServer.
+
+    Can be passed anywhere a ContextMesh is expected, such as ToolHandler and
+    the prompt builders. Values travel in a binary encoding of JSON types, so
+    they must be JSON-like, as they must be for database persistence; tuples
+    come back as lists and frozen values as plain dicts and lists.
+
+    The client is thread-safe and pipelines requests from concurrent threads
+    over one connection. A client inherited across fork() reconnects on first
+    use in the child, dropping its change listeners.
+    """
+
+    def __init__(
+        self,
+        address: Union[str, Tuple[str, int]],
+        connect_timeout: float = 5.0,
+    ):
+        """
+        Connect to a server.
+
+        Args:
+            address: The server's Unix socket path or (host, port) tuple
+            connect_timeout: Seconds to wait for the connection
+
+        Raises:
+            SynthaConnectionError: If the server cannot be reached
+        """
+        self.address = address
+        self.connect_timeout = connect_timeout
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self._listeners: Dict[int, Callable[[Dict[str, Any]], None]] = {}
+        self._listener_lock = threading.Lock()
+        self._events: Optional[queue.Queue] = None
+        self._sock: Optional[socket.socket] = None
+        self._pid = 0
+
+        info = self._call("server_info")
+        if info["protocol_version"] != PROTOCOL_VERSION:
+            self.close()
+            raise SynthaConnectionError(
+                f"Context mesh server speaks protocol {info['protocol_version']}, "
+                f"this client speaks {PROTOCOL_VERSION}",
+                service="context mesh server",
+            )
+        self.user_id: Optional[str] = info["user_id"]
+        self.enable_persistence: bool = info["enable_persistence"]
+
+    def _connect(self) -> socket.socket:
+        family, address = _parse_address(self.address)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(self.connect_timeout)
+        try:
+            sock.connect(address)
+        except OSError as e:
+            sock.close()
+            raise SynthaConnectionError(
+                f"Cannot connect to context mesh server at {self.address}: {e}",
+                service="context mesh server",
+                cause=e,
+            ) from e
+        sock.settimeout(None)
+        if family != socket.AF_UNIX:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._sock = sock
+        self._pid = os.getpid()
+        self._pending = {}
+        self._listeners = {}
+        self._events = None
+        threading.Thread(
+            target=self._read_loop,
+            args=(sock, self._pending),
+            name="syntha-remote-reader",
+            daemon=True,
+        ).start()
+        return sock
+
+    def _submit(self, calls: List[Tuple[str, tuple, dict]]) -> List[Future]:
+        """Send calls in one write; returns a future per call."""
+        with self._send_lock:
+            sock = self._sock
+            if sock is None or self._pid != os.getpid():
+                sock = self._connect()
+            pending = self._pending
+
+            out = bytearray()
+            futures = []
+            with self._pending_lock:
+                for method, args, kwargs in calls:
+                    request_id = next(self._ids)
+                    _frame(request_id, _REQUEST, [method, args, kwargs], out)
+                    future: Future = Future()
+                    pending[request_id] = future
+                    futures.append(future)
+            try:
+                sock.sendall(out)
+            except OSError as e:
+                self._fail_pending(pending, e)
+        return futures
+
+    def _call(self, method: str, *args) -> Any:
+        return self._submit([(method, args, {})])[0].result()
+
+    def _read_loop(self, sock: socket.socket, pending: Dict[int, Future]) -> None:
+        buffer = bytearray()
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                for request_id, kind, payload in _split_frames(buffer):
+                    if kind == _EVENT:
+                        if self._events is not None:
+                            self._events.put(payload)
+                        continue
+                    with self._pending_lock:
+                        future = pending.pop(request_id, None)
+                    if future is None:
+                        continue
+                    if kind == _RESULT:
+                        future.set_result(payload)
+                    else:
+                        future.set_exception(_remote_error(*payload))
+        except Exception as e:
+            error = e
+        finally:
+            self._fail_pending(pending, error)
+            if self._events is not None:
+                self._events.put(None)
+
+    def _fail_pending(
+        self, pending: Dict[int, Future], cause: Optional[BaseException]
+    ) -> None:
+        with self._pending_lock:
+            futures = list(pending.values())
+            pending.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(
+                    SynthaConnectionError(
+                        f"Lost connection to context mesh server at {self.address}",
+                        service="context mesh server",
+                        cause=cause,
+                    )
+                )
+
+    def _deliver_events(self, events: queue.Queue) -> None:
+        # Callbacks run here rather than on the reader thread so they can call
+        # back into the mesh without blocking the replies they wait for
+        while True:
+            payload = events.get()
+            if payload is None:
+                return
+            listener_id, event = payload
+            with self._listener_lock:
+                callback = self._listeners.get(listener_id)
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception:
+                logger.exception(
+                    "RemoteContextMesh change listener failed for %s", event["key"]
+                )
+
+    def pipeline(self) -> RemotePipeline:
+        """Start a batch of calls sent to the server in a single write."""
+        return RemotePipeline(self)
+
+    def close(self) -> None:
+        """Close the connection. The server and its mesh keep running."""
+        with self._send_lock:
+            sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def push(
+        self,
+        key: str,
+        value: Any,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Add or update context. See ContextMesh.push()."""
+        self._call("push", key, value, subscribers, topics, ttl)
+
+    def push_many(self, items: List[Dict[str, Any]]) -> None:
+        """Add or update several context items. See ContextMesh.push_many()."""
+        self._call("push_many", items)
+
+    def patch(
+        self, key: str, merge_patch: Any, agent_name: Optional[str] = None
+    ) -> bool:
+        """Update part of a context value. See ContextMesh.patch()."""
+        return self._call("patch", key, merge_patch, agent_name)
+
+    def increment(
+        self,
+        key: str,
+        delta: Union[int, float] = 1,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> Union[int, float]:
+        """Atomically add to a numeric context value. See ContextMesh.increment()."""
+        return self._call("increment", key, delta, agent_name, subscribers, topics, ttl)
+
+    def append(
+        self,
+        key: str,
+        item: Any,
+        max_len: Optional[int] = None,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> int:
+        """Atomically append to a list context value. See ContextMesh.append()."""
+        return self._call(
+            "append", key, item, max_len, agent_name, subscribers, topics, ttl
+        )
+
+    def get(self, key: str, agent_name: Optional[str] = None) -> Optional[Any]:
+        """Retrieve a context item. See ContextMesh.get()."""
+        return self._call("get", key, agent_name)
+
+    def get_many(
+        self, keys: List[str], agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve several context items. See ContextMesh.get_many()."""
+        return self._call("get_many", keys, agent_name)
+
+    def get_prefix(
+        self, prefix: str, agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve the context items under a key prefix. See ContextMesh.get_prefix()."""
+        return self._call("get_prefix", prefix, agent_name)
+
+    def list_keys(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None,
+        limit: Optional[int] = None,
+        agent_name: Optional[str] = None,
+    ) -> List[str]:
+        """List context keys in sorted order. See ContextMesh.list_keys()."""
+        return self._call("list_keys", prefix, start_after, limit, agent_name)
+
+    def export_items(self, keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Export context items with their routing. See ContextMesh.export_items()."""
+        return self._call("export_items", keys)
+
+    def get_all_for_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Get all context accessible to an agent."""
+        return self._call("get_all_for_agent", agent_name)
+
+    def get_keys_for_agent(self, agent_name: str) -> List[str]:
+        """Get all context keys accessible to an agent."""
+        return self._call("get_keys_for_agent", agent_name)
+
+    def get_changes_since(
+        self,
+        cursor: int = 0,
+        agent_name: Optional[str] = None,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get the changes visible to an agent since a cursor."""
+        return self._call("get_changes_since", cursor, agent_name, keys, topics)
+
+    def current_cursor(self) -> int:
+        """Get a cursor for the current state. See ContextMesh.current_cursor()."""
+        return self._call("current_cursor")
+
+    def wait_for(
+        self,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        since: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Block until matching context changes. See ContextMesh.wait_for()."""
+        return self._call("wait_for", keys, topics, agent_name, timeout, since)
+
+    def on_change(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+    ) -> int:
+        """
+        Register a callback for context changes. See ContextMesh.on_change().
+
+        The server pushes matching events over the connection and callbacks
+        run, in order, on a delivery thread owned by this client.
+        """
+        with self._send_lock:
+            if self._events is None:
+                self._events = queue.Queue()
+                threading.Thread(
+                    target=self._deliver_events,
+                    args=(self._events,),
+                    name="syntha-remote-events",
+                    daemon=True,
+                ).start()
+        # Events can arrive before the reply; delivery waits on this lock
+        # until the callback is registered
+        with self._listener_lock:
+            listener_id = self._call("on_change", keys, topics, agent_name)
+            self._listeners[listener_id] = callback
+        return listener_id
+
+    def remove_change_listener(self, listener_id: int) -> bool:
+        """Remove a callback registered with on_change()."""
+        with self._listener_lock:
+            self._listeners.pop(listener_id, None)
+        return self._call("remove_change_listener", listener_id)
+
+    def remove(self, key: str) -> bool:
+        """Remove a context item from the mesh."""
+        return self._call("remove", key)
+
+    def clear(self) -> None:
+        """Clear all context items."""
+        self._call("clear")
+
+    def cleanup_expired(self) -> int:
+        """Remove expired items and return how many were removed."""
+        return self._call("cleanup_expired")
+
+    def flush(self) -> None:
+        """Commit the server mesh's queued database writes."""
+        self._call("flush")
+
+    def size(self) -> int:
+        """Get the number of items in the mesh."""
+        return self._call("size")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the context mesh."""
+        return self._call("get_stats")
+
+    def register_agent_topics(self, agent_name: str, topics: List[str]) -> None:
+        """Register the topics an agent is interested in."""
+        self._call("register_agent_topics", agent_name, topics)
+
+    def get_topics_for_agent(self, agent_name: str) -> List[str]:
+        """Get the topics an agent is subscribed to."""
+        return self._call("get_topics_for_agent", agent_name)
+
+    def get_subscribers_for_topic(self, topic: str) -> List[str]:
+        """Get all agents subscribed to a topic."""
+        return self._call("get_subscribers_for_topic", topic)
+
+    def get_all_topics(self) -> List[str]:
+        """Get all topics that have subscribers."""
+        return self._call("get_all_topics")
+
+    def unsubscribe_from_topics(self, agent_name: str, topics: List[str]) -> None:
+        """Unsubscribe an agent from specific topics."""
+        self._call("unsubscribe_from_topics", agent_name, topics)
+
+    def delete_topic(self, topic: str) -> int:
+        """Delete a topic and its context. Returns the number of items deleted."""
+        return self._call("delete_topic", topic)
+
+    def get_available_keys_by_topic(self, agent_name: str) -> Dict[str, List[str]]:
+        """Get the keys accessible to an agent, grouped by topic."""
+        return self._call("get_available_keys_by_topic", agent_name)
+
+    def set_agent_post_permissions(
+        self, agent_name: str, allowed_topics: List[str]
+    ) -> None:
+        """Set which topics an agent is allowed to post to."""
+        self._call("set_agent_post_permissions", agent_name, allowed_topics)
+
+    def get_agent_post_permissions(self, agent_name: str) -> List[str]:
+        """Get the topics an agent is allowed to post to."""
+        return self._call("get_agent_post_permissions", agent_name)
+
+    def get_all_post_permissions(self) -> Dict[str, List[str]]:
+        """Get the posting permissions of every agent that has them."""
+        return self._call("get_all_post_permissions")
+
+    def can_agent_post_to_topic(self, agent_name: str, topic: str) -> bool:
+        """Check whether an agent can post to a topic."""
+        return self._call("can_agent_post_to_topic", agent_name, topic)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a context mesh server: ``python -m syntha.server``."""
+    parser = argparse.ArgumentParser(description="Serve a Syntha ContextMesh")
+    parser.add_argument("--socket", help="Unix socket path to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host")
+    parser.add_argument("--port", type=int, default=7733, help="TCP port")
+    parser.add_argument("--user-id", help="Serve context for this user only")
+    parser.add_argument(
+        "--db-backend", default="sqlite", choices=["sqlite", "postgresql"]
+    )
+    parser.add_argument("--db-path", help="SQLite database path")
+    parser.add_argument("--connection-string", help="PostgreSQL connection string")
+    parser.add_argument(
+        "--no-persistence", action="store_true", help="Keep context in memory only"
+    )
+    args = parser.parse_args(argv)
+
+    db_config = {}
+    if args.db_path:
+        db_config["db_path"] = args.db_path
+    if args.connection_string:
+        db_config["connection_string"] = args.connection_string
+
+    server = ContextMeshServer(
+        address=args.socket or (args.host, args.port),
+        enable_persistence=not args.no_persistence,
+        db_backend=args.db_backend,
+        user_id=args.user_id,
+        **db_config,
+    )
+    logger.info("Serving context mesh on %s", server.address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
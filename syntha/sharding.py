@@ -0,0 +1,777 @@
+"""
+Sharded Context Mesh - partition context across several meshes.
+
+Copyright 2025 Syntha
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Routes a tenant's context to backend meshes (in-process ContextMesh instances,
+RemoteContextMesh clients, or anything else with the ContextMesh API) using
+consistent hashing, so adding or removing a shard only moves the context that
+hashes to it.
+"""
+
+import bisect
+import hashlib
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .context import ReadWriteLock
+
+logger = logging.getLogger(__name__)
+
+# Supported values for the ShardedContextMesh ``partition_by`` option
+PARTITION_MODES = ("user", "key")
+
+# How many composite cursors a ShardedContextMesh remembers; older cursors
+# get a reset from get_changes_since(), like cursors older than the change log
+_CURSOR_LIMIT = 4096
+
+# Longest a multi-shard wait_for() sleeps between checks, so TTL expiry is
+# noticed without change events
+_WAIT_POLL_INTERVAL = 1.0
+
+
+def _hash(value: str) -> int:
+    """Stable 64-bit hash, identical in every process (unlike hash())."""
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class _TopologySide:
+    """
+    One side of a ShardedContextMesh's topology lock.
+
+    Listener callbacks that shards invoke while this thread holds the lock are
+    queued, and run once it is released.
+    """
+
+    def __init__(self, mesh: "ShardedContextMesh", side: Any):
+        self._mesh = mesh
+        self._side = side
+
+    def __enter__(self):
+        self._side.acquire()
+        local = self._mesh._local
+        local.depth = getattr(local, "depth", 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        mesh = self._mesh
+        self._side.release()
+        mesh._local.depth -= 1
+        if not mesh._local.depth and mesh._events:
+            mesh._dispatch_events()
+
+
+class HashRing:
+    """
+    Consistent hash ring with virtual nodes.
+
+    Each node is placed on the ring at ``virtual_nodes`` points, and a key
+    belongs to the node owning the first point at or after the key's hash.
+    Adding or removing a node only changes the owner of about 1/N of the keys.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = 128):
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be at least 1")
+        self.virtual_nodes = virtual_nodes
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self._nodes: Dict[str, None] = {}
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """The nodes on the ring, in the order they were added."""
+        return list(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._nodes
+
+    def add_node(self, node: str) -> None:
+        """Place a node on the ring."""
+        if node in self._nodes:
+            raise ValueError(f"Node {node!r} is already on the ring")
+        self._nodes[node] = None
+        for replica in range(self.virtual_nodes):
+            point = _hash(f"{node}#{replica}")
+            index = bisect.bisect_left(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def remove_node(self, node: str) -> None:
+        """Take a node off the ring."""
+        if node not in self._nodes:
+            raise ValueError(f"Node {node!r} is not on the ring")
+        del self._nodes[node]
+        kept = [
+            (point, owner)
+            for point, owner in zip(self._points, self._owners)
+            if owner != node
+        ]
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def get_node(self, key: str) -> str:
+        """Get the node that owns a key."""
+        if not self._points:
+            raise ValueError("The hash ring has no nodes")
+        index = bisect.bisect_left(self._points, _hash(key))
+        return self._owners[index % len(self._owners)]
+
+
+class ShardedContextMesh:
+    """
+    ContextMesh API over several backend meshes, partitioned by consistent
+    hashing.
+
+    With ``partition_by="user"`` (the default) a tenant's whole context lives
+    on the shard its ``user_id`` hashes to, so every operation goes to a
+    single backend. With ``partition_by="key"`` a single large tenant's keys
+    are spread over all shards; topic subscriptions and post permissions are
+    written to every shard so topic routing works on each of them, and reads
+    that span keys fan out and merge.
+    """
+
+    def __init__(
+        self,
+        shards: Dict[str, Any],
+        user_id: Optional[str] = None,
+        partition_by: str = "user",
+        virtual_nodes: int = 128,
+    ):
+        """
+        Create a sharded mesh.
+
+        Args:
+            shards: Mapping of shard name to a backend mesh, or to a factory
+                called with ``user_id`` that returns the tenant's mesh on that
+                shard. ``partition_by="user"`` requires factories.
+            user_id: The tenant, used for partitioning and passed to factories
+            partition_by: "user" or "key"
+            virtual_nodes: Points per shard on the hash ring
+        """
+        if partition_by not in PARTITION_MODES:
+            raise ValueError(
+                f"Unsupported partition_by {partition_by!r}; "
+                f"expected one of {', '.join(PARTITION_MODES)}"
+            )
+        if not shards:
+            raise ValueError("ShardedContextMesh needs at least one shard")
+
+        self.user_id = user_id
+        self.partition_by = partition_by
+        self._ring = HashRing(virtual_nodes=virtual_nodes)
+        self._specs: Dict[str, Any] = {}
+        self._backends: Dict[str, Any] = {}
+        self._owned: set = set()
+        self._topology = ReadWriteLock()
+        self._reading = _TopologySide(self, self._topology.reader)
+        self._writing = _TopologySide(self, self._topology.writer)
+        self._local = threading.local()
+
+        self._cursor_lock = threading.Lock()
+        self._cursor_ids = itertools.count(1)
+        self._cursors: "OrderedDict[int, Dict[str, int]]" = OrderedDict()
+
+        self._listener_ids = itertools.count(1)
+        self._listeners: Dict[int, Tuple[tuple, Dict[str, int]]] = {}
+        # Listener events raised while the topology lock was held
+        self._events: deque = deque()
+        self._dispatch_lock = threading.RLock()
+
+        for name, spec in shards.items():
+            self._add_spec(name, spec)
+        for name in self._owners():
+            self._backends[name] = self._open(name)
+
+    @property
+    def shards(self) -> List[str]:
+        """The shard names on the hash ring."""
+        return self._ring.nodes
+
+    def shard_for(self, key: str) -> str:
+        """Get the name of the shard that stores a key."""
+        if self.partition_by == "user":
+            return self._ring.get_node(self.user_id or "")
+        return self._ring.get_node(key)
+
+    def _add_spec(self, name: str, spec: Any) -> None:
+        if self.partition_by == "user" and not callable(spec):
+            raise ValueError(
+                "partition_by='user' needs shard factories that create a "
+                "tenant's mesh from its user_id"
+            )
+        self._ring.add_node(name)
+        self._specs[name] = spec
+
+    def _owners(self) -> List[str]:
+        """The shards that should have a backend open for this tenant."""
+        if self.partition_by == "user":
+            return [self._ring.get_node(self.user_id or "")]
+        return self._ring.nodes
+
+    def _open(self, name: str) -> Any:
+        spec = self._specs[name]
+        if callable(spec):
+            self._owned.add(name)
+            return spec(self.user_id)
+        return spec
+
+    def _backend_for(self, key: str) -> Any:
+        return self._backends[self.shard_for(key)]
+
+    def _primary(self) -> Any:
+        """The backend that answers tenant-wide routing queries."""
+        return next(iter(self._backends.values()))
+
+    def _group(self, keys: Iterable[str]) -> Dict[str, List[str]]:
+        """Group keys by the shard that stores them, keeping their order."""
+        groups: Dict[str, List[str]] = {}
+        for key in keys:
+            groups.setdefault(self.shard_for(key), []).append(key)
+        return groups
+
+    def add_shard(self, name: str, shard: Any) -> None:
+        """
+        Add a shard and move the context that now hashes to it.
+
+        Outstanding cursors get a reset from get_changes_since() afterwards.
+        """
+        with self._writing:
+            self._add_spec(name, shard)
+            self._rebalance()
+
+    def remove_shard(self, name: str) -> None:
+        """
+        Remove a shard after moving its context to the remaining shards.
+
+        Outstanding cursors get a reset from get_changes_since() afterwards.
+        """
+        with self._writing:
+            if name not in self._ring:
+                raise ValueError(f"Unknown shard {name!r}")
+            if len(self._ring) == 1:
+                raise ValueError("Cannot remove the last shard")
+            self._ring.remove_node(name)
+            self._rebalance()
+            del self._specs[name]
+
+    def _rebalance(self) -> None:
+        """Open and drain backends to match the ring. Assumes writer lock."""
+        owners = self._owners()
+        source = self._primary()
+
+        # New shards need the tenant's routing before they receive context
+        for name in owners:
+            if name not in self._backends:
+                backend = self._open(name)
+                self._copy_routing(source, backend)
+                for args, backend_ids in self._listeners.values():
+                    backend_ids[name] = backend.on_change(*args)
+                self._backends[name] = backend
+
+        for name, backend in list(self._backends.items()):
+            moving: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in backend.export_items():
+                owner = self.shard_for(entry["key"])
+                if owner != name:
+                    moving.setdefault(owner, []).append(entry)
+
+            # Remove before pushing so change listeners end on a "set" event.
+            # The removals are committed first in case both shards write to
+            # the same database.
+            for owner, entries in moving.items():
+                for entry in entries:
+                    backend.remove(entry["key"])
+                backend.flush()
+                self._backends[owner].push_many(entries)
+
+            # Every item has moved, and clear() would also delete the rows
+            # the new shard just wrote when both shards share a database
+            if name not in owners:
+                for _, backend_ids in self._listeners.values():
+                    listener_id = backend_ids.pop(name, None)
+                    if listener_id is not None:
+                        backend.remove_change_listener(listener_id)
+                del self._backends[name]
+                if name in self._owned:
+                    self._owned.discard(name)
+                    backend.close()
+
+        with self._cursor_lock:
+            self._cursors.clear()
+
+    @staticmethod
+    def _copy_routing(source: Any, target: Any) -> None:
+        """Copy topic subscriptions and post permissions between backends."""
+        agents: Dict[str, None] = {}
+        for topic in source.get_all_topics():
+            agents.update(dict.fromkeys(source.get_subscribers_for_topic(topic)))
+        for agent_name in agents:
+            target.register_agent_topics(
+                agent_name, source.get_topics_for_agent(agent_name)
+            )
+        for agent_name, topics in source.get_all_post_permissions().items():
+            target.set_agent_post_permissions(agent_name, topics)
+
+    def close(self) -> None:
+        """Close the backends created from shard factories."""
+        with self._writing:
+            for name in self._owned:
+                self._backends[name].close()
+            self._owned.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def push(
+        self,
+        key: str,
+        value: Any,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Add or update context. See ContextMesh.push()."""
+        with self._reading:
+            self._backend_for(key).push(key, value, subscribers, topics, ttl)
+
+    def push_many(self, items: List[Dict[str, Any]]) -> None:
+        """Add or update several context items. See ContextMesh.push_many()."""
+        for entry in items:
+            if "key" not in entry or "value" not in entry:
+                raise ValueError("Each item passed to push_many needs a key and value")
+        with self._reading:
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in items:
+                groups.setdefault(self.shard_for(entry["key"]), []).append(entry)
+            for name, entries in groups.items():
+                self._backends[name].push_many(entries)
+
+    def patch(
+        self, key: str, merge_patch: Any, agent_name: Optional[str] = None
+    ) -> bool:
+        """Update part of a context value. See ContextMesh.patch()."""
+        with self._reading:
+            return self._backend_for(key).patch(key, merge_patch, agent_name)
+
+    def increment(
+        self,
+        key: str,
+        delta: Union[int, float] = 1,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> Union[int, float]:
+        """Atomically add to a numeric context value. See ContextMesh.increment()."""
+        with self._reading:
+            return self._backend_for(key).increment(
+                key, delta, agent_name, subscribers, topics, ttl
+            )
+
+    def append(
+        self,
+        key: str,
+        item: Any,
+        max_len: Optional[int] = None,
+        agent_name: Optional[str] = None,
+        subscribers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+    ) -> int:
+        """Atomically append to a list context value. See ContextMesh.append()."""
+        with self._reading:
+            return self._backend_for(key).append(
+                key, item, max_len, agent_name, subscribers, topics, ttl
+            )
+
+    def get(self, key: str, agent_name: Optional[str] = None) -> Optional[Any]:
+        """Retrieve a context item. See ContextMesh.get()."""
+        with self._reading:
+            return self._backend_for(key).get(key, agent_name)
+
+    def get_many(
+        self, keys: List[str], agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve several context items. See ContextMesh.get_many()."""
+        found: Dict[str, Any] = {}
+        with self._reading:
+            for name, shard_keys in self._group(keys).items():
+                found.update(self._backends[name].get_many(shard_keys, agent_name))
+        return {key: found[key] for key in keys if key in found}
+
+    def get_prefix(
+        self, prefix: str, agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve the context items under a key prefix. See ContextMesh.get_prefix()."""
+        found: Dict[str, Any] = {}
+        with self._reading:
+            for backend in self._backends.values():
+                found.update(backend.get_prefix(prefix, agent_name))
+        return {key: found[key] for key in sorted(found)}
+
+    def list_keys(
+        self,
+        prefix: str = "",
+        start_after: Optional[str] = None,
+        limit: Optional[int] = None,
+        agent_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        List context keys in sorted order. See ContextMesh.list_keys().
+
+        Every shard returns up to ``limit`` keys and the sorted lists are
+        merged, so a page never needs more than ``limit`` keys per shard.
+        """
+        with self._reading:
+            pages = [
+                backend.list_keys(prefix, start_after, limit, agent_name)
+                for backend in self._backends.values()
+            ]
+        return list(itertools.islice(heapq.merge(*pages), limit))
+
+    def export_items(self, keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Export context items with their routing. See ContextMesh.export_items()."""
+        entries: List[Dict[str, Any]] = []
+        with self._reading:
+            if keys is None:
+                for backend in self._backends.values():
+                    entries.extend(backend.export_items())
+            else:
+                for name, shard_keys in self._group(keys).items():
+                    entries.extend(self._backends[name].export_items(shard_keys))
+        return entries
+
+    def get_all_for_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Get all context accessible to an agent."""
+        result: Dict[str, Any] = {}
+        with self._reading:
+            for backend in self._backends.values():
+                result.update(backend.get_all_for_agent(agent_name))
+        return result
+
+    def get_keys_for_agent(self, agent_name: str) -> List[str]:
+        """Get all context keys accessible to an agent."""
+        keys: List[str] = []
+        with self._reading:
+            for backend in self._backends.values():
+                keys.extend(backend.get_keys_for_agent(agent_name))
+        return keys
+
+    def _issue_cursor(self, positions: Dict[str, int]) -> int:
+        """Get a router cursor standing for a cursor on each backend."""
+        with self._cursor_lock:
+            cursor = next(self._cursor_ids)
+            self._cursors[cursor] = positions
+            if len(self._cursors) > _CURSOR_LIMIT:
+                self._cursors.popitem(last=False)
+        return cursor
+
+    def current_cursor(self) -> int:
+        """Get a cursor for the current state. See ContextMesh.current_cursor()."""
+        with self._reading:
+            return self._issue_cursor(
+                {
+                    name: backend.current_cursor()
+                    for name, backend in self._backends.items()
+                }
+            )
+
+    def get_changes_since(
+        self,
+        cursor: int = 0,
+        agent_name: Optional[str] = None,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the changes visible to an agent since a cursor.
+
+        Cursors are issued by this sharded mesh and stand for a position on
+        every shard. A cursor it does not know, for example one from before
+        a rebalance, gets a reset with the full visible context.
+        """
+        with self._reading:
+            with self._cursor_lock:
+                positions = self._cursors.get(cursor) if cursor else None
+
+            def changes_from(name: str, position: int) -> Dict[str, Any]:
+                return self._backends[name].get_changes_since(
+                    position, agent_name, keys, topics
+                )
+
+            results = {
+                name: changes_from(name, positions.get(name, 0) if positions else 0)
+                for name in self._backends
+            }
+            reset = (cursor != 0 and positions is None) or any(
+                changes["reset"] for changes in results.values()
+            )
+            if reset:
+                # Every shard has to answer in full for the reset to replace
+                # the caller's state
+                for name, changes in results.items():
+                    if not changes["reset"]:
+                        results[name] = changes_from(name, 0)
+
+            changed: Dict[str, Any] = {}
+            removed: List[str] = []
+            for changes in results.values():
+                changed.update(changes["changed"])
+                removed.extend(changes["removed"])
+            new_positions = {
+                name: changes["cursor"] for name, changes in results.items()
+            }
+
+        if new_positions == positions:
+            new_cursor = cursor
+        else:
+            new_cursor = self._issue_cursor(new_positions)
+        return {
+            "cursor": new_cursor,
+            "changed": changed,
+            # A key that moved shards is reported as changed, not removed
+            "removed": [key for key in removed if key not in changed],
+            "reset": reset,
+        }
+
+    def wait_for(
+        self,
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        since: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Block until matching context changes. See ContextMesh.wait_for()."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        cursor = self.current_cursor() if since is None else since
+
+        changed = threading.Event()
+        listener_id = self.on_change(
+            lambda event: changed.set(), keys, topics, agent_name
+        )
+        try:
+            while True:
+                changed.clear()
+                changes = self.get_changes_since(cursor, agent_name, keys, topics)
+                if changes["changed"] or changes["removed"]:
+                    return changes
+                cursor = changes["cursor"]
+
+                wait_time = _WAIT_POLL_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    wait_time = min(wait_time, remaining)
+                changed.wait(wait_time)
+        finally:
+            self.remove_change_listener(listener_id)
+
+    def on_change(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        keys: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        agent_name: Optional[str] = None,
+    ) -> int:
+        """
+        Register a callback for context changes on every shard.
+
+        See ContextMesh.on_change(). Event ``sequence`` numbers are per shard.
+        """
+        with self._writing:
+            listener_id = next(self._listener_ids)
+            args = (self._deliver(listener_id, callback), keys, topics, agent_name)
+            backend_ids = {
+                name: backend.on_change(*args)
+                for name, backend in self._backends.items()
+            }
+            self._listeners[listener_id] = (args, backend_ids)
+        return listener_id
+
+    def _deliver(
+        self, listener_id: int, callback: Callable[[Dict[str, Any]], None]
+    ) -> Callable[[Dict[str, Any]], None]:
+        """Wrap a callback so it never runs under this thread's topology lock."""
+
+        def deliver(event: Dict[str, Any]) -> None:
+            if getattr(self._local, "depth", 0):
+                # A callback that calls back into the mesh would wait for the
+                # topology lock behind a rebalance that waits for this thread
+                self._events.append((listener_id, callback, event))
+            else:
+                callback(event)
+
+        return deliver
+
+    def _dispatch_events(self) -> None:
+        """Run the queued listener callbacks, in order."""
+        with self._dispatch_lock:
+            while self._events:
+                listener_id, callback, event = self._events.popleft()
+                if listener_id not in self._listeners:
+                    continue
+                try:
+                    callback(event)
+                except Exception:
+                    logger.exception(
+                        "ShardedContextMesh change listener failed for %s",
+                        event["key"],
+                    )
+
+    def remove_change_listener(self, listener_id: int) -> bool:
+        """Remove a callback registered with on_change()."""
+        with self._writing:
+            entry = self._listeners.pop(listener_id, None)
+            if entry is None:
+                return False
+            for name, backend_id in entry[1].items():
+                self._backends[name].remove_change_listener(backend_id)
+        return True
+
+    def remove(self, key: str) -> bool:
+        """Remove a context item from the mesh."""
+        with self._reading:
+            return self._backend_for(key).remove(key)
+
+    def clear(self) -> None:
+        """Clear all context items on every shard."""
+        with self._reading:
+            for backend in self._backends.values():
+                backend.clear()
+
+    def cleanup_expired(self) -> int:
+        """Remove expired items and return how many were removed."""
+        with self._reading:
+            return sum(backend.cleanup_expired() for backend in self._backends.values())
+
+    def flush(self) -> None:
+        """Commit the queued database writes of every shard."""
+        with self._reading:
+            for backend in self._backends.values():
+                backend.flush()
+
+    def size(self) -> int:
+        """Get the number of items in the mesh."""
+        with self._reading:
+            return sum(backend.size() for backend in self._backends.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics summed over the shards."""
+        with self._reading:
+            shard_stats = [backend.get_stats() for backend in self._backends.values()]
+        stats: Dict[str, Any] = {}
+        for backend_stats in shard_stats:
+            for name, value in backend_stats.items():
+                stats[name] = stats.get(name, 0) + value
+        # Routing is the same on every shard, so count it once
+        for name in ("total_topics", "agents_with_topics"):
+            if name in shard_stats[0]:
+                stats[name] = shard_stats[0][name]
+        # A ratio is recomputed from the summed sizes
+        if "compression_ratio" in stats:
+            compressed_bytes = stats["compressed_bytes"]
+            stats["compression_ratio"] = (
+                stats["uncompressed_bytes"] / compressed_bytes
+                if compressed_bytes
+                else 1.0
+            )
+        stats["shards"] = len(shard_stats)
+        return stats
+
+    def register_agent_topics(self, agent_name: str, topics: List[str]) -> None:
+        """Register the topics an agent is interested in, on every shard."""
+        with self._reading:
+            for backend in self._backends.values():
+                backend.register_agent_topics(agent_name, topics)
+
+    def get_topics_for_agent(self, agent_name: str) -> List[str]:
+        """Get the topics an agent is subscribed to."""
+        with self._reading:
+            return self._primary().get_topics_for_agent(agent_name)
+
+    def get_subscribers_for_topic(self, topic: str) -> List[str]:
+        """Get all agents subscribed to a topic."""
+        with self._reading:
+            return self._primary().get_subscribers_for_topic(topic)
+
+    def get_all_topics(self) -> List[str]:
+        """Get all topics that have subscribers."""
+        with self._reading:
+            return self._primary().get_all_topics()
+
+    def unsubscribe_from_topics(self, agent_name: str, topics: List[str]) -> None:
+        """Unsubscribe an agent from specific topics, on every shard."""
+        with self._reading:
+            for backend in self._backends.values():
+                backend.unsubscribe_from_topics(agent_name, topics)
+
+    def delete_topic(self, topic: str) -> int:
+        """Delete a topic and its context. Returns the number of items deleted."""
+        with self._reading:
+            return sum(
+                backend.delete_topic(topic) for backend in self._backends.values()
+            )
+
+    def get_available_keys_by_topic(self, agent_name: str) -> Dict[str, List[str]]:
+        """Get the keys accessible to an agent, grouped by topic."""
+        result: Dict[str, List[str]] = {}
+        with self._reading:
+            for backend in self._backends.values():
+                for topic, keys in backend.get_available_keys_by_topic(
+                    agent_name
+                ).items():
+                    result.setdefault(topic, []).extend(keys)
+        return result
+
+    def set_agent_post_permissions(
+        self, agent_name: str, allowed_topics: List[str]
+    ) -> None:
+        """Set which topics an agent is allowed to post to, on every shard."""
+        with self._reading:
+            for backend in self._backends.values():
+                backend.set_agent_post_permissions(agent_name, allowed_topics)
+
+    def get_agent_post_permissions(self, agent_name: str) -> List[str]:
+        """Get the topics an agent is allowed to post to."""
+        with self._reading:
+            return self._primary().get_agent_post_permissions(agent_name)
+
+    def get_all_post_permissions(self) -> Dict[str, List[str]]:
+        """Get the posting permissions of every agent that has them."""
+        with self._reading:
+            return self._primary().get_all_post_permissions()
+
+    def can_agent_post_to_topic(self, agent_name: str, topic: str) -> bool:
+        """Check whether an agent can post to a topic."""
+        with self._reading:
+            return self._primary().can_agent_post_to_topic(agent_name, topic)
@@ -56,7 +56,11 @@ def get_context_tool_schema() -> Dict[str, Any]:
                     "type": "array",
                     "items": {"type": "string"},
                     "description": "Specific context keys to retrieve. Use list_context to see available options.",
-                }
+                },
+                "prefix": {
+                    "type": "string",
+                    "description": "Only retrieve context whose keys start with this prefix (e.g. 'project/123/').",
+                },
             },
             "required": [],
         },
@@ -64,7 +68,10 @@ def get_context_tool_schema() -> Dict[str, Any]:
 
 
 def handle_get_context_call(
-    context_mesh: ContextMesh, agent_name: str, keys: Optional[List[str]] = None
+    context_mesh: ContextMesh,
+    agent_name: str,
+    keys: Optional[List[str]] = None,
+    prefix: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Handle a get_context function call from an agent.
@@ -73,18 +80,22 @@ def handle_get_context_call(
         context_mesh: The ContextMesh instance to query
         agent_name: Name of the requesting agent (auto-injected by ToolHandler)
         keys: Optional list of specific keys to retrieve
+        prefix: Optional key prefix the retrieved keys must start with
 
     Returns:
         Dictionary with context data and metadata
     """
     try:
         if keys:
-            # Retrieve specific keys
-            result = {}
-            for key in keys:
-                value = context_mesh.get(key, agent_name)
-                if value is not None:
-                    result[key] = value
+            # Retrieve specific keys in one batch (single lock acquisition)
+            result = {
+                key: value
+                for key, value in context_mesh.get_many(keys, agent_name).items()
+                if value is not None and (not prefix or key.startswith(prefix))
+            }
+        elif prefix:
+            # Retrieve the accessible keys under the prefix
+            result = context_mesh.get_prefix(prefix, agent_name)
         else:
             # Retrieve all accessible context
             result = context_mesh.get_all_for_agent(agent_name)
@@ -241,6 +252,294 @@ def handle_push_context_call(
         }
 
 
+def get_patch_context_tool_schema() -> Dict[str, Any]:
+    """
+    Get the function schema for updating part of an existing context value.
+
+    Returns:
+        Function schema dictionary for patching context
+    """
+    return {
+        "name": "patch_context",
+        "description": """Update some fields of existing context without resending the whole value.
+        
+        The patch is a JSON object (JSON merge patch): its fields replace the
+        matching fields, nested objects are merged, and null removes a field.
+        Example: {"status": "done", "draft": null}
+        
+        You don't need to specify your agent name - the system knows who you are.""",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key of the context to update",
+                },
+                "patch": {
+                    "type": "string",
+                    "description": "JSON object with the fields to change (null removes a field)",
+                },
+            },
+            "required": ["key", "patch"],
+        },
+    }
+
+
+def handle_patch_context_call(
+    context_mesh: ContextMesh,
+    key: str,
+    patch: Any,
+    sender_agent: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Handle a patch_context function call from an agent.
+
+    Args:
+        context_mesh: The ContextMesh instance to update
+        key: Context key to update
+        patch: JSON merge patch, as a dict or JSON text
+        sender_agent: Agent updating the context (auto-injected by ToolHandler)
+
+    Returns:
+        Dictionary with operation status
+    """
+    try:
+        if isinstance(patch, str):
+            patch = json.loads(patch)
+        if not isinstance(patch, dict):
+            raise ValueError("patch must be a JSON object")
+
+        if not context_mesh.patch(key, patch, sender_agent):
+            return {
+                "success": False,
+                "error": f"Context '{key}' not found or not accessible",
+                "key": key,
+            }
+
+        return {
+            "success": True,
+            "message": f"Context '{key}' updated",
+            "key": key,
+            "fields": list(patch.keys()),
+            "sender_agent": sender_agent,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "key": key,
+        }
+
+
+def get_increment_context_tool_schema() -> Dict[str, Any]:
+    """
+    Get the function schema for atomically updating a shared counter.
+
+    Returns:
+        Function schema dictionary for incrementing context
+    """
+    return {
+        "name": "increment_context",
+        "description": """Add to a shared counter, such as "tasks_completed".
+        
+        Safe when several agents update the same counter at once. A counter
+        that does not exist yet is created with the given amount and shared
+        with 'topics' and 'subscribers' like push_context.
+        
+        You don't need to specify your agent name - the system knows who you are.""",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key of the counter",
+                },
+                "delta": {
+                    "type": "number",
+                    "description": "Amount to add (negative to subtract). Default: 1",
+                },
+                "topics": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Topics to share a new counter with",
+                },
+                "subscribers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific agents to share a new counter with",
+                },
+                "ttl_hours": {
+                    "type": "number",
+                    "description": "How long a new counter should remain available (hours). Default: 24 hours",
+                },
+            },
+            "required": ["key"],
+        },
+    }
+
+
+def handle_increment_context_call(
+    context_mesh: ContextMesh,
+    key: str,
+    delta: float = 1,
+    topics: Optional[List[str]] = None,
+    subscribers: Optional[List[str]] = None,
+    ttl_hours: float = 24.0,
+    sender_agent: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Handle an increment_context function call from an agent.
+
+    Args:
+        context_mesh: The ContextMesh instance to update
+        key: Context key of the counter
+        delta: Amount to add
+        topics: Topics of a newly created counter (optional)
+        subscribers: Agents targeted by a newly created counter (optional)
+        ttl_hours: Time-to-live in hours of a newly created counter
+        sender_agent: Agent updating the counter (auto-injected by ToolHandler)
+
+    Returns:
+        Dictionary with operation status and the new value
+    """
+    try:
+        ttl_seconds = ttl_hours * 3600 if ttl_hours > 0 else None
+        value = context_mesh.increment(
+            key,
+            delta,
+            sender_agent,
+            subscribers=subscribers,
+            topics=topics,
+            ttl=ttl_seconds,
+        )
+        return {
+            "success": True,
+            "message": f"Context '{key}' is now {value}",
+            "key": key,
+            "value": value,
+            "sender_agent": sender_agent,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "key": key,
+        }
+
+
+def get_append_context_tool_schema() -> Dict[str, Any]:
+    """
+    Get the function schema for atomically adding an entry to a shared list.
+
+    Returns:
+        Function schema dictionary for appending to context
+    """
+    return {
+        "name": "append_context",
+        "description": """Add an entry to the end of a shared list, such as a log of decisions.
+        
+        Safe when several agents add entries at once, and only the new entry
+        is sent. A list that does not exist yet is created and shared with
+        'topics' and 'subscribers' like push_context. Use 'max_len' to keep
+        only the most recent entries.
+        
+        You don't need to specify your agent name - the system knows who you are.""",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key of the list",
+                },
+                "entry": {
+                    "type": "string",
+                    "description": "The entry to add (text or JSON)",
+                },
+                "max_len": {
+                    "type": "integer",
+                    "description": "Keep only this many of the most recent entries",
+                },
+                "topics": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Topics to share a new list with",
+                },
+                "subscribers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific agents to share a new list with",
+                },
+                "ttl_hours": {
+                    "type": "number",
+                    "description": "How long a new list should remain available (hours). Default: 24 hours",
+                },
+            },
+            "required": ["key", "entry"],
+        },
+    }
+
+
+def handle_append_context_call(
+    context_mesh: ContextMesh,
+    key: str,
+    entry: Any,
+    max_len: Optional[int] = None,
+    topics: Optional[List[str]] = None,
+    subscribers: Optional[List[str]] = None,
+    ttl_hours: float = 24.0,
+    sender_agent: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Handle an append_context function call from an agent.
+
+    Args:
+        context_mesh: The ContextMesh instance to update
+        key: Context key of the list
+        entry: Entry to append (will attempt JSON parsing)
+        max_len: Number of most recent entries to keep (optional)
+        topics: Topics of a newly created list (optional)
+        subscribers: Agents targeted by a newly created list (optional)
+        ttl_hours: Time-to-live in hours of a newly created list
+        sender_agent: Agent adding the entry (auto-injected by ToolHandler)
+
+    Returns:
+        Dictionary with operation status and the new length
+    """
+    try:
+        # Try to parse the entry as JSON, fall back to string
+        try:
+            parsed_entry = json.loads(entry)
+        except (json.JSONDecodeError, TypeError):
+            parsed_entry = entry
+
+        ttl_seconds = ttl_hours * 3600 if ttl_hours > 0 else None
+        length = context_mesh.append(
+            key,
+            parsed_entry,
+            max_len,
+            sender_agent,
+            subscribers=subscribers,
+            topics=topics,
+            ttl=ttl_seconds,
+        )
+        return {
+            "success": True,
+            "message": f"Added an entry to context '{key}'",
+            "key": key,
+            "length": length,
+            "sender_agent": sender_agent,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "key": key,
+        }
+
+
 def get_list_context_tool_schema() -> Dict[str, Any]:
     """
     Get the function schema for listing available context keys.
@@ -256,12 +555,21 @@ def get_list_context_tool_schema() -> Dict[str, Any]:
         This shows you what context is available so you can decide which keys to retrieve.
         
         You don't need to specify your agent name - the system knows who you are.""",
-        "parameters": {"type": "object", "properties": {}, "required": []},
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "prefix": {
+                    "type": "string",
+                    "description": "Only list keys that start with this prefix (e.g. 'project/123/').",
+                }
+            },
+            "required": [],
+        },
     }
 
 
 def handle_list_context_call(
-    context_mesh: ContextMesh, agent_name: str
+    context_mesh: ContextMesh, agent_name: str, prefix: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Handle a list_context_keys function call from an agent.
@@ -269,6 +577,7 @@ def handle_list_context_call(
     Args:
         context_mesh: The ContextMesh instance to query
         agent_name: Name of the requesting agent (auto-injected by ToolHandler)
+        prefix: Optional key prefix the listed keys must start with
 
     Returns:
         Dictionary with available keys organized by topic
@@ -277,8 +586,16 @@ def handle_list_context_call(
         # Get keys organized by topic
         keys_by_topic = context_mesh.get_available_keys_by_topic(agent_name)
 
-        # Also get all accessible keys (for backward compatibility)
-        all_keys = context_mesh.get_keys_for_agent(agent_name)
+        if prefix:
+            # Look the keys up in the sorted key index
+            all_keys = context_mesh.list_keys(prefix, agent_name=agent_name)
+            keys_by_topic = {
+                topic: [key for key in keys if key.startswith(prefix)]
+                for topic, keys in keys_by_topic.items()
+            }
+        else:
+            # Also get all accessible keys (for backward compatibility)
+            all_keys = context_mesh.get_keys_for_agent(agent_name)
 
         return {
             "success": True,
@@ -408,22 +725,21 @@ def handle_discover_topics_call(
         Dictionary with available topics and their subscriber information
     """
     try:
-        # Get all topics by examining the topic subscribers mapping
         all_topics = {}
 
-        # Access the internal topic mapping if available
-        if hasattr(context_mesh, "_topic_subscribers"):
-            for topic, agents in context_mesh._topic_subscribers.items():
-                subscriber_count = len(agents)
-                topic_info: Dict[str, Any] = {
-                    "subscriber_count": subscriber_count,
-                    "is_active": subscriber_count > 0,
-                }
+        # Only public methods are used so remote meshes work too
+        for topic in context_mesh.get_all_topics():
+            agents = context_mesh.get_subscribers_for_topic(topic)
+            subscriber_count = len(agents)
+            topic_info: Dict[str, Any] = {
+                "subscriber_count": subscriber_count,
+                "is_active": subscriber_count > 0,
+            }
 
-                if include_subscriber_names:
-                    topic_info["subscribers"] = list(agents)
+            if include_subscriber_names:
+                topic_info["subscribers"] = list(agents)
 
-                all_topics[topic] = topic_info
+            all_topics[topic] = topic_info
 
         # Sort topics by subscriber count (most popular first)
         sorted_topics = dict(
@@ -648,6 +964,9 @@ def get_all_tool_schemas() -> List[Dict[str, Any]]:
     return [
         get_context_tool_schema(),
         get_push_context_tool_schema(),
+        get_patch_context_tool_schema(),
+        get_increment_context_tool_schema(),
+        get_append_context_tool_schema(),
         get_list_context_tool_schema(),
         get_subscribe_to_topics_tool_schema(),
         get_discover_topics_tool_schema(),
@@ -711,6 +1030,9 @@ class ToolHandler:
         self.all_handlers = {
             "get_context": self.handle_get_context,
             "push_context": self.handle_push_context,
+            "patch_context": self.handle_patch_context,
+            "increment_context": self.handle_increment_context,
+            "append_context": self.handle_append_context,
             "list_context": self.handle_list_context,
             "subscribe_to_topics": self.handle_subscribe_to_topics,
             "discover_topics": self.handle_discover_topics,
@@ -828,6 +1150,30 @@ class ToolHandler:
         kwargs["sender_agent"] = self.agent_name
         return handle_push_context_call(self.context_mesh, **kwargs)
 
+    def handle_patch_context(self, **kwargs) -> Dict[str, Any]:
+        """Handle patch_context tool call."""
+        error = self._check_agent_name()
+        if error:
+            return error
+        kwargs["sender_agent"] = self.agent_name
+        return handle_patch_context_call(self.context_mesh, **kwargs)
+
+    def handle_increment_context(self, **kwargs) -> Dict[str, Any]:
+        """Handle increment_context tool call."""
+        error = self._check_agent_name()
+        if error:
+            return error
+        kwargs["sender_agent"] = self.agent_name
+        return handle_increment_context_call(self.context_mesh, **kwargs)
+
+    def handle_append_context(self, **kwargs) -> Dict[str, Any]:
+        """Handle append_context tool call."""
+        error = self._check_agent_name()
+        if error:
+            return error
+        kwargs["sender_agent"] = self.agent_name
+        return handle_append_context_call(self.context_mesh, **kwargs)
+
     def handle_list_context(self, **kwargs) -> Dict[str, Any]:
         """Handle list_context tool call."""
         error = self._check_agent_name()
@@ -1333,6 +1679,9 @@ PREDEFINED_ROLES = {
             "list_context",
             "discover_topics",
             "push_context",
+            "patch_context",
+            "increment_context",
+            "append_context",
             "subscribe_to_topics",
             "unsubscribe_from_topics",
         ],
@@ -1344,6 +1693,9 @@ PREDEFINED_ROLES = {
             "list_context",
             "discover_topics",
             "push_context",
+            "patch_context",
+            "increment_context",
+            "append_context",
             "subscribe_to_topics",
             "unsubscribe_from_topics",
         ],
@@ -1355,6 +1707,9 @@ PREDEFINED_ROLES = {
             "list_context",
             "discover_topics",
             "push_context",
+            "patch_context",
+            "increment_context",
+            "append_context",
             "subscribe_to_topics",
             "unsubscribe_from_topics",
             "delete_topic",
@@ -0,0 +1,554 @@
+"""
+Write-behind queue - batched, coalesced persistence for ContextMesh.
+
+Copyright 2025 Syntha
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Mesh mutations are queued in order and committed to the database backend in
+batches, one transaction per batch. A write that is overwritten before it is
+flushed (the same key pushed twice, an agent's topics changed twice) is
+coalesced into the latest one.
+"""
+
+import logging
+import time
+from threading import Condition, Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .compression import CompressedValue
+from .persistence import DatabaseBackend
+
+logger = logging.getLogger(__name__)
+
+# A queued write, e.g. ("save_item", row) or ("remove_agent_topics", agent_name)
+_Write = Tuple[Any, ...]
+
+# Writes queued since the last barrier, keyed by what they overwrite, such as
+# ("item", key). Writes to different slots are independent of each other.
+_Segment = Dict[Tuple[str, str], _Write]
+
+# Seconds a failed flush waits before the flusher thread tries again
+_RETRY_DELAY = 1.0
+
+# Seconds without writes after which the flusher thread exits; it is started
+# again by the next write
+_IDLE_EXIT = 5.0
+
+
+class WriteBehindQueue:
+    """
+    Ordered queue of database writes for one ContextMesh.
+
+    Writes are grouped into segments separated by barriers (clearing all
+    data, deleting a topic's data, sweeping expired rows). Within a segment
+    the latest write per item, agent subscription or agent permission set
+    replaces earlier ones; segments and barriers are applied in order, so the
+    database always ends up in the state of the last queued write.
+
+    With a ``flush_interval`` a background thread commits the queue once the
+    oldest pending write is that old, or once ``max_batch`` writes are
+    pending. Without one, writes stay queued until flush() is called.
+    """
+
+    def __init__(
+        self,
+        backend: DatabaseBackend,
+        user_id: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        max_batch: int = 1000,
+    ):
+        """
+        Create a queue.
+
+        Args:
+            backend: Connected database backend the writes are committed to
+            user_id: Write through the backend's per-user methods
+            flush_interval: Seconds a write may stay queued before the
+                background thread commits it (None disables the thread)
+            max_batch: Number of pending writes that triggers a flush
+        """
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self.backend = backend
+        self.user_id = user_id
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._user_scoped = bool(user_id) and hasattr(
+            backend, "save_context_items_for_user"
+        )
+        self._plain_values = not getattr(backend, "stores_compressed_values", False)
+
+        self._cond = Condition(Lock())
+        # Pending segments (dicts) and barriers (tuples), oldest first
+        self._segments: List[Union[_Segment, _Write]] = []
+        # Segments taken by the flush in progress; still visible to
+        # pending_item() until they are committed
+        self._in_flight: List[Union[_Segment, _Write]] = []
+        self._pending = 0
+        self._pending_since: Optional[float] = None
+
+        # Every write takes the next sequence number. Writes up to
+        # _committed are in the database; writes up to _attempted have been
+        # part of a flush, which failed with _error if _committed is lower.
+        self._sequence = 0
+        self._committed = 0
+        self._attempted = 0
+        self._error: Optional[BaseException] = None
+
+        self._flush_lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._closed = False
+
+        self._flushes = 0
+        self._coalesced = 0
+
+    # -- Queueing -----------------------------------------------------------
+
+    def save_items(self, rows: List[Tuple[Any, ...]]) -> int:
+        """
+        Queue context items for saving.
+
+        Args:
+            rows: Rows in the format of DatabaseBackend.save_context_items()
+
+        Returns:
+            Sequence number of the last queued write
+        """
+        with self._cond:
+            for row in rows:
+                self._put(("item", row[0]), ("save_item", row))
+            return self._queued()
+
+    def patch_item(self, row: Tuple[Any, ...], patch: Dict[str, Any]) -> int:
+        """
+        Queue a JSON merge patch of a saved item's value.
+
+        Args:
+            row: The patched item, in the format of save_items(); read by
+                pending_item() until the patch is committed
+            patch: The merge patch sent to the database
+
+        Returns:
+            Sequence number of the queued write
+        """
+        slot = ("item", row[0])
+        with self._cond:
+            segment = self._segments[-1] if self._segments else None
+            if isinstance(segment, dict) and slot in segment:
+                # Merge patches do not compose exactly (a removed member
+                # patched back in loses its other members), so save the result
+                self._put(slot, ("save_item", row))
+            else:
+                self._put(slot, ("patch_item", row, patch))
+            return self._queued()
+
+    def append_item(self, row: Tuple[Any, ...], items: List[Any], trim: int) -> int:
+        """
+        Queue entries appended to a saved item's list value.
+
+        Appends compose, so repeated appends to a key are merged into one
+        write; an earlier save or patch of the key in the same segment is
+        kept and applied first.
+
+        Args:
+            row: The item after the append, in the format of save_items();
+                read by pending_item() but never written
+            items: The appended entries
+            trim: Number of entries removed from the front of the list after
+                appending
+
+        Returns:
+            Sequence number of the queued write
+        """
+        slot = ("item", row[0])
+        with self._cond:
+            segment = self._segments[-1] if self._segments else None
+            earlier = segment.get(slot) if isinstance(segment, dict) else None
+            if earlier is not None and earlier[0] == "append_item":
+                earlier[2].extend(items)
+                write = ("append_item", row, earlier[2], earlier[3] + trim, earlier[4])
+            else:
+                write = ("append_item", row, list(items), trim, earlier)
+            self._put(slot, write)
+            return self._queued()
+
+    def delete_item(self, key: str) -> int:
+        """Queue the deletion of a context item."""
+        with self._cond:
+            self._put(("item", key), ("delete_item", key))
+            return self._queued()
+
+    def save_agent_topics(self, agent_name: str, topics: List[str]) -> int:
+        """Queue an agent's topic subscriptions for saving."""
+        with self._cond:
+            self._put(("topics", agent_name), ("save_agent_topics", agent_name, topics))
+            return self._queued()
+
+    def remove_agent_topics(self, agent_name: str) -> int:
+        """Queue the removal of an agent's topic subscriptions."""
+        with self._cond:
+            self._put(("topics", agent_name), ("remove_agent_topics", agent_name))
+            return self._queued()
+
+    def save_agent_permissions(self, agent_name: str, topics: List[str]) -> int:
+        """Queue an agent's post permissions for saving."""
+        with self._cond:
+            self._put(
+                ("permissions", agent_name),
+                ("save_agent_permissions", agent_name, topics),
+            )
+            return self._queued()
+
+    def clear(self) -> int:
+        """Queue clearing all data; pending writes it supersedes are dropped."""
+        with self._cond:
+            self._coalesced += self._pending
+            self._segments = [("clear",)]
+            self._pending = 1
+            return self._queued()
+
+    def delete_topic_data(self, topic: str) -> int:
+        """Queue the deletion of a topic's data."""
+        with self._cond:
+            self._barrier(("delete_topic_data", topic))
+            return self._queued()
+
+    def cleanup_expired(self, current_time: float) -> int:
+        """Queue the deletion of rows expired at ``current_time``."""
+        with self._cond:
+            self._barrier(("cleanup_expired", current_time))
+            return self._queued()
+
+    def _put(self, slot: Tuple[str, str], write: _Write) -> None:
+        """Add a write to the open segment, replacing an earlier one. Assumes _cond."""
+        segment = self._segments[-1] if self._segments else None
+        if not isinstance(segment, dict):
+            segment = {}
+            self._segments.append(segment)
+        if slot in segment:
+            self._coalesced += 1
+        else:
+            self._pending += 1
+        segment[slot] = write
+
+    def _barrier(self, write: _Write) -> None:
+        """Add a write that must run between its neighbours. Assumes _cond."""
+        self._segments.append(write)
+        self._pending += 1
+
+    def _queued(self) -> int:
+        """Number the queued write and wake the flusher. Assumes _cond."""
+        self._sequence += 1
+        first = self._pending_since is None
+        if first:
+            self._pending_since = time.monotonic()
+        if self.flush_interval is not None and not self._closed:
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="syntha-write-behind", daemon=True
+                )
+                self._thread.start()
+            elif first or self._pending >= self.max_batch:
+                self._cond.notify_all()
+        return self._sequence
+
+    # -- Reading ------------------------------------------------------------
+
+    def pending_item(self, key: str) -> Optional[_Write]:
+        """
+        Get the latest write for a key that is not in the database yet.
+
+        Returns:
+            ("save_item", row), ("patch_item", row, patch),
+            ("append_item", row, items, trim, earlier) or
+            ("delete_item", key), or None if the database is up to date for
+            the key
+        """
+        slot = ("item", key)
+        with self._cond:
+            for segment in reversed(self._in_flight + self._segments):
+                if isinstance(segment, dict):
+                    write = segment.get(slot)
+                    if write is not None:
+                        return write
+                elif segment[0] == "clear":
+                    return ("delete_item", key)
+        return None
+
+    def __len__(self) -> int:
+        """Number of writes waiting to be flushed."""
+        with self._cond:
+            return self._pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the queue."""
+        with self._cond:
+            return {
+                "pending_writes": self._pending,
+                "coalesced_writes": self._coalesced,
+                "flushes": self._flushes,
+            }
+
+    # -- Flushing -----------------------------------------------------------
+
+    def flush(self, through: Optional[int] = None) -> None:
+        """
+        Commit every queued write in one transaction.
+
+        Args:
+            through: Only flush if the write with this sequence number is not
+                committed yet (a concurrent flush may have committed it)
+
+        Raises:
+            TypeError: If a value could not be serialized. The other writes
+                are committed and the failing ones are dropped.
+            Exception: The backend error if the writes could not be
+                committed. They stay queued and are retried by the next flush.
+        """
+        with self._flush_lock:
+            with self._cond:
+                if not self._segments or (
+                    through is not None and self._committed >= through
+                ):
+                    return
+                self._in_flight = self._segments
+                self._segments = []
+                last = self._sequence
+                count = self._pending
+                self._pending = 0
+                self._pending_since = None
+
+            dropped: Optional[Exception] = None
+            try:
+                try:
+                    self._write(self._in_flight)
+                except (TypeError, ValueError) as e:
+                    # A value could not be serialized, which no retry fixes:
+                    # commit the other writes and drop the failing ones
+                    dropped = e
+                    self._write(self._in_flight, isolate=True)
+            except BaseException as e:
+                with self._cond:
+                    # Put the writes back in front of the newer ones
+                    self._segments = self._in_flight + self._segments
+                    self._in_flight = []
+                    self._pending += count
+                    if self._pending_since is None:
+                        self._pending_since = time.monotonic()
+                    self._attempted = last
+                    self._error = e
+                    self._cond.notify_all()
+                raise
+
+            with self._cond:
+                self._in_flight = []
+                self._committed = self._attempted = last
+                self._error = None
+                self._flushes += 1
+                self._cond.notify_all()
+            if dropped is not None:
+                raise dropped
+
+    def wait(self, sequence: int, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the write with the given sequence number is committed.
+
+        Returns:
+            True once it is committed, False on timeout
+
+        Raises:
+            Exception: The backend error if the flush that included the write
+                failed (the write is retried by a later flush)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._attempted < sequence:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            if self._committed < sequence:
+                raise self._error  # type: ignore[misc]
+            return True
+
+    def close(self) -> None:
+        """Stop the flusher thread and commit the remaining writes."""
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _write(
+        self, segments: List[Union[_Segment, _Write]], isolate: bool = False
+    ) -> None:
+        """Apply segments in order in one transaction."""
+        with self.backend.transaction():
+            for segment in segments:
+                self._apply(segment, isolate)
+
+    def _apply(self, segment: Union[_Segment, _Write], isolate: bool) -> None:
+        """
+        Run a segment or barrier against the backend. With ``isolate``, items
+        are saved one at a time and those that cannot be serialized are
+        skipped.
+        """
+        backend = self.backend
+        user_id = self.user_id
+        if not isinstance(segment, dict):
+            kind = segment[0]
+            if kind == "clear":
+                if self._user_scoped:
+                    backend.clear_all_for_user(user_id)
+                else:
+                    backend.clear_all()
+            elif kind == "delete_topic_data":
+                if self._user_scoped:
+                    backend.delete_topic_data_for_user(user_id, segment[1])
+                elif hasattr(backend, "delete_topic_data"):
+                    backend.delete_topic_data(segment[1])
+            elif self._user_scoped:
+                backend.cleanup_expired_for_user(user_id, segment[1])
+            else:
+                backend.cleanup_expired(segment[1])
+            return
+
+        # Saves go to the backend as one batch
+        rows = [
+            self._backend_row(write[1])
+            for write in segment.values()
+            if write[0] == "save_item"
+        ]
+        batches = [[row] for row in rows] if isolate else [rows] if rows else []
+        for batch in batches:
+            try:
+                if len(batch) == 1:
+                    self._save_row(batch[0])
+                elif self._user_scoped:
+                    backend.save_context_items_for_user(user_id, batch)
+                else:
+                    backend.save_context_items(batch)
+            except (TypeError, ValueError):
+                if not isolate:
+                    raise
+                logger.error("Dropped unserializable context item %r", batch[0][0])
+
+        for write in segment.values():
+            kind = write[0]
+            if kind == "patch_item":
+                try:
+                    self._patch_row(write[1][0], write[2])
+                except (TypeError, ValueError):
+                    if not isolate:
+                        raise
+                    logger.error("Dropped unserializable patch of %r", write[1][0])
+            elif kind == "append_item":
+                key = write[1][0]
+                try:
+                    earlier = write[4]
+                    if earlier is not None:
+                        if earlier[0] == "save_item":
+                            self._save_row(earlier[1])
+                        elif earlier[0] == "patch_item":
+                            self._patch_row(key, earlier[2])
+                    if self._user_scoped:
+                        backend.append_to_context_item_for_user(
+                            user_id, key, write[2], write[3]
+                        )
+                    else:
+                        backend.append_to_context_item(key, write[2], write[3])
+                except (TypeError, ValueError):
+                    if not isolate:
+                        raise
+                    logger.error("Dropped unserializable append to %r", key)
+            elif kind == "delete_item":
+                if self._user_scoped:
+                    backend.delete_context_item_for_user(user_id, write[1])
+                else:
+                    backend.delete_context_item(write[1])
+            elif kind == "save_agent_topics":
+                if self._user_scoped:
+                    backend.save_agent_topics_for_user(user_id, write[1], write[2])
+                else:
+                    backend.save_agent_topics(write[1], write[2])
+            elif kind == "remove_agent_topics":
+                if self._user_scoped:
+                    backend.remove_agent_topics_for_user(user_id, write[1])
+                else:
+                    backend.remove_agent_topics(write[1])
+            elif kind == "save_agent_permissions":
+                if self._user_scoped:
+                    backend.save_agent_permissions_for_user(user_id, write[1], write[2])
+                else:
+                    backend.save_agent_permissions(write[1], write[2])
+
+    def _backend_row(self, row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Decompress a row's value for backends that only store plain values."""
+        if self._plain_values and isinstance(row[1], CompressedValue):
+            return (row[0], row[1].decompress()) + row[2:]
+        return row
+
+    def _save_row(self, row: Tuple[Any, ...]) -> None:
+        """Save a single item row."""
+        row = self._backend_row(row)
+        if self._user_scoped:
+            self.backend.save_context_item_for_user(self.user_id, *row)
+        else:
+            self.backend.save_context_item(*row)
+
+    def _patch_row(self, key: str, patch: Dict[str, Any]) -> None:
+        """Apply a merge patch to a saved item."""
+        if self._user_scoped:
+            self.backend.patch_context_item_for_user(self.user_id, key, patch)
+        else:
+            self.backend.patch_context_item(key, patch)
+
+    def _run(self) -> None:
+        """Body of the flusher thread."""
+        retry_at = 0.0
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    if self._closed:
+                        self._thread = None
+                        return
+                    if self._pending_since is None:
+                        # Nothing to do; exit once idle for long enough
+                        if not self._cond.wait(_IDLE_EXIT) and (
+                            self._pending_since is None
+                        ):
+                            self._thread = None
+                            return
+                        continue
+                    due = max(self._pending_since + self.flush_interval, retry_at)
+                    if self._pending >= self.max_batch and now >= retry_at:
+                        break
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+
+            try:
+                self.flush()
+            except Exception:
+                logger.exception(
+                    "Write-behind flush failed; retrying in %.1fs", _RETRY_DELAY
+                )
+                retry_at = time.monotonic() + _RETRY_DELAY
@@ -523,8 +523,8 @@ class TestAccessControlPerformance:
         assert creation_time < 1.0
 
         # Verify different access levels
-        assert len(handlers["agent_0"].get_available_tools()) == 7  # admin
-        assert len(handlers["agent_1"].get_available_tools()) == 6  # contributor
+        assert len(handlers["agent_0"].get_available_tools()) == 10  # admin
+        assert len(handlers["agent_1"].get_available_tools()) == 9  # contributor
         assert len(handlers["agent_2"].get_available_tools()) == 3  # readonly
         assert len(handlers["agent_3"].get_available_tools()) == 2  # custom
 
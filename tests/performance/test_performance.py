@@ -11,7 +11,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pytest
 
-from syntha.context import ContextMesh
+from syntha.context import ContextItem, ContextMesh
 
 
 class TestContextMeshPerformance:
@@ -125,6 +125,16 @@ class TestContextMeshPerformance:
         # Cleanup
         mesh.close()
 
+    def test_push_many_performance(self, benchmark, tmp_path):
+        """Benchmark bulk pushes persisted in a single transaction."""
+        mesh = ContextMesh(db_path=str(tmp_path / "bulk.db"), user_id="bench")
+        items = [{"key": f"key_{i}", "value": {"data": i}} for i in range(1000)]
+
+        benchmark(mesh.push_many, items)
+
+        assert mesh.size() == 1000
+        mesh.close()
+
     def test_ttl_cleanup_performance(self, benchmark):
         """Benchmark TTL cleanup performance."""
         mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
@@ -190,6 +200,389 @@ class TestContextMeshPerformance:
         mesh.close()
 
 
+class TestIndexMaintenancePerformance:
+    """Index maintenance must not scale with total keys or agents."""
+
+    def test_overwrite_cost_with_many_keys_and_agents(self):
+        """Overwriting a key touches only that key's subscribers."""
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+
+        agents = [f"agent_{i}" for i in range(500)]
+        for i in range(50000):
+            mesh.push(f"key_{i}", i, subscribers=[agents[i % len(agents)]])
+
+        overwrites = 2000
+        start = time.perf_counter()
+        for i in range(overwrites):
+            mesh.push(f"key_{i}", -i, subscribers=[agents[(i + 1) % len(agents)]])
+        per_overwrite = (time.perf_counter() - start) / overwrites
+
+        # List-based indexes needed milliseconds per overwrite at this size
+        assert per_overwrite < 0.0005, f"{per_overwrite * 1e6:.1f}us per overwrite"
+        assert mesh.get("key_0", "agent_1") == 0
+        assert mesh.get("key_0", "agent_0") is None
+
+        mesh.close()
+
+
+class TestTopicIndexPerformance:
+    """Topic operations must only touch the affected topic's keys and agents."""
+
+    def test_topic_operations_with_many_topics(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+
+        topics = [f"topic_{i}" for i in range(5000)]
+        for i, topic in enumerate(topics):
+            mesh.register_agent_topics(f"agent_{i}", [topic, "shared"])
+            mesh.push(f"key_{i}", i, topics=[topic])
+
+        calls = 500
+        start = time.perf_counter()
+        for i in range(calls):
+            mesh.get_available_keys_by_topic(f"agent_{i}")
+        per_listing = (time.perf_counter() - start) / calls
+
+        start = time.perf_counter()
+        for topic in topics[:calls]:
+            mesh.delete_topic(topic)
+        per_delete = (time.perf_counter() - start) / calls
+
+        # Scanning every key and agent took milliseconds per call at this size
+        assert per_listing < 0.0005, f"{per_listing * 1e6:.1f}us per listing"
+        assert per_delete < 0.0005, f"{per_delete * 1e6:.1f}us per delete"
+        assert mesh.size() == len(topics) - calls
+        assert mesh.get_topics_for_agent("agent_0") == ["shared"]
+
+        mesh.close()
+
+
+class TestChangeTrackingPerformance:
+    """Delta reads must scale with the number of changes, not the mesh size."""
+
+    def test_delta_cost_independent_of_mesh_size(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        for i in range(50000):
+            mesh.push(f"key_{i}", {"i": i})
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+
+        for i in range(10):
+            mesh.push(f"key_{i}", {"i": -i})
+
+        calls = 1000
+        start = time.perf_counter()
+        for _ in range(calls):
+            changes = mesh.get_changes_since(cursor, "agent1")
+        per_call = (time.perf_counter() - start) / calls
+
+        # A full get_all_for_agent at this size takes tens of milliseconds
+        assert per_call < 0.0005, f"{per_call * 1e6:.1f}us per delta"
+        assert len(changes["changed"]) == 10
+
+        mesh.close()
+
+
+class TestAgentViewPerformance:
+    """Repeated get_all_for_agent calls without changes must skip the rebuild."""
+
+    def test_cached_view_is_cheap(self):
+        def time_reads(cache_views):
+            mesh = ContextMesh(
+                enable_persistence=False, copy_mode="frozen", cache_views=cache_views
+            )
+            mesh.register_agent_topics("agent1", ["sales"])
+            for i in range(5000):
+                if i % 3 == 0:
+                    mesh.push(f"key_{i}", {"i": i}, subscribers=["agent1"])
+                elif i % 3 == 1:
+                    mesh.push(f"key_{i}", {"i": i}, topics=["sales"], ttl=3600)
+                else:
+                    mesh.push(f"key_{i}", {"i": i})
+            expected = mesh.get_all_for_agent("agent1")
+
+            start = time.perf_counter()
+            for _ in range(100):
+                assert len(mesh.get_all_for_agent("agent1")) == len(expected)
+            elapsed = time.perf_counter() - start
+            mesh.close()
+            return elapsed
+
+        uncached = time_reads(False)
+        cached = time_reads(True)
+        assert cached * 5 < uncached, f"{cached:.4f}s cached vs {uncached:.4f}s"
+
+
+class TestSnapshotPerformance:
+    """Warm starts from a snapshot must beat replaying the database."""
+
+    def test_restore_faster_than_database_load(self, tmp_path):
+        db_path = str(tmp_path / "mesh.db")
+        snapshot_path = str(tmp_path / "mesh.snapshot")
+        mesh = ContextMesh(db_path=db_path, user_id="user1")
+        mesh.push_many(
+            [
+                {"key": f"key_{i}", "value": {"i": i, "text": "x" * 50}}
+                for i in range(20000)
+            ]
+        )
+        mesh.snapshot(snapshot_path)
+        mesh.close()
+
+        start = time.perf_counter()
+        cold = ContextMesh(db_path=db_path, user_id="user1")
+        cold_start = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = ContextMesh(
+            db_path=db_path, user_id="user1", snapshot_path=snapshot_path
+        )
+        warm_start = time.perf_counter() - start
+
+        assert warm.size() == cold.size() == 20000
+        assert warm_start < cold_start, f"{warm_start:.3f}s vs {cold_start:.3f}s"
+        assert warm_start < 1.0
+        cold.close()
+        warm.close()
+
+
+class TestExpiryPerformance:
+    """TTL cleanup cost must follow the number of expiring items."""
+
+    def test_cleanup_cost_independent_of_mesh_size(self):
+        """A cleanup with nothing due stays cheap on a large mesh."""
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        for i in range(100000):
+            mesh.push(f"key_{i}", i, ttl=3600 if i % 2 else None)
+        for i in range(10):
+            mesh.push(f"short_{i}", i, ttl=0.01)
+        time.sleep(0.05)
+
+        start = time.perf_counter()
+        removed = mesh.cleanup_expired()
+        first_cleanup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            mesh.cleanup_expired()
+        idle_cleanup = (time.perf_counter() - start) / 1000
+
+        start = time.perf_counter()
+        stats = mesh.get_stats()
+        stats_time = time.perf_counter() - start
+
+        assert removed == 10
+        assert stats["expired_items"] == 0
+        # A full scan of 100k items takes tens of milliseconds
+        assert first_cleanup < 0.005
+        assert idle_cleanup < 0.0005
+        assert stats_time < 0.005
+
+        mesh.close()
+
+
+class _SlowCopyValue:
+    """Value whose deep copy blocks outside the GIL, like a large buffer copy."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def __deepcopy__(self, memo):
+        time.sleep(self.delay)
+        return _SlowCopyValue(self.delay)
+
+
+class TestConcurrentReadScaling:
+    """Multi-threaded read throughput for the ContextMesh concurrency modes."""
+
+    THREAD_COUNTS = [1, 2, 4, 8]
+
+    def _measure_reads_per_second(self, mesh, keys, threads, duration=0.3):
+        """Run ``threads`` readers for ``duration`` seconds and return reads/sec."""
+        stop = threading.Event()
+        counts = [0] * threads
+
+        def reader(index):
+            key_count = len(keys)
+            i = index
+            while not stop.is_set():
+                mesh.get(keys[i % key_count], "reader")
+                counts[index] += 1
+                i += 1
+
+        workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        time.sleep(duration)
+        stop.set()
+        for worker in workers:
+            worker.join()
+        return sum(counts) / (time.perf_counter() - start)
+
+    def _scaling_table(self, concurrency, value_factory, key_count=100):
+        mesh = ContextMesh(enable_persistence=False, concurrency=concurrency)
+        keys = [f"key_{i}" for i in range(key_count)]
+        for key in keys:
+            mesh.push(key, value_factory())
+        try:
+            return {
+                threads: self._measure_reads_per_second(mesh, keys, threads)
+                for threads in self.THREAD_COUNTS
+            }
+        finally:
+            mesh.close()
+
+    @pytest.mark.concurrent
+    def test_read_throughput_scales_with_threads(self):
+        """Readers in shared_reads mode overlap; in exclusive mode they queue."""
+        results = {
+            mode: self._scaling_table(mode, lambda: _SlowCopyValue(0.002))
+            for mode in ("exclusive", "shared_reads")
+        }
+
+        print("\nReads/sec with a 2ms GIL-releasing copy per read:")
+        for mode, table in results.items():
+            row = ", ".join(f"{t}t={rate:,.0f}" for t, rate in table.items())
+            print(f"  {mode:>12}: {row}")
+
+        shared = results["shared_reads"]
+        exclusive = results["exclusive"]
+
+        # A single exclusive lock caps throughput at one read at a time
+        assert exclusive[8] < exclusive[1] * 2
+        # Shared reads keep scaling with thread count
+        assert shared[8] > shared[1] * 3
+        assert shared[8] > exclusive[8] * 2
+
+    @pytest.mark.concurrent
+    def test_cpu_bound_read_throughput(self):
+        """Report plain dict reads; shared mode must not collapse under contention."""
+        results = {
+            mode: self._scaling_table(mode, lambda: {"data": "x" * 100, "n": [1, 2]})
+            for mode in ("exclusive", "shared_reads")
+        }
+
+        print("\nReads/sec for small dict values:")
+        for mode, table in results.items():
+            row = ", ".join(f"{t}t={rate:,.0f}" for t, rate in table.items())
+            print(f"  {mode:>12}: {row}")
+
+        for table in results.values():
+            assert all(rate > 0 for rate in table.values())
+
+    @pytest.mark.concurrent
+    def test_shared_reads_with_concurrent_writers(self):
+        """Readers and writers interleave safely in shared_reads mode."""
+        mesh = ContextMesh(enable_persistence=False, concurrency="shared_reads")
+        errors = []
+
+        def writer(writer_id):
+            try:
+                for i in range(200):
+                    mesh.push(f"w{writer_id}_{i % 20}", {"i": i})
+                    if i % 7 == 0:
+                        mesh.remove(f"w{writer_id}_{i % 20}")
+            except Exception as e:  # pragma: no cover - surfaced via assert
+                errors.append(e)
+
+        def reader():
+            try:
+                for _ in range(200):
+                    mesh.get_all_for_agent("reader")
+                    mesh.get_keys_for_agent("reader")
+                    mesh.get_stats()
+            except Exception as e:  # pragma: no cover - surfaced via assert
+                errors.append(e)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(writer, i) for i in range(4)]
+            futures += [executor.submit(reader) for _ in range(4)]
+            for future in as_completed(futures):
+                future.result()
+
+        assert errors == []
+        keys = mesh.get_keys_for_agent("reader")
+        assert sorted(keys) == sorted(mesh.get_all_for_agent("reader").keys())
+
+        mesh.close()
+
+
+class TestSlowDatabaseLatency:
+    """Read latency while writers commit to a slow database."""
+
+    DB_LATENCY = 0.02
+
+    def _slow_mesh(self, tmp_path, durability):
+        mesh = ContextMesh(
+            db_path=str(tmp_path / f"{durability}.db"), durability=durability
+        )
+        backend = mesh.db_backend
+        for name in ("save_context_item", "save_context_items", "delete_context_item"):
+            original = getattr(backend, name)
+
+            def slow(*args, _original=original, **kwargs):
+                time.sleep(self.DB_LATENCY)  # A slow fsync or network round trip
+                return _original(*args, **kwargs)
+
+            setattr(backend, name, slow)
+        return mesh
+
+    def _read_latencies(self, mesh, writers, duration=0.5):
+        """Time reads of a resident key while ``writers`` threads push."""
+        mesh.push("hot", {"data": "x" * 100})
+        stop = threading.Event()
+        latencies = []
+        pushes = [0] * writers
+
+        def writer(index):
+            i = 0
+            while not stop.is_set():
+                mesh.push(f"w{index}_{i % 10}", {"i": i})
+                pushes[index] += 1
+                i += 1
+                time.sleep(0.001)  # Keep "async" writers from hogging the GIL
+
+        def reader():
+            while not stop.is_set():
+                start = time.perf_counter()
+                mesh.get("hot", "reader")
+                latencies.append(time.perf_counter() - start)
+                time.sleep(0.0005)
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        threads.append(threading.Thread(target=reader))
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        latencies.sort()
+        return (
+            latencies[len(latencies) // 2],
+            latencies[int(len(latencies) * 0.99)],
+            sum(pushes),
+        )
+
+    @pytest.mark.concurrent
+    def test_reads_do_not_wait_for_database_commits(self, tmp_path):
+        """Commits happen outside the mesh lock, so reads stay fast."""
+        print(f"\nRead latency with {self.DB_LATENCY * 1000:.0f}ms database writes:")
+        for durability in ("sync", "batched", "async"):
+            mesh = self._slow_mesh(tmp_path, durability)
+            try:
+                median, p99, pushes = self._read_latencies(mesh, writers=4)
+            finally:
+                mesh.close()
+            print(
+                f"  {durability:>8}: median={median * 1e6:,.0f}us "
+                f"p99={p99 * 1e6:,.0f}us pushes={pushes:,}"
+            )
+            # Readers never queue behind a commit holding the lock
+            assert p99 < self.DB_LATENCY / 2
+            assert pushes > 0
+
+
 class TestToolHandlerPerformance:
     """Performance tests for ToolHandler operations."""
 
@@ -374,6 +767,44 @@ class TestMemoryUsage:
 
         mesh.close()
 
+    def test_context_item_bytes_per_item(self):
+        """Compare the footprint of ContextItem with the previous dict layout."""
+        import tracemalloc
+
+        class DictContextItem:
+            """The ContextItem layout before slots and interned subscribers."""
+
+            def __init__(self, value, subscribers=None, ttl=None, topics=None):
+                self.value = value
+                self.subscribers = (subscribers or []).copy()
+                self.topics = list(topics or [])
+                self.created_at = time.time()
+                self.ttl = ttl
+                self.version = 0
+
+        routes = [["agent1", "agent2"], ["agent3"], ["agent1", "agent2", "agent3"]]
+        count = 10000
+
+        def bytes_per_item(factory):
+            tracemalloc.start()
+            try:
+                items = [factory(list(routes[i % 3])) for i in range(count)]
+                allocated, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(items) == count
+            return allocated / count
+
+        before = bytes_per_item(
+            lambda subscribers: DictContextItem("v", subscribers, 60)
+        )
+        after = bytes_per_item(
+            lambda subscribers: ContextItem("v", subscribers, 60, copy_mode="none")
+        )
+
+        print(f"\nContextItem: {before:.0f} -> {after:.0f} bytes per item")
+        assert after < before * 0.75
+
 
 @pytest.fixture
 def benchmark_mesh():
@@ -0,0 +1,171 @@
+"""
+Unit tests for AsyncContextMesh.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from syntha import AsyncContextMesh, ContextMesh
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncContextMesh:
+    """Tests for the asyncio front end."""
+
+    def test_routing_matches_context_mesh(self):
+        async def scenario():
+            async with AsyncContextMesh(enable_persistence=False) as mesh:
+                await mesh.register_agent_topics("agent1", ["sales"])
+                await mesh.push("global", "g")
+                await mesh.push("private", "p", subscribers=["agent2"])
+                await mesh.push("report", "r", topics=["sales"])
+
+                assert await mesh.get("private", "agent1") is None
+                assert await mesh.get("report", "agent1") == "r"
+                assert await mesh.get_all_for_agent("agent1") == {
+                    "global": "g",
+                    "report": "r",
+                }
+                assert await mesh.get_topics_for_agent("agent1") == ["sales"]
+                assert await mesh.remove("global") is True
+                assert await mesh.size() == 2
+
+        run(scenario())
+
+    def test_invalid_arguments(self):
+        mesh = ContextMesh(enable_persistence=False)
+        with pytest.raises(ValueError, match="either an existing mesh"):
+            AsyncContextMesh(mesh, enable_indexing=False)
+        with pytest.raises(ValueError, match="max_workers"):
+            AsyncContextMesh(mesh, max_workers=0)
+        mesh.close()
+
+    def test_persistent_mesh_uses_io_executor(self, tmp_path):
+        db_path = str(tmp_path / "async.db")
+
+        async def scenario():
+            mesh = AsyncContextMesh(db_path=db_path, user_id="user1")
+            threads = set()
+            original_push = mesh.mesh.push
+
+            def push(*args, **kwargs):
+                threads.add(threading.current_thread().name)
+                original_push(*args, **kwargs)
+
+            mesh.mesh.push = push
+            await asyncio.gather(
+                *(mesh.push(f"key{i}", i, topics=["t"]) for i in range(20))
+            )
+            await mesh.close()
+            return threads
+
+        threads = run(scenario())
+        assert threads and all(name.startswith("syntha-io") for name in threads)
+
+        # Same user isolation as ContextMesh
+        reloaded = ContextMesh(db_path=db_path, user_id="user1")
+        other_user = ContextMesh(db_path=db_path, user_id="user2")
+        assert reloaded.get("key19") == 19
+        assert other_user.get("key19") is None
+        reloaded.close()
+        other_user.close()
+
+    def test_slow_commit_does_not_block_loop(self, tmp_path):
+        async def scenario():
+            mesh = AsyncContextMesh(db_path=str(tmp_path / "slow.db"))
+            original_save = mesh.mesh.db_backend.save_context_item
+
+            def slow_save(*args, **kwargs):
+                time.sleep(0.2)
+                original_save(*args, **kwargs)
+
+            mesh.mesh.db_backend.save_context_item = slow_save
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            await mesh.push("key", "value")
+            task.cancel()
+            await mesh.close()
+            return ticks
+
+        assert run(scenario()) >= 5
+
+    def test_wait_for_push_from_another_coroutine(self):
+        async def scenario():
+            mesh = AsyncContextMesh(enable_persistence=False)
+            mesh.mesh.register_agent_topics("agent1", ["sales"])
+
+            async def writer():
+                await asyncio.sleep(0.02)
+                await mesh.push("secret", 1, subscribers=["agent2"])
+                await asyncio.sleep(0.02)
+                await mesh.push("report", 2, topics=["sales"])
+
+            task = asyncio.create_task(writer())
+            changes = await mesh.wait_for(agent_name="agent1", timeout=5)
+            await task
+            assert await mesh.wait_for(keys=["never"], timeout=0.02) is None
+            await mesh.close()
+            return changes
+
+        assert run(scenario())["changed"] == {"report": 2}
+
+    def test_wait_for_push_from_thread_and_expiry(self):
+        async def scenario():
+            mesh = AsyncContextMesh(enable_persistence=False)
+            timer = threading.Timer(0.02, mesh.mesh.push, args=("key", "v"))
+            timer.start()
+            pushed = await mesh.wait_for(keys=["key"], timeout=5)
+            timer.join()
+
+            await mesh.push("lease", "held", ttl=0.05)
+            expired = await mesh.wait_for(keys=["lease"], timeout=5)
+            await mesh.close()
+            return pushed, expired
+
+        pushed, expired = run(scenario())
+        assert pushed["changed"] == {"key": "v"}
+        assert expired["removed"] == ["lease"]
+
+    def test_on_change_delivers_on_loop(self):
+        async def scenario():
+            mesh = AsyncContextMesh(enable_persistence=False)
+            loop_thread = threading.current_thread()
+            events = []
+            received = asyncio.Event()
+
+            def listener(event):
+                assert threading.current_thread() is loop_thread
+                events.append(event["key"])
+
+            async def async_listener(event):
+                received.set()
+
+            listener_id = await mesh.on_change(listener, keys=["a"])
+            await mesh.on_change(async_listener, keys=["b"])
+
+            thread = threading.Thread(target=mesh.mesh.push, args=("a", 1))
+            thread.start()
+            thread.join()
+            await mesh.push("b", 2)
+            await asyncio.wait_for(received.wait(), 5)
+
+            assert await mesh.remove_change_listener(listener_id) is True
+            await mesh.push("a", 3)
+            await asyncio.sleep(0.01)
+            await mesh.close()
+            return events
+
+        assert run(scenario()) == ["a"]
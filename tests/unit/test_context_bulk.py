@@ -0,0 +1,179 @@
+"""
+Unit tests for ContextMesh bulk operations.
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from syntha.context import ContextMesh
+from syntha.tools import ToolHandler
+
+
+class TestPushMany:
+    """Tests for ContextMesh.push_many."""
+
+    def test_push_many_routes_like_push(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.register_agent_topics("sales_agent", ["sales"])
+
+        mesh.push_many(
+            [
+                {"key": "global", "value": 1},
+                {"key": "direct", "value": 2, "subscribers": ["agent1"]},
+                {"key": "topic", "value": 3, "topics": ["sales"]},
+                {"key": "nobody", "value": 4, "topics": ["empty_topic"]},
+                {
+                    "key": "combined",
+                    "value": 5,
+                    "topics": ["sales"],
+                    "subscribers": ["manager"],
+                },
+            ]
+        )
+
+        assert mesh.get_all_for_agent("sales_agent") == {
+            "global": 1,
+            "topic": 3,
+            "combined": 5,
+        }
+        assert mesh.get("direct", "agent1") == 2
+        assert mesh.get("combined", "manager") == 5
+        assert mesh.get("nobody", "sales_agent") is None
+        assert mesh._data["topic"].topics == ("sales",)
+        mesh.close()
+
+    def test_push_many_ttl_and_overwrites(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push_many(
+            [
+                {"key": "key", "value": "first"},
+                {"key": "key", "value": "second", "ttl": 60},
+            ]
+        )
+
+        assert mesh.get("key") == "second"
+        assert mesh._data["key"].ttl == 60
+        assert mesh.size() == 1
+        mesh.close()
+
+    def test_push_many_requires_key_and_value(self):
+        mesh = ContextMesh(enable_persistence=False)
+        with pytest.raises(ValueError):
+            mesh.push_many([{"key": "ok", "value": 1}, {"value": 2}])
+
+        # Validation happens before anything is stored
+        assert mesh.size() == 0
+        mesh.close()
+
+    def test_push_many_empty_batch(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push_many([])
+        assert mesh.size() == 0
+        mesh.close()
+
+    def test_push_many_persists_in_one_backend_call(self, tmp_path):
+        db_path = str(tmp_path / "bulk.db")
+        mesh = ContextMesh(db_path=db_path, user_id="user1")
+        backend = mesh.db_backend
+        backend.save_context_item_for_user = Mock(
+            side_effect=backend.save_context_item_for_user
+        )
+        backend.save_context_items_for_user = Mock(
+            side_effect=backend.save_context_items_for_user
+        )
+
+        mesh.push_many(
+            [{"key": f"key_{i}", "value": {"i": i}} for i in range(100)]
+            + [{"key": "key_0", "value": "overwritten"}]
+        )
+
+        backend.save_context_item_for_user.assert_not_called()
+        backend.save_context_items_for_user.assert_called_once()
+        rows = backend.save_context_items_for_user.call_args[0][1]
+        assert len(rows) == 100
+        mesh.close()
+
+        reloaded = ContextMesh(db_path=db_path, user_id="user1")
+        assert reloaded.size() == 100
+        assert reloaded.get("key_0") == "overwritten"
+        assert reloaded.get("key_99") == {"i": 99}
+        reloaded.close()
+
+
+class TestGetMany:
+    """Tests for ContextMesh.get_many."""
+
+    def test_get_many_applies_access_control(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.register_agent_topics("sales_agent", ["sales"])
+        mesh.push("global", "g")
+        mesh.push("private", "p", subscribers=["other_agent"])
+        mesh.push("topic", "t", topics=["sales"])
+
+        result = mesh.get_many(["global", "private", "topic", "missing"], "sales_agent")
+
+        assert result == {"global": "g", "topic": "t"}
+        assert list(result) == ["global", "topic"]
+        mesh.close()
+
+    def test_get_many_without_agent_skips_access_control(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push("private", "p", subscribers=["other_agent"])
+        mesh.push("expired", "e", ttl=0.01)
+        time.sleep(0.05)
+
+        assert mesh.get_many(["private", "expired", "private"]) == {"private": "p"}
+        mesh.close()
+
+    def test_get_many_returns_copies(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push("config", {"nested": [1, 2]})
+
+        result = mesh.get_many(["config"])
+        result["config"]["nested"].append(3)
+
+        assert mesh.get("config") == {"nested": [1, 2]}
+        mesh.close()
+
+    def test_get_context_tool_uses_single_batch(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push("a", 1)
+        mesh.push("b", 2)
+        mesh.get = Mock(side_effect=mesh.get)
+        handler = ToolHandler(context_mesh=mesh, agent_name="agent1")
+
+        result = handler.handle_tool_call("get_context", keys=["a", "b", "c"])
+
+        assert result["success"] is True
+        assert result["context"] == {"a": 1, "b": 2}
+        mesh.get.assert_not_called()
+        mesh.close()
+
+
+class TestExportItems:
+    """Tests for exporting items in the push_many format."""
+
+    def test_export_round_trips_through_push_many(self):
+        source = ContextMesh(enable_persistence=False)
+        source.register_agent_topics("agent1", ["sales"])
+        source.push("global", {"a": 1})
+        source.push("private", "p", subscribers=["agent2", "agent1"])
+        source.push("report", "r", topics=["sales"], ttl=60)
+        source.push("expired", "x", ttl=0.001)
+        time.sleep(0.01)
+
+        entries = source.export_items()
+        assert [entry["key"] for entry in entries] == ["global", "private", "report"]
+        assert entries[1]["subscribers"] == ["agent1", "agent2"]
+        assert entries[2]["topics"] == ["sales"]
+        assert 0 < entries[2]["ttl"] <= 60
+
+        target = ContextMesh(enable_persistence=False)
+        target.register_agent_topics("agent1", ["sales"])
+        target.push_many(entries)
+        assert target.get_all_for_agent("agent1") == source.get_all_for_agent("agent1")
+        assert source.export_items(["report", "missing"])[0]["key"] == "report"
+        source.close()
+        target.close()
@@ -0,0 +1,143 @@
+"""
+Unit tests for ContextMesh change tracking and get_changes_since.
+"""
+
+import time
+
+import pytest
+
+from syntha.context import ContextMesh
+
+
+@pytest.fixture
+def mesh():
+    mesh = ContextMesh(enable_persistence=False)
+    yield mesh
+    mesh.close()
+
+
+class TestGetChangesSince:
+    """Tests for the cursor-based delta API."""
+
+    def test_initial_call_returns_visible_context(self, mesh):
+        mesh.push("global", 1)
+        mesh.push("mine", 2, subscribers=["agent1"])
+        mesh.push("theirs", 3, subscribers=["agent2"])
+
+        changes = mesh.get_changes_since(0, "agent1")
+
+        assert changes["changed"] == {"global": 1, "mine": 2}
+        assert changes["removed"] == []
+        assert changes["reset"] is False
+        assert changes["cursor"] == mesh._data["theirs"].version
+
+    def test_only_changes_after_cursor_are_returned(self, mesh):
+        mesh.push("a", 1)
+        mesh.push("b", 2)
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+
+        assert mesh.get_changes_since(cursor, "agent1")["changed"] == {}
+
+        mesh.push("b", 20)
+        mesh.push("c", 3)
+        mesh.remove("a")
+        changes = mesh.get_changes_since(cursor, "agent1")
+
+        assert list(changes["changed"].items()) == [("b", 20), ("c", 3)]
+        assert changes["removed"] == ["a"]
+        assert changes["cursor"] > cursor
+
+    def test_versions_increase_monotonically(self, mesh):
+        mesh.push("a", 1)
+        first = mesh._data["a"].version
+        mesh.push("b", 2)
+        mesh.push("a", 3)
+        assert first < mesh._data["b"].version < mesh._data["a"].version
+
+    def test_changes_honor_access_control(self, mesh):
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+        mesh.push("secret", 1, subscribers=["agent2"])
+        mesh.remove("secret")
+
+        changes = mesh.get_changes_since(cursor, "agent1")
+        assert changes["changed"] == {}
+        assert changes["removed"] == []
+
+    def test_losing_access_is_reported_as_removal(self, mesh):
+        mesh.push("doc", 1, subscribers=["agent1"])
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+
+        mesh.push("doc", 2, subscribers=["agent2"])
+
+        changes = mesh.get_changes_since(cursor, "agent1")
+        assert changes["changed"] == {}
+        assert changes["removed"] == ["doc"]
+        assert mesh.get_changes_since(cursor, "agent2")["changed"] == {"doc": 2}
+
+    def test_expiry_is_reported_as_removal(self, mesh):
+        mesh.push("short", 1, ttl=0.01)
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+        time.sleep(0.05)
+
+        changes = mesh.get_changes_since(cursor, "agent1")
+        assert changes["removed"] == ["short"]
+
+    def test_topic_changes_follow_subscriptions(self, mesh):
+        mesh.register_agent_topics("agent1", ["sales"])
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+
+        mesh.push("report", 1, topics=["sales"])
+        mesh.push("hr_note", 2, topics=["hr"])
+
+        changes = mesh.get_changes_since(cursor, "agent1")
+        assert changes["changed"] == {"report": 1}
+
+    def test_subscription_change_forces_reset(self, mesh):
+        mesh.push("report", 1, topics=["sales"])
+        mesh.push("global", 2)
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+
+        mesh.register_agent_topics("agent1", ["sales"])
+
+        changes = mesh.get_changes_since(cursor, "agent1")
+        assert changes["reset"] is True
+        assert changes["changed"] == {"report": 1, "global": 2}
+
+        # Other agents keep receiving incremental results
+        assert mesh.get_changes_since(cursor, "agent2")["reset"] is False
+
+    def test_old_cursor_after_tombstone_overflow_resets(self, mesh):
+        mesh._max_tombstones = 2
+        for i in range(4):
+            mesh.push(f"key_{i}", i)
+        cursor = mesh.get_changes_since(0, "agent1")["cursor"]
+
+        for i in range(3):
+            mesh.remove(f"key_{i}")
+
+        changes = mesh.get_changes_since(cursor, "agent1")
+        assert changes["reset"] is True
+        assert changes["changed"] == {"key_3": 3}
+        assert len(mesh._tombstones) == 2
+
+    def test_clear_and_unknown_cursors_reset(self, mesh):
+        mesh.push("a", 1)
+        cursor = mesh.get_changes_since(0)["cursor"]
+
+        assert mesh.get_changes_since(cursor + 100)["reset"] is True
+
+        mesh.clear()
+        mesh.push("b", 2)
+        changes = mesh.get_changes_since(cursor)
+        assert changes["reset"] is True
+        assert changes["changed"] == {"b": 2}
+
+    def test_system_view_without_agent(self, mesh):
+        cursor = mesh.get_changes_since(0)["cursor"]
+        mesh.push("private", 1, subscribers=["agent2"])
+        mesh.remove("private")
+        mesh.push("other", 2, subscribers=["agent3"])
+
+        changes = mesh.get_changes_since(cursor)
+        assert changes["changed"] == {"other": 2}
+        assert changes["removed"] == ["private"]
@@ -0,0 +1,210 @@
+"""
+Unit tests for compression of large context values.
+"""
+
+import sqlite3
+
+import pytest
+
+from syntha import ContextMesh, create_database_backend
+from syntha.compression import CompressedValue, compress_value
+from syntha.write_behind import WriteBehindQueue
+
+DOCUMENT = {"title": "Report", "body": ["The quick brown fox. " * 20] * 10}
+
+
+class TestCompressValue:
+    """Tests for compress_value()."""
+
+    def test_large_values_round_trip(self):
+        compressed = compress_value(DOCUMENT, 100)
+        assert isinstance(compressed, CompressedValue)
+        assert len(compressed.data) < compressed.size
+        assert compressed.decompress() == DOCUMENT
+        assert CompressedValue.from_bytes(compressed.to_bytes()) == compressed
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "short",
+            {"a": 1},
+            12345,
+            ("x" * 500, "y"),
+            {1: "x" * 500},
+            ["x" * 500, {"n"}],
+            [float("nan")] * 200,
+        ],
+    )
+    def test_values_kept_as_is(self, value):
+        assert compress_value(value, 100) is value
+
+    def test_incompressible_values_are_kept(self):
+        # zlib's header and checksum outweigh any saving on short values
+        value = ["abc", 1]
+        assert compress_value(value, 1) is value
+
+    def test_invalid_stored_value(self):
+        with pytest.raises(ValueError, match="compressed"):
+            CompressedValue.from_bytes(b"ABCD" + bytes(8))
+
+
+class TestContextMeshCompression:
+    """Tests for ContextMesh with a compress_threshold."""
+
+    @pytest.mark.parametrize("copy_mode", ["deep", "frozen", "none"])
+    def test_values_are_decompressed_on_read(self, copy_mode):
+        with ContextMesh(
+            enable_persistence=False, copy_mode=copy_mode, compress_threshold=100
+        ) as mesh:
+            mesh.register_agent_topics("reader", ["docs"])
+            mesh.push("doc", DOCUMENT, topics=["docs"])
+            mesh.push("small", {"a": 1}, topics=["docs"])
+            assert isinstance(mesh._data["doc"].value, CompressedValue)
+            assert not isinstance(mesh._data["small"].value, CompressedValue)
+
+            assert mesh.get("doc") == DOCUMENT
+            assert mesh.get("doc") is not mesh.get("doc")
+            assert mesh.get_all_for_agent("reader") == {
+                "doc": DOCUMENT,
+                "small": {"a": 1},
+            }
+            if copy_mode == "frozen":
+                with pytest.raises(TypeError):
+                    mesh.get("doc")["title"] = "Changed"
+
+    def test_stats_report_the_ratio(self):
+        with ContextMesh(enable_persistence=False, compress_threshold=100) as mesh:
+            mesh.push("doc", DOCUMENT)
+            mesh.push("small", "text")
+            stats = mesh.get_stats()
+            compressed = mesh._data["doc"].value
+            assert stats["compressed_items"] == 1
+            assert stats["compressed_bytes"] == len(compressed.data)
+            assert stats["uncompressed_bytes"] == compressed.size
+            assert stats["compression_ratio"] > 10
+
+            mesh.clear()
+            assert mesh.get_stats()["compressed_bytes"] == 0
+            assert mesh.get_stats()["compression_ratio"] == 1.0
+
+        with ContextMesh(enable_persistence=False) as mesh:
+            assert "compression_ratio" not in mesh.get_stats()
+
+    def test_stats_follow_every_change(self, tmp_path):
+        def assert_counted(mesh):
+            values = [
+                item.value
+                for item in mesh._data.values()
+                if isinstance(item.value, CompressedValue)
+            ]
+            stats = mesh.get_stats()
+            assert stats["compressed_items"] == len(values)
+            assert stats["compressed_bytes"] == sum(len(v.data) for v in values)
+            assert stats["uncompressed_bytes"] == sum(v.size for v in values)
+
+        db_path = str(tmp_path / "stats.db")
+        with ContextMesh(
+            db_path=db_path, user_id="alice", compress_threshold=100, max_items=3
+        ) as mesh:
+            mesh.push_many([{"key": f"doc{i}", "value": DOCUMENT} for i in range(3)])
+            mesh.push("short", "text", ttl=0.01)
+            assert_counted(mesh)  # doc0 was evicted
+            mesh.patch("doc1", {"body": None})
+            mesh.remove("doc2")
+            for i in range(20):
+                mesh.append("log", f"Step {i} finished without errors")
+            assert_counted(mesh)
+            assert mesh.get("doc0") == DOCUMENT  # Paged in
+            assert_counted(mesh)
+            mesh.cleanup_expired()
+            assert_counted(mesh)
+
+            path = str(tmp_path / "stats.snapshot")
+            mesh.snapshot(path)
+            mesh.push("doc3", DOCUMENT)
+            mesh.restore(path)
+            assert_counted(mesh)
+
+        with ContextMesh(
+            db_path=db_path, user_id="alice", compress_threshold=100
+        ) as reloaded:
+            assert_counted(reloaded)
+            assert reloaded.get_stats()["compressed_items"] == 3
+
+    def test_updates_of_compressed_values(self):
+        with ContextMesh(enable_persistence=False, compress_threshold=100) as mesh:
+            mesh.push("doc", DOCUMENT)
+            assert mesh.patch("doc", {"title": None, "status": "final"})
+            expected = {"body": DOCUMENT["body"], "status": "final"}
+            assert mesh.get("doc") == expected
+
+            events = []
+            mesh.on_change(lambda event: events.append(event["value"]), keys=["doc"])
+            mesh.patch("doc", {"body": None})
+            assert events == [{"status": "final"}]
+            assert not isinstance(mesh._data["doc"].value, CompressedValue)
+
+            for i in range(20):
+                mesh.append("log", f"Step {i} finished without errors")
+            assert isinstance(mesh._data["log"].value, CompressedValue)
+            assert mesh.append("log", "done", max_len=5) == 5
+            assert mesh.get("log")[-2:] == ["Step 19 finished without errors", "done"]
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError, match="compress_threshold"):
+            ContextMesh(enable_persistence=False, compress_threshold=0)
+
+
+class TestCompressionPersistence:
+    """Tests for compressed values in the database."""
+
+    @pytest.mark.parametrize("durability", ["sync", "async"])
+    def test_values_are_stored_compressed(self, tmp_path, durability):
+        db_path = str(tmp_path / "compressed.db")
+        with ContextMesh(
+            db_path=db_path,
+            user_id="alice",
+            durability=durability,
+            compress_threshold=100,
+        ) as mesh:
+            mesh.push("doc", DOCUMENT, topics=["docs"])
+            for i in range(20):
+                mesh.append("log", f"Step {i} finished without errors")
+            mesh.patch("doc", {"status": "final"})
+
+        connection = sqlite3.connect(db_path)
+        stored = dict(connection.execute("SELECT key, value FROM context_items"))
+        connection.close()
+        assert isinstance(stored["doc"], bytes)
+        assert len(stored["doc"]) < CompressedValue.from_bytes(stored["doc"]).size
+
+        expected = dict(DOCUMENT, status="final")
+        with ContextMesh(db_path=db_path, user_id="alice") as reloaded:
+            assert reloaded.get("doc") == expected
+            assert len(reloaded.get("log")) == 20
+            # The database patches and extends values it stored compressed
+            assert reloaded.patch("doc", {"status": "archived"})
+            assert reloaded.append("log", "done") == 21
+
+        with ContextMesh(db_path=db_path, user_id="alice", lazy_load=True) as lazy:
+            assert lazy.get("doc") == dict(DOCUMENT, status="archived")
+            assert lazy.get("log")[-1] == "done"
+
+    def test_plain_values_for_other_backends(self, tmp_path):
+        saved = []
+
+        class PlainBackend(type(create_database_backend("sqlite"))):
+            stores_compressed_values = False
+
+            def save_context_item_for_user(self, user_id, key, value, *args):
+                saved.append(value)
+                super().save_context_item_for_user(user_id, key, value, *args)
+
+        backend = PlainBackend(str(tmp_path / "plain.db"))
+        backend.connect()
+        queue = WriteBehindQueue(backend, user_id="alice", flush_interval=60)
+        queue.save_items([("doc", compress_value(DOCUMENT, 100), [], None, 0.0)])
+        queue.flush()
+        assert saved == [DOCUMENT]
+        queue.close()
+        backend.close()
@@ -0,0 +1,128 @@
+"""
+Unit tests for ContextMesh concurrency modes and the ReadWriteLock.
+"""
+
+import threading
+import time
+
+import pytest
+
+from syntha.context import ContextMesh, ReadWriteLock
+
+
+@pytest.mark.concurrent
+class TestReadWriteLock:
+    """Tests for the writer-preferring readers/writer lock."""
+
+    def test_readers_share_the_lock(self):
+        """Multiple readers can hold the lock at the same time."""
+        lock = ReadWriteLock()
+        inside = threading.Barrier(3, timeout=2)
+
+        def reader():
+            with lock.reader:
+                # All three readers must be inside together to pass the barrier
+                inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_writer_excludes_readers(self):
+        """A reader cannot enter while a writer holds the lock."""
+        lock = ReadWriteLock()
+        events = []
+
+        lock.acquire_write()
+
+        def reader():
+            with lock.reader:
+                events.append("read")
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        events.append("write_done")
+        lock.release_write()
+        thread.join()
+
+        assert events == ["write_done", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Writers are preferred over readers that arrive after them."""
+        lock = ReadWriteLock()
+        events = []
+
+        lock.acquire_read()
+
+        def writer():
+            with lock.writer:
+                events.append("write")
+
+        def late_reader():
+            with lock.reader:
+                events.append("read")
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        time.sleep(0.05)
+
+        reader_thread = threading.Thread(target=late_reader)
+        reader_thread.start()
+        time.sleep(0.05)
+
+        # Neither can proceed while the first reader holds the lock
+        assert events == []
+        lock.release_read()
+
+        writer_thread.join()
+        reader_thread.join()
+        assert events == ["write", "read"]
+
+
+class TestConcurrencyModes:
+    """Tests for the ContextMesh concurrency option."""
+
+    def test_default_mode_is_exclusive(self):
+        mesh = ContextMesh(enable_persistence=False)
+        assert mesh.concurrency == "exclusive"
+        assert mesh._read_lock is mesh._lock
+        mesh.close()
+
+    def test_invalid_mode_raises(self):
+        with pytest.raises(ValueError, match="Unsupported concurrency mode"):
+            ContextMesh(enable_persistence=False, concurrency="optimistic")
+
+    def test_shared_reads_mode_behaves_like_exclusive(self):
+        mesh = ContextMesh(enable_persistence=False, concurrency="shared_reads")
+        mesh.register_agent_topics("agent1", ["sales"])
+        mesh.push("global", "g")
+        mesh.push("private", "p", subscribers=["agent1"])
+        mesh.push("topic", "t", topics=["sales"])
+
+        assert mesh.get("private", "agent1") == "p"
+        assert mesh.get("private", "agent2") is None
+        assert mesh.get_all_for_agent("agent1") == {
+            "global": "g",
+            "private": "p",
+            "topic": "t",
+        }
+        assert set(mesh.get_keys_for_agent("agent2")) == {"global"}
+        assert mesh.get_stats()["total_items"] == 3
+
+        assert mesh.remove("private") is True
+        assert mesh.get("private", "agent1") is None
+        mesh.close()
+
+    def test_auto_cleanup_runs_from_read_path(self):
+        """Reads trigger due auto-cleanup under the write lock."""
+        mesh = ContextMesh(enable_persistence=False, concurrency="shared_reads")
+        mesh.push("short", "value", ttl=0.01)
+        time.sleep(0.05)
+
+        mesh._last_cleanup = 0  # Force the cleanup interval to have passed
+        assert mesh.get_all_for_agent("agent1") == {}
+        assert mesh.size() == 0
+        mesh.close()
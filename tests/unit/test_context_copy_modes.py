@@ -0,0 +1,124 @@
+"""
+Unit tests for ContextMesh copy semantics (deep / frozen / none).
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from syntha.context import (
+    ContextItem,
+    ContextMesh,
+    FrozenDict,
+    FrozenList,
+    freeze_value,
+)
+
+
+class TestFreezeValue:
+    """Tests for the immutable value representation."""
+
+    def test_nested_structures_are_frozen(self):
+        frozen = freeze_value({"a": [1, {"b": 2}], "c": {3, 4}, "d": (5, [6])})
+
+        assert isinstance(frozen, FrozenDict)
+        assert isinstance(frozen["a"], FrozenList)
+        assert isinstance(frozen["a"][1], FrozenDict)
+        assert frozen["c"] == frozenset({3, 4})
+        assert isinstance(frozen["d"][1], FrozenList)
+
+    def test_frozen_values_compare_equal_to_originals(self):
+        original = {"a": [1, 2], "b": {"c": "d"}}
+        frozen = freeze_value(original)
+        assert frozen == original
+        assert json.loads(json.dumps(frozen)) == original
+
+    def test_frozen_values_reject_mutation(self):
+        frozen = freeze_value({"a": [1, 2]})
+
+        with pytest.raises(TypeError):
+            frozen["b"] = 1
+        with pytest.raises(TypeError):
+            frozen.update({"b": 1})
+        with pytest.raises(TypeError):
+            del frozen["a"]
+        with pytest.raises(TypeError):
+            frozen["a"].append(3)
+        with pytest.raises(TypeError):
+            frozen["a"][0] = 5
+
+    def test_frozen_values_copy_and_pickle(self):
+        frozen = freeze_value({"a": [1, {"b": 2}]})
+
+        assert copy.deepcopy(frozen) is frozen
+        restored = pickle.loads(pickle.dumps(frozen))
+        assert restored == frozen
+        assert isinstance(restored, FrozenDict)
+        assert isinstance(restored["a"], FrozenList)
+
+    def test_context_item_copy_modes(self):
+        value = {"a": [1]}
+        assert ContextItem(value, copy_mode="deep").value is not value
+        assert ContextItem(value, copy_mode="none").value is value
+        assert isinstance(ContextItem(value, copy_mode="frozen").value, FrozenDict)
+
+
+class TestMeshCopyModes:
+    """Tests for the ContextMesh copy_mode option."""
+
+    def test_default_is_deep(self):
+        mesh = ContextMesh(enable_persistence=False)
+        assert mesh.copy_mode == "deep"
+
+        value = {"list": [1, 2]}
+        mesh.push("key", value)
+        value["list"].append(3)
+
+        first = mesh.get("key")
+        first["list"].append(4)
+        assert mesh.get("key") == {"list": [1, 2]}
+        mesh.close()
+
+    def test_invalid_copy_mode_raises(self):
+        with pytest.raises(ValueError, match="Unsupported copy mode"):
+            ContextMesh(enable_persistence=False, copy_mode="shallow")
+
+    def test_frozen_mode_hands_out_shared_read_only_views(self):
+        mesh = ContextMesh(enable_persistence=False, copy_mode="frozen")
+        value = {"list": [1, 2], "nested": {"x": 1}}
+        mesh.push("key", value, subscribers=["agent1"])
+
+        # Pushing takes a snapshot; later caller edits are not visible
+        value["list"].append(3)
+
+        first = mesh.get("key", "agent1")
+        second = mesh.get_all_for_agent("agent1")["key"]
+        assert first is second
+        assert first == {"list": [1, 2], "nested": {"x": 1}}
+
+        with pytest.raises(TypeError):
+            first["nested"]["x"] = 2
+        mesh.close()
+
+    def test_none_mode_shares_caller_objects(self):
+        mesh = ContextMesh(enable_persistence=False, copy_mode="none")
+        value = {"list": [1, 2]}
+        mesh.push("key", value)
+
+        assert mesh.get("key") is value
+        assert mesh.get_all_for_agent("agent1")["key"] is value
+        mesh.close()
+
+    def test_frozen_mode_with_persistence(self, tmp_path):
+        db_path = str(tmp_path / "frozen.db")
+        mesh = ContextMesh(copy_mode="frozen", db_path=db_path)
+        mesh.push("key", {"list": [1, 2]})
+        mesh.close()
+
+        reloaded = ContextMesh(copy_mode="frozen", db_path=db_path)
+        value = reloaded.get("key")
+        assert value == {"list": [1, 2]}
+        assert isinstance(value, FrozenDict)
+        reloaded.close()
@@ -0,0 +1,244 @@
+"""
+Unit tests for atomic counters and append-only lists.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from syntha import ContextMesh, create_database_backend
+from syntha.write_behind import WriteBehindQueue
+
+
+class TestIncrement:
+    """Tests for ContextMesh.increment()."""
+
+    def test_increment_creates_and_adds(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            assert mesh.increment("tasks", topics=["ops"]) == 1
+            assert mesh.increment("tasks", 4) == 5
+            assert mesh.increment("tasks", -0.5) == 4.5
+            assert mesh.get("tasks") == 4.5
+
+            mesh.register_agent_topics("worker", ["ops"])
+            assert mesh.get("tasks", "worker") == 4.5
+
+    def test_invalid_values(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            mesh.push("name", "abc")
+            mesh.push("flag", True)
+            with pytest.raises(TypeError, match="not a number"):
+                mesh.increment("name")
+            with pytest.raises(TypeError, match="not a number"):
+                mesh.increment("flag")
+            with pytest.raises(TypeError, match="delta"):
+                mesh.increment("count", "1")
+
+    def test_access_control(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            mesh.push("private", 1, subscribers=["owner"])
+            with pytest.raises(PermissionError):
+                mesh.increment("private", agent_name="intruder")
+            assert mesh.increment("private", agent_name="owner") == 2
+
+    def test_concurrent_increments_are_not_lost(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+
+            def worker():
+                for _ in range(500):
+                    mesh.increment("count")
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert mesh.get("count") == 4000
+
+
+class TestAppend:
+    """Tests for ContextMesh.append()."""
+
+    def test_append_creates_and_extends(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            assert mesh.append("decisions", "start") == 1
+            assert mesh.append("decisions", {"step": 2}) == 2
+            assert mesh.get("decisions") == ["start", {"step": 2}]
+
+            mesh.push("name", "abc")
+            with pytest.raises(TypeError, match="not a list"):
+                mesh.append("name", "x")
+            with pytest.raises(ValueError, match="max_len"):
+                mesh.append("decisions", "x", max_len=0)
+
+    def test_max_len_keeps_the_latest_entries(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            mesh.push("log", [0, 1, 2, 3])
+            assert mesh.append("log", 4, max_len=3) == 3
+            for i in range(5, 10):
+                mesh.append("log", i, max_len=3)
+            assert mesh.get("log") == [7, 8, 9]
+
+    @pytest.mark.parametrize("copy_mode", ["deep", "frozen", "none"])
+    def test_earlier_reads_and_events_are_unchanged(self, copy_mode):
+        # Reads do not deliver events in "shared_reads" mode
+        with ContextMesh(
+            enable_persistence=False, copy_mode=copy_mode, concurrency="shared_reads"
+        ) as mesh:
+            mesh.append("log", {"n": 1})
+            mesh.append("log", {"n": 2})
+            before = mesh.get("log")
+
+            events = []
+            mesh.on_change(lambda event: events.append(event["value"]), keys=["log"])
+            writers = [
+                threading.Thread(target=mesh.append, args=("log", {"n": n}))
+                for n in (3, 4)
+            ]
+            with mesh._dispatch_lock:
+                # Both appends are committed before their events are delivered
+                for writer in writers:
+                    writer.start()
+                    while len(mesh.get("log")) < 3 + writers.index(writer):
+                        time.sleep(0.001)
+            for writer in writers:
+                writer.join()
+
+            assert before == [{"n": 1}, {"n": 2}]
+            assert [len(value) for value in events] == [3, 4]
+            assert mesh.get("log")[-1] == {"n": 4}
+
+    @pytest.mark.parametrize("copy_mode", ["deep", "frozen", "none"])
+    def test_appends_do_not_copy_the_list(self, copy_mode):
+        with ContextMesh(enable_persistence=False, copy_mode=copy_mode) as mesh:
+            mesh.append("log", 0)
+            mesh.append("log", 1)
+            stored = mesh._data["log"].value
+            for i in range(2, 100):
+                mesh.append("log", i, max_len=50)
+            assert mesh._data["log"].value is stored
+
+            first = mesh.get("log")
+            view = mesh.get_all_for_agent("reader")["log"]
+            mesh.append("log", 100, max_len=50)
+            assert first == view == list(range(50, 100))
+            assert mesh.get("log") == list(range(51, 101))
+            if copy_mode == "frozen":
+                with pytest.raises((TypeError, AttributeError)):
+                    first.append(0)
+
+    def test_entries_are_copied(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            entry = {"n": 1}
+            mesh.append("log", "first")
+            mesh.append("log", entry)
+            entry["n"] = 2
+            assert mesh.get("log") == ["first", {"n": 1}]
+
+
+class TestCounterPersistence:
+    """Tests for persisting counters and lists."""
+
+    @pytest.mark.parametrize("durability", ["sync", "async"])
+    def test_values_survive_a_restart(self, tmp_path, durability):
+        db_path = str(tmp_path / "counters.db")
+        with ContextMesh(
+            db_path=db_path, user_id="alice", durability=durability
+        ) as mesh:
+            mesh.push("log", ["a"], topics=["ops"])
+            mesh.flush()
+            for i in range(5):
+                mesh.increment("count")
+                mesh.append("log", i, max_len=4)
+
+        with ContextMesh(db_path=db_path, user_id="alice") as reloaded:
+            assert reloaded.get("count") == 5
+            assert reloaded.get("log") == [1, 2, 3, 4]
+            reloaded.register_agent_topics("worker", ["ops"])
+            assert reloaded.get("log", "worker") == [1, 2, 3, 4]
+
+    def test_appends_do_not_rewrite_the_list(self, tmp_path):
+        db_path = str(tmp_path / "append.db")
+        with ContextMesh(db_path=db_path, user_id="alice") as mesh:
+            mesh.push("log", list(range(100)))
+            with patch.object(
+                mesh.db_backend,
+                "save_context_item_for_user",
+                side_effect=AssertionError("the whole list was written"),
+            ):
+                mesh.append("log", 100)
+                mesh.append("log", 101, max_len=100)
+
+        with ContextMesh(db_path=db_path, user_id="alice") as reloaded:
+            assert reloaded.get("log") == list(range(2, 102))
+
+    def test_evicted_lists_are_read_from_the_queue(self, tmp_path):
+        with ContextMesh(
+            db_path=str(tmp_path / "evict.db"),
+            user_id="alice",
+            durability="async",
+            flush_interval=60,
+            max_items=1,
+        ) as mesh:
+            mesh.append("a", 1)
+            mesh.flush()
+            mesh.append("a", 2)
+            mesh.push("b", 0)  # Evicts "a" with its append still queued
+            assert mesh.append("a", 3) == 3
+            mesh.push("b", 1)
+            assert mesh.get("a") == [1, 2, 3]
+            mesh.flush()
+            assert mesh.db_backend.get_context_item_for_user("alice", "a")[0] == [
+                1,
+                2,
+                3,
+            ]
+
+    def test_evicted_lists_are_released(self, tmp_path):
+        with ContextMesh(
+            db_path=str(tmp_path / "release.db"), user_id="alice", max_items=2
+        ) as mesh:
+            for key in "abcde":
+                for i in range(3):
+                    mesh.append(key, i)
+            assert mesh.get_stats()["resident_items"] == 2
+            assert set(mesh._owned_lists) <= {"d", "e"}
+            assert mesh.get("a") == [0, 1, 2]
+
+    def test_queued_appends_are_merged(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "q.db"))
+        backend.connect()
+        queue = WriteBehindQueue(backend, user_id="alice", flush_interval=60)
+
+        queue.save_items([("log", [1], [], None, 0.0)])
+        queue.append_item(("log", [1, 2], [], None, 0.0), [2], 0)
+        queue.append_item(("log", [2, 3], [], None, 0.0), [3], 1)
+        assert len(queue) == 1
+        assert queue.pending_item("log")[2:4] == ([2, 3], 1)
+        queue.flush()
+
+        assert backend.get_context_item_for_user("alice", "log")[0] == [2, 3]
+        queue.close()
+        backend.close()
+
+    def test_sqlite_appends_in_the_database(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "a.db"))
+        backend.connect()
+        backend.save_context_item_for_user("alice", "log", [0], ["t"], None, 0.0)
+        backend.save_context_item_for_user("bob", "log", [], [], None, 0.0)
+
+        # More entries than one statement takes
+        entries = [{"n": i} for i in range(1, 121)] + ["text", None, True]
+        assert backend.append_to_context_item_for_user("alice", "log", entries, 70)
+        expected = ([0] + entries)[70:]
+        assert backend.get_context_item_for_user("alice", "log") == (
+            expected,
+            ["t"],
+            None,
+            0.0,
+        )
+        assert backend.get_context_item_for_user("bob", "log")[0] == []
+        assert not backend.append_to_context_item_for_user("alice", "missing", [1])
+        backend.close()
@@ -0,0 +1,238 @@
+"""
+Unit tests for ContextMesh durability levels and the write-behind queue.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from syntha import ContextMesh, create_database_backend
+from syntha.write_behind import WriteBehindQueue
+
+
+def stored(db_path, key, user_id=None):
+    """Read a value straight from the database file."""
+    backend = create_database_backend("sqlite", db_path=db_path)
+    backend.connect()
+    try:
+        if user_id:
+            row = backend.get_context_item_for_user(user_id, key)
+        else:
+            row = backend.get_context_item(key)
+        return None if row is None else row[0]
+    finally:
+        backend.close()
+
+
+class TestDurabilityLevels:
+    """Tests for the sync, batched and async durability levels."""
+
+    def test_sync_commits_before_returning(self, tmp_path):
+        db_path = str(tmp_path / "sync.db")
+        with ContextMesh(db_path=db_path) as mesh:
+            mesh.push("key", "value")
+            assert stored(db_path, "key") == "value"
+            assert "pending_writes" not in mesh.get_stats()
+
+    def test_commits_run_outside_the_lock(self, tmp_path):
+        mesh = ContextMesh(db_path=str(tmp_path / "unlocked.db"))
+        reads = []
+        original = mesh.db_backend.save_context_item
+
+        def save(*args, **kwargs):
+            # Another thread can read while the write is being committed
+            reader = threading.Thread(target=lambda: reads.append(mesh.get("key")))
+            reader.start()
+            reader.join(timeout=5)
+            return original(*args, **kwargs)
+
+        mesh.db_backend.save_context_item = save
+        mesh.push("key", "value")
+        assert reads == ["value"]
+        mesh.close()
+
+    def test_database_follows_memory_order(self, tmp_path):
+        db_path = str(tmp_path / "order.db")
+        mesh = ContextMesh(db_path=db_path, user_id="alice")
+
+        def writer(n):
+            for i in range(30):
+                if (i + n) % 3 == 0:
+                    mesh.remove(f"k{i % 5}")
+                else:
+                    mesh.push(f"k{i % 5}", f"{n}-{i}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i in range(5):
+            assert stored(db_path, f"k{i}", "alice") == mesh.get(f"k{i}")
+        mesh.close()
+
+    def test_batched_commits_concurrent_writers_together(self, tmp_path):
+        db_path = str(tmp_path / "batched.db")
+        with ContextMesh(
+            db_path=db_path, durability="batched", flush_interval=0.02
+        ) as mesh:
+
+            def writer(n):
+                for i in range(10):
+                    mesh.push(f"k{n}-{i}", i)
+                    # Durable once push returns
+                    assert mesh._writes._committed >= 1
+
+            threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert stored(db_path, "k7-9") == 9
+            stats = mesh.get_stats()
+            assert stats["pending_writes"] == 0
+            assert stats["flushes"] < 80
+
+    def test_async_coalesces_and_flushes_on_close(self, tmp_path):
+        db_path = str(tmp_path / "async.db")
+        mesh = ContextMesh(
+            db_path=db_path, user_id="alice", durability="async", flush_interval=60
+        )
+        for i in range(100):
+            mesh.push("counter", i)
+        mesh.register_agent_topics("agent1", ["sales"])
+        mesh.register_agent_topics("agent1", ["sales", "ops"])
+        mesh.push("gone", 1)
+        mesh.remove("gone")
+
+        stats = mesh.get_stats()
+        assert stats["pending_writes"] == 3
+        assert stats["coalesced_writes"] == 101
+        assert stored(db_path, "counter", "alice") is None
+
+        mesh.close()
+        assert stored(db_path, "counter", "alice") == 99
+
+        reloaded = ContextMesh(db_path=db_path, user_id="alice")
+        assert reloaded.get("counter") == 99
+        assert reloaded.get("gone") is None
+        assert reloaded.get_topics_for_agent("agent1") == ["sales", "ops"]
+        reloaded.close()
+
+    def test_flusher_commits_after_interval(self, tmp_path):
+        db_path = str(tmp_path / "interval.db")
+        with ContextMesh(
+            db_path=db_path, durability="async", flush_interval=0.01
+        ) as mesh:
+            mesh.push("key", "value")
+            assert mesh._writes.wait(mesh._writes._sequence, timeout=5)
+            assert stored(db_path, "key") == "value"
+
+    def test_clear_supersedes_queued_writes(self, tmp_path):
+        db_path = str(tmp_path / "clear.db")
+        with ContextMesh(
+            db_path=db_path, durability="async", flush_interval=60
+        ) as mesh:
+            mesh.push("old", 1)
+            mesh.flush()
+            mesh.push("dropped", 2)
+            mesh.clear()
+            mesh.push("new", 3)
+            assert mesh.get_stats()["pending_writes"] == 2
+            mesh.flush()
+
+            assert stored(db_path, "old") is None
+            assert stored(db_path, "dropped") is None
+            assert stored(db_path, "new") == 3
+
+    def test_evicted_values_are_read_from_the_queue(self, tmp_path):
+        with ContextMesh(
+            db_path=str(tmp_path / "evict.db"),
+            durability="async",
+            flush_interval=60,
+            max_items=1,
+        ) as mesh:
+            mesh.push("a", {"n": 1})
+            mesh.push("b", {"n": 2})  # Evicts "a" before it is flushed
+            assert mesh.get("a") == {"n": 1}
+            mesh.remove("a")
+            mesh.push("c", 3)
+            mesh.push("b", {"n": 4})
+            assert mesh.get("c") == 3
+            assert mesh.get("b") == {"n": 4}
+
+    def test_failed_flush_keeps_writes_queued(self, tmp_path):
+        db_path = str(tmp_path / "retry.db")
+        with ContextMesh(
+            db_path=db_path, durability="async", flush_interval=60
+        ) as mesh:
+            mesh.push("key", "value")
+            with patch.object(
+                mesh.db_backend,
+                "save_context_item",
+                side_effect=RuntimeError("database is down"),
+            ):
+                with pytest.raises(RuntimeError, match="database is down"):
+                    mesh.flush()
+            assert mesh.get_stats()["pending_writes"] == 1
+
+            mesh.flush()
+            assert stored(db_path, "key") == "value"
+
+    def test_unserializable_values_are_dropped(self, tmp_path):
+        db_path = str(tmp_path / "bad.db")
+        with ContextMesh(
+            db_path=db_path, durability="async", flush_interval=60
+        ) as mesh:
+            mesh.push("good", 1)
+            mesh.push("bad", object())
+            with pytest.raises(TypeError):
+                mesh.flush()
+            assert mesh.get_stats()["pending_writes"] == 0
+            assert stored(db_path, "good") == 1
+            assert stored(db_path, "bad") is None
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError, match="durability"):
+            ContextMesh(enable_persistence=False, durability="eventually")
+        with pytest.raises(ValueError, match="flush_interval"):
+            ContextMesh(enable_persistence=False, flush_interval=0)
+        with pytest.raises(ValueError, match="flush_batch_size"):
+            ContextMesh(enable_persistence=False, flush_batch_size=0)
+
+
+class TestWriteBehindQueue:
+    """Tests for the queue on its own."""
+
+    def test_barriers_keep_their_place(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "q.db"))
+        backend.connect()
+        queue = WriteBehindQueue(backend, user_id="alice")
+
+        queue.save_items([("a", 1, [], None, 0.0)])
+        queue.cleanup_expired(1.0)  # Removes nothing: "a" has no TTL
+        queue.save_items([("b", 2, [], 1.0, 0.0)])
+        assert queue.pending_item("a") == ("save_item", ("a", 1, [], None, 0.0))
+        queue.flush()
+
+        assert queue.pending_item("a") is None
+        assert backend.get_context_item_for_user("alice", "a")[0] == 1
+        assert backend.get_context_item_for_user("alice", "b")[0] == 2
+        queue.close()
+        backend.close()
+
+    def test_max_batch_triggers_a_flush(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "q.db"))
+        backend.connect()
+        queue = WriteBehindQueue(backend, flush_interval=60, max_batch=10)
+
+        sequence = None
+        for i in range(10):
+            sequence = queue.save_items([(f"k{i}", i, [], None, 0.0)])
+        assert queue.wait(sequence, timeout=5) is True
+        assert len(queue) == 0
+        queue.close()
+        backend.close()
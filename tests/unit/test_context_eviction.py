@@ -0,0 +1,179 @@
+"""
+Unit tests for memory-bounded ContextMesh instances (max_items / max_bytes).
+"""
+
+import pytest
+
+from syntha.context import ContextMesh, FrozenDict
+
+
+def bounded_mesh(**kwargs):
+    return ContextMesh(enable_persistence=False, **kwargs)
+
+
+class TestEvictionConfig:
+    """Tests for the eviction options."""
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"eviction_policy": "fifo"}, "Unsupported eviction policy"),
+            ({"max_items": 0}, "max_items"),
+            ({"max_bytes": 0}, "max_bytes"),
+        ],
+    )
+    def test_invalid_options_raise(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            bounded_mesh(**kwargs)
+
+    def test_unbounded_by_default(self):
+        mesh = bounded_mesh()
+        for i in range(100):
+            mesh.push(f"key{i}", i)
+        assert mesh.size() == 100
+        assert "evictions" not in mesh.get_stats()
+        mesh.close()
+
+
+class TestInMemoryEviction:
+    """Without persistence, evicted items are dropped."""
+
+    def test_lru_evicts_least_recently_used(self):
+        mesh = bounded_mesh(max_items=2)
+        mesh.push("a", 1)
+        mesh.push("b", 2)
+        assert mesh.get("a") == 1  # "b" is now least recently used
+        mesh.push("c", 3)
+
+        assert mesh.get("b") is None
+        assert mesh.get_many(["a", "c"]) == {"a": 1, "c": 3}
+        assert mesh.get_stats()["evictions"] == 1
+        mesh.close()
+
+    def test_lfu_evicts_least_frequently_used(self):
+        mesh = bounded_mesh(max_items=2, eviction_policy="lfu")
+        mesh.push("a", 1)
+        mesh.push("b", 2)
+        for _ in range(3):
+            mesh.get("a")
+        mesh.get("b")
+
+        mesh.push("c", 3)  # "b" has fewer accesses than "a"
+        assert mesh.get("b") is None
+        mesh.push("d", 4)  # "c" is the least frequently used now
+        assert mesh.get("c") is None
+        assert mesh.get_many(["a", "d"]) == {"a": 1, "d": 4}
+        mesh.close()
+
+    def test_max_bytes(self):
+        mesh = bounded_mesh(max_bytes=20000)
+        for i in range(20):
+            mesh.push(f"doc{i}", "x" * 2000)
+
+        stats = mesh.get_stats()
+        assert 0 < stats["resident_bytes"] <= 20000
+        assert stats["evictions"] > 0
+        assert mesh.size() == stats["resident_items"] < 20
+        assert mesh.get("doc19") == "x" * 2000
+        mesh.close()
+
+    def test_oversized_value_stays_resident(self):
+        mesh = bounded_mesh(max_bytes=100)
+        mesh.push("small", 1)
+        mesh.push("huge", "x" * 1000)
+
+        assert mesh.get("small") is None
+        assert mesh.get("huge") == "x" * 1000
+        mesh.close()
+
+    def test_removal_updates_accounting(self):
+        mesh = bounded_mesh(max_items=2, max_bytes=10000)
+        mesh.push("a", "value")
+        mesh.push("b", "value", topics=["t"])
+        mesh.remove("a")
+        mesh.delete_topic("t")
+
+        assert mesh.get_stats()["resident_items"] == 0
+        assert mesh.get_stats()["resident_bytes"] == 0
+        mesh.push("c", 3)
+        mesh.push("d", 4)
+        assert mesh.size() == 2
+        mesh.close()
+
+    def test_eviction_is_reported_as_removal(self):
+        mesh = bounded_mesh(max_items=1)
+        mesh.push("a", 1)
+        cursor = mesh.get_changes_since()["cursor"]
+        mesh.push("b", 2)
+
+        changes = mesh.get_changes_since(cursor)
+        assert changes["changed"] == {"b": 2}
+        assert changes["removed"] == ["a"]
+        mesh.close()
+
+
+class TestPersistentEviction:
+    """With persistence, evicted values stay in the database and are paged in."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "bounded.db")
+
+    def test_values_are_paged_back_in(self, db_path):
+        mesh = ContextMesh(db_path=db_path, user_id="user1", max_items=2)
+        mesh.push("a", {"n": 1}, subscribers=["agent1"])
+        mesh.push("b", {"n": 2}, topics=["sales"])
+        mesh.push("c", {"n": 3})
+
+        stats = mesh.get_stats()
+        assert stats["total_items"] == 3
+        assert stats["resident_items"] == 2
+
+        # Routing still applies to evicted items
+        assert mesh.get("a", "agent2") is None
+        assert mesh.get("a", "agent1") == {"n": 1}
+        mesh.register_agent_topics("agent1", ["sales"])
+        assert mesh.get_all_for_agent("agent1") == {
+            "a": {"n": 1},
+            "b": {"n": 2},
+            "c": {"n": 3},
+        }
+        assert mesh.get_stats()["resident_items"] == 2
+        mesh.close()
+
+    def test_delete_topic_keeps_evicted_value(self, db_path):
+        mesh = ContextMesh(db_path=db_path, user_id="user1", max_items=1)
+        mesh.push("shared", "kept", topics=["a", "b"])
+        mesh.push("other", 1)  # Evicts "shared"
+        mesh.delete_topic("a")
+        mesh.close()
+
+        reloaded = ContextMesh(db_path=db_path, user_id="user1")
+        assert reloaded.get("shared") == "kept"
+        assert reloaded._data["shared"].topics == ("b",)
+        reloaded.close()
+
+    def test_bounds_apply_when_loading(self, db_path):
+        mesh = ContextMesh(db_path=db_path, user_id="user1")
+        for i in range(5):
+            mesh.push(f"key{i}", i)
+        mesh.close()
+
+        reloaded = ContextMesh(db_path=db_path, user_id="user1", max_items=2)
+        assert reloaded.get_stats()["resident_items"] == 2
+        assert reloaded.get_many([f"key{i}" for i in range(5)]) == {
+            f"key{i}": i for i in range(5)
+        }
+        reloaded.close()
+
+    def test_frozen_values_stay_frozen(self, db_path):
+        mesh = ContextMesh(
+            db_path=db_path, user_id="user1", max_items=1, copy_mode="frozen"
+        )
+        mesh.push("a", {"n": 1})
+        mesh.push("b", 2)
+
+        value = mesh.get("a")
+        assert isinstance(value, FrozenDict)
+        assert value == {"n": 1}
+        mesh.close()
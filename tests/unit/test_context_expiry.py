@@ -0,0 +1,148 @@
+"""
+Unit tests for heap-based TTL expiry in ContextMesh.
+"""
+
+import time
+
+import pytest
+
+from syntha.context import ContextMesh
+
+
+class TestExpiryHeap:
+    """Tests for expiry tracking and amortized cleanup."""
+
+    def test_cleanup_removes_only_expired_items(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        mesh.push("short", 1, ttl=0.01)
+        mesh.push("long", 2, ttl=60)
+        mesh.push("forever", 3)
+        time.sleep(0.05)
+
+        assert mesh.cleanup_expired() == 1
+        assert mesh.get("long") == 2
+        assert mesh.get("forever") == 3
+        assert mesh.size() == 2
+        mesh.close()
+
+    def test_non_expiring_items_are_not_tracked(self):
+        mesh = ContextMesh(enable_persistence=False)
+        for i in range(10):
+            mesh.push(f"key_{i}", i)
+        assert mesh._expiry_heap == []
+        mesh.close()
+
+    def test_overwritten_item_uses_new_ttl(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        mesh.push("key", "old", ttl=0.01)
+        mesh.push("key", "new", ttl=60)
+        time.sleep(0.05)
+
+        # The stale heap entry for the first push must not expire the new item
+        assert mesh.cleanup_expired() == 0
+        assert mesh.get("key") == "new"
+        mesh.close()
+
+    def test_removed_item_entry_is_ignored(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        mesh.push("key", "value", ttl=0.01)
+        mesh.remove("key")
+        time.sleep(0.05)
+
+        assert mesh.cleanup_expired() == 0
+        assert mesh._expiry_heap == []
+        mesh.close()
+
+    def test_stale_entries_are_compacted(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        for i in range(1000):
+            mesh.push("key", i, ttl=60)
+
+        assert len(mesh._expiry_heap) <= 2 * mesh.size() + 64
+        mesh.close()
+
+    def test_expiry_is_amortized_into_pushes(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push("short", 1, ttl=0.01)
+        time.sleep(0.05)
+
+        mesh.push("other", 2)
+        assert mesh.size() == 1
+        assert mesh.get("short") is None
+        mesh.close()
+
+    def test_expiry_is_amortized_into_reads(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push("short", 1, ttl=0.01, subscribers=["agent1"])
+        time.sleep(0.05)
+
+        assert mesh.get_keys_for_agent("agent1") == []
+        assert mesh.size() == 0
+        assert "agent1" not in mesh._agent_index
+        mesh.close()
+
+    def test_get_stats_counts_expired_items_without_removing(self):
+        mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+        mesh.push("expired_global", 1, ttl=0.01)
+        mesh.push("expired_private", 2, ttl=0.01, subscribers=["a"])
+        mesh.push("live_global", 3, ttl=60)
+        mesh.push("live_private", 4, subscribers=["a"])
+        time.sleep(0.05)
+
+        stats = mesh.get_stats()
+        assert stats["total_items"] == 4
+        assert stats["expired_items"] == 2
+        assert stats["active_items"] == 2
+        assert stats["global_items"] == 1
+        assert stats["private_items"] == 1
+        assert mesh.size() == 4
+        mesh.close()
+
+    def test_get_stats_without_indexing(self):
+        mesh = ContextMesh(
+            enable_persistence=False, auto_cleanup=False, enable_indexing=False
+        )
+        mesh.push("expired", 1, ttl=0.01)
+        mesh.push("live", 2)
+        time.sleep(0.05)
+
+        stats = mesh.get_stats()
+        assert stats["expired_items"] == 1
+        assert stats["global_items"] == 1
+        mesh.close()
+
+
+class TestReaperThread:
+    """Tests for the optional background reaper."""
+
+    def test_reaper_removes_expired_items(self):
+        mesh = ContextMesh(enable_persistence=False, reaper_interval=0.02)
+        mesh.push("short", 1, ttl=0.01)
+
+        deadline = time.time() + 2
+        while mesh.size() and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert mesh.size() == 0
+        mesh.close()
+        assert mesh._reaper_thread is None
+
+    def test_start_and_stop_reaper(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.start_reaper(0.05)
+        thread = mesh._reaper_thread
+        assert thread is not None and thread.is_alive()
+
+        # Starting twice keeps the existing thread
+        mesh.start_reaper(0.05)
+        assert mesh._reaper_thread is thread
+
+        mesh.stop_reaper()
+        assert not thread.is_alive()
+        mesh.close()
+
+    def test_invalid_reaper_interval(self):
+        mesh = ContextMesh(enable_persistence=False)
+        with pytest.raises(ValueError):
+            mesh.start_reaper(0)
+        mesh.close()
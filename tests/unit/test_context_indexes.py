@@ -0,0 +1,71 @@
+"""
+Unit tests for ContextMesh agent/global index maintenance.
+"""
+
+from syntha.context import ContextMesh
+
+
+class TestIndexMaintenance:
+    """Tests for the set-based agent and global indexes."""
+
+    def setup_method(self):
+        self.mesh = ContextMesh(enable_persistence=False)
+
+    def teardown_method(self):
+        self.mesh.close()
+
+    def test_indexes_track_subscribers(self):
+        self.mesh.push("global", 1)
+        self.mesh.push("shared", 2, subscribers=["a", "b"])
+
+        assert list(self.mesh._global_keys) == ["global"]
+        assert list(self.mesh._agent_index["a"]) == ["shared"]
+        assert list(self.mesh._agent_index["b"]) == ["shared"]
+        assert sorted(self.mesh._key_agents["shared"]) == ["a", "b"]
+
+    def test_overwrite_moves_key_between_agents(self):
+        self.mesh.push("key", 1, subscribers=["a", "b"])
+        self.mesh.push("key", 2, subscribers=["c"])
+
+        assert "a" not in self.mesh._agent_index
+        assert "b" not in self.mesh._agent_index
+        assert list(self.mesh._agent_index["c"]) == ["key"]
+        assert self.mesh._key_agents["key"] == {"c"}
+        assert self.mesh.get("key", "a") is None
+        assert self.mesh.get("key", "c") == 2
+
+    def test_overwrite_private_with_global(self):
+        self.mesh.push("key", 1, subscribers=["a"])
+        self.mesh.push("key", 2)
+
+        assert "key" not in self.mesh._key_agents
+        assert "key" in self.mesh._global_keys
+        assert self.mesh.get_keys_for_agent("anyone") == ["key"]
+
+    def test_remove_and_clear_empty_indexes(self):
+        self.mesh.push("p", 1, subscribers=["a"])
+        self.mesh.push("g", 2)
+
+        self.mesh.remove("p")
+        self.mesh.remove("g")
+        assert self.mesh._agent_index == {}
+        assert self.mesh._global_keys == {}
+        assert self.mesh._key_agents == {}
+
+        self.mesh.push("p", 1, subscribers=["a"])
+        self.mesh.clear()
+        assert self.mesh._agent_index == {}
+        assert self.mesh._key_agents == {}
+
+    def test_insertion_order_is_preserved(self):
+        for i in range(5):
+            self.mesh.push(f"key_{i}", i, subscribers=["a"])
+        self.mesh.push("key_2", "updated", subscribers=["a"])
+
+        assert self.mesh.get_keys_for_agent("a") == [
+            "key_0",
+            "key_1",
+            "key_3",
+            "key_4",
+            "key_2",
+        ]
@@ -0,0 +1,152 @@
+"""
+Unit tests for prefix and range queries over the sorted key index.
+"""
+
+import random
+import time
+from unittest.mock import patch
+
+import pytest
+
+from syntha import ContextMesh, create_database_backend
+from syntha.context import _SortedKeys
+
+
+@pytest.fixture
+def mesh():
+    mesh = ContextMesh(enable_persistence=False)
+    for key in ["project/2/summary", "project/1/summary", "project/1/notes", "misc"]:
+        mesh.push(key, key.upper())
+    yield mesh
+    mesh.close()
+
+
+class TestPrefixQueries:
+    """Tests for get_prefix() and list_keys()."""
+
+    def test_list_keys_in_sorted_order(self, mesh):
+        assert mesh.list_keys() == [
+            "misc",
+            "project/1/notes",
+            "project/1/summary",
+            "project/2/summary",
+        ]
+        assert mesh.list_keys("project/1/") == ["project/1/notes", "project/1/summary"]
+        assert mesh.list_keys("project/3/") == []
+
+    def test_list_keys_pages(self, mesh):
+        first = mesh.list_keys("project/", limit=2)
+        assert first == ["project/1/notes", "project/1/summary"]
+        assert mesh.list_keys("project/", start_after=first[-1], limit=2) == [
+            "project/2/summary"
+        ]
+        # A cursor before the prefix starts at the prefix
+        assert mesh.list_keys("project/2", start_after="a") == ["project/2/summary"]
+        assert mesh.list_keys(limit=0) == []
+        with pytest.raises(ValueError, match="limit"):
+            mesh.list_keys(limit=-1)
+
+    def test_get_prefix_returns_values_in_key_order(self, mesh):
+        result = mesh.get_prefix("project/1/")
+        assert result == {
+            "project/1/notes": "PROJECT/1/NOTES",
+            "project/1/summary": "PROJECT/1/SUMMARY",
+        }
+        assert list(result) == ["project/1/notes", "project/1/summary"]
+        assert len(mesh.get_prefix("")) == 4
+
+    def test_access_control_and_expiry(self, mesh):
+        mesh.register_agent_topics("analyst", ["sales"])
+        mesh.push("project/1/private", "p", subscribers=["other"])
+        mesh.push("project/1/sales", "s", topics=["sales"])
+        mesh.push("project/1/short", "gone", ttl=0.01)
+        time.sleep(0.02)
+
+        assert mesh.list_keys("project/1/", agent_name="analyst") == [
+            "project/1/notes",
+            "project/1/sales",
+            "project/1/summary",
+        ]
+        assert "project/1/private" not in mesh.get_prefix("project/1/", "analyst")
+        assert "project/1/short" not in mesh.get_prefix("project/1/")
+
+    def test_index_follows_changes(self, mesh, tmp_path):
+        assert len(mesh.list_keys()) == 4  # Builds the index
+        mesh.remove("misc")
+        mesh.push("project/1/notes", "updated")
+        mesh.push("project/0/notes", "new")
+        assert mesh.list_keys() == [
+            "project/0/notes",
+            "project/1/notes",
+            "project/1/summary",
+            "project/2/summary",
+        ]
+
+        mesh.snapshot(str(tmp_path / "mesh.snap"))
+        mesh.clear()
+        assert mesh.list_keys() == []
+        mesh.restore(str(tmp_path / "mesh.snap"))
+        assert mesh.list_keys("project/2/") == ["project/2/summary"]
+
+        mesh.push("t/1", 1, topics=["temp"])
+        mesh.delete_topic("temp")
+        assert mesh.list_keys("t/") == []
+
+    def test_evicted_values_are_paged_in_with_one_query(self, tmp_path):
+        db_path = str(tmp_path / "prefix.db")
+        with ContextMesh(db_path=db_path, user_id="alice") as mesh:
+            for i in range(5):
+                mesh.push(f"doc/{i}", {"n": i})
+
+        mesh = ContextMesh(db_path=db_path, user_id="alice", lazy_load=True)
+        with patch.object(
+            mesh.db_backend,
+            "get_context_item_for_user",
+            side_effect=AssertionError("values are read one by one"),
+        ):
+            assert mesh.get_prefix("doc/") == {f"doc/{i}": {"n": i} for i in range(5)}
+        mesh.close()
+
+
+class TestSortedKeys:
+    """Tests for the blocked sorted key index."""
+
+    def test_matches_a_sorted_list(self):
+        rng = random.Random(7)
+        index = _SortedKeys()
+        reference = set()
+        for _ in range(5000):
+            key = f"k{rng.randrange(2000):04d}"
+            if rng.random() < 0.7:
+                index.add(key)
+                reference.add(key)
+            else:
+                index.discard(key)
+                reference.discard(key)
+
+        assert len(index) == len(reference)
+        assert list(index.iter_from("")) == sorted(reference)
+        assert list(index.iter_from("k1000", inclusive=False)) == sorted(
+            key for key in reference if key > "k1000"
+        )
+
+
+class TestBackendPrefixQueries:
+    """Tests for the prefix queries of the SQLite backend."""
+
+    def test_sqlite_prefix_is_a_literal_range(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "q.db"))
+        backend.connect()
+        for key in ["a%b/1", "a%b/2", "axb/1", "a_b", "A%B/1", "a%c"]:
+            backend.save_context_item_for_user("alice", key, key, [], None, 0.0)
+        backend.save_context_item_for_user("bob", "a%b/3", "bob", [], None, 0.0)
+
+        assert sorted(backend.get_context_items_by_prefix_for_user("alice", "a%b")) == [
+            "a%b/1",
+            "a%b/2",
+        ]
+        assert backend.get_context_items_by_prefix_for_user("alice", "a_b") == {
+            "a_b": ("a_b", [], None, 0.0)
+        }
+        assert len(backend.get_context_items_by_prefix("a%b/")) == 3
+        backend.close()
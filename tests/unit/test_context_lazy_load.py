@@ -0,0 +1,72 @@
+"""
+Unit tests for ContextMesh lazy loading (lazy_load=True).
+"""
+
+import time
+
+import pytest
+
+from syntha.context import _UNLOADED, ContextMesh
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "lazy.db")
+    mesh = ContextMesh(db_path=path, user_id="user1")
+    mesh.register_agent_topics("agent1", ["sales"])
+    mesh.push("global", {"n": 1})
+    mesh.push("private", {"n": 2}, subscribers=["agent2"])
+    mesh.push("report", {"n": 3}, topics=["sales"])
+    mesh.push("short", "gone", ttl=0.01)
+    mesh.close()
+    time.sleep(0.02)
+    return path
+
+
+class TestLazyLoad:
+    """Tests for loading metadata eagerly and values on demand."""
+
+    def test_only_metadata_is_loaded(self, db_path):
+        mesh = ContextMesh(db_path=db_path, user_id="user1", lazy_load=True)
+
+        assert set(mesh._data) == {"global", "private", "report"}
+        assert all(item.value is _UNLOADED for item in mesh._data.values())
+        assert mesh._data["report"].topics == ("sales",)
+        mesh.close()
+
+    def test_values_are_read_through(self, db_path):
+        mesh = ContextMesh(db_path=db_path, user_id="user1", lazy_load=True)
+
+        assert mesh.get("private", "agent1") is None
+        assert mesh.get_keys_for_agent("agent1") == ["global", "report"]
+        assert mesh.get_all_for_agent("agent1") == {
+            "global": {"n": 1},
+            "report": {"n": 3},
+        }
+        assert mesh._data["private"].value is _UNLOADED
+        assert mesh.get("private", "agent2") == {"n": 2}
+        assert mesh._data["private"].value == {"n": 2}
+        mesh.close()
+
+    def test_writes_and_topic_deletes(self, db_path):
+        mesh = ContextMesh(db_path=db_path, user_id="user1", lazy_load=True)
+        mesh.push("global", "updated")
+        assert mesh.get("global") == "updated"
+        assert mesh.delete_topic("sales") == 1
+        mesh.close()
+
+        reloaded = ContextMesh(db_path=db_path, user_id="user1", lazy_load=True)
+        assert reloaded.get_many(["global", "report"]) == {"global": "updated"}
+        reloaded.close()
+
+    def test_combines_with_memory_limits(self, db_path):
+        mesh = ContextMesh(
+            db_path=db_path, user_id="user1", lazy_load=True, max_items=1
+        )
+        assert mesh.get_many(["global", "private", "report"]) == {
+            "global": {"n": 1},
+            "private": {"n": 2},
+            "report": {"n": 3},
+        }
+        assert mesh.get_stats()["resident_items"] == 1
+        mesh.close()
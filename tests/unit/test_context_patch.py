@@ -0,0 +1,140 @@
+"""
+Unit tests for JSON merge-patch updates.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from syntha import ContextMesh, create_database_backend
+from syntha.context import apply_merge_patch
+from syntha.write_behind import WriteBehindQueue
+
+
+class TestApplyMergePatch:
+    """Tests for the RFC 7386 merge."""
+
+    @pytest.mark.parametrize(
+        "target, merge_patch, expected",
+        [
+            ({"a": "b"}, {"a": "c"}, {"a": "c"}),
+            ({"a": "b"}, {"b": "c"}, {"a": "b", "b": "c"}),
+            ({"a": "b"}, {"a": None}, {}),
+            ({"a": "b", "b": "c"}, {"a": None}, {"b": "c"}),
+            ({"a": ["b"]}, {"a": "c"}, {"a": "c"}),
+            ({"a": "c"}, {"a": ["b"]}, {"a": ["b"]}),
+            ({"a": {"b": "c"}}, {"a": {"b": "d", "c": None}}, {"a": {"b": "d"}}),
+            ({"a": [{"b": "c"}]}, {"a": [1]}, {"a": [1]}),
+            (["a", "b"], ["c", "d"], ["c", "d"]),
+            ({"a": "b"}, ["c"], ["c"]),
+            ({"e": None}, {"a": 1}, {"e": None, "a": 1}),
+            ([1, 2], {"a": "b", "c": None}, {"a": "b"}),
+            ({}, {"a": {"bb": {"ccc": None}}}, {"a": {"bb": {}}}),
+        ],
+    )
+    def test_rfc_examples(self, target, merge_patch, expected):
+        assert apply_merge_patch(target, merge_patch) == expected
+
+    def test_unpatched_members_are_shared(self):
+        target = {"a": {"b": 1}, "c": {"d": 2}}
+        result = apply_merge_patch(target, {"a": {"b": 3}})
+        assert target == {"a": {"b": 1}, "c": {"d": 2}}
+        assert result["c"] is target["c"]
+        assert result["a"] is not target["a"]
+
+
+class TestContextMeshPatch:
+    """Tests for ContextMesh.patch()."""
+
+    def test_patch_updates_part_of_a_value(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            mesh.push("doc", {"title": "Draft", "meta": {"tags": ["x"], "rev": 1}})
+            before = mesh.get("doc")
+            assert mesh.patch("doc", {"meta": {"rev": 2}, "title": None}) is True
+            assert mesh.get("doc") == {"meta": {"tags": ["x"], "rev": 2}}
+            assert before == {"title": "Draft", "meta": {"tags": ["x"], "rev": 1}}
+            assert mesh.patch("missing", {"a": 1}) is False
+
+    def test_patch_respects_access_and_expiry(self):
+        import time
+
+        with ContextMesh(enable_persistence=False) as mesh:
+            mesh.push("private", {"a": 1}, subscribers=["owner"])
+            mesh.push("short", {"a": 1}, ttl=0.01)
+            time.sleep(0.02)
+            assert mesh.patch("private", {"a": 2}, agent_name="intruder") is False
+            assert mesh.patch("private", {"a": 2}, agent_name="owner") is True
+            assert mesh.get("private", "owner") == {"a": 2}
+            assert mesh.patch("short", {"a": 2}) is False
+
+    def test_patch_notifies_subscribers(self):
+        with ContextMesh(enable_persistence=False) as mesh:
+            mesh.push("doc", {"a": 1})
+            events = []
+            mesh.on_change(events.append, keys=["doc"])
+            mesh.patch("doc", {"b": 2})
+            assert [(e["type"], e["key"], e["value"]) for e in events] == [
+                ("set", "doc", {"a": 1, "b": 2})
+            ]
+
+    def test_frozen_values_stay_frozen(self):
+        with ContextMesh(enable_persistence=False, copy_mode="frozen") as mesh:
+            mesh.push("doc", {"a": {"b": 1}})
+            mesh.patch("doc", {"a": {"c": 2}})
+            with pytest.raises(TypeError):
+                mesh.get("doc")["a"]["d"] = 3
+
+    def test_patch_is_persisted(self, tmp_path):
+        db_path = str(tmp_path / "patch.db")
+        with ContextMesh(db_path=db_path, user_id="alice") as mesh:
+            mesh.register_agent_topics("reader", ["t"])
+            mesh.push("doc", {"a": 1, "b": {"c": 2}}, topics=["t"])
+            with patch.object(
+                mesh.db_backend,
+                "save_context_item_for_user",
+                side_effect=AssertionError("the full value was written"),
+            ):
+                mesh.patch("doc", {"b": {"c": None, "d": 3}})
+
+        with ContextMesh(db_path=db_path, user_id="alice") as reloaded:
+            assert reloaded.get("doc") == {"a": 1, "b": {"d": 3}}
+            assert reloaded.get_available_keys_by_topic("reader") == {"t": ["doc"]}
+
+
+class TestPatchPersistence:
+    """Tests for patches in the queue and the SQLite backend."""
+
+    def test_repeated_patches_fall_back_to_a_save(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "q.db"))
+        backend.connect()
+        queue = WriteBehindQueue(backend, user_id="alice", flush_interval=60)
+
+        queue.save_items([("doc", {"a": 1}, [], None, 0.0)])
+        queue.flush()
+        queue.patch_item(("doc", {"a": 1, "b": 2}, [], None, 0.0), {"b": 2})
+        assert queue.pending_item("doc")[0] == "patch_item"
+        queue.patch_item(("doc", {"a": 1}, [], None, 0.0), {"b": None})
+        assert queue.pending_item("doc")[0] == "save_item"
+        queue.flush()
+
+        assert backend.get_context_item_for_user("alice", "doc")[0] == {"a": 1}
+        queue.close()
+        backend.close()
+
+    def test_sqlite_patch_merges_in_the_database(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "p.db"))
+        backend.connect()
+        backend.save_context_item_for_user(
+            "alice", "doc", {"a": {"b": 1, "c": 2}}, ["t"], None, 0.0
+        )
+        backend.save_context_item_for_user("bob", "doc", {"a": 1}, [], None, 0.0)
+
+        backend.patch_context_item_for_user("alice", "doc", {"a": {"b": None}, "d": 4})
+        assert backend.get_context_item_for_user("alice", "doc") == (
+            {"a": {"c": 2}, "d": 4},
+            ["t"],
+            None,
+            0.0,
+        )
+        assert backend.get_context_item_for_user("bob", "doc")[0] == {"a": 1}
+        backend.close()
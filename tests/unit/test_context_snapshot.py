@@ -0,0 +1,214 @@
+"""
+Unit tests for ContextMesh.snapshot() and ContextMesh.restore().
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from syntha.context import _UNLOADED, ContextMesh, FrozenDict
+
+
+@pytest.fixture
+def populated():
+    mesh = ContextMesh(enable_persistence=False)
+    mesh.register_agent_topics("agent1", ["sales"])
+    mesh.set_agent_post_permissions("agent1", ["sales"])
+    mesh.push("global", {"n": 1})
+    mesh.push("private", [1, 2], subscribers=["agent2"])
+    mesh.push("report", "r", topics=["sales", "support"], ttl=3600)
+    mesh.push("blob", bytearray(b"\x00\x01" * 1000))
+    yield mesh
+    mesh.close()
+
+
+def assert_same_state(restored, original):
+    for agent in ("agent1", "agent2", "agent3"):
+        assert restored.get_all_for_agent(agent) == original.get_all_for_agent(agent)
+        assert sorted(restored.get_keys_for_agent(agent)) == sorted(
+            original.get_keys_for_agent(agent)
+        )
+    assert restored.get_topics_for_agent("agent1") == ["sales"]
+    assert restored.get_subscribers_for_topic("sales") == ["agent1"]
+    assert restored.can_agent_post_to_topic("agent1", "sales")
+    assert restored._data["report"].expires_at == original._data["report"].expires_at
+
+
+class TestSnapshot:
+    """Tests for writing and restoring snapshots."""
+
+    def test_roundtrip(self, populated, tmp_path):
+        path = str(tmp_path / "mesh.snapshot")
+        populated.snapshot(path)
+
+        restored = ContextMesh(enable_persistence=False)
+        restored.push("stale", 1)
+        restored.restore(path)
+
+        assert restored.get("stale") is None
+        assert restored.get("blob") == bytearray(b"\x00\x01" * 1000)
+        assert_same_state(restored, populated)
+
+        # The restored mesh keeps working normally
+        restored.push("report", "updated", topics=["sales"])
+        assert restored.get("report", "agent1") == "updated"
+        assert restored.delete_topic("sales") == 1
+        restored.close()
+
+    def test_indexes_are_rebuilt_when_missing(self, populated, tmp_path):
+        path = str(tmp_path / "mesh.snapshot")
+        unindexed = ContextMesh(enable_persistence=False, enable_indexing=False)
+        unindexed.restore(self._snapshot(populated, path))
+        assert_same_state(unindexed, populated)
+
+        unindexed.snapshot(path)
+        indexed = ContextMesh(enable_persistence=False)
+        indexed.restore(path)
+        assert_same_state(indexed, populated)
+        assert indexed._key_agents["private"] == {"agent2"}
+        unindexed.close()
+        indexed.close()
+
+    def test_restore_starts_a_new_change_history(self, populated, tmp_path):
+        path = self._snapshot(populated, str(tmp_path / "mesh.snapshot"))
+        cursor = populated.get_changes_since(0)["cursor"]
+        populated.push("after", 1)
+
+        populated.restore(path)
+
+        changes = populated.get_changes_since(cursor)
+        assert changes["reset"] is True
+        assert "after" not in changes["changed"]
+        assert populated.get_changes_since(changes["cursor"])["changed"] == {}
+
+    def test_copy_mode_is_applied(self, populated, tmp_path):
+        path = self._snapshot(populated, str(tmp_path / "mesh.snapshot"))
+        frozen = ContextMesh(enable_persistence=False, copy_mode="frozen")
+        frozen.restore(path)
+        assert isinstance(frozen.get("global"), FrozenDict)
+        frozen.close()
+
+    def test_invalid_files(self, populated, tmp_path):
+        bogus = tmp_path / "bogus"
+        bogus.write_bytes(b"not a snapshot at all, just some bytes")
+        with pytest.raises(ValueError, match="not a ContextMesh snapshot"):
+            populated.restore(str(bogus))
+
+        path = self._snapshot(populated, str(tmp_path / "mesh.snapshot"))
+        other_user = ContextMesh(enable_persistence=False, user_id="user2")
+        with pytest.raises(ValueError, match="user_id"):
+            other_user.restore(path)
+        other_user.close()
+
+    def test_expired_items_are_cleaned_up_after_restore(self, tmp_path):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.push("short", 1, ttl=0.05)
+        path = self._snapshot(mesh, str(tmp_path / "mesh.snapshot"))
+        time.sleep(0.1)
+
+        restored = ContextMesh(enable_persistence=False)
+        restored.restore(path)
+        assert restored.get("short") is None
+        assert restored.cleanup_expired() == 1
+        mesh.close()
+        restored.close()
+
+    @staticmethod
+    def _snapshot(mesh, path):
+        mesh.snapshot(path)
+        return path
+
+
+class TestPersistentSnapshot:
+    """Snapshots of persistent meshes and warm starts."""
+
+    def test_unloaded_values_are_included(self, tmp_path):
+        db_path = str(tmp_path / "mesh.db")
+        path = str(tmp_path / "mesh.snapshot")
+        writer = ContextMesh(db_path=db_path, user_id="user1")
+        for i in range(3):
+            writer.push(f"key{i}", i)
+        writer.close()
+
+        lazy = ContextMesh(db_path=db_path, user_id="user1", lazy_load=True)
+        lazy.snapshot(path)
+        # Taking the snapshot does not load the values into the mesh
+        assert all(item.value is _UNLOADED for item in lazy._data.values())
+        lazy.close()
+
+        restored = ContextMesh(enable_persistence=False, user_id="user1")
+        restored.restore(path)
+        assert restored.get_many(["key0", "key1", "key2"]) == {
+            "key0": 0,
+            "key1": 1,
+            "key2": 2,
+        }
+        restored.close()
+
+    def test_unloaded_values_are_read_without_the_lock(self, tmp_path):
+        db_path = str(tmp_path / "mesh.db")
+        path = str(tmp_path / "mesh.snapshot")
+        writer = ContextMesh(db_path=db_path, user_id="user1")
+        for i in range(5):
+            writer.push(f"key{i}", i)
+        writer.close()
+
+        lazy = ContextMesh(db_path=db_path, user_id="user1", lazy_load=True)
+        read_all = lazy.db_backend.get_all_context_items_for_user
+
+        def read_while_writing(user_id):
+            rows = read_all(user_id)
+            # Writers are not blocked while the rows are read
+            writer = threading.Thread(target=lazy.push, args=("key1", "changed"))
+            writer.start()
+            writer.join(timeout=5)
+            assert not writer.is_alive()
+            return rows
+
+        with patch.object(
+            lazy.db_backend,
+            "get_all_context_items_for_user",
+            side_effect=read_while_writing,
+        ) as bulk_read, patch.object(
+            lazy.db_backend,
+            "get_context_item_for_user",
+            side_effect=AssertionError("values were read one at a time"),
+        ):
+            lazy.snapshot(path)
+        assert bulk_read.call_count == 1
+        lazy.close()
+
+        restored = ContextMesh(enable_persistence=False, user_id="user1")
+        restored.restore(path)
+        assert restored.get_many(["key0", "key1", "key4"]) == {
+            "key0": 0,
+            "key1": "changed",
+            "key4": 4,
+        }
+        restored.close()
+
+    def test_warm_start_skips_database_load(self, tmp_path):
+        db_path = str(tmp_path / "mesh.db")
+        path = str(tmp_path / "mesh.snapshot")
+        mesh = ContextMesh(db_path=db_path, user_id="user1")
+        mesh.push("saved", 1)
+        mesh.snapshot(path)
+        mesh.push("after_snapshot", 2)
+        mesh.close()
+
+        warm = ContextMesh(db_path=db_path, user_id="user1", snapshot_path=path)
+        assert warm.get("saved") == 1
+        assert warm.get("after_snapshot") is None
+        warm.push("new", 3)
+        warm.close()
+
+        # Writes after a warm start are persisted as usual
+        cold = ContextMesh(db_path=db_path, user_id="user1")
+        assert cold.get_many(["saved", "after_snapshot", "new"]) == {
+            "saved": 1,
+            "after_snapshot": 2,
+            "new": 3,
+        }
+        cold.close()
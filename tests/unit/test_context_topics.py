@@ -0,0 +1,182 @@
+"""
+Unit tests for read-time topic visibility in ContextMesh.
+"""
+
+import pytest
+
+from syntha.context import ContextItem, ContextMesh
+
+
+@pytest.fixture(params=[True, False], ids=["indexed", "scan"])
+def mesh(request):
+    mesh = ContextMesh(enable_persistence=False, enable_indexing=request.param)
+    yield mesh
+    mesh.close()
+
+
+class TestLazyTopicVisibility:
+    """Topic subscribers are resolved when context is read."""
+
+    def test_late_subscriber_sees_earlier_context(self, mesh):
+        mesh.push("report", "q3", topics=["sales"])
+        assert mesh.get("report", "sales_agent") is None
+
+        mesh.register_agent_topics("sales_agent", ["sales"])
+
+        assert mesh.get("report", "sales_agent") == "q3"
+        assert mesh.get_all_for_agent("sales_agent") == {"report": "q3"}
+        assert mesh.get_keys_for_agent("sales_agent") == ["report"]
+        assert mesh.get_many(["report"], "sales_agent") == {"report": "q3"}
+
+    def test_unsubscribe_revokes_topic_visibility(self, mesh):
+        mesh.register_agent_topics("sales_agent", ["sales", "support"])
+        mesh.push("report", "q3", topics=["sales"])
+        mesh.push("ticket", "t1", topics=["support"])
+
+        mesh.unsubscribe_from_topics("sales_agent", ["sales"])
+
+        assert mesh.get("report", "sales_agent") is None
+        assert mesh.get_all_for_agent("sales_agent") == {"ticket": "t1"}
+
+    def test_direct_subscribers_and_globals_are_combined(self, mesh):
+        mesh.register_agent_topics("sales_agent", ["sales"])
+        mesh.push("global", "g")
+        mesh.push("direct", "d", subscribers=["sales_agent"])
+        mesh.push("both", "b", topics=["sales"], subscribers=["sales_agent"])
+        mesh.push("manager_only", "m", topics=["hr"], subscribers=["manager"])
+
+        assert mesh.get_all_for_agent("sales_agent") == {
+            "global": "g",
+            "direct": "d",
+            "both": "b",
+        }
+        assert mesh.get("manager_only", "manager") == "m"
+        assert mesh.get("manager_only", "sales_agent") is None
+
+    def test_subscription_changes_do_not_touch_items(self, mesh):
+        mesh.push("report", "q3", topics=["sales"])
+        item = mesh._data["report"]
+
+        mesh.register_agent_topics("agent1", ["sales"])
+        mesh.register_agent_topics("agent2", ["sales"])
+        mesh.unsubscribe_from_topics("agent1", ["sales"])
+
+        assert mesh._data["report"] is item
+        assert item.subscribers == []
+        assert item.topics == ("sales",)
+
+    def test_overwrite_and_remove_update_topic_index(self, mesh):
+        mesh.push("report", "v1", topics=["sales", "support"])
+        assert set(mesh._topic_keys) == {"sales", "support"}
+
+        mesh.push("report", "v2", topics=["sales"])
+        assert list(mesh._topic_keys) == ["sales"]
+
+        mesh.remove("report")
+        assert mesh._topic_keys == {}
+
+    def test_topic_context_is_not_global(self, mesh):
+        mesh.push("report", "q3", topics=["sales"])
+        stats = mesh.get_stats()
+        assert stats["global_items"] == 0
+        assert stats["private_items"] == 1
+
+    def test_delete_topic_keeps_multi_topic_items(self, mesh):
+        mesh.register_agent_topics("agent1", ["sales", "support"])
+        mesh.push("sales_only", 1, topics=["sales"])
+        mesh.push("shared", 2, topics=["sales", "support"])
+
+        assert mesh.delete_topic("sales") == 1
+        assert mesh.get_all_for_agent("agent1") == {"shared": 2}
+        assert mesh._data["shared"].topics == ("support",)
+
+    def test_delete_topic_replaces_multi_topic_items(self, mesh):
+        mesh.register_agent_topics("agent1", ["sales"])
+        mesh.register_agent_topics("agent2", ["support"])
+        mesh.push("shared", 2, topics=["sales", "support"])
+        assert mesh.get_all_for_agent("agent1") == {"shared": 2}
+        events = []
+        mesh.on_change(events.append, keys=["shared"])
+        previous = mesh._data["shared"]
+
+        mesh.delete_topic("sales")
+
+        assert previous.topics == ("sales", "support")
+        assert mesh._data["shared"].topics == ("support",)
+        assert mesh.get_all_for_agent("agent1") == {}
+        assert mesh.get_all_for_agent("agent2") == {"shared": 2}
+        assert [event["type"] for event in events] == ["set"]
+
+
+class TestTopicPersistence:
+    """Topics survive a reload from the database."""
+
+    def test_topics_are_restored_on_reload(self, tmp_path):
+        db_path = str(tmp_path / "topics.db")
+        mesh = ContextMesh(db_path=db_path, user_id="user1")
+        mesh.push("report", "q3", topics=["sales"])
+        mesh.push_many([{"key": "ticket", "value": "t1", "topics": ["support"]}])
+        mesh.close()
+
+        reloaded = ContextMesh(db_path=db_path, user_id="user1")
+        assert reloaded.get("report", "sales_agent") is None
+
+        reloaded.register_agent_topics("sales_agent", ["sales", "support"])
+        assert reloaded.get_all_for_agent("sales_agent") == {
+            "report": "q3",
+            "ticket": "t1",
+        }
+        reloaded.close()
+
+    def test_legacy_marker_items_stay_hidden(self):
+        item = ContextItem("value", ["__NO_SUBSCRIBERS__"])
+        assert not item.is_accessible_by("agent1", ["sales"])
+
+    def test_string_topics_are_rejected(self):
+        with pytest.raises(TypeError):
+            ContextItem("value", topics="sales")
+
+
+class TestTopicIndexes:
+    """The topic -> keys and topic -> agents indexes stay consistent."""
+
+    def test_reregistering_drops_old_topic_subscriptions(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.register_agent_topics("agent1", ["sales", "support"])
+        mesh.register_agent_topics("agent1", ["support", "hr"])
+
+        assert mesh.get_subscribers_for_topic("sales") == []
+        assert mesh.get_subscribers_for_topic("support") == ["agent1"]
+        assert set(mesh.get_all_topics()) == {"support", "hr"}
+        mesh.close()
+
+    def test_available_keys_by_topic(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.register_agent_topics("agent1", ["sales", "support"])
+        mesh.push("report", 1, topics=["sales"])
+        mesh.push("shared", 2, topics=["sales", "support"])
+        mesh.push("hr_note", 3, topics=["hr"])
+        mesh.push("global", 4)
+
+        assert mesh.get_available_keys_by_topic("agent1") == {
+            "sales": ["report", "shared"],
+            "support": ["shared"],
+            "other": ["global"],
+        }
+        mesh.close()
+
+    def test_delete_topic_only_updates_its_subscribers(self):
+        mesh = ContextMesh(enable_persistence=False)
+        mesh.register_agent_topics("agent1", ["sales", "support"])
+        mesh.register_agent_topics("agent2", ["sales"])
+        mesh.register_agent_topics("agent3", ["hr"])
+        mesh.push("report", 1, topics=["sales"])
+
+        assert mesh.delete_topic("sales") == 1
+
+        assert mesh.get_topics_for_agent("agent1") == ["support"]
+        assert mesh.get_topics_for_agent("agent2") == []
+        assert mesh.get_topics_for_agent("agent3") == ["hr"]
+        assert "sales" not in mesh._topic_subscribers
+        assert "sales" not in mesh._topic_keys
+        mesh.close()
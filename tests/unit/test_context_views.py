@@ -0,0 +1,93 @@
+"""
+Unit tests for the materialized per-agent views behind get_all_for_agent.
+"""
+
+import time
+
+import pytest
+
+from syntha.context import ContextMesh
+
+
+@pytest.fixture
+def mesh():
+    mesh = ContextMesh(enable_persistence=False, auto_cleanup=False)
+    mesh.register_agent_topics("agent1", ["sales"])
+    mesh.register_agent_topics("agent2", ["support"])
+    mesh.push("global", "g")
+    mesh.push("mine", "m", subscribers=["agent1"])
+    mesh.push("report", "r", topics=["sales"])
+    yield mesh
+    mesh.close()
+
+
+class TestAgentViews:
+    """Tests for view caching and invalidation."""
+
+    def test_repeated_reads_reuse_the_view(self, mesh):
+        first = mesh.get_all_for_agent("agent1")
+        view = mesh._agent_views["agent1"]
+
+        assert mesh.get_all_for_agent("agent1") == first
+        assert mesh._agent_views["agent1"] is view
+        assert first == {"global": "g", "mine": "m", "report": "r"}
+
+    def test_unrelated_changes_keep_the_view(self, mesh):
+        mesh.get_all_for_agent("agent1")
+        view = mesh._agent_views["agent1"]
+
+        mesh.push("theirs", 1, subscribers=["agent2"])
+        mesh.push("ticket", 2, topics=["support"])
+        mesh.register_agent_topics("agent2", ["support", "billing"])
+
+        assert mesh._agent_views["agent1"] is view
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda mesh: mesh.push("global2", "new"),
+            lambda mesh: mesh.push("mine", "updated", subscribers=["agent1"]),
+            lambda mesh: mesh.push("mine", "moved", subscribers=["agent2"]),
+            lambda mesh: mesh.push("report2", "new", topics=["sales"]),
+            lambda mesh: mesh.remove("report"),
+            lambda mesh: mesh.unsubscribe_from_topics("agent1", ["sales"]),
+            lambda mesh: mesh.delete_topic("sales"),
+        ],
+    )
+    def test_visible_changes_invalidate(self, mesh, change):
+        mesh.get_all_for_agent("agent1")
+        change(mesh)
+        assert "agent1" not in mesh._agent_views
+
+        # The rebuilt view matches an uncached read
+        result = mesh.get_all_for_agent("agent1")
+        mesh.cache_views = False
+        assert result == mesh.get_all_for_agent("agent1")
+
+    def test_view_expires_with_its_items(self, mesh):
+        mesh.push("short", "s", subscribers=["agent1"], ttl=0.05)
+        assert "short" in mesh.get_all_for_agent("agent1")
+
+        time.sleep(0.1)
+        assert "short" not in mesh.get_all_for_agent("agent1")
+
+    def test_results_are_independent_copies(self, mesh):
+        mesh.push("doc", {"items": [1]}, subscribers=["agent1"])
+        result = mesh.get_all_for_agent("agent1")
+        result["doc"]["items"].append(2)
+        result["extra"] = True
+
+        assert mesh.get_all_for_agent("agent1")["doc"] == {"items": [1]}
+        assert "extra" not in mesh.get_all_for_agent("agent1")
+
+    def test_disabled_for_bounded_meshes(self):
+        mesh = ContextMesh(enable_persistence=False, max_items=10)
+        mesh.push("key", 1)
+        assert mesh.get_all_for_agent("agent1") == {"key": 1}
+        assert mesh._agent_views == {}
+        mesh.close()
+
+    def test_clear_drops_views(self, mesh):
+        mesh.get_all_for_agent("agent1")
+        mesh.clear()
+        assert mesh.get_all_for_agent("agent1") == {}
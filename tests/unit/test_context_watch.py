@@ -0,0 +1,164 @@
+"""
+Unit tests for ContextMesh.wait_for and ContextMesh.on_change.
+"""
+
+import threading
+import time
+
+import pytest
+
+from syntha.context import ContextMesh
+
+
+@pytest.fixture
+def mesh():
+    mesh = ContextMesh(enable_persistence=False)
+    yield mesh
+    mesh.close()
+
+
+def push_later(mesh, delay, *args, **kwargs):
+    timer = threading.Timer(delay, mesh.push, args=args, kwargs=kwargs)
+    timer.start()
+    return timer
+
+
+class TestWaitFor:
+    """Tests for the blocking watch API."""
+
+    def test_wakes_up_on_push(self, mesh):
+        timer = push_later(mesh, 0.05, "result", {"done": True})
+
+        start = time.monotonic()
+        changes = mesh.wait_for(keys=["result"], timeout=5)
+        timer.join()
+
+        assert changes["changed"] == {"result": {"done": True}}
+        assert time.monotonic() - start < 1
+
+    def test_times_out(self, mesh):
+        start = time.monotonic()
+        assert mesh.wait_for(keys=["never"], timeout=0.05) is None
+        assert time.monotonic() - start >= 0.05
+
+    def test_ignores_other_keys(self, mesh):
+        timer = push_later(mesh, 0.01, "other", 1)
+        assert mesh.wait_for(keys=["result"], timeout=0.1) is None
+        timer.join()
+
+    def test_since_zero_accepts_existing_context(self, mesh):
+        mesh.push("result", 42)
+        assert mesh.wait_for(keys=["result"], timeout=0, since=0)["changed"] == {
+            "result": 42
+        }
+        # Without since, only future changes count
+        assert mesh.wait_for(keys=["result"], timeout=0.01) is None
+
+    def test_topic_wait_honors_access_control(self, mesh):
+        mesh.register_agent_topics("agent1", ["sales"])
+        timer = push_later(mesh, 0.02, "private", 1, subscribers=["agent2"])
+        assert mesh.wait_for(agent_name="agent1", timeout=0.1) is None
+        timer.join()
+
+        timer = push_later(mesh, 0.02, "report", 2, topics=["sales"])
+        changes = mesh.wait_for(topics=["sales"], agent_name="agent1", timeout=5)
+        timer.join()
+        assert changes["changed"] == {"report": 2}
+
+    def test_wakes_up_on_expiry(self, mesh):
+        mesh.push("lease", "held", ttl=0.05)
+
+        changes = mesh.wait_for(keys=["lease"], timeout=5)
+
+        assert changes["removed"] == ["lease"]
+        assert mesh.get("lease") is None
+
+
+class TestOnChange:
+    """Tests for change listeners."""
+
+    def test_events_fire_after_commit(self, mesh):
+        seen = []
+
+        def listener(event):
+            # Reading from the mesh would deadlock if called under the lock
+            seen.append((event, mesh.get(event["key"])))
+
+        mesh.on_change(listener)
+        mesh.push("a", 1)
+        mesh.remove("a")
+
+        assert [event["type"] for event, _ in seen] == ["set", "remove"]
+        assert seen[0] == (
+            {"type": "set", "key": "a", "value": 1, "sequence": seen[0][0]["sequence"]},
+            1,
+        )
+        assert seen[1][1] is None
+        assert seen[0][0]["sequence"] < seen[1][0]["sequence"]
+
+    def test_key_topic_and_agent_filters(self, mesh):
+        mesh.register_agent_topics("agent1", ["sales"])
+        by_key, by_topic, by_agent = [], [], []
+        mesh.on_change(lambda e: by_key.append(e["key"]), keys=["a"])
+        mesh.on_change(lambda e: by_topic.append(e["key"]), topics=["sales"])
+        mesh.on_change(lambda e: by_agent.append(e["key"]), agent_name="agent1")
+
+        mesh.push("a", 1)
+        mesh.push("report", 2, topics=["sales"])
+        mesh.push("secret", 3, subscribers=["agent2"])
+
+        assert by_key == ["a"]
+        assert by_topic == ["report"]
+        assert by_agent == ["a", "report"]
+
+    def test_losing_access_is_a_remove_event(self, mesh):
+        events = []
+        mesh.push("doc", 1, subscribers=["agent1"])
+        mesh.on_change(events.append, agent_name="agent1")
+
+        mesh.push("doc", 2, subscribers=["agent2"])
+
+        assert [(e["type"], e["value"]) for e in events] == [("remove", None)]
+
+    def test_expire_events(self):
+        mesh = ContextMesh(enable_persistence=False, reaper_interval=0.01)
+        expired = threading.Event()
+        mesh.on_change(
+            lambda e: e["type"] == "expire" and expired.set(), keys=["lease"]
+        )
+
+        mesh.push("lease", "held", ttl=0.02)
+
+        assert expired.wait(2)
+        mesh.close()
+
+    def test_remove_listener_and_errors(self, mesh):
+        events = []
+
+        def broken(event):
+            raise RuntimeError("listener bug")
+
+        mesh.on_change(broken)
+        listener_id = mesh.on_change(events.append)
+
+        mesh.push("a", 1)  # The failing listener must not break the push
+        assert mesh.remove_change_listener(listener_id) is True
+        assert mesh.remove_change_listener(listener_id) is False
+        mesh.push("b", 2)
+
+        assert [e["key"] for e in events] == ["a"]
+        assert mesh.get("b") == 2
+
+    def test_listener_can_write_to_mesh(self, mesh):
+        seen = []
+
+        def mirror(event):
+            seen.append(event["key"])
+            if event["key"] == "source":
+                mesh.push("mirror", event["value"])
+
+        mesh.on_change(mirror)
+        mesh.push("source", 7)
+
+        assert seen == ["source", "mirror"]
+        assert mesh.get("mirror") == 7
@@ -270,6 +270,168 @@ class TestSQLiteBackend:
 
         backend.close()
 
+    def test_sqlite_save_context_items_batch(self, tmp_path):
+        """Test saving a batch of context items in one call."""
+        db_path = str(tmp_path / "test.db")
+        backend = SQLiteBackend(db_path=db_path)
+        backend.connect()
+
+        now = time.time()
+        backend.save_context_items(
+            [
+                ("key1", {"a": 1}, ["agent1"], None, now),
+                ("key2", [1, 2], [], 60.0, now),
+            ]
+        )
+        backend.save_context_items_for_user(
+            "user1",
+            [
+                ("user_key1", "user_value", [], None, now),
+                ("key3", None, ["agent2"], None, now),
+            ],
+        )
+
+        all_items = backend.get_all_context_items()
+        assert all_items["key1"][0] == {"a": 1}
+        assert all_items["key2"][2] == 60.0
+
+        user_items = backend.get_all_context_items_for_user("user1")
+        assert set(user_items) == {"user_key1", "key3"}
+        assert user_items["user_key1"][0] == "user_value"
+        assert user_items["key3"][1] == ["agent2"]
+
+        backend.close()
+
+    def test_sqlite_save_context_items_is_atomic(self, tmp_path):
+        """A failing row rolls back the whole batch."""
+        db_path = str(tmp_path / "test.db")
+        backend = SQLiteBackend(db_path=db_path)
+        backend.connect()
+
+        now = time.time()
+        with pytest.raises(Exception):
+            backend.save_context_items_for_user(
+                "user1",
+                [
+                    ("good", "value", [], None, now),
+                    ("bad", "value", [], None, None),  # created_at is NOT NULL
+                ],
+            )
+
+        assert backend.get_all_context_items_for_user("user1") == {}
+        backend.close()
+
+    def test_sqlite_transaction_groups_writes(self, tmp_path):
+        """Writes inside transaction() commit together or not at all."""
+        backend = SQLiteBackend(db_path=str(tmp_path / "test.db"))
+        backend.connect()
+        now = time.time()
+
+        with backend.transaction():
+            backend.save_context_item("a", 1, [], None, now)
+            with backend.transaction():
+                backend.save_agent_topics("agent1", ["sales"])
+            backend.delete_context_item("missing")
+        assert backend.get_context_item("a")[0] == 1
+        assert backend.get_agent_topics("agent1") == ["sales"]
+
+        with pytest.raises(RuntimeError):
+            with backend.transaction():
+                backend.save_context_item("b", 2, [], None, now)
+                backend.remove_agent_topics("agent1")
+                raise RuntimeError("abort")
+        assert backend.get_context_item("b") is None
+        assert backend.get_agent_topics("agent1") == ["sales"]
+        backend.close()
+
+    def test_sqlite_context_topics_roundtrip(self, tmp_path):
+        """Topics are stored alongside items and loaded separately."""
+        db_path = str(tmp_path / "test.db")
+        backend = SQLiteBackend(db_path=db_path)
+        backend.connect()
+
+        now = time.time()
+        backend.save_context_item("plain", "value", [], None, now)
+        backend.save_context_item("topical", "value", ["manager"], None, now, ["sales"])
+        backend.save_context_items_for_user(
+            "user1",
+            [
+                ("batch_plain", "value", [], None, now),
+                ("batch_topical", "value", [], None, now, ["support", "sales"]),
+            ],
+        )
+
+        topics = backend.get_all_context_topics()
+        assert topics["topical"] == ["sales"]
+        assert "plain" not in topics
+        assert backend.get_all_context_topics_for_user("user1") == {
+            "batch_topical": ["support", "sales"]
+        }
+        # The item tuples keep their original shape
+        assert backend.get_all_context_items()["topical"][1] == ["manager"]
+
+        # Overwriting without topics clears them
+        backend.save_context_item_for_user("user1", "batch_topical", 1, [], None, now)
+        assert backend.get_all_context_topics_for_user("user1") == {}
+        backend.close()
+
+    def test_sqlite_adds_topics_column_to_existing_table(self, tmp_path):
+        """Databases created before topic storage are migrated on connect."""
+        import sqlite3
+
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE context_items (
+                key TEXT NOT NULL,
+                user_id TEXT,
+                value TEXT NOT NULL,
+                subscribers TEXT NOT NULL,
+                ttl REAL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (key, user_id)
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO context_items VALUES ('old', NULL, '1', '[]', NULL, ?)",
+            (time.time(),),
+        )
+        conn.commit()
+        conn.close()
+
+        backend = SQLiteBackend(db_path=db_path)
+        backend.connect()
+        backend.save_context_item("new", 2, [], None, time.time(), ["sales"])
+
+        assert backend.get_all_context_topics() == {"new": ["sales"]}
+        assert set(backend.get_all_context_items()) == {"old", "new"}
+        backend.close()
+
+    def test_sqlite_context_metadata_filters_expired_rows(self, tmp_path):
+        """Metadata queries skip values and filter expired rows in SQL."""
+        backend = SQLiteBackend(db_path=str(tmp_path / "metadata.db"))
+        backend.connect()
+
+        now = time.time()
+        backend.save_context_items_for_user(
+            "user1",
+            [
+                ("live", {"big": "value"}, ["agent1"], 60, now, ["sales"]),
+                ("forever", "value", [], None, now - 1000),
+                ("expired", "value", [], 1, now - 10),
+            ],
+        )
+        backend.save_context_item_for_user("user2", "other", "value", [], None, now)
+
+        assert backend.get_all_context_metadata_for_user("user1", now) == {
+            "live": (["agent1"], 60, now, ["sales"]),
+            "forever": ([], None, now - 1000, None),
+        }
+        assert "expired" in backend.get_all_context_metadata_for_user("user1")
+        backend.close()
+
 
 class TestPostgreSQLBackend:
     """Test PostgreSQL database backend."""
@@ -348,6 +510,35 @@ class TestPostgreSQLBackend:
         finally:
             backend.close()
 
+    @pytest.mark.database
+    def test_postgresql_save_context_items_batch(self):
+        """Test batch upserts with execute_values."""
+        connection_string = os.getenv("POSTGRES_URL")
+        if not connection_string:
+            pytest.skip("PostgreSQL not available")
+
+        backend = PostgreSQLBackend(connection_string=connection_string)
+
+        try:
+            backend.connect()
+            now = time.time()
+            backend.save_context_items_for_user(
+                "pg_batch_user",
+                [
+                    ("key1", "first", [], None, now),
+                    ("key2", {"a": 1}, ["agent1"], 60.0, now),
+                    ("key1", "second", [], None, now),
+                ],
+            )
+
+            items = backend.get_all_context_items_for_user("pg_batch_user")
+            assert items["key1"][0] == "second"
+            assert items["key2"][1] == ["agent1"]
+
+            backend.clear_all_for_user("pg_batch_user")
+        finally:
+            backend.close()
+
 
 class TestDatabaseBackendFactory:
     """Test database backend factory function."""
@@ -0,0 +1,162 @@
+"""
+Unit tests for ContextMeshPool.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from syntha import ContextMesh, ContextMeshPool, create_database_backend
+
+
+@pytest.fixture
+def pool(tmp_path):
+    with ContextMeshPool(max_resident=2, db_path=str(tmp_path / "pool.db")) as pool:
+        yield pool
+
+
+class TestContextMeshPool:
+    """Tests for per-tenant meshes over a shared backend."""
+
+    def test_tenants_share_one_backend_and_stay_isolated(self, pool):
+        alice = pool.get("alice")
+        bob = pool.get("bob")
+        assert alice.db_backend is bob.db_backend is pool.db_backend
+        assert alice.user_id == "alice"
+
+        alice.push("key", "alice's")
+        bob.push("key", "bob's")
+        assert pool.get("alice").get("key") == "alice's"
+        assert pool.get("alice") is alice
+
+    def test_least_recently_used_tenant_is_hibernated(self, pool):
+        alice = pool.get("alice")
+        alice.register_agent_topics("agent1", ["sales"])
+        alice.push("report", "r", topics=["sales"])
+        pool.get("bob")
+        pool.get("alice")
+        pool.get("carol")
+
+        assert pool.resident_tenants() == ["alice", "carol"]
+        assert "bob" not in pool
+
+        pool.get("dave")
+        assert pool.resident_tenants() == ["carol", "dave"]
+
+        # Rehydrated from the shared backend
+        rehydrated = pool.get("alice")
+        assert rehydrated is not alice
+        assert rehydrated.get("report", "agent1") == "r"
+        assert pool.get_stats() == {
+            "resident_tenants": 2,
+            "leased_tenants": 0,
+            "max_resident": 2,
+            "loads": 5,
+            "hibernations": 3,
+        }
+
+    def test_hibernation_keeps_the_shared_backend_open(self, pool):
+        pool.get("alice").push("key", "value")
+        assert pool.hibernate("alice") is True
+        assert pool.hibernate("alice") is False
+        assert pool.get("bob").size() == 0
+        assert pool.get("alice").get("key") == "value"
+
+    def test_leased_tenants_are_not_hibernated(self, pool):
+        with pool.lease("alice") as alice:
+            pool.get("bob")
+            pool.get("carol")
+            assert "alice" in pool
+            assert pool.hibernate("alice") is False
+            assert pool.get_stats()["leased_tenants"] == 1
+            alice.push("key", "value")
+
+        pool.get("dave")
+        assert "alice" not in pool
+
+    def test_idle_tenants_are_hibernated(self, tmp_path):
+        with ContextMeshPool(
+            idle_timeout=0.05, db_path=str(tmp_path / "idle.db")
+        ) as pool:
+            pool.get("alice")
+            time.sleep(0.1)
+            pool.get("bob")  # Runs the due idle check
+            assert pool.resident_tenants() == ["bob"]
+            assert pool.hibernate_idle() == 0
+
+    def test_concurrent_gets_load_a_tenant_once(self, pool):
+        meshes = []
+        original = ContextMesh.__init__
+
+        def slow_init(self, *args, **kwargs):
+            time.sleep(0.05)
+            original(self, *args, **kwargs)
+
+        with patch.object(ContextMesh, "__init__", slow_init):
+            threads = [
+                threading.Thread(target=lambda: meshes.append(pool.get("alice")))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(meshes) == 4
+        assert all(mesh is meshes[0] for mesh in meshes)
+        assert pool.get_stats()["loads"] == 1
+
+    def test_hibernating_tenant_is_reloaded_with_its_writes(self, tmp_path):
+        with ContextMeshPool(
+            db_path=str(tmp_path / "pool.db"), durability="async", flush_interval=60
+        ) as pool:
+            alice = pool.get("alice")
+            alice.push("draft", "latest")
+            close = alice.close
+
+            def slow_close():
+                time.sleep(0.2)
+                close()
+
+            with patch.object(alice, "close", side_effect=slow_close):
+                hibernating = threading.Thread(target=pool.hibernate, args=("alice",))
+                hibernating.start()
+                while "alice" in pool:
+                    time.sleep(0.001)
+                # Loaded once the hibernating mesh has committed its writes
+                assert pool.get("alice").get("draft") == "latest"
+                hibernating.join()
+
+    def test_mesh_config_is_applied_to_tenants(self, tmp_path):
+        with ContextMeshPool(
+            db_path=str(tmp_path / "config.db"), lazy_load=True, copy_mode="frozen"
+        ) as pool:
+            mesh = pool.get("alice")
+            assert mesh.lazy_load is True
+            assert mesh.copy_mode == "frozen"
+            assert pool.db_backend.db_path == str(tmp_path / "config.db")
+
+    def test_external_backend_is_not_closed(self, tmp_path):
+        backend = create_database_backend("sqlite", db_path=str(tmp_path / "ext.db"))
+        backend.connect()
+        pool = ContextMeshPool(db_backend=backend)
+        pool.get("alice").push("key", "value")
+        pool.close()
+
+        assert backend.connection is not None
+        assert backend.get_context_item_for_user("alice", "key")[0] == "value"
+        backend.close()
+
+    def test_invalid_arguments(self, pool):
+        with pytest.raises(ValueError, match="max_resident"):
+            ContextMeshPool(max_resident=0)
+        with pytest.raises(ValueError, match="idle_timeout"):
+            ContextMeshPool(idle_timeout=0)
+        with pytest.raises(ValueError, match="need a user_id"):
+            pool.get("")
+
+        pool.close()
+        with pytest.raises(ValueError, match="closed"):
+            pool.get("alice")
@@ -0,0 +1,276 @@
+"""
+Unit tests for ContextMeshServer and RemoteContextMesh.
+"""
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from syntha import (
+    ContextMesh,
+    ContextMeshServer,
+    RemoteContextMesh,
+    SynthaConnectionError,
+    ToolHandler,
+    build_system_prompt,
+)
+from syntha.server import _decode, _encode
+
+
+@pytest.fixture
+def server(tmp_path):
+    with ContextMeshServer(
+        address=str(tmp_path / "mesh.sock"), enable_persistence=False
+    ) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with RemoteContextMesh(server.address) as client:
+        yield client
+
+
+def _push_from_process(address, key):
+    with RemoteContextMesh(address) as client:
+        client.push(key, {"pid": multiprocessing.current_process().name})
+
+
+class TestEncoding:
+    """Tests for the binary value encoding."""
+
+    def test_round_trip(self):
+        value = {
+            "none": None,
+            "flags": [True, False],
+            "int": -42,
+            "big": 2**80,
+            "float": 1.5,
+            "text": "héllo",
+            "bytes": b"\x00\x01",
+            "nested": {"list": [1, [2, {"three": 3}]]},
+        }
+        out = bytearray()
+        _encode(value, out)
+        decoded, end = _decode(memoryview(out), 0)
+        assert decoded == value
+        assert end == len(out)
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError, match="Cannot send a value of type set"):
+            _encode({1, 2}, bytearray())
+
+
+class TestRemoteContextMesh:
+    """Tests for the client proxy against a local server."""
+
+    def test_routing_matches_context_mesh(self, client):
+        client.register_agent_topics("agent1", ["sales"])
+        client.push("global", "g")
+        client.push("private", "p", subscribers=["agent2"])
+        client.push("report", {"total": 10}, topics=["sales"])
+
+        assert client.get("private", "agent1") is None
+        assert client.get("report", "agent1") == {"total": 10}
+        assert client.get_all_for_agent("agent1") == {
+            "global": "g",
+            "report": {"total": 10},
+        }
+        assert client.get_topics_for_agent("agent1") == ["sales"]
+        assert client.get_subscribers_for_topic("sales") == ["agent1"]
+        assert client.remove("global") is True
+        assert client.size() == 2
+
+    def test_clients_share_one_mesh(self, server, client):
+        with RemoteContextMesh(server.address) as other:
+            other.push("shared", 1)
+            assert client.get("shared") == 1
+        assert server.mesh.get("shared") == 1
+
+    def test_tcp_address(self):
+        with ContextMeshServer(enable_persistence=False) as server:
+            host, port = server.address
+            assert port != 0
+            with RemoteContextMesh((host, port)) as client:
+                client.push("key", "value")
+                assert client.get("key") == "value"
+
+    def test_serves_existing_mesh(self, tmp_path):
+        mesh = ContextMesh(enable_persistence=False, user_id="user1")
+        with ContextMeshServer(mesh, address=str(tmp_path / "m.sock")) as server:
+            with RemoteContextMesh(server.address) as client:
+                assert client.user_id == "user1"
+                client.push("key", "value")
+        # The server does not close a mesh it was given
+        assert mesh.get("key") == "value"
+        mesh.close()
+
+    def test_errors_are_raised_on_the_client(self, client):
+        with pytest.raises(ValueError, match="needs a key and value"):
+            client.push_many([{"value": 1}])
+        with pytest.raises(TypeError, match="Cannot send"):
+            client.push("key", object())
+        # The connection is still usable
+        client.push("key", "value")
+        assert client.get("key") == "value"
+
+    def test_pipeline(self, client):
+        pipe = client.pipeline()
+        pipe.push("a", 1).push("b", 2)
+        pipe.get_many(["a", "b"])
+        pipe.size()
+        assert len(pipe) == 4
+        assert pipe.execute() == [None, None, {"a": 1, "b": 2}, 2]
+
+        with pytest.raises(ValueError):
+            with client.pipeline() as pipe:
+                pipe.push("c", 3)
+                pipe.push_many([{"value": 1}])
+                pipe.push("d", 4)
+        # Every call runs even when one fails
+        assert client.get_many(["c", "d"]) == {"c": 3, "d": 4}
+
+        with pytest.raises(AttributeError):
+            client.pipeline().wait_for
+
+    def test_concurrent_threads_share_the_connection(self, client):
+        def worker(n):
+            for i in range(50):
+                client.push(f"t{n}-{i}", i)
+                assert client.get(f"t{n}-{i}") == i
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert client.size() == 200
+
+    def test_wait_for_does_not_block_other_requests(self, server, client):
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(client.wait_for(keys=["ready"], timeout=5))
+        )
+        waiter.start()
+        time.sleep(0.1)
+
+        # Same connection, while wait_for is pending on the server
+        client.push("ready", True)
+        waiter.join(timeout=5)
+        assert results[0]["changed"] == {"ready": True}
+        assert client.wait_for(keys=["never"], timeout=0.05) is None
+
+    def test_on_change_events(self, server, client):
+        events = []
+        received = threading.Event()
+
+        def callback(event):
+            events.append(event)
+            # Callbacks may call back into the mesh
+            if client.get(event["key"]) is None:
+                received.set()
+
+        listener_id = client.on_change(callback, keys=["watched"])
+        server.mesh.push("ignored", 1)
+        server.mesh.push("watched", 2)
+        server.mesh.remove("watched")
+        assert received.wait(5)
+        assert [(e["type"], e["key"], e["value"]) for e in events] == [
+            ("set", "watched", 2),
+            ("remove", "watched", None),
+        ]
+
+        assert client.remove_change_listener(listener_id) is True
+        assert client.remove_change_listener(listener_id) is False
+
+    def test_listener_registered_while_events_are_dispatched(self, server, client):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_listener(event):
+            if event["key"] == "first":
+                started.set()
+                release.wait(5)
+
+        server.mesh.on_change(slow_listener)
+        first = threading.Thread(target=server.mesh.push, args=("first", 1))
+        first.start()
+        assert started.wait(5)
+        # Its event waits for the slow listener to finish with the first one
+        second = threading.Thread(target=server.mesh.push, args=("second", 2))
+        second.start()
+        while not server.mesh._pending_events:
+            time.sleep(0.001)
+
+        events, received = [], threading.Event()
+
+        def callback(event):
+            events.append(event["key"])
+            received.set()
+
+        registering = threading.Thread(target=client.on_change, args=(callback,))
+        registering.start()
+        while len(server.mesh._change_listeners) < 2:
+            time.sleep(0.001)
+        release.set()
+
+        for thread in (registering, first, second):
+            thread.join(5)
+            assert not thread.is_alive()
+        assert received.wait(5)
+        assert events == ["second"]
+        server.mesh.push("third", 3)
+
+    def test_listeners_removed_when_client_disconnects(self, server):
+        client = RemoteContextMesh(server.address)
+        client.on_change(lambda event: None)
+        assert len(server.mesh._change_listeners) == 1
+        client.close()
+
+        deadline = time.time() + 5
+        while server.mesh._change_listeners and time.time() < deadline:
+            time.sleep(0.01)
+        assert server.mesh._change_listeners == {}
+
+    def test_tool_handler_and_prompts(self, client):
+        client.register_agent_topics("Analyst", ["sales"])
+        handler = ToolHandler(client, agent_name="Sales")
+        result = handler.handle_tool_call(
+            "push_context", key="lead", value="Acme", topics=["sales"]
+        )
+        assert result["success"] is True
+
+        discovered = ToolHandler(client, "Analyst").handle_tool_call("discover_topics")
+        assert discovered["topics"] == {
+            "sales": {"subscriber_count": 1, "is_active": True}
+        }
+        assert "Acme" in build_system_prompt("Analyst", client)
+
+    def test_server_close_fails_pending_calls(self, tmp_path):
+        server = ContextMeshServer(
+            address=str(tmp_path / "m.sock"), enable_persistence=False
+        ).start()
+        client = RemoteContextMesh(server.address)
+        client.push("key", "value")
+        server.close()
+
+        with pytest.raises(SynthaConnectionError):
+            for _ in range(100):
+                client.get("key")
+                time.sleep(0.01)
+        with pytest.raises(SynthaConnectionError):
+            RemoteContextMesh(server.address)
+
+    def test_worker_processes_share_context(self, server):
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_push_from_process, args=(server.address, f"w{n}"))
+            for n in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+        assert sorted(server.mesh.get_keys_for_agent("anyone")) == ["w0", "w1"]
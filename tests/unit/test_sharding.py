@@ -0,0 +1,380 @@
+"""
+Unit tests for HashRing and ShardedContextMesh.
+"""
+
+import threading
+import time
+
+import pytest
+
+from syntha import (
+    ContextMesh,
+    ContextMeshServer,
+    HashRing,
+    RemoteContextMesh,
+    ShardedContextMesh,
+    ToolHandler,
+)
+
+
+def memory_shards(*names):
+    return {name: ContextMesh(enable_persistence=False) for name in names}
+
+
+def tenant_factory(meshes):
+    """A shard factory that records the tenant meshes it creates."""
+
+    def create(user_id):
+        mesh = ContextMesh(enable_persistence=False, user_id=user_id)
+        meshes.append(mesh)
+        return mesh
+
+    return create
+
+
+class TestHashRing:
+    """Tests for the consistent hash ring."""
+
+    def test_keys_spread_over_nodes(self):
+        ring = HashRing(["a", "b", "c"])
+        counts = {"a": 0, "b": 0, "c": 0}
+        for i in range(3000):
+            counts[ring.get_node(f"key-{i}")] += 1
+        assert all(600 < count < 1400 for count in counts.values())
+
+    def test_adding_a_node_moves_only_its_share(self):
+        ring = HashRing(["a", "b", "c"])
+        before = {f"key-{i}": ring.get_node(f"key-{i}") for i in range(3000)}
+        ring.add_node("d")
+        moved = [key for key, node in before.items() if ring.get_node(key) != node]
+
+        assert all(ring.get_node(key) == "d" for key in moved)
+        assert 300 < len(moved) < 1200
+
+        ring.remove_node("d")
+        assert all(ring.get_node(key) == node for key, node in before.items())
+
+    def test_invalid_operations(self):
+        ring = HashRing(["a"])
+        with pytest.raises(ValueError, match="already on the ring"):
+            ring.add_node("a")
+        with pytest.raises(ValueError, match="not on the ring"):
+            ring.remove_node("b")
+        with pytest.raises(ValueError, match="virtual_nodes"):
+            HashRing(virtual_nodes=0)
+        with pytest.raises(ValueError, match="no nodes"):
+            HashRing().get_node("key")
+
+
+class TestKeyPartitioning:
+    """Tests for spreading one tenant's keys over several shards."""
+
+    def test_keys_are_spread_and_topic_routing_works(self):
+        shards = memory_shards("a", "b", "c")
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        mesh.register_agent_topics("analyst", ["sales"])
+        for i in range(60):
+            mesh.push(f"report-{i}", i, topics=["sales"])
+        mesh.push("private", "p", subscribers=["other"])
+
+        assert all(shard.size() > 0 for shard in shards.values())
+        assert all(
+            shard.get_topics_for_agent("analyst") == ["sales"]
+            for shard in shards.values()
+        )
+        assert mesh.size() == 61
+        assert len(mesh.get_all_for_agent("analyst")) == 60
+        assert mesh.get("report-7", "analyst") == 7
+        assert mesh.get("private", "analyst") is None
+        assert mesh.get_many(["report-2", "private", "report-1"], "analyst") == {
+            "report-2": 2,
+            "report-1": 1,
+        }
+        assert len(mesh.get_available_keys_by_topic("analyst")["sales"]) == 60
+        assert mesh.get_stats()["total_topics"] == 1
+        assert mesh.get_stats()["total_items"] == 61
+
+        assert mesh.delete_topic("sales") == 60
+        assert mesh.size() == 1
+
+    def test_compression_stats_are_combined(self):
+        shards = {
+            name: ContextMesh(enable_persistence=False, compress_threshold=100)
+            for name in ("a", "b")
+        }
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        for i in range(20):
+            mesh.push(f"doc-{i}", {"body": f"Section {i}. " + "Lorem ipsum. " * 40})
+        assert all(shard.get_stats()["compressed_items"] for shard in shards.values())
+
+        stats = mesh.get_stats()
+        assert stats["compressed_items"] == 20
+        assert stats["compression_ratio"] == pytest.approx(
+            stats["uncompressed_bytes"] / stats["compressed_bytes"]
+        )
+        # The shards' ratios are averaged, not added up
+        ratios = [shard.get_stats()["compression_ratio"] for shard in shards.values()]
+        assert min(ratios) <= stats["compression_ratio"] <= max(ratios)
+
+    def test_prefix_queries_merge_shards(self):
+        mesh = ShardedContextMesh(memory_shards("a", "b", "c"), partition_by="key")
+        for i in range(30):
+            mesh.push(f"doc/{i:02d}", i)
+        mesh.push("other", 0)
+
+        assert mesh.list_keys("doc/", limit=5) == [f"doc/{i:02d}" for i in range(5)]
+        assert mesh.list_keys("doc/", start_after="doc/27") == ["doc/28", "doc/29"]
+        assert list(mesh.get_prefix("doc/1")) == [f"doc/1{i}" for i in range(10)]
+
+    def test_push_many_groups_by_shard(self):
+        shards = memory_shards("a", "b")
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        mesh.push_many([{"key": f"k{i}", "value": i} for i in range(20)])
+        assert mesh.size() == 20
+        for i in range(20):
+            assert shards[mesh.shard_for(f"k{i}")].get(f"k{i}") == i
+
+        with pytest.raises(ValueError, match="needs a key and value"):
+            mesh.push_many([{"key": "missing"}])
+
+    def test_changes_since_uses_composite_cursors(self):
+        mesh = ShardedContextMesh(memory_shards("a", "b", "c"), partition_by="key")
+        for i in range(10):
+            mesh.push(f"k{i}", i)
+
+        first = mesh.get_changes_since(0)
+        assert len(first["changed"]) == 10
+
+        mesh.push("k1", "updated")
+        mesh.remove("k2")
+        changes = mesh.get_changes_since(first["cursor"])
+        assert changes == {
+            "cursor": changes["cursor"],
+            "changed": {"k1": "updated"},
+            "removed": ["k2"],
+            "reset": False,
+        }
+        # No further changes keep the same cursor
+        assert mesh.get_changes_since(changes["cursor"])["cursor"] == changes["cursor"]
+        # Unknown cursors get a reset
+        assert mesh.get_changes_since(10**9)["reset"] is True
+
+    def test_add_shard_moves_keys(self):
+        shards = memory_shards("a", "b")
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        mesh.register_agent_topics("analyst", ["sales"])
+        mesh.set_agent_post_permissions("analyst", ["sales"])
+        for i in range(100):
+            mesh.push(f"k{i}", i, topics=["sales"], ttl=60)
+        cursor = mesh.get_changes_since(0, "analyst")["cursor"]
+
+        new_shard = ContextMesh(enable_persistence=False)
+        mesh.add_shard("c", new_shard)
+
+        assert mesh.shards == ["a", "b", "c"]
+        assert 0 < new_shard.size() < 100
+        assert mesh.size() == 100
+        assert new_shard.get_topics_for_agent("analyst") == ["sales"]
+        assert new_shard.get_agent_post_permissions("analyst") == ["sales"]
+        for i in range(100):
+            key = f"k{i}"
+            assert shards.get(mesh.shard_for(key), new_shard).get(key) == i
+        assert all(0 < entry["ttl"] <= 60 for entry in new_shard.export_items())
+        assert mesh.get_changes_since(cursor, "analyst")["reset"] is True
+
+    def test_remove_shard_moves_keys(self):
+        shards = memory_shards("a", "b", "c")
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        for i in range(50):
+            mesh.push(f"k{i}", i)
+
+        mesh.remove_shard("a")
+        assert mesh.shards == ["b", "c"]
+        assert shards["a"].size() == 0
+        assert mesh.size() == 50
+        assert mesh.get_many([f"k{i}" for i in range(50)]) == {
+            f"k{i}": i for i in range(50)
+        }
+
+        with pytest.raises(ValueError, match="Unknown shard"):
+            mesh.remove_shard("a")
+        mesh.remove_shard("b")
+        with pytest.raises(ValueError, match="last shard"):
+            mesh.remove_shard("c")
+
+    def test_on_change_and_wait_for(self):
+        shards = memory_shards("a", "b")
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        events = []
+        listener_id = mesh.on_change(events.append)
+        for i in range(10):
+            mesh.push(f"k{i}", i)
+        assert sorted(event["key"] for event in events) == [f"k{i}" for i in range(10)]
+
+        # Listeners follow keys to new shards
+        mesh.add_shard("c", ContextMesh(enable_persistence=False))
+        events.clear()
+        for i in range(10):
+            mesh.push(f"k{i}", -i)
+        assert len(events) == 10
+
+        assert mesh.remove_change_listener(listener_id) is True
+        assert mesh.remove_change_listener(listener_id) is False
+
+        timer = threading.Timer(0.1, mesh.push, args=("ready", True))
+        timer.start()
+        start = time.monotonic()
+        changes = mesh.wait_for(keys=["ready"], timeout=5)
+        assert changes["changed"] == {"ready": True}
+        assert time.monotonic() - start < 1
+        assert mesh.wait_for(keys=["never"], timeout=0.05) is None
+
+    def test_listeners_can_call_back_into_the_mesh(self):
+        shards = memory_shards("a", "b")
+        mesh = ShardedContextMesh(shards, partition_by="key")
+        for i in range(20):
+            mesh.push(f"k{i}", i)
+
+        seen = {}
+        mesh.on_change(
+            lambda event: seen.update({event["key"]: mesh.get(event["key"])})
+        )
+
+        # Moving keys raises events while the rebalance holds the topology
+        thread = threading.Thread(
+            target=mesh.add_shard, args=("c", ContextMesh(enable_persistence=False))
+        )
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        moved = [key for key in seen if mesh.shard_for(key) == "c"]
+        assert moved and all(seen[key] == int(key[1:]) for key in moved)
+
+        # A push's listener runs while a rebalance waits for the topology
+        rebalancing = threading.Event()
+
+        def wait_for_rebalance(event):
+            if event["key"] == "trigger":
+                rebalancing.wait(5)
+                time.sleep(0.05)
+                seen["trigger"] = mesh.get("trigger")
+
+        mesh.on_change(wait_for_rebalance)
+        pusher = threading.Thread(target=mesh.push, args=("trigger", 1))
+        remover = threading.Thread(target=mesh.remove_shard, args=("a",))
+        pusher.start()
+        rebalancing.set()
+        remover.start()
+        pusher.join(5)
+        remover.join(5)
+        assert not pusher.is_alive() and not remover.is_alive()
+        assert seen["trigger"] == 1
+        assert mesh.shards == ["b", "c"]
+
+    def test_tool_handler_works_with_sharded_mesh(self):
+        mesh = ShardedContextMesh(memory_shards("a", "b"), partition_by="key")
+        mesh.register_agent_topics("analyst", ["sales"])
+        writer = ToolHandler(mesh, "writer")
+        for i in range(5):
+            writer.handle_tool_call(
+                "push_context", key=f"lead-{i}", value=i, topics=["sales"]
+            )
+        result = ToolHandler(mesh, "analyst").handle_tool_call("get_context")
+        assert result["context"] == {f"lead-{i}": i for i in range(5)}
+
+    def test_remote_shards(self, tmp_path):
+        servers = [
+            ContextMeshServer(
+                address=str(tmp_path / f"{name}.sock"), enable_persistence=False
+            ).start()
+            for name in "ab"
+        ]
+        try:
+            mesh = ShardedContextMesh(
+                {
+                    name: (lambda user_id, s=server: RemoteContextMesh(s.address))
+                    for name, server in zip("ab", servers)
+                },
+                partition_by="key",
+            )
+            for i in range(20):
+                mesh.push(f"k{i}", i)
+            assert all(server.mesh.size() > 0 for server in servers)
+            assert mesh.get_many([f"k{i}" for i in range(20)]) == {
+                f"k{i}": i for i in range(20)
+            }
+            mesh.close()
+        finally:
+            for server in servers:
+                server.close()
+
+
+class TestUserPartitioning:
+    """Tests for placing each tenant on one shard."""
+
+    def test_tenant_lives_on_one_shard(self):
+        created = []
+        factory = tenant_factory(created)
+        shards = {name: factory for name in ("a", "b", "c")}
+
+        alice = ShardedContextMesh(shards, user_id="alice")
+        bob = ShardedContextMesh(shards, user_id="bob")
+        assert [mesh.user_id for mesh in created] == ["alice", "bob"]
+
+        alice.push("key", "alice's")
+        bob.push("key", "bob's")
+        assert alice.get("key") == "alice's"
+        assert bob.get("key") == "bob's"
+        assert alice.shard_for("any") == alice.shard_for("other")
+
+    def test_instances_rejected(self):
+        with pytest.raises(ValueError, match="needs shard factories"):
+            ShardedContextMesh(memory_shards("a"), user_id="alice")
+        with pytest.raises(ValueError, match="partition_by"):
+            ShardedContextMesh(memory_shards("a"), partition_by="topic")
+        with pytest.raises(ValueError, match="at least one shard"):
+            ShardedContextMesh({})
+
+    def test_tenant_moves_when_its_shard_changes(self):
+        created = []
+        factory = tenant_factory(created)
+        tenant = next(
+            user_id
+            for user_id in (f"user-{i}" for i in range(1000))
+            if HashRing(["a", "b"]).get_node(user_id)
+            != HashRing(["a", "b", "c"]).get_node(user_id)
+        )
+
+        mesh = ShardedContextMesh({"a": factory, "b": factory}, user_id=tenant)
+        mesh.register_agent_topics("analyst", ["sales"])
+        mesh.push("report", "r", topics=["sales"])
+        old_backend = created[0]
+
+        mesh.add_shard("c", factory)
+        assert mesh.shard_for("report") == "c"
+        new_backend = created[1]
+        assert new_backend.user_id == tenant
+        assert new_backend.get("report", "analyst") == "r"
+        assert old_backend.size() == 0
+        assert mesh.get_all_for_agent("analyst") == {"report": "r"}
+
+    @pytest.mark.parametrize("durability", ["sync", "async"])
+    def test_tenant_moves_within_a_shared_database(self, tmp_path, durability):
+        db_path = str(tmp_path / "shared.db")
+
+        def factory(user_id):
+            return ContextMesh(db_path=db_path, user_id=user_id, durability=durability)
+
+        tenant = next(
+            user_id
+            for user_id in (f"user-{i}" for i in range(1000))
+            if HashRing(["a", "b"]).get_node(user_id)
+            != HashRing(["a", "b", "c"]).get_node(user_id)
+        )
+        mesh = ShardedContextMesh({"a": factory, "b": factory}, user_id=tenant)
+        mesh.push("report", "r")
+        mesh.add_shard("c", factory)
+        mesh.close()
+
+        with ContextMesh(db_path=db_path, user_id=tenant) as reloaded:
+            assert reloaded.get("report") == "r"
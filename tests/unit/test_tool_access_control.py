@@ -42,9 +42,12 @@ class TestBasicAccessControl:
         handler = ToolHandler(self.mesh, "agent1")
         available_tools = handler.get_available_tools()
 
-        assert len(available_tools) == 7
+        assert len(available_tools) == 10
         assert "get_context" in available_tools
         assert "push_context" in available_tools
+        assert "patch_context" in available_tools
+        assert "increment_context" in available_tools
+        assert "append_context" in available_tools
         assert "list_context" in available_tools
         assert "subscribe_to_topics" in available_tools
         assert "discover_topics" in available_tools
@@ -66,7 +69,7 @@ class TestBasicAccessControl:
         handler = ToolHandler(self.mesh, "agent1", denied_tools=denied_tools)
 
         available_tools = handler.get_available_tools()
-        assert len(available_tools) == 5
+        assert len(available_tools) == 8
         assert "delete_topic" not in available_tools
         assert "unsubscribe_from_topics" not in available_tools
         assert "get_context" in available_tools
@@ -352,7 +355,7 @@ class TestDynamicAccessControl:
         handler = ToolHandler(self.mesh, "agent1")
 
         # Initially has all tools
-        assert len(handler.get_available_tools()) == 7
+        assert len(handler.get_available_tools()) == 10
 
         # Restrict to specific tools
         handler.set_allowed_tools(["get_context", "push_context"])
@@ -444,7 +447,7 @@ class TestAccessSummaryAndValidation:
         assert isinstance(summary["available_tools"], list)
         assert isinstance(summary["denied_tools"], list)
         assert summary["total_available"] == len(handler.get_available_tools())
-        assert summary["total_possible"] == 7  # Total Syntha tools
+        assert summary["total_possible"] == 10  # Total Syntha tools
 
     def test_access_summary_with_all_tools_allowed(self):
         """Test access summary when all tools are allowed."""
@@ -497,7 +500,7 @@ class TestEdgeCasesAndErrorHandling:
 
         # Should not affect anything
         available_tools = handler.get_available_tools()
-        assert len(available_tools) == 7  # All real tools should be available
+        assert len(available_tools) == 10  # All real tools should be available
 
     def test_empty_role_based_access_dict(self):
         """Test behavior with empty role_based_access dict."""
@@ -505,7 +508,7 @@ class TestEdgeCasesAndErrorHandling:
 
         # Should behave like normal handler
         available_tools = handler.get_available_tools()
-        assert len(available_tools) == 7
+        assert len(available_tools) == 10
 
     def test_role_based_access_with_nonexistent_role(self):
         """Test setting a role that doesn't exist in role_based_access."""
@@ -518,7 +521,7 @@ class TestEdgeCasesAndErrorHandling:
 
         # Should still have all tools since role doesn't exist in mapping
         available_tools = handler.get_available_tools()
-        assert len(available_tools) == 7
+        assert len(available_tools) == 10
 
 
 class TestIntegrationWithExistingTools:
@@ -26,7 +26,7 @@ class TestToolHandlerCore:
 
         assert handler.context_mesh is mesh
         assert handler.agent_name is None
-        assert len(handler.handlers) == 7  # Built-in Syntha tools
+        assert len(handler.handlers) == 10  # Built-in Syntha tools
         assert "get_context" in handler.handlers
         assert "push_context" in handler.handlers
         assert "list_context" in handler.handlers
@@ -71,12 +71,15 @@ class TestToolHandlerCore:
         handler = ToolHandler(context_mesh=mesh)
 
         schemas = handler.get_schemas()
-        assert len(schemas) == 7
+        assert len(schemas) == 10
 
         schema_names = {schema["name"] for schema in schemas}
         expected_names = {
             "get_context",
             "push_context",
+            "patch_context",
+            "increment_context",
+            "append_context",
             "list_context",
             "subscribe_to_topics",
             "discover_topics",
@@ -93,7 +96,7 @@ class TestToolHandlerCore:
         handler = ToolHandler(context_mesh=mesh)
 
         schemas = handler.get_syntha_schemas_only()
-        assert len(schemas) == 7
+        assert len(schemas) == 10
 
         mesh.close()
 
@@ -206,6 +209,94 @@ class TestBuiltInTools:
 
         mesh.close()
 
+    def test_context_tools_with_prefix(self):
+        """Test get_context and list_context filtered by a key prefix."""
+        mesh = ContextMesh(enable_persistence=False)
+        handler = ToolHandler(context_mesh=mesh, agent_name="test_agent")
+        mesh.push("project/1/summary", "s1")
+        mesh.push("project/1/notes", "n1")
+        mesh.push("project/2/summary", "s2")
+        mesh.push("project/1/private", "p", subscribers=["other_agent"])
+
+        result = handler.handle_tool_call("list_context", prefix="project/1/")
+        assert result["all_accessible_keys"] == ["project/1/notes", "project/1/summary"]
+        assert result["keys_by_topic"] == {
+            "other": ["project/1/summary", "project/1/notes"]
+        }
+
+        result = handler.handle_tool_call("get_context", prefix="project/1/")
+        assert result["context"] == {"project/1/notes": "n1", "project/1/summary": "s1"}
+
+        result = handler.handle_tool_call(
+            "get_context",
+            keys=["project/1/notes", "project/2/summary"],
+            prefix="project/1/",
+        )
+        assert result["context"] == {"project/1/notes": "n1"}
+
+        mesh.close()
+
+    def test_patch_context_tool(self):
+        """Test updating part of a value with patch_context."""
+        mesh = ContextMesh(enable_persistence=False)
+        handler = ToolHandler(context_mesh=mesh, agent_name="test_agent")
+        mesh.push("order", {"status": "new", "meta": {"rev": 1}})
+
+        result = handler.handle_tool_call(
+            "patch_context", key="order", patch='{"status": "shipped", "meta": null}'
+        )
+        assert result["success"] is True
+        assert result["fields"] == ["status", "meta"]
+        assert mesh.get("order") == {"status": "shipped"}
+
+        result = handler.handle_tool_call("patch_context", key="order", patch="[1]")
+        assert result["success"] is False
+
+        result = handler.handle_tool_call("patch_context", key="missing", patch="{}")
+        assert result["success"] is False
+
+        mesh.close()
+
+    def test_counter_and_list_tools(self):
+        """Test increment_context and append_context."""
+        mesh = ContextMesh(enable_persistence=False)
+        handler = ToolHandler(context_mesh=mesh, agent_name="test_agent")
+        mesh.register_agent_topics("observer", ["ops"])
+        mesh.register_agent_topics("test_agent", ["ops"])
+
+        result = handler.handle_tool_call(
+            "increment_context", key="done", topics=["ops"]
+        )
+        assert result["success"] is True
+        assert result["value"] == 1
+        result = handler.handle_tool_call("increment_context", key="done", delta=2)
+        assert result["value"] == 3
+        assert mesh.get("done", "observer") == 3
+
+        handler.handle_tool_call("append_context", key="log", entry="plain text")
+        result = handler.handle_tool_call(
+            "append_context", key="log", entry='{"step": 2}', max_len=1
+        )
+        assert result["success"] is True
+        assert result["length"] == 1
+        assert mesh.get("log") == [{"step": 2}]
+
+        mesh.push("private", 1, subscribers=["other_agent"])
+        result = handler.handle_tool_call("increment_context", key="private")
+        assert result["success"] is False
+        assert "not accessible" in result["error"]
+
+        # New counters and lists expire like pushed context
+        handler.handle_tool_call("increment_context", key="daily")
+        handler.handle_tool_call("append_context", key="notes", entry="a", ttl_hours=1)
+        handler.handle_tool_call("increment_context", key="total", ttl_hours=0)
+        ttls = {entry["key"]: entry["ttl"] for entry in mesh.export_items()}
+        assert 86000 < ttls["daily"] <= 86400
+        assert 3500 < ttls["notes"] <= 3600
+        assert ttls["total"] is None
+
+        mesh.close()
+
     def test_subscribe_to_topics_tool(self):
         """Test subscribe_to_topics tool."""
         mesh = ContextMesh(enable_persistence=False)
@@ -299,7 +390,7 @@ class TestToolSchemas:
         handler = ToolHandler(context_mesh=mesh)
 
         schemas = handler.get_schemas()
-        assert len(schemas) == 7
+        assert len(schemas) == 10
 
         # Check that all schemas have required fields
         for schema in schemas:
@@ -328,7 +419,7 @@ class TestToolSchemas:
         ]
 
         merged_schemas = handler.get_schemas(merge_with=existing_tools)
-        assert len(merged_schemas) == 8  # 7 Syntha + 1 custom
+        assert len(merged_schemas) == 11  # 10 Syntha + 1 custom
 
         tool_names = {schema["name"] for schema in merged_schemas}
         assert "custom_tool" in tool_names